@@ -0,0 +1,72 @@
+# -*- coding: UTF-8 -*-
+
+# Porpose: Benchmark of the file fingerprinting functions of utils.py,
+#          run it by hand, e.g. `python3 tests/bench_fingerprint.py 4096`
+# Rev: 18.Oct.2026
+
+import sys
+import os.path
+import time
+import tempfile
+import argparse
+
+PATH = os.path.realpath(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(os.path.dirname(PATH)))
+
+try:
+    from videomass.vdms_utils.utils import (fingerprint,
+                                            content_digest,
+                                            )
+except ImportError as error:
+    sys.exit(error)
+
+MIB = 1024 * 1024
+
+
+def make_file(dirname, size):
+    """
+    Writes a file of `size` MiB of pseudo-random data.
+    """
+    filename = os.path.join(dirname, 'bench.bin')
+    block = os.urandom(MIB)
+    with open(filename, 'wb') as fname:
+        for _ in range(size):
+            fname.write(block)
+    return filename
+
+
+def measure(func, filename, repeat):
+    """
+    Returns the best time of `repeat` calls of `func`.
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(filename)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Throughput of the '
+                                     'file fingerprinting functions')
+    parser.add_argument('size', nargs='?', type=int, default=1024,
+                        help='size of the test file in MiB')
+    parser.add_argument('-f', '--file', help='use an existing file')
+    parser.add_argument('-r', '--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = args.file or make_file(tmp, args.size)
+        size = os.path.getsize(filename) / MIB
+        print(f'file: {filename} ({size:.0f} MiB)')
+        for name, func in (('fingerprint', fingerprint),
+                           ('content_digest', content_digest)):
+            elapsed = measure(func, filename, args.repeat)
+            print(f'{name:>15}: {elapsed * 1000:10.2f} ms '
+                  f'{size / elapsed:12.1f} MiB/s')
+
+
+if __name__ == '__main__':
+    main()
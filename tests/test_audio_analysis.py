@@ -0,0 +1,117 @@
+# -*- coding: UTF-8 -*-
+
+# Porpose: Contains test cases for the audio_analysis.py object.
+# Rev: 18.Oct.2026
+
+import sys
+import os.path
+import unittest
+
+PATH = os.path.realpath(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(os.path.dirname(PATH)))
+
+try:
+    from videomass.vdms_threads.audio_analysis import (AnalysisParser,
+                                                       AudioStats,
+                                                       analysis_filter,
+                                                       analysis_variant,
+                                                       audio_stream,
+                                                       loudnorm_targets,
+                                                       )
+except ImportError as error:
+    sys.exit(error)
+
+STDERR = """\
+[Parsed_volumedetect_0 @ 0x55d1] n_samples: 2646000
+[Parsed_volumedetect_0 @ 0x55d1] mean_volume: -21.3 dB
+[Parsed_volumedetect_0 @ 0x55d1] max_volume: -0.4 dB
+[Parsed_astats_1 @ 0x55d2] Channel: 1
+[Parsed_astats_1 @ 0x55d2] RMS level dB: -20.9
+[Parsed_astats_1 @ 0x55d2] Overall
+[Parsed_astats_1 @ 0x55d2] Peak level dB: -0.4
+[Parsed_astats_1 @ 0x55d2] RMS level dB: -21.3
+[Parsed_loudnorm_2 @ 0x55d3]
+{
+\t"input_i" : "-18.52",
+\t"input_tp" : "-0.31",
+\t"input_lra" : "6.40",
+\t"input_thresh" : "-28.90",
+\t"output_i" : "-23.01",
+\t"output_tp" : "-4.80",
+\t"output_lra" : "5.90",
+\t"output_thresh" : "-33.38",
+\t"normalization_type" : "dynamic",
+\t"target_offset" : "0.01"
+}
+"""
+
+
+class TestAudioAnalysis(unittest.TestCase):
+    """Test case for the audio_analysis module."""
+
+    def test_parser(self):
+        parser = AnalysisParser()
+        for line in STDERR.splitlines(True):
+            parser.feed(line)
+        rec = parser.record
+        self.assertEqual(rec.volumedetect(), ('-0.4 dB', '-21.3 dB'))
+        self.assertEqual(rec.astats, {'Peak level dB': '-0.4',
+                                      'RMS level dB': '-21.3'})
+        summary = rec.loudnorm_summary()
+        self.assertEqual(summary['Input Integrated:'], '-18.52')
+        self.assertEqual(summary['Target Offset:'], '0.01')
+        same = AudioStats.from_json(rec.to_json())
+        self.assertEqual(same.loudnorm_summary(), summary)
+
+    def test_incomplete_record(self):
+        self.assertIsNone(AudioStats(loudness={'input_i': '-18'})
+                          .loudnorm_summary())
+        self.assertIsNone(AudioStats.from_json('{"foo": 1}'))
+
+    def test_volumedetect_only(self):
+        self.assertEqual(analysis_filter(''), 'volumedetect')
+        self.assertIn('loudnorm=I=-23:TP=-1:LRA=7',
+                      analysis_filter('I=-23:TP=-1:LRA=7'))
+        self.assertEqual(analysis_variant('-ss 10', '-t 5', '-map 0:a:1'),
+                         'audiostats -ss 10 -t 5 a:1')
+        self.assertNotEqual(analysis_variant('', '', '', 'loudnorm=I=-23'),
+                            analysis_variant('', '', ''))
+        parser = AnalysisParser()
+        for line in STDERR.splitlines(True)[:3]:
+            parser.feed(line)
+        self.assertTrue(parser.record.complete(''))
+        self.assertFalse(parser.record.complete('I=-24:TP=-2:LRA=7'))
+        self.assertFalse(AudioStats().complete(''))
+
+    def test_variant(self):
+        self.assertEqual(loudnorm_targets('-filter:a: loudnorm=I=-23.0:'
+                                          'TP=-1:LRA=7:print_format=summary'),
+                         'I=-23:TP=-1:LRA=7')
+        self.assertEqual(loudnorm_targets(''), 'I=-24:TP=-2:LRA=7')
+        self.assertEqual(audio_stream('-map 0:v? -map 0:a:1?'), '1')
+        self.assertEqual(audio_stream('-map 0:a:?'), '')
+        self.assertEqual(audio_stream(''), '')
+        ebu = '-filter:a: loudnorm=I=-23.0:LRA=7.0:TP=-1.0'
+        self.assertEqual(analysis_variant('-ss 10', '-t 5', '-map 0:a:1',
+                                          'loudnorm=I=-23:TP=-1:LRA=7'),
+                         analysis_variant('-ss 10', '-t  5',
+                                          f'-map 0:a:1? {ebu}', ebu))
+        self.assertNotEqual(analysis_variant('', '', '', ebu),
+                            analysis_variant('', '', '', ebu, '-hwaccel x'))
+
+    def test_from_summary(self):
+        parser = AnalysisParser()
+        for line in STDERR.splitlines(True):
+            parser.feed(line)
+        summary = parser.record.loudnorm_summary()
+        rec = AudioStats.from_json(AudioStats.from_summary(summary).to_json())
+        self.assertEqual(rec.loudnorm_summary(), summary)
+        self.assertFalse(rec.complete(''))  # no volumedetect values
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
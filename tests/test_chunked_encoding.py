@@ -0,0 +1,80 @@
+# -*- coding: UTF-8 -*-
+
+# Porpose: Contains test cases for the chunked_encoding.py object.
+# Rev: 18.Oct.2026
+
+import sys
+import os.path
+import unittest
+from unittest import mock
+
+PATH = os.path.realpath(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(os.path.dirname(PATH)))
+
+try:
+    from videomass.vdms_threads import chunked_encoding
+    from videomass.vdms_threads.chunked_encoding import (chunk_segments,
+                                                         split_points,
+                                                         MIN_SEGMENT_LENGTH,
+                                                         )
+except ImportError as error:
+    sys.exit(error)
+
+
+class TestChunkSegments(unittest.TestCase):
+    """Test case for the chunk_segments function."""
+
+    def test_short_duration(self):
+        opt = {'chunked_segments': 8}
+        self.assertEqual(chunk_segments(opt, MIN_SEGMENT_LENGTH - 1), 1)
+        self.assertEqual(chunk_segments(opt, 0), 1)
+        self.assertEqual(chunk_segments(opt, MIN_SEGMENT_LENGTH * 3.5), 3)
+        self.assertEqual(chunk_segments(opt, MIN_SEGMENT_LENGTH * 100), 8)
+
+    def test_auto(self):
+        with mock.patch.object(chunked_encoding.os, 'cpu_count',
+                               return_value=4):
+            self.assertEqual(chunk_segments({}, 3600), 4)
+            self.assertEqual(chunk_segments({'chunked_segments': '0'},
+                                            3600), 4)
+        with mock.patch.object(chunked_encoding.os, 'cpu_count',
+                               return_value=None):
+            self.assertEqual(chunk_segments({}, 3600), 1)
+
+
+class TestSplitPoints(unittest.TestCase):
+    """Test case for the split_points function."""
+
+    def test_single_segment(self):
+        self.assertEqual(split_points([0.0, 2.0, 4.0], 5.0, 1),
+                         [(0.0, None)])
+        self.assertEqual(split_points([], 300.0, 4), [(0.0, None)])
+
+    def test_keyframe_snapping(self):
+        keyframes = [0.0, 98.0, 103.0, 190.0, 215.0, 290.0]
+        self.assertEqual(split_points(keyframes, 300.0, 3),
+                         [(0.0, 98.0), (98.0, 190.0), (190.0, None)])
+
+    def test_no_duplicate_cuts(self):
+        keyframes = [0.0, 150.0, 299.0]  # one keyframe for both cuts
+        self.assertEqual(split_points(keyframes, 300.0, 3),
+                         [(0.0, 150.0), (150.0, None)])
+        self.assertEqual(split_points([0.0, 300.0], 300.0, 2),
+                         [(0.0, None)])  # cut at the end is dropped
+
+    def test_last_segment(self):
+        keyframes = [float(sec) for sec in range(0, 600, 2)]
+        points = split_points(keyframes, 600.0, 4)
+        self.assertEqual(points[0][0], 0.0)
+        self.assertIsNone(points[-1][1])  # up to the end of the source
+        self.assertEqual(points[-1][0], 450.0)
+        for (_, end), (start, _) in zip(points, points[1:]):
+            self.assertEqual(end, start)  # contiguous
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+# -*- coding: UTF-8 -*-
+
+# Porpose: Contains test cases for the dispatcher.py object.
+# Rev: 18.Oct.2026
+
+import sys
+import os.path
+import time
+import unittest
+from unittest import mock
+
+PATH = os.path.realpath(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(os.path.dirname(PATH)))
+
+try:
+    from videomass.vdms_threads import dispatcher
+    from videomass.vdms_threads.dispatcher import EventDispatcher
+except ImportError as error:
+    sys.exit(error)
+
+
+def wait_for(condition, timeout=5):
+    """
+    Polls `condition` until it returns True or `timeout`
+    seconds have elapsed, returns its last result.
+    """
+    end = time.monotonic() + timeout
+    while not condition() and time.monotonic() < end:
+        time.sleep(0.01)
+    return condition()
+
+
+class TestEventDispatcher(unittest.TestCase):
+    """Test case for the EventDispatcher object."""
+
+    def setUp(self):
+        self.saved = EventDispatcher.RATE, EventDispatcher.IDLE
+        self.batches = []  # batches passed to wx.CallAfter
+        self.sent = []  # messages delivered by pubsub
+        patch = mock.patch.object(dispatcher.wx, 'CallAfter',
+                                  side_effect=self.call_after)
+        patch.start()
+        self.addCleanup(patch.stop)
+        patch = mock.patch.object(dispatcher.pub, 'sendMessage',
+                                  side_effect=self.send_message)
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.disp = EventDispatcher()
+
+    def tearDown(self):
+        EventDispatcher.RATE, EventDispatcher.IDLE = self.saved
+
+    def call_after(self, func, batch):
+        self.batches.append(batch)
+        func(batch)
+
+    def send_message(self, topic, **kwargs):
+        self.sent.append((topic, kwargs))
+
+    def test_coalesce(self):
+        self.disp.running = True  # batches are taken by hand
+        for val in (1, 2, 3):
+            self.disp.send('PROGRESS_EVT', output=val, jobid=1)
+        self.disp.send('PROGRESS_EVT', output=9, jobid=2)
+        self.disp.send('UPDATE_EVT', output='a', status=0, jobid=1)
+        self.disp.send('UPDATE_EVT', output='b', status=0, jobid=1)
+        self.assertEqual(self.disp.pending,
+                         [('PROGRESS_EVT', {'output': 3, 'jobid': 1}),
+                          ('PROGRESS_EVT', {'output': 9, 'jobid': 2}),
+                          ('UPDATE_EVT', {'output': ['a', 'b'],
+                                          'status': 0, 'jobid': 1})])
+        self.assertEqual(self.disp.stats(reset=True), (6, 3))
+        self.assertEqual(self.disp.stats(), (0, 0))
+
+    def test_end_flushes_pending(self):
+        EventDispatcher.RATE, EventDispatcher.IDLE = 100, 1
+        self.disp.running = True
+        self.disp.send('PROGRESS_EVT', output=1, jobid=1)
+        self.disp.send('UPDATE_EVT', output='a', status=0, jobid=1)
+        self.disp.send('END_EVT', msg='DONE', jobid=1)
+        self.disp.send('PROGRESS_EVT', output=2, jobid=1)  # not merged
+        self.disp.run()  # one batch, then idle
+        self.assertEqual(len(self.batches), 1)
+        self.assertEqual([topic for topic, kwa in self.sent],
+                         ['PROGRESS_EVT', 'UPDATE_EVT', 'END_EVT',
+                          'PROGRESS_EVT'])
+        self.assertEqual(self.sent[1][1]['output'], ['a'])
+        self.assertEqual(self.sent[3][1]['output'], 2)
+        self.assertFalse(self.disp.running)
+
+    def test_rate(self):
+        EventDispatcher.RATE = 10
+        start = time.monotonic()
+        for val in range(50):
+            self.disp.send('PROGRESS_EVT', output=val, jobid=1)
+            time.sleep(0.005)
+        elapsed = time.monotonic() - start
+        self.assertTrue(wait_for(lambda: self.sent[-1:] == [
+            ('PROGRESS_EVT', {'output': 49, 'jobid': 1})]))
+        self.assertLessEqual(len(self.batches), elapsed * 10 + 2)
+        self.assertEqual(len(self.sent), len(self.batches))
+
+    def test_idle_stop(self):
+        EventDispatcher.RATE, EventDispatcher.IDLE = 100, 3
+        self.disp.send('COUNT_EVT', count='a', jobid=1)
+        self.assertTrue(self.disp.running)
+        self.assertTrue(wait_for(lambda: not self.disp.running))
+        self.assertEqual(self.sent, [('COUNT_EVT',
+                                      {'count': 'a', 'jobid': 1})])
+        self.disp.send('COUNT_EVT', count='b', jobid=1)  # restarted
+        self.assertTrue(self.disp.running)
+        self.assertTrue(wait_for(lambda: len(self.sent) == 2))
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
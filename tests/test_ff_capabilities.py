@@ -0,0 +1,115 @@
+# -*- coding: UTF-8 -*-
+
+# Porpose: Contains test cases for the ff_capabilities.py object.
+# Rev: 18.Oct.2026
+
+import sys
+import os.path
+import json
+import tempfile
+import unittest
+
+PATH = os.path.realpath(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(os.path.dirname(PATH)))
+
+try:
+    from videomass.vdms_threads.ff_capabilities import (SCHEMA,
+                                                        FFCapabilities,
+                                                        binary_key,
+                                                        codec_names,
+                                                        parse_filters,
+                                                        parse_hwaccels,
+                                                        parse_pix_fmts,
+                                                        )
+except ImportError as error:
+    sys.exit(error)
+
+FILTERS = """Filters:
+  T.. = Timeline support
+  .S. = Slice threading
+  ..C = Command support
+  A = Audio input/output
+ ... abench            A->A       Benchmark part of a filtergraph.
+ TSC scale             V->V       Scale the input video size.
+ ... amovie            |->N       Read audio from a movie source.
+"""
+
+DATA = {'version': 'ffmpeg version 7.1', 'conf': [[], [], [], []],
+        'formats': {}, 'filters': {'scale': ''}, 'hwaccels': ['vaapi'],
+        'encoders': {'Video': ['V....D libx264  H.264'],
+                     'Audio': [], 'Subtitle': []},
+        'decoders': {'Video': [], 'Audio': [], 'Subtitle': []},
+        'pix_fmts': {'libx264': ['yuv420p']}}
+
+
+class TestParsers(unittest.TestCase):
+    """Test case for the output parsers."""
+
+    def test_parse_filters(self):
+        self.assertEqual(sorted(parse_filters(FILTERS)),
+                         ['abench', 'amovie', 'scale'])
+
+    def test_parse_hwaccels(self):
+        text = 'Hardware acceleration methods:\nvdpau\ncuda\n\n'
+        self.assertEqual(parse_hwaccels(text), ['vdpau', 'cuda'])
+
+    def test_parse_pix_fmts(self):
+        text = ('Encoder libx264 [libx264 H.264]:\n'
+                '    Supported pixel formats: yuv420p yuv422p\n')
+        self.assertEqual(parse_pix_fmts(text), ['yuv420p', 'yuv422p'])
+        self.assertEqual(parse_pix_fmts(''), [])
+
+    def test_codec_names(self):
+        self.assertEqual(codec_names(DATA['encoders']), {'libx264'})
+
+
+class TestFFCapabilities(unittest.TestCase):
+    """Test case for the FFCapabilities object."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.binary = os.path.join(self.tmp.name, 'ffmpeg')
+        with open(self.binary, 'w', encoding='utf-8') as fname:
+            fname.write('')
+        os.chmod(self.binary, 0o755)
+        self.filename = os.path.join(self.tmp.name, 'ffmpeg_caps.json')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_caps(self, key):
+        with open(self.filename, 'w', encoding='utf-8') as fname:
+            json.dump({'schema': SCHEMA, 'key': key, 'data': DATA}, fname)
+
+    def test_load(self):
+        self.write_caps(binary_key(self.binary))
+        caps = FFCapabilities()
+        caps.open(self.filename, self.binary, 'Linux')
+        self.assertTrue(caps.ready())
+        self.assertTrue(caps.has_encoder('libx264'))
+        self.assertFalse(caps.has_encoder('libx265'))
+        self.assertTrue(caps.has_filter('scale'))
+        self.assertEqual(caps.pix_fmts('libx264'), ['yuv420p'])
+
+    def test_binary_key(self):
+        self.assertEqual(binary_key(self.binary)['path'], self.binary)
+        os.chmod(self.binary, 0o644)  # not executable
+        self.assertIsNone(binary_key(self.binary))
+        self.assertIsNone(binary_key(os.path.join(self.tmp.name, 'none')))
+
+    def test_changed_binary(self):
+        key = binary_key(self.binary)
+        key['size'] += 1
+        self.write_caps(key)
+        caps = FFCapabilities()
+        caps.open(self.filename, self.binary, 'Linux')
+        self.assertFalse(caps.ready())
+        self.assertIsNone(caps.has_encoder('libx264'))
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
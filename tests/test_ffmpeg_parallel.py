@@ -0,0 +1,148 @@
+# -*- coding: UTF-8 -*-
+
+# Porpose: Contains test cases for the parallel jobs of the ffmpeg.py
+#          object.
+# Rev: 18.Oct.2026
+
+import sys
+import os.path
+import time
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+PATH = os.path.realpath(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(os.path.dirname(PATH)))
+
+try:
+    from videomass.vdms_threads import ffmpeg
+    from videomass.vdms_threads.ffmpeg import (FFmpeg,
+                                               max_workers,
+                                               concurrent_jobs,
+                                               )
+except ImportError as error:
+    sys.exit(error)
+
+
+class TestWorkers(unittest.TestCase):
+    """Test case for the number of concurrent jobs."""
+
+    def test_max_workers(self):
+        self.assertEqual(max_workers({'parallel_jobs_max': 3}), 3)
+        with mock.patch.object(ffmpeg.os, 'cpu_count', return_value=8):
+            self.assertEqual(max_workers({'parallel_jobs_max': 0}), 4)
+            self.assertEqual(max_workers({}), 4)
+        with mock.patch.object(ffmpeg.os, 'cpu_count', return_value=1):
+            self.assertEqual(max_workers({'parallel_jobs_max': -1}), 1)
+        with mock.patch.object(ffmpeg.os, 'cpu_count', return_value=None):
+            self.assertEqual(max_workers({}), 1)
+
+    def test_concurrent_jobs(self):
+        self.assertEqual(concurrent_jobs({'parallel_jobs': False,
+                                          'parallel_jobs_max': 6}), 1)
+        self.assertEqual(concurrent_jobs({'parallel_jobs': True,
+                                          'parallel_jobs_max': 6}), 6)
+
+
+class TestRunParallel(unittest.TestCase):
+    """Test case for the run_parallel method, with a stubbed execute."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        os.mkdir(os.path.join(self.tmp.name, 'tmp'))
+        self.appset = {'ffmpeg_cmd': 'ffmpeg',
+                       'ffmpeg_loglev': '-loglevel warning',
+                       'cachedir': self.tmp.name,
+                       'parallel_jobs': True,
+                       'parallel_jobs_max': 3,
+                       }
+        self.events = []
+        self.running = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+        app = mock.Mock(appset=self.appset)
+        patch = mock.patch.object(ffmpeg.wx, 'GetApp', return_value=app)
+        patch.start()
+        self.addCleanup(patch.stop)
+        for name, new in (('send_event', self.send_event),
+                          ('append_to_log', mock.Mock()),
+                          ('time', mock.Mock()),  # no sleep
+                          ):
+            patch = mock.patch.object(ffmpeg, name, new)
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def send_event(self, topic, **kwargs):
+        with self.lock:
+            self.events.append((topic, kwargs))
+
+    def execute(self, cmd, kwa, jobid=None, workdir=None, logbuf=None,
+                summary=None):
+        """
+        Replaces FFmpeg.execute: the higher the job number,
+        the earlier it ends (jobid is None if not parallel).
+        The 'fail' items return 'FAILED'.
+        """
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep((10 - (jobid or 0)) * 0.01)
+        with self.lock:
+            self.running -= 1
+        return 'FAILED' if 'fail' in kwa['source'] else 'DONE'
+
+    def items(self, names):
+        return [{'type': 'One pass', 'source': name,
+                 'destination': f'{name}.mkv', 'args': ('-c copy', ''),
+                 'start-time': '', 'end-time': '', 'duration': 1000}
+                for name in names]
+
+    def run_ffmpeg(self, names, *journal, items=None):
+        with mock.patch.object(FFmpeg, 'start'), \
+                mock.patch.object(FFmpeg, 'execute', autospec=True,
+                                  side_effect=lambda slf, *a, **k:
+                                  self.execute(*a, **k)):
+            thread = FFmpeg(os.path.join(self.tmp.name, 'log'),
+                            items or self.items(names), *journal)
+            thread.run()
+        return thread
+
+    def test_maxjobs(self):
+        self.assertEqual(self.run_ffmpeg(['a', 'b']).maxjobs, 2)
+        self.assertEqual(self.peak, 2)
+        self.appset['parallel_jobs'] = False
+        self.assertEqual(self.run_ffmpeg(['a', 'b']).maxjobs, 1)
+
+    def test_ordered_results(self):
+        names = ['a', 'b', 'fail', 'c', 'd', 'e']
+        self.run_ffmpeg(names)
+        self.assertLessEqual(self.peak, 3)
+        end = [kwa for topic, kwa in self.events if topic == 'END_EVT']
+        self.assertEqual(end, [{'filetotrash': ['a', 'b', 'c', 'd', 'e']}])
+
+    def test_journal(self):
+        journal = mock.Mock()
+        journal.state.return_value = None
+        journal.finished.return_value = False
+        self.run_ffmpeg(['a', 'b'], journal)
+        journal.clear.assert_called_once_with()
+        journal = mock.Mock()
+        journal.state.return_value = None
+        journal.finished.return_value = False
+        items = self.items(['a', 'b'])
+        items[1]['type'] = 'Unknown'
+        self.assertTrue(self.run_ffmpeg([], journal, items=items)
+                        .fatal_error)
+        journal.clear.assert_not_called()  # kept for the next run
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
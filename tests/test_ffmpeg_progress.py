@@ -0,0 +1,97 @@
+# -*- coding: UTF-8 -*-
+
+# Porpose: Contains test cases for the ffmpeg_progress.py object.
+# Rev: 18.Oct.2026
+
+import sys
+import os.path
+import subprocess
+import unittest
+
+PATH = os.path.realpath(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(os.path.dirname(PATH)))
+
+try:
+    from videomass.vdms_threads.ffmpeg_progress import (progress_cmd,
+                                                        ProgressParser,
+                                                        ProgressRecord,
+                                                        FFmpegPipes,
+                                                        )
+except ImportError as error:
+    sys.exit(error)
+
+BLOCK = ['frame=250\n', 'fps=49.95\n', 'stream_0_0_q=28.0\n',
+         'bitrate= 435.0kbits/s\n', 'total_size=1048576\n',
+         'out_time_us=10000000\n', 'out_time=00:00:10.000000\n',
+         'speed=2.01x\n', 'progress=continue\n']
+
+
+class TestProgressCmd(unittest.TestCase):
+    """Test case for the progress_cmd function."""
+
+    def test_progress_cmd_list(self):
+        cmd = ['ffmpeg', '-y', '-stats', '-i', 'in.mkv', 'out.mkv']
+        self.assertEqual(progress_cmd(cmd),
+                         ['ffmpeg', '-progress', 'pipe:1', '-nostats',
+                          '-y', '-i', 'in.mkv', 'out.mkv'])
+
+    def test_progress_cmd_string(self):
+        cmd = '"C:\\ffmpeg.exe" -y -stats -i "in.mkv" "out.mkv"'
+        self.assertEqual(progress_cmd(cmd),
+                         '"C:\\ffmpeg.exe" -progress pipe:1 -nostats'
+                         ' -y -i "in.mkv" "out.mkv"')
+
+
+class TestProgressParser(unittest.TestCase):
+    """Test case for the ProgressParser object."""
+
+    def test_parser_block(self):
+        parser = ProgressParser()
+        records = [parser.feed(line) for line in BLOCK]
+        self.assertEqual(records[:-1], [None] * (len(BLOCK) - 1))
+        rec = records[-1]
+        self.assertEqual(rec.frame, 250)
+        self.assertEqual(rec.fps, 49.95)
+        self.assertEqual(rec.out_time_us, 10000000)
+        self.assertEqual(rec.msec, 10000)
+        self.assertEqual(rec.total_size, 1048576)
+        self.assertEqual(rec.speed, 2.01)
+        self.assertFalse(rec.end)
+
+    def test_parser_not_available(self):
+        parser = ProgressParser()
+        for line in ('total_size=N/A\n', 'out_time_ms=N/A\n',
+                     'speed=N/A\n'):
+            parser.feed(line)
+        rec = parser.feed('progress=end\n')
+        self.assertEqual((rec.total_size, rec.msec, rec.speed),
+                         (0, 0, 0.0))
+        self.assertTrue(rec.end)
+
+
+class TestFFmpegPipes(unittest.TestCase):
+    """Test case for the FFmpegPipes object."""
+
+    def test_pipes(self):
+        script = ('import sys\n'
+                  f'sys.stdout.write({"".join(BLOCK)!r})\n'
+                  'sys.stderr.write("diagnostics\\n")\n')
+        with subprocess.Popen([sys.executable, '-c', script],
+                              stdout=subprocess.PIPE,
+                              stderr=subprocess.PIPE,
+                              stdin=subprocess.PIPE,
+                              universal_newlines=True,
+                              ) as proc:
+            items = list(FFmpegPipes(proc))
+        self.assertEqual(len(items), 2)
+        self.assertIn('diagnostics\n', items)
+        rec = [item for item in items if isinstance(item, ProgressRecord)]
+        self.assertEqual(rec[0].frame, 250)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+# -*- coding: UTF-8 -*-
+
+# Porpose: Contains test cases for the list model of filedrop.py.
+# Rev: 18.Oct.2026
+
+import sys
+import os.path
+import unittest
+from array import array
+
+PATH = os.path.realpath(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(os.path.dirname(PATH)))
+
+try:
+    from videomass.vdms_utils.list_model import (sort_order,
+                                                 remaining_rows,
+                                                 reorder_columns,
+                                                 )
+except ImportError as error:
+    sys.exit(error)
+
+
+def model():
+    """
+    Returns the columns of a list model of three rows.
+    """
+    return (['b.mkv', 'a.mp4', 'c.wav'],  # file_src
+            [90000, 5000, 600000],  # duration
+            ['video: Matroska', 'video: MP4', 'audio: WAV'],  # formats
+            array('d', [2e9, 3e6, 1e8]),  # sizes
+            )
+
+
+class TestListModel(unittest.TestCase):
+    """Test case for the columnar model of the file list."""
+
+    def test_sort_order(self):
+        names, duration, formats, sizes = model()
+        self.assertEqual(sort_order(names), [1, 0, 2])
+        self.assertEqual(sort_order(duration), [1, 0, 2])  # numeric, not text
+        self.assertEqual(sort_order(sizes), [1, 2, 0])  # typed, in bytes
+        self.assertEqual(sort_order(sizes, descending=True), [0, 2, 1])
+        self.assertEqual(sort_order(formats), [2, 1, 0])
+        self.assertEqual(sort_order([]), [])
+
+    def test_sort_stable(self):
+        duration = [0, 5000, 0, 5000]  # e.g. unknown durations
+        self.assertEqual(sort_order(duration), [0, 2, 1, 3])
+        self.assertEqual(sort_order(duration, descending=True),
+                         [1, 3, 0, 2])
+
+    def test_reorder(self):
+        columns = model()
+        reorder_columns(columns, [2, 0, 1])
+        self.assertEqual(columns[0], ['c.wav', 'b.mkv', 'a.mp4'])
+        self.assertEqual(columns[1], [600000, 90000, 5000])
+        self.assertEqual(columns[3], array('d', [1e8, 2e9, 3e6]))
+        self.assertIsInstance(columns[3], array)
+
+    def test_remove(self):
+        columns = model()
+        keep = remaining_rows(3, [1, 1])
+        self.assertEqual(keep, [0, 2])
+        reorder_columns(columns, keep)
+        self.assertEqual(columns[0], ['b.mkv', 'c.wav'])
+        self.assertEqual(columns[2], ['video: Matroska', 'audio: WAV'])
+        self.assertEqual(columns[3], array('d', [2e9, 1e8]))
+        reorder_columns(columns, remaining_rows(2, [0, 1]))
+        self.assertEqual(columns, ([], [], [], array('d')))
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
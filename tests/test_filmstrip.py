@@ -0,0 +1,66 @@
+# -*- coding: UTF-8 -*-
+
+# Porpose: Contains test cases for the filmstrip.py object.
+# Rev: 18.Oct.2026
+
+import sys
+import os.path
+import unittest
+
+PATH = os.path.realpath(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(os.path.dirname(PATH)))
+
+try:
+    from videomass.vdms_utils.filmstrip import (Filmstrip,
+                                                strip_geometry,
+                                                showinfo_time,
+                                                )
+except ImportError as error:
+    sys.exit(error)
+
+
+class TestFilmstrip(unittest.TestCase):
+    """Test case for the Filmstrip object."""
+
+    def test_geometry(self):
+        self.assertEqual(strip_geometry(900, 80, 16 / 9), (142, 7))
+        self.assertEqual(strip_geometry(900, 80, 4 / 3), (108, 9))
+
+    def test_showinfo_time(self):
+        line = (b'[Parsed_showinfo_1 @ 0x55d0c8] n:   3 pts: 184320 '
+                b'pts_time:12.5    duration:512 fmt:yuv420p\n')
+        self.assertEqual(showinfo_time(line), 12.5)
+        self.assertIsNone(showinfo_time(b'[Parsed_showinfo_1 @ 0x55d0c8] '
+                                        b'  color_range:tv\n'))
+        self.assertIsNone(showinfo_time(b'Input #0, matroska,webm\n'))
+
+    def test_slots(self):
+        strip = Filmstrip(2, 1, 4)
+        self.assertEqual(strip.slot(0.0, 40.0), 0)
+        self.assertEqual(strip.slot(19.9, 40.0), 1)
+        self.assertEqual(strip.slot(45.0, 40.0), 3)
+        self.assertTrue(strip.add(1, bytes(6)))
+        self.assertFalse(strip.add(1, bytes([1]) * 6))  # first is kept
+        self.assertFalse(strip.add(2, bytes(5)))  # wrong size
+        self.assertEqual(list(strip.thumbs), [1])
+
+    def test_bytes(self):
+        strip = Filmstrip(2, 1, 4)
+        strip.add(3, bytes([3]) * 6)
+        strip.add(0, bytes([0]) * 6)
+        copy = Filmstrip.from_bytes(strip.to_bytes())
+        self.assertEqual((copy.width, copy.height, copy.slots),
+                         (2, 1, 4))
+        self.assertEqual(copy.thumbs, strip.thumbs)
+        with self.assertRaises(ValueError):
+            Filmstrip.from_bytes(strip.to_bytes()[:-1])
+        with self.assertRaises(ValueError):
+            Filmstrip.from_bytes(b'VMPK')
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+# -*- coding: UTF-8 -*-
+
+# Porpose: Contains test cases for the frame_server.py object.
+# Rev: 18.Oct.2026
+
+import sys
+import os.path
+import threading
+import unittest
+
+PATH = os.path.realpath(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(os.path.dirname(PATH)))
+
+try:
+    from videomass.vdms_threads.frame_server import (FrameServer,
+                                                     FrameServers,
+                                                     preview_cmd,
+                                                     )
+except ImportError as error:
+    sys.exit(error)
+
+# frames of the fake source, each frame is filled with its own slot number
+LENGTH = 30
+STARTS = []  # slots at which the fake decoder was started
+
+
+def fake_cmd(ffmpeg_cmd, filename, start, width, height, fps):
+    """
+    Makes a command that writes raw frames of the fake source
+    from `start` seconds up to LENGTH frames.
+    """
+    first = int(round(start * fps))
+    STARTS.append(first)
+    script = ('import sys\n'
+              f'for num in range({first}, {LENGTH}):\n'
+              f'    sys.stdout.buffer.write(bytes([num]) * {width * height}'
+              ' * 3)\n'
+              )
+    return [sys.executable, '-c', script]
+
+
+def new_server(maxframes=100):
+    """
+    Returns a FrameServer of a 2x1 source on the fake decoder.
+    """
+    STARTS.clear()
+    return FrameServer('fake.mkv', 2, 1, fps=10, maxframes=maxframes,
+                       command=fake_cmd)
+
+
+class TestFrameServer(unittest.TestCase):
+    """Test case for the FrameServer object."""
+
+    def test_preview_cmd(self):
+        cmd = preview_cmd('ffmpeg', 'in.mkv', 1.5, 320, 180)
+        self.assertEqual(cmd[cmd.index('-ss') + 1], '1.500')
+        self.assertEqual(cmd[cmd.index('-vf') + 1], 'fps=10,scale=320:180')
+        self.assertEqual(cmd[-1], '-')
+
+    def test_frame_forward(self):
+        server = new_server()
+        self.assertEqual(server.frame(0.5), bytes([5]) * 6)
+        self.assertEqual(server.frame(1.0), bytes([10]) * 6)  # read ahead
+        self.assertEqual(server.frame(0.7), bytes([7]) * 6)  # cached
+        self.assertEqual(STARTS, [5])
+        server.close()
+
+    def test_frame_seek(self):
+        server = new_server()
+        server.frame(2.0)
+        server.frame(0.5)  # behind the decoder
+        self.assertEqual(STARTS, [20, 5])
+        server.close()
+
+    def test_frame_end(self):
+        server = new_server()
+        self.assertEqual(server.frame(2.5), bytes([25]) * 6)
+        self.assertEqual(server.frame(2.9), bytes([29]) * 6)
+        self.assertEqual(server.frame(3.2), bytes([29]) * 6)
+        self.assertEqual(server.end, LENGTH)
+        server.close()
+
+    def test_lru(self):
+        server = new_server(maxframes=3)
+        server.frame(0.0)
+        server.frame(0.5)
+        self.assertEqual(list(server.frames), [3, 4, 5])
+        server.close()
+
+    def test_request(self):
+        server = new_server()
+        done = threading.Event()
+        result = []
+
+        def callback(seconds, data):
+            result.append((seconds, data))
+            done.set()
+
+        server.request(1.0, callback)
+        self.assertTrue(done.wait(10))
+        self.assertEqual(result, [(1.0, bytes([10]) * 6)])
+        server.close()
+
+    def test_suspend(self):
+        server = new_server()
+        server.frame(0.5)
+        server.pending = (2.5, None)  # not yet taken by the worker
+        server.suspend()
+        self.assertIsNone(server.pending)
+        self.assertIsNone(server.proc)
+        self.assertEqual(server.serve(0.5), bytes([5]) * 6)  # cached
+        self.assertIsNone(server.serve(2.5))  # no restart
+        self.assertEqual(STARTS, [5])
+        self.assertEqual(server.frame(2.5), bytes([25]) * 6)
+        self.assertEqual(STARTS, [5, 25])
+        server.close()
+
+
+class TestFrameServers(unittest.TestCase):
+    """Test case for the FrameServers object."""
+
+    def test_get(self):
+        servers = FrameServers()
+        first = servers.get('a.mkv', 2, 1, 'ffmpeg')
+        self.assertIs(servers.get('a.mkv', 2, 1, 'ffmpeg'), first)
+        self.assertIsNot(servers.get('a.mkv', 2, 1, '/opt/ffmpeg'), first)
+        self.assertTrue(first.closed)
+
+    def test_evict(self):
+        servers = FrameServers()
+        first = servers.get('a.mkv', 2, 1, 'ffmpeg')
+        for name in ('b.mkv', 'c.mkv'):
+            servers.get(name, 2, 1, 'ffmpeg')
+        self.assertTrue(first.closed)
+        self.assertEqual(len(servers.servers), FrameServers.MAXSERVERS)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
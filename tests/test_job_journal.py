@@ -0,0 +1,75 @@
+# -*- coding: UTF-8 -*-
+
+# Porpose: Contains test cases for the job_journal.py object.
+# Rev: 18.Oct.2026
+
+import sys
+import os.path
+import tempfile
+import unittest
+
+PATH = os.path.realpath(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(os.path.dirname(PATH)))
+
+try:
+    from videomass.vdms_io.job_journal import JobJournal, job_key
+except ImportError as error:
+    sys.exit(error)
+
+
+class TestJobJournal(unittest.TestCase):
+    """Test case for the JobJournal object."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.jfile = os.path.join(self.tmp.name, 'queue.journal')
+        self.output = os.path.join(self.tmp.name, 'output.mkv')
+        with open(self.output, 'wb') as fname:
+            fname.write(b'encoded data')
+        self.key = job_key({'source': 'in.mkv', 'destination': self.output})
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_job_key(self):
+        item = {'args': ('-c:v libx264', ''), 'source': 'in.mkv'}
+        self.assertEqual(job_key(item), job_key(dict(reversed(item.items()))))
+        self.assertNotEqual(job_key(item), job_key(dict(item, args=[])))
+
+    def test_resume_done(self):
+        journal = JobJournal(self.jfile)
+        journal.record(self.key, 'queued')
+        journal.record(self.key, 'running', self.output)
+        journal.record(self.key, 'done', self.output)
+        journal = JobJournal(self.jfile)  # reload as after a restart
+        self.assertEqual(journal.state(self.key), 'done')
+        self.assertTrue(journal.finished(self.key))
+        with open(self.output, 'ab') as fname:
+            fname.write(b'changed')
+        self.assertFalse(journal.finished(self.key))
+
+    def test_discard_partial(self):
+        journal = JobJournal(self.jfile)
+        journal.record(self.key, 'running', self.output)
+        with open(self.jfile, 'a', encoding='utf-8') as fname:
+            fname.write('{"key": "truncated')  # crash while writing
+        journal = JobJournal(self.jfile)
+        self.assertEqual(journal.state(self.key), 'running')
+        self.assertFalse(journal.finished(self.key))
+        journal.discard_partial(self.key)
+        self.assertFalse(os.path.exists(self.output))
+
+    def test_clear(self):
+        journal = JobJournal(self.jfile)
+        journal.record(self.key, 'queued')
+        journal.clear()
+        self.assertFalse(os.path.exists(self.jfile))
+        self.assertIsNone(JobJournal(self.jfile).state(self.key))
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+# -*- coding: UTF-8 -*-
+
+# Porpose: Contains test cases for the keyframe_index.py object.
+# Rev: 18.Oct.2026
+
+import sys
+import os.path
+import unittest
+
+PATH = os.path.realpath(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(os.path.dirname(PATH)))
+
+try:
+    from videomass.vdms_utils.keyframe_index import KeyframeIndex
+except ImportError as error:
+    sys.exit(error)
+
+# ffprobe -show_entries packet=pts_time,flags -of csv=print_section=0
+PACKETS = ('0.080000,___\n'  # before the first keyframe
+           '0.000000,K__\n'
+           '0.120000,___\n'
+           '0.040000,___\n'
+           '2.000000,K__\n'
+           '2.040000,___\n'
+           'N/A,K__\n'
+           '5.000000,K_D\n'
+           '5.040000,___\n'
+           '5.080000,___\n'
+           '5.120000,___\n'
+           )
+
+
+class TestKeyframeIndex(unittest.TestCase):
+    """Test case for the KeyframeIndex object."""
+
+    def setUp(self):
+        self.index = KeyframeIndex.from_packets(PACKETS)
+
+    def test_from_packets(self):
+        self.assertEqual(self.index.times, [0.0, 2.0, 5.0])
+        self.assertEqual(self.index.gops, [3, 3, 4])
+        self.assertEqual(len(self.index), 3)
+        self.assertEqual(self.index.closed, [True, True, True])
+
+    def test_open_gop(self):
+        # a CRA keyframe followed by leading (RASL) pictures
+        index = KeyframeIndex.from_packets('0.000000,K__\n'
+                                           '0.040000,___\n'
+                                           '2.000000,K__\n'
+                                           '1.920000,___\n'
+                                           '1.960000,___\n'
+                                           '2.040000,___\n')
+        self.assertEqual(index.closed, [True, False])
+        self.assertEqual(index.closed_times(), [0.0])
+
+    def test_lookups(self):
+        self.assertEqual(self.index.before(4.9), 2.0)
+        self.assertEqual(self.index.before(5.0), 5.0)
+        self.assertEqual(self.index.after(2.1), 5.0)
+        self.assertIsNone(self.index.after(5.1))
+        self.assertEqual(self.index.nearest(3.4), 2.0)
+        self.assertEqual(self.index.nearest(3.6), 5.0)
+        self.assertEqual(self.index.between(1.0, 5.0), [2.0, 5.0])
+        self.assertIsNone(KeyframeIndex([]).nearest(1.0))
+
+    def test_stats(self):
+        stats = self.index.stats()
+        self.assertEqual(stats['keyframes'], 3)
+        self.assertEqual((stats['min'], stats['max'], stats['mean']),
+                         (2.0, 3.0, 2.5))
+        self.assertAlmostEqual(stats['mean_packets'], 10 / 3)
+        self.assertEqual(KeyframeIndex([1.0]).stats()['mean'], 0.0)
+
+    def test_json(self):
+        copy = KeyframeIndex.from_json(self.index.to_json())
+        self.assertEqual((copy.times, copy.gops, copy.closed),
+                         (self.index.times, self.index.gops,
+                          self.index.closed))
+        with self.assertRaises(ValueError):
+            KeyframeIndex.from_json('{"times": []}')
+        with self.assertRaises(ValueError):  # without closed GOPs
+            KeyframeIndex.from_json('{"times": [], "gops": []}')
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+# -*- coding: UTF-8 -*-
+
+# Porpose: Contains test cases for the make_filelog.py object.
+# Rev: 18.Oct.2026
+
+import sys
+import os.path
+import time
+import tempfile
+import unittest
+
+PATH = os.path.realpath(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(os.path.dirname(PATH)))
+
+try:
+    from videomass.vdms_io.make_filelog import LogWriter
+except ImportError as error:
+    sys.exit(error)
+
+# thresholds of LogWriter replaced by the tests
+LIMITS = ('FLUSH_SIZE', 'FLUSH_TIME', 'MAX_SIZE', 'IDLE_TIME')
+
+
+def wait_for(condition, timeout=5):
+    """
+    Polls `condition` until it returns True or `timeout`
+    seconds have elapsed, returns its last result.
+    """
+    end = time.monotonic() + timeout
+    while not condition() and time.monotonic() < end:
+        time.sleep(0.01)
+    return condition()
+
+
+class TestLogWriter(unittest.TestCase):
+    """Test case for the LogWriter object."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.saved = {name: getattr(LogWriter, name) for name in LIMITS}
+        LogWriter.FLUSH_TIME = 60.0  # no flush on time unless set
+        self.writer = LogWriter()
+        self.logfile = os.path.join(self.tmp.name, 'test.log')
+
+    def tearDown(self):
+        self.writer.flush(close=True)
+        for name, value in self.saved.items():
+            setattr(LogWriter, name, value)
+        self.tmp.cleanup()
+
+    def read(self, name=None):
+        try:
+            with open(name or self.logfile, 'r', encoding='utf-8') as fln:
+                return fln.read()
+        except OSError:
+            return None
+
+    def test_flush_on_size(self):
+        LogWriter.FLUSH_SIZE = 10
+        self.writer.write(self.logfile, 'abc')
+        time.sleep(0.2)
+        self.assertIsNone(self.read())  # still buffered
+        self.writer.write(self.logfile, 'x' * 10)
+        self.assertTrue(wait_for(lambda: self.read() == 'abc' + 'x' * 10))
+
+    def test_flush_on_time(self):
+        LogWriter.FLUSH_TIME = 0.05
+        self.writer.write(self.logfile, 'abc')
+        self.assertTrue(wait_for(lambda: self.read() == 'abc'))
+
+    def test_rotation(self):
+        LogWriter.MAX_SIZE = 10
+        self.writer.write(self.logfile, 'a' * 8)
+        self.writer.flush()
+        self.writer.write(self.logfile, 'b' * 8)
+        self.writer.flush()
+        self.assertEqual(self.read(f'{self.logfile}.1'), 'a' * 8)
+        self.assertEqual(self.read(), 'b' * 8)
+
+    def test_truncate(self):
+        self.writer.write(self.logfile, 'old')
+        self.writer.flush()
+        self.writer.write(self.logfile, 'new', mode='w')
+        self.writer.write(self.logfile, ' text')
+        self.writer.flush()
+        self.assertEqual(self.read(), 'new text')
+
+    def test_idle_restart(self):
+        LogWriter.FLUSH_TIME = 0.05
+        LogWriter.IDLE_TIME = 0.2
+        self.writer.write(self.logfile, 'a')
+        self.assertTrue(wait_for(lambda: self.writer.thread is None))
+        self.assertEqual(self.writer.files, {})  # handles closed
+        self.assertEqual(self.read(), 'a')
+        self.writer.write(self.logfile, 'b')
+        self.assertIsNotNone(self.writer.thread)
+        self.writer.flush()
+        self.assertEqual(self.read(), 'ab')
+
+    def test_write_error(self):
+        logfile = os.path.join(self.tmp.name, 'missing', 'test.log')
+        errors = []
+        self.writer.onerror = lambda name, err: errors.append(name)
+        self.writer.write(logfile, 'abc')
+        self.writer.flush()
+        self.writer.write(logfile, 'def')
+        self.writer.flush()
+        self.assertEqual(errors, [logfile])  # reported once
+        os.mkdir(os.path.dirname(logfile))
+        self.writer.flush()
+        self.assertEqual(self.read(logfile), 'abcdef')
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+# -*- coding: UTF-8 -*-
+
+# Porpose: Contains test cases for the media_import.py object.
+# Rev: 18.Oct.2026
+
+import sys
+import os.path
+import time
+import threading
+import unittest
+from unittest import mock
+
+PATH = os.path.realpath(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(os.path.dirname(PATH)))
+
+try:
+    from videomass.vdms_threads import media_import
+    from videomass.vdms_threads.media_import import MediaImport
+except ImportError as error:
+    sys.exit(error)
+
+APPSET = {'ffprobe_cmd': 'ffprobe', 'encoding': 'utf-8'}
+
+
+class TestMediaImport(unittest.TestCase):
+    """Test case for the MediaImport object."""
+
+    def setUp(self):
+        self.results = []
+        self.ended = []
+        self.probed = []
+        self.lock = threading.Lock()
+        app = mock.Mock(appset=APPSET)
+        for name, kwa in (('GetApp', {'return_value': app}),
+                          ('CallAfter', {'side_effect': self.call_after})):
+            patch = mock.patch.object(media_import.wx, name, **kwa)
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    @staticmethod
+    def call_after(func, *args):
+        func(*args)
+
+    def onresult(self, path, data, error):
+        self.results.append((path, data, error))
+
+    def onend(self, cancelled, rejected):
+        self.ended.append(cancelled)
+        self.rejected = rejected
+
+    def probe(self, filename, cmd, txtenc):
+        """
+        Probe replacement, the lower the number in the
+        file name, the later the result.
+        """
+        with self.lock:
+            self.probed.append(filename)
+        time.sleep((10 - int(filename[1:])) * 0.01)
+        return {'format': {'filename': filename}}, None
+
+    def test_order(self):
+        paths = [f'f{num}' for num in range(10)]
+        with mock.patch.object(media_import, 'probe_media', self.probe):
+            thread = MediaImport(iter(paths), self.onresult, self.onend,
+                                 workers=4)
+            thread.join(10)
+        self.assertEqual([res[0] for res in self.results], paths)
+        self.assertEqual(self.results[3][1], {'format': {'filename': 'f3'}})
+        self.assertEqual(self.ended, [False])
+        self.assertEqual(self.rejected, [])
+
+    def test_rejected(self):
+        rejected = []
+
+        def paths():
+            for num in range(4):
+                if num % 2:
+                    rejected.append((f'f{num}', 'filtered'))
+                else:
+                    yield f'f{num}'
+
+        with mock.patch.object(media_import, 'probe_media', self.probe):
+            thread = MediaImport(paths(), self.onresult, self.onend,
+                                 rejected=rejected)
+            thread.join(10)
+        self.assertEqual([res[0] for res in self.results], ['f0', 'f2'])
+        self.assertIs(self.rejected, rejected)
+        self.assertEqual(rejected, [('f1', 'filtered'), ('f3', 'filtered')])
+
+    def test_order_batch(self):
+        paths = [f'f{num % 10}' for num in range(media_import.BATCH * 2)]
+        with mock.patch.object(media_import, 'probe_media', self.probe):
+            thread = MediaImport(paths, self.onresult, self.onend,
+                                 workers=8)
+            thread.join(10)
+        self.assertEqual([res[0] for res in self.results], paths)
+
+    def test_cancel(self):
+        paths = [f'f{num}' for num in range(20)]
+        with mock.patch.object(media_import, 'probe_media', self.probe):
+            thread = MediaImport(paths, self.onresult, self.onend,
+                                 workers=1)
+            while not self.probed:
+                time.sleep(0.01)
+            thread.stop()
+            thread.join(10)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(self.ended, [True])
+        self.assertLess(len(self.probed), len(paths))  # futures cancelled
+        self.assertLessEqual(len(self.results), len(self.probed))
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
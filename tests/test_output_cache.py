@@ -0,0 +1,113 @@
+# -*- coding: UTF-8 -*-
+
+# Porpose: Contains test cases for the output_cache.py object.
+# Rev: 18.Oct.2026
+
+import sys
+import os.path
+import tempfile
+import unittest
+
+PATH = os.path.realpath(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(os.path.dirname(PATH)))
+
+try:
+    from videomass.vdms_io.output_cache import (OutputCache,
+                                                place_output,
+                                                unshare_output,
+                                                )
+except ImportError as error:
+    sys.exit(error)
+
+CMD = ('"ffmpeg" -i "{SOURCE}" -c:v libx264 "{OUTPUT}"',)
+
+
+class TestOutputCache(unittest.TestCase):
+    """Test case for the OutputCache object."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = OutputCache()
+        dbpath = os.path.join(self.tmp.name, 'output_cache.db')
+        self.assertIsNone(self.cache.open(dbpath))
+        self.source = self.path('source.mkv', 'source')
+        self.output = self.path('output.mp4', 'encoded')
+
+    def tearDown(self):
+        self.cache.conn.close()
+        self.tmp.cleanup()
+
+    def path(self, name, text=None):
+        name = os.path.join(self.tmp.name, name)
+        if text is not None:
+            with open(name, 'w', encoding='utf-8') as fname:
+                fname.write(text)
+        return name
+
+    def fprint(self, source=None, dest='out.mkv', cmd=CMD,
+               version='ffmpeg 7.1', store=None):
+        return self.cache.fingerprint(source or self.source, dest, cmd,
+                                      version, store)
+
+    def test_fingerprint(self):
+        fprint = self.fprint()
+        self.assertEqual(fprint, self.fprint())
+        self.assertNotEqual(fprint, self.fprint(version='ffmpeg 7.0'))
+        self.assertNotEqual(fprint, self.fprint(cmd=CMD + ('',)))
+        self.assertIsNone(self.fprint(source=self.path('none.mkv')))
+
+    def test_fingerprint_container(self):
+        self.assertNotEqual(self.fprint(dest='/a/out.mkv'),
+                            self.fprint(dest='/a/out.mp4'))
+        self.assertEqual(self.fprint(dest='/a/out.MKV'),
+                         self.fprint(dest='/b/other.mkv'))
+
+    def test_fingerprint_content(self):
+        store = {}
+
+        class Store:
+            """A dict with the ProbeCache interface."""
+            def get(self, filename, variant):
+                return store.get((filename, variant))
+
+            def put(self, filename, variant, data):
+                store[(filename, variant)] = data
+
+        fprint = self.fprint(store=Store())
+        self.assertEqual(len(store), 1)  # the digest is stored
+        self.assertNotEqual(fprint, self.fprint())
+        os.utime(self.source, ns=(0, 0))  # same content, other time
+        self.assertEqual(fprint, self.fprint(store=Store()))
+
+    def test_lookup_record(self):
+        fprint = self.fprint()
+        self.assertIsNone(self.cache.lookup(fprint))
+        self.cache.record(fprint, self.output)
+        self.assertEqual(self.cache.lookup(fprint), self.output)
+        self.path('output.mp4', 'modified')
+        self.assertIsNone(self.cache.lookup(fprint))
+
+    def test_place_output(self):
+        dest = self.path('copy.mp4')
+        self.assertIsNone(place_output(self.output, dest))
+        self.assertIsNone(place_output(self.output, dest))
+        with open(dest, encoding='utf-8') as fname:
+            self.assertEqual(fname.read(), 'encoded')
+        self.assertEqual(os.stat(self.output).st_nlink, 1)  # not a link
+
+    def test_unshare_output(self):
+        dest = self.path('link.mp4')
+        os.link(self.output, dest)
+        unshare_output(dest)
+        self.assertFalse(os.path.exists(dest))
+        self.assertTrue(os.path.exists(self.output))
+        unshare_output(self.output)  # not shared
+        self.assertTrue(os.path.exists(self.output))
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+# -*- coding: UTF-8 -*-
+
+# Porpose: Contains test cases for the peak_pyramid.py object.
+# Rev: 18.Oct.2026
+
+import sys
+import os.path
+import struct
+import tempfile
+import unittest
+
+PATH = os.path.realpath(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(os.path.dirname(PATH)))
+
+try:
+    from videomass.vdms_utils.peak_pyramid import (PeakPyramid,
+                                                   block_peaks,
+                                                   halve,
+                                                   )
+    from videomass.vdms_io.peak_cache import PeakCache
+except ImportError as error:
+    sys.exit(error)
+
+
+def pcm(samples):
+    """Packs a list of samples as s16le bytes."""
+    return struct.pack(f'<{len(samples)}h', *samples)
+
+
+class TestPeaks(unittest.TestCase):
+    """Test case for the block reduction."""
+
+    def test_block_peaks(self):
+        data = pcm([1, -5, 3, 7, -2, 0, 4, -1])
+        self.assertEqual(block_peaks(data, 4), ([-5, -2], [7, 4]))
+
+    def test_halve_odd(self):
+        mins, maxs = halve([-1, -4, -2], [1, 3, 2])
+        self.assertEqual((list(mins), list(maxs)), ([-4, -2], [3, 2]))
+
+
+class TestPeakPyramid(unittest.TestCase):
+    """Test case for the PeakPyramid object."""
+
+    def setUp(self):
+        mins = [-100 * (n % 7) for n in range(1000)]
+        maxs = [100 * (n % 11) for n in range(1000)]
+        self.pyramid = PeakPyramid(mins, maxs, rate=1000, block=10)
+
+    def test_levels(self):
+        self.assertEqual(self.pyramid.bins, 1000)
+        self.assertEqual(self.pyramid.duration, 10.0)
+        self.assertEqual(len(self.pyramid.levels[-1][0]), 1)
+        self.assertEqual(self.pyramid.levels[-1][0][0], -600)
+        self.assertEqual(self.pyramid.levels[-1][1][0], 1000)
+
+    def test_peaks_widths(self):
+        for width in (1, 37, 500, 1000, 3000):
+            peaks = self.pyramid.peaks(width)
+            self.assertEqual(len(peaks), width)
+        low, high = self.pyramid.peaks(1)[0]
+        self.assertEqual((low, high), (-600 / 32768, 1000 / 32768))
+
+    def test_peaks_range(self):
+        # one column for each base bin of the first second
+        peaks = self.pyramid.peaks(100, 0.0, 1.0)
+        self.assertEqual(peaks[3], (-300 / 32768, 300 / 32768))
+        # beyond the end of the waveform
+        self.assertEqual(self.pyramid.peaks(2, 10.0, 20.0)[1], (0.0, 0.0))
+
+    def test_bytes(self):
+        data = self.pyramid.to_bytes()
+        copy = PeakPyramid.from_bytes(data)
+        self.assertEqual(copy.levels, self.pyramid.levels)
+        self.assertEqual((copy.rate, copy.block), (1000, 10))
+        with self.assertRaises(ValueError):
+            PeakPyramid.from_bytes(data[:-2])
+        with self.assertRaises(ValueError):
+            PeakPyramid.from_bytes(b'PNG')
+
+
+class TestPeakCache(unittest.TestCase):
+    """Test case for the PeakCache object."""
+
+    def test_read_write(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, 'source.wav')
+            with open(source, 'wb') as fname:
+                fname.write(b'audio')
+            cache = PeakCache()
+            self.assertIsNone(cache.key(source, 'variant'))
+            cache.open(os.path.join(tmp, 'waveform'))
+            key = cache.key(source, 'variant')
+            self.assertIsNone(cache.read(key))
+            cache.write(key, b'peaks')
+            self.assertEqual(cache.read(key), b'peaks')
+            self.assertNotEqual(cache.key(source, 'other'), key)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
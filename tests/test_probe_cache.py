@@ -0,0 +1,65 @@
+# -*- coding: UTF-8 -*-
+
+# Porpose: Contains test cases for the probe_cache.py object.
+# Rev: 18.Oct.2026
+
+import sys
+import os.path
+import tempfile
+import unittest
+
+PATH = os.path.realpath(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(os.path.dirname(PATH)))
+
+try:
+    from videomass.vdms_io.probe_cache import ProbeCache
+except ImportError as error:
+    sys.exit(error)
+
+
+class TestProbeCache(unittest.TestCase):
+    """Test case for the ProbeCache object."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ProbeCache()
+        dbpath = os.path.join(self.tmp.name, 'probe_cache.db')
+        self.assertIsNone(self.cache.open(dbpath, maxentries=2))
+        self.files = []
+        for num in range(3):
+            name = os.path.join(self.tmp.name, f'media{num}.mkv')
+            with open(name, 'w', encoding='utf-8') as fname:
+                fname.write('data')
+            self.files.append(name)
+
+    def tearDown(self):
+        self.cache.conn.close()
+        self.tmp.cleanup()
+
+    def test_get_put(self):
+        self.assertIsNone(self.cache.get(self.files[0], '-v error'))
+        self.cache.put(self.files[0], '-v error', '{}')
+        self.assertEqual(self.cache.get(self.files[0], '-v error'), '{}')
+        self.assertIsNone(self.cache.get(self.files[0], '-v info'))
+
+    def test_modified_file(self):
+        self.cache.put(self.files[0], '', '{}')
+        with open(self.files[0], 'a', encoding='utf-8') as fname:
+            fname.write('more data')
+        self.assertIsNone(self.cache.get(self.files[0]))
+
+    def test_eviction_and_clear(self):
+        for name in self.files:
+            self.cache.put(name, '', name)
+        self.assertIsNone(self.cache.get(self.files[0]))
+        self.assertEqual(self.cache.get(self.files[2]), self.files[2])
+        self.cache.clear()
+        self.assertIsNone(self.cache.get(self.files[2]))
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+# -*- coding: UTF-8 -*-
+
+# Porpose: Contains test cases for the queue_store.py object.
+# Rev: 18.Oct.2026
+
+import sys
+import os.path
+import json
+import tempfile
+import unittest
+
+PATH = os.path.realpath(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(os.path.dirname(PATH)))
+
+try:
+    from videomass.vdms_utils.queue_store import QueueStore
+except ImportError as error:
+    sys.exit(error)
+
+
+def item(dest, args='-c copy'):
+    """Returns a minimal queue item"""
+    return {'destination': dest, 'args': [args, '']}
+
+
+class TestQueueStore(unittest.TestCase):
+    """Test case for the QueueStore object."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.qfile = os.path.join(self.tmp.name, 'queue.backup')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_put_and_load(self):
+        store = QueueStore(self.qfile)
+        self.assertFalse(store.put(item('a.mkv')))
+        self.assertFalse(store.put(item('b.mkv')))
+        self.assertTrue(store.put(item('a.mkv', '-c:v libx264')))
+        self.assertEqual(store.find('b.mkv'), 1)
+        with open(self.qfile, encoding='utf-8') as fln:
+            self.assertEqual(len(fln.readlines()), 3)  # appended only
+
+        loaded = QueueStore(self.qfile)
+        self.assertEqual(loaded.load(), [item('a.mkv', '-c:v libx264'),
+                                         item('b.mkv')])
+
+    def test_save_after_changes(self):
+        store = QueueStore(self.qfile)
+        for name in ('a.mkv', 'b.mkv', 'c.mkv'):
+            store.put(item(name))
+        store.items.pop(0)
+        self.assertEqual(store.find('c.mkv'), 1)
+        store.save()
+        self.assertEqual(QueueStore(self.qfile).load(),
+                         [item('b.mkv'), item('c.mkv')])
+
+    def test_legacy_and_truncated(self):
+        with open(self.qfile, 'w', encoding='utf-8') as fln:
+            json.dump([item('a.mkv'), item('b.mkv')], fln, indent=4)
+        self.assertEqual(len(QueueStore(self.qfile).load()), 2)
+        with open(self.qfile, 'w', encoding='utf-8') as fln:
+            fln.write(json.dumps(item('a.mkv')) + '\n{"destina')
+        self.assertEqual(QueueStore(self.qfile).load(), [item('a.mkv')])
+
+    def test_clear(self):
+        store = QueueStore(self.qfile)
+        store.put(item('a.mkv'))
+        store.clear()
+        self.assertFalse(store.exists())
+        self.assertEqual(store.items, [])
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+# -*- coding: UTF-8 -*-
+
+# Porpose: Contains test cases for the scan_folder and allowed_file
+#          functions of media_import.py.
+# Rev: 18.Oct.2026
+
+import sys
+import os.path
+import tempfile
+import unittest
+
+PATH = os.path.realpath(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(os.path.dirname(PATH)))
+
+try:
+    from videomass.vdms_threads.media_import import allowed_file, scan_folder
+except ImportError as error:
+    sys.exit(error)
+
+
+class TestAllowedFile(unittest.TestCase):
+    """Test case for the allowed_file function."""
+
+    def test_extension_case(self):
+        self.assertTrue(allowed_file('A.MKV', ['mkv']))
+        self.assertTrue(allowed_file('b.mp4', ['MP4']))
+        self.assertFalse(allowed_file('c.mkv.txt', ['mkv']))
+        self.assertFalse(allowed_file('mkv', ['mkv']))  # no extension
+
+    def test_mime_fallback(self):
+        self.assertTrue(allowed_file('a.MP4', ['mkv', 'video/*']))
+        self.assertTrue(allowed_file('b.wav', ['Audio/*']))
+        self.assertFalse(allowed_file('c.txt', ['video/*', 'audio/*']))
+        self.assertFalse(allowed_file('d.xyz123', ['video/*']))
+
+
+class TestScanFolder(unittest.TestCase):
+    """Test case for the scan_folder generator."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.top = self.tmp.name
+        self.rejects = []
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def reject(self, path, reason):
+        self.rejects.append((os.path.relpath(path, self.top), reason))
+
+    def touch(self, *names):
+        for name in names:
+            path = os.path.join(self.top, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8'):
+                pass
+
+    def scan(self, allowlist=('mkv',)):
+        return [os.path.relpath(path, self.top) for path in
+                scan_folder(self.top, list(allowlist), self.reject)]
+
+    def test_sorted_recursive(self):
+        self.touch('b.mkv', 'a.MKV', os.path.join('sub', 'c.mkv'),
+                   'd.txt')
+        self.assertEqual(self.scan(), ['a.MKV', 'b.mkv',
+                                       os.path.join('sub', 'c.mkv')])
+        self.assertEqual(self.rejects, [('d.txt', 'filtered')])
+
+    def test_hidden(self):
+        self.touch('.a.mkv', os.path.join('.hidden', 'b.mkv'), 'c.mkv')
+        self.assertEqual(self.scan(), ['c.mkv'])
+        self.assertEqual(sorted(self.rejects), [('.a.mkv', 'hidden'),
+                                                ('.hidden', 'hidden')])
+
+    def test_symlink_loop(self):
+        self.touch(os.path.join('sub', 'a.mkv'))
+        os.symlink(self.top, os.path.join(self.top, 'sub', 'loop'))
+        os.symlink('missing.mkv', os.path.join(self.top, 'broken.mkv'))
+        self.assertEqual(self.scan(), [os.path.join('sub', 'a.mkv')])
+        self.assertEqual(self.rejects,
+                         [('broken.mkv', 'unreadable'),
+                          (os.path.join('sub', 'loop'), 'unreadable')])
+
+    def test_unreadable(self):
+        missing = os.path.join(self.top, 'missing')
+        self.assertEqual(list(scan_folder(missing, ['mkv'], self.reject)),
+                         [])
+        self.assertEqual(self.rejects, [('missing', 'unreadable')])
+
+    @unittest.skipIf(not hasattr(os, 'geteuid') or os.geteuid() == 0,
+                     'permissions are not enforced')
+    def test_unreadable_subdir(self):
+        self.touch(os.path.join('sub', 'a.mkv'), 'b.mkv')
+        sub = os.path.join(self.top, 'sub')
+        os.chmod(sub, 0)
+        try:
+            self.assertEqual(self.scan(), ['b.mkv'])
+        finally:
+            os.chmod(sub, 0o755)
+        self.assertEqual(self.rejects, [('sub', 'unreadable')])
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+# -*- coding: UTF-8 -*-
+
+# Porpose: Contains test cases for the smart_cut.py object.
+# Rev: 18.Oct.2026
+
+import sys
+import os.path
+import unittest
+
+PATH = os.path.realpath(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(os.path.dirname(PATH)))
+
+try:
+    from videomass.vdms_threads.smart_cut import (is_stream_copy,
+                                                  cut_range,
+                                                  smart_cut_plan,
+                                                  encoder_args,
+                                                  piece_args,
+                                                  cut_points,
+                                                  decode_check,
+                                                  )
+except ImportError as error:
+    sys.exit(error)
+
+KEYFRAMES = [0.0, 2.0, 4.0, 6.0, 8.0, 10.0]
+
+
+class TestSmartCut(unittest.TestCase):
+    """Test case for the smart cut helpers."""
+
+    def test_is_stream_copy(self):
+        self.assertTrue(is_stream_copy('-map 0:v? -c:v copy -c:a aac'))
+        self.assertFalse(is_stream_copy('-c:v libx264 -c:a copy'))
+
+    def test_cut_range(self):
+        self.assertEqual(cut_range('-ss 00:00:01.500', '-t 00:00:07.000'),
+                         (1.5, 8.5))
+        self.assertIsNone(cut_range('', ''))
+
+    def test_plan(self):
+        self.assertEqual(smart_cut_plan(KEYFRAMES, 1.5, 8.5),
+                         [('encode', 1.5, 2.0), ('copy', 2.0, 8.0),
+                          ('encode', 8.0, 8.5)])
+
+    def test_plan_on_keyframes(self):
+        self.assertEqual(smart_cut_plan(KEYFRAMES, 2.0, 7.5),
+                         [('copy', 2.0, 6.0), ('encode', 6.0, 7.5)])
+        self.assertEqual(smart_cut_plan(KEYFRAMES, 1.0, 6.0),
+                         [('encode', 1.0, 2.0), ('copy', 2.0, 6.0)])
+
+    def test_plan_inside_a_gop(self):
+        self.assertIsNone(smart_cut_plan(KEYFRAMES, 2.5, 3.5))
+        self.assertIsNone(smart_cut_plan(KEYFRAMES, 1.5, 2.5))
+
+    def test_encoder_args(self):
+        stream = {'codec_name': 'h264', 'profile': 'High',
+                  'pix_fmt': 'yuv420p'}
+        args = encoder_args(stream)
+        self.assertIn('-c:v libx264', args)
+        self.assertIn('-profile:v high', args)
+        self.assertIn('-pix_fmt yuv420p', args)
+        self.assertIsNone(encoder_args({'codec_name': 'vp9'}))
+
+    def test_piece_args(self):
+        self.assertEqual(piece_args({'codec_name': 'hevc'}),
+                         '-bsf:v hevc_mp4toannexb -f mpegts')
+        self.assertIsNone(piece_args({'codec_name': 'vp9'}))
+
+    def test_cut_points(self):
+        self.assertEqual(cut_points([('encode', 1.5, 2.0),
+                                     ('copy', 2.0, 8.0),
+                                     ('encode', 8.0, 8.5)]), [0.5, 6.5])
+        self.assertEqual(cut_points([('copy', 2.0, 6.0)]), [])
+
+    def test_decode_check(self):
+        self.assertIsNone(decode_check('video.mp4', []))
+        self.assertTrue(decode_check('video.mp4', [1.0],
+                                     cmd='/nonexistent/ffmpeg'))
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
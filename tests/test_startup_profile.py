@@ -0,0 +1,54 @@
+# -*- coding: UTF-8 -*-
+
+# Porpose: Contains test cases for the startup_profile.py object.
+# Rev: 18.Oct.2026
+
+import sys
+import os.path
+import unittest
+
+PATH = os.path.realpath(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(os.path.dirname(PATH)))
+
+try:
+    from videomass.vdms_sys.startup_profile import StartupProfile
+except ImportError as error:
+    sys.exit(error)
+
+
+class TestStartupProfile(unittest.TestCase):
+    """Test case for the StartupProfile object."""
+
+    def test_nested_spans(self):
+        prof = StartupProfile()
+        with prof.span('outer'):
+            with prof.span('inner'):
+                pass
+        prof.mark('done')
+        self.assertEqual([(d, label) for d, label, _ in prof.spans],
+                         [(0, 'outer'), (1, 'inner'), (0, '@ done')])
+        self.assertGreaterEqual(prof.spans[0][2], prof.spans[1][2])
+        self.assertEqual(prof.depth, 0)
+
+    def test_span_on_error(self):
+        prof = StartupProfile()
+        with self.assertRaises(ValueError):
+            with prof.span('failing'):
+                raise ValueError
+        self.assertEqual(prof.depth, 0)
+
+    def test_lines(self):
+        prof = StartupProfile()
+        with prof.span('import'):
+            pass
+        rows = prof.lines()
+        self.assertTrue(rows[1].endswith('  import'))
+        self.assertTrue(rows[-1].startswith('Videomass modules loaded:'))
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
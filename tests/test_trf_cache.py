@@ -0,0 +1,87 @@
+# -*- coding: UTF-8 -*-
+
+# Porpose: Contains test cases for the trf_cache.py object.
+# Rev: 18.Oct.2026
+
+import sys
+import os.path
+import tempfile
+import unittest
+
+PATH = os.path.realpath(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(os.path.dirname(PATH)))
+
+try:
+    from videomass.vdms_io.trf_cache import TransformCache, detect_filter
+except ImportError as error:
+    sys.exit(error)
+
+ARGS = ('-vf vidstabdetect=shakiness=5:accuracy=15:result=transforms.trf'
+        ',vidstabtransform=smoothing=15 -an')
+
+
+class TestTransformCache(unittest.TestCase):
+    """Test case for the TransformCache object."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = TransformCache()
+        cachedir = os.path.join(self.tmp.name, 'vidstab')
+        self.assertIsNone(self.cache.open(cachedir, maxsize=10))
+        self.source = os.path.join(self.tmp.name, 'media.mkv')
+        with open(self.source, 'w', encoding='utf-8') as fname:
+            fname.write('data')
+        self.trf = os.path.join(self.tmp.name, 'transforms.trf')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_trf(self, text):
+        with open(self.trf, 'w', encoding='utf-8') as fname:
+            fname.write(text)
+
+    def test_detect_filter(self):
+        self.assertEqual(detect_filter(ARGS), 'vidstabdetect=shakiness=5:'
+                         'accuracy=15:result=transforms.trf')
+        self.assertIsNone(detect_filter('-vf scale=640:-1'))
+
+    def test_key(self):
+        key = self.cache.key(self.source, detect_filter(ARGS), '-ss 10')
+        self.assertEqual(key, self.cache.key(self.source,
+                                             detect_filter(ARGS), '-ss  10'))
+        self.assertNotEqual(key, self.cache.key(self.source,
+                                                detect_filter(ARGS), ''))
+        self.assertIsNone(self.cache.key(self.source, None))
+        self.assertIsNone(TransformCache().key(self.source, 'vidstabdetect'))
+
+    def test_fetch_store(self):
+        key = self.cache.key(self.source, 'vidstabdetect')
+        self.assertFalse(self.cache.fetch(key, self.trf))
+        self.write_trf('12345')
+        self.cache.store(key, self.trf)
+        os.remove(self.trf)
+        self.assertTrue(self.cache.fetch(key, self.trf))
+        with open(self.trf, encoding='utf-8') as fname:
+            self.assertEqual(fname.read(), '12345')
+
+    def test_eviction_and_clear(self):
+        keys = [self.cache.key(self.source, f'vidstabdetect={n}')
+                for n in range(3)]
+        for num, key in enumerate(keys):
+            self.write_trf('1234')
+            self.cache.store(key, self.trf)
+            os.utime(os.path.join(self.cache.dirpath, f'{key}.trf'),
+                     (num, num))
+        self.cache.evict()
+        self.assertFalse(self.cache.fetch(keys[0], self.trf))
+        self.assertTrue(self.cache.fetch(keys[2], self.trf))
+        self.cache.clear()
+        self.assertFalse(self.cache.fetch(keys[2], self.trf))
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
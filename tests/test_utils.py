@@ -1,10 +1,12 @@
 # -*- coding: UTF-8 -*-
 
 # Porpose: Contains test cases for the utils.py object.
-# Rev: 07.Feb.2024
+# Rev: 18.Oct.2026
 
 import sys
 import os.path
+import hashlib
+import tempfile
 import unittest
 
 PATH = os.path.realpath(os.path.abspath(__file__))
@@ -15,6 +17,11 @@ try:
                                             to_bytes,
                                             time_to_integer,
                                             integer_to_time,
+                                            sampled_digest,
+                                            fingerprint,
+                                            content_digest,
+                                            DigestThread,
+                                            stored_digest,
                                             )
 except ImportError as error:
     sys.exit(error)
@@ -100,6 +107,69 @@ class TestTimeHuman(unittest.TestCase):
                                          mills=False), '02:30:50')
 
 
+class TestFingerprint(unittest.TestCase):
+    """Test case for the file fingerprinting functions."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp.name, 'media.mkv')
+        self.data = bytes(range(256)) * 4096  # 1 MiB
+        with open(self.filename, 'wb') as fname:
+            fname.write(self.data)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def overwrite(self, offset, data):
+        with open(self.filename, 'r+b') as fname:
+            fname.seek(offset)
+            fname.write(data)
+
+    def test_sampled_digest(self):
+        digest = sampled_digest(self.filename, samples=2, blocksize=4096)
+        self.overwrite(8192, b'x')  # not sampled
+        self.assertEqual(digest, sampled_digest(self.filename, samples=2,
+                                                blocksize=4096))
+        self.overwrite(len(self.data) - 1, b'x')  # tail
+        self.assertNotEqual(digest, sampled_digest(self.filename,
+                                                   samples=2,
+                                                   blocksize=4096))
+
+    def test_small_file(self):
+        small = os.path.join(self.tmp.name, 'small.txt')
+        with open(small, 'wb') as fname:
+            fname.write(b'abc')
+        self.assertEqual(sampled_digest(small),
+                         hashlib.blake2b(b'3abc', digest_size=16).hexdigest())
+
+    def test_fingerprint(self):
+        fprint = fingerprint(self.filename)
+        self.assertEqual(fprint, fingerprint(self.filename))
+        stat = os.stat(self.filename)
+        self.overwrite(0, b'x')
+        os.utime(self.filename, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertNotEqual(fprint, fingerprint(self.filename))
+
+    def test_content_digest(self):
+        self.assertEqual(content_digest(self.filename, blocksize=1000),
+                         hashlib.blake2b(self.data,
+                                         digest_size=16).hexdigest())
+        store = {}
+
+        class Store:
+            """A dict with the ProbeCache interface."""
+            def get(self, filename, variant):
+                return store.get((filename, variant))
+
+            def put(self, filename, variant, data):
+                store[(filename, variant)] = data
+
+        thread = DigestThread([self.filename], Store())
+        thread.join()
+        self.assertEqual(stored_digest(self.filename, Store()),
+                         content_digest(self.filename))
+
+
 def main():
     unittest.main()
 
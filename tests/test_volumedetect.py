@@ -0,0 +1,111 @@
+# -*- coding: UTF-8 -*-
+
+# Porpose: Contains test cases for the volumedetect.py object.
+# Rev: 18.Oct.2026
+
+import sys
+import os.path
+import time
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+PATH = os.path.realpath(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(os.path.dirname(PATH)))
+
+try:
+    from videomass.vdms_threads import volumedetect
+    from videomass.vdms_threads.volumedetect import (VolumeDetectThread,
+                                                     volume_workers,
+                                                     )
+    from videomass.vdms_threads.audio_analysis import AudioStats
+except ImportError as error:
+    sys.exit(error)
+
+
+class TestVolumeWorkers(unittest.TestCase):
+    """Test case for the volume_workers function."""
+
+    def test_clamping(self):
+        self.assertEqual(volume_workers({'volumedetect_jobs': 4}, 10), 4)
+        self.assertEqual(volume_workers({'volumedetect_jobs': 4}, 2), 2)
+        self.assertEqual(volume_workers({'volumedetect_jobs': 4}, 0), 1)
+        with mock.patch.object(volumedetect.os, 'cpu_count',
+                               return_value=6):
+            self.assertEqual(volume_workers({}, 10), 6)
+            self.assertEqual(volume_workers({'volumedetect_jobs': -1},
+                                            3), 3)
+        with mock.patch.object(volumedetect.os, 'cpu_count',
+                               return_value=None):
+            self.assertEqual(volume_workers({}, 10), 1)
+
+
+class TestVolumeDetectThread(unittest.TestCase):
+    """Test case for the pool of VolumeDetectThread, with a stubbed
+    analysis of the files."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.appset = {'logdir': self.tmp.name, 'volumedetect_jobs': 3}
+        self.running = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+        app = mock.Mock(appset=self.appset)
+        for name, kwa in (('GetApp', {'return_value': app}),
+                          ('CallAfter', {})):
+            patch = mock.patch.object(volumedetect.wx, name, **kwa)
+            patch.start()
+            self.addCleanup(patch.stop)
+        patch = mock.patch('builtins._', str, create=True)  # gettext
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def detect(self, thread, files):
+        """
+        Replaces VolumeDetectThread.detect: the files are
+        numbers, the higher the number the earlier the result.
+        The 'error' file fails.
+        """
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(0.02 if files == 'error' else (10 - int(files)) * 0.01)
+        with self.lock:
+            self.running -= 1
+        if files == 'error':
+            return AudioStats(), 'ERROR'
+        return AudioStats(max_volume=f'-{files}.0 dB'), None
+
+    def run_detect(self, files):
+        with mock.patch.object(VolumeDetectThread, 'start'), \
+                mock.patch.object(VolumeDetectThread, 'detect',
+                                  autospec=True, side_effect=self.detect):
+            thread = VolumeDetectThread(('', ''), files, '')
+            thread.run()
+        return thread.data
+
+    def test_ordered_results(self):
+        files = [str(num) for num in range(8)]
+        volume, status = self.run_detect(files)
+        self.assertIsNone(status)
+        self.assertEqual([rec.max_volume for rec in volume],
+                         [f'-{num}.0 dB' for num in files])
+        self.assertLessEqual(self.peak, 3)
+
+    def test_error(self):
+        self.appset['volumedetect_jobs'] = 1
+        volume, status = self.run_detect(['1', 'error', '2', '3'])
+        self.assertEqual((volume, status), ([], 'ERROR'))
+        self.assertEqual(self.peak, 1)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -6,7 +6,7 @@ Compatibility: Python3, wxPython Phoenix
 Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
 Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
 license: GPL3
-Rev: July.10.2025
+Rev: Oct.18.2026
 Code checker: flake8, pylint
 
 This file is part of Videomass.
@@ -26,8 +26,9 @@ This file is part of Videomass.
 """
 import os
 import sys
-from shutil import which, rmtree
+from shutil import rmtree
 import builtins
+from videomass.vdms_sys.startup_profile import STARTUP
 import wx
 try:
     from wx.svg import SVGimage
@@ -37,6 +38,13 @@ from videomass.vdms_sys.argparser import arguments
 from videomass.vdms_sys.configurator import DataSource
 from videomass.vdms_sys import app_const as appC
 from videomass.vdms_utils.utils import del_filecontents
+from videomass.vdms_io.make_filelog import flush_logs
+from videomass.vdms_io.probe_cache import PROBECACHE
+from videomass.vdms_io.trf_cache import TRFCACHE
+from videomass.vdms_io.peak_cache import PEAKCACHE
+from videomass.vdms_io.filmstrip_cache import FILMSTRIPCACHE
+from videomass.vdms_io.output_cache import OUTPUTCACHE
+from videomass.vdms_threads.ff_capabilities import FFCAPS, binary_key
 # from videomass.vdms_sys.external_package import importer_init_file
 
 # add translation macro to builtin similar to what gettext does
@@ -64,6 +72,7 @@ class Videomass(wx.App):
 
         """
         self.locale = None
+        self.ffmpeg_key = None  # see `check_ffmpeg`
         self.appset = {'DISPLAY_SIZE': None,
                        'IS_DARK_THEME': None,
                        'GETLANG': None,
@@ -71,8 +80,9 @@ class Videomass(wx.App):
                        'SUPP_LANGs': ['it_IT', 'en_US', 'ru_RU'],
                        # supported langs for online help (user guide)
                        }
-        self.data = DataSource(kwargs)  # instance data
-        self.appset.update(self.data.get_configuration())  # data system
+        with STARTUP.span('configuration'):
+            self.data = DataSource(kwargs)  # instance data
+            self.appset.update(self.data.get_configuration())  # data system
         self.iconset = None
 
         wx.App.__init__(self, redirect, filename)  # constructor
@@ -93,35 +103,65 @@ class Videomass(wx.App):
             self.appset['IS_DARK_THEME'] = appear.IsDark()
 
         self.iconset = self.data.icons_set(self.appset['icontheme'])
+        with STARTUP.span('open caches'):
+            PROBECACHE.open(os.path.join(self.appset['confdir'],
+                                         'probe_cache.db'))
+            TRFCACHE.open(os.path.join(self.appset['cachedir'], 'vidstab'))
+            PEAKCACHE.open(os.path.join(self.appset['cachedir'], 'waveform'))
+            FILMSTRIPCACHE.open(os.path.join(self.appset['cachedir'],
+                                             'filmstrip'))
+            OUTPUTCACHE.open(os.path.join(self.appset['confdir'],
+                                          'output_cache.db'))
 
         # locale
-        wx.Locale.AddCatalogLookupPathPrefix(self.appset['localepath'])
-        self.update_language(self.appset['locale_name'])
+        with STARTUP.span('locale'):
+            wx.Locale.AddCatalogLookupPathPrefix(self.appset['localepath'])
+            self.update_language(self.appset['locale_name'])
 
         if self.check_ffmpeg():
             self.wizard(self.iconset['videomass'])
             return True
-
-        from videomass.vdms_main.main_frame import MainFrame
-        main_frame = MainFrame(self.appset)
-        main_frame.Show()
+        with STARTUP.span('FFmpeg capabilities'):
+            FFCAPS.open(os.path.join(self.appset['confdir'],
+                                     'ffmpeg_caps.json'),
+                        self.appset['ffmpeg_cmd'], self.appset['ostype'],
+                        key=self.ffmpeg_key)
+
+        with STARTUP.span('import main_frame'):
+            from videomass.vdms_main.main_frame import MainFrame
+        with STARTUP.span('build MainFrame'):
+            main_frame = MainFrame(self.appset)
+            main_frame.Show()
         self.SetTopWindow(main_frame)
+        wx.CallAfter(self.startup_done)
         return True
     # -------------------------------------------------------------------
 
+    @staticmethod
+    def startup_done():
+        """
+        Called by the main loop once the main frame is shown,
+        prints the start-up profile if requested.
+        """
+        STARTUP.mark('main loop started')
+        STARTUP.report()
+    # -------------------------------------------------------------------
+
     def check_ffmpeg(self):
         """
         Check the FFmpeg's executables (ffmpeg, ffprobe, ffplay).
         Returns True if one of the executables is missing or if
         one of the executables doesn't have execute permission.
-        Returns None otherwise.
+        Returns None otherwise. The `binary_key` of ffmpeg is
+        kept to validate the FFmpeg capabilities map.
         """
-        for link in [self.appset['ffmpeg_cmd'],
-                     self.appset['ffprobe_cmd'],
-                     self.appset['ffplay_cmd']
-                     ]:
-            if not which(link, mode=os.F_OK | os.X_OK, path=None):
-                return True
+        keys = [binary_key(link) for link in [self.appset['ffmpeg_cmd'],
+                                              self.appset['ffprobe_cmd'],
+                                              self.appset['ffplay_cmd']
+                                              ]]
+        if None in keys:
+            return True
+        self.ffmpeg_key = keys[0]
         return None
     # -------------------------------------------------------------------
 
@@ -173,6 +213,7 @@ class Videomass(wx.App):
         The ideal place to run the last few things before completely
         exiting the application, eg. delete temporary files etc.
         """
+        flush_logs(close=True)
         if self.appset['clearcache']:
             tmp = os.path.join(self.appset['cachedir'], 'tmp')
             if os.path.exists(tmp):
@@ -240,6 +281,9 @@ def main():
         kwargs = {'make_portable': None}
     else:
         kwargs = arguments()
+        if kwargs['profile_startup']:
+            STARTUP.enable()
+    STARTUP.mark('gui_app imported')
 
     app = Videomass(redirect=False, **kwargs)
     app.MainLoop()
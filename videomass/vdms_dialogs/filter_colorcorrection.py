@@ -6,7 +6,7 @@ Compatibility: Python3, wxPython Phoenix
 Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
 Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
 license: GPL3
-Rev: Sep.18.2025
+Rev: Oct.18.2026
 Code checker: flake8, pylint
 
 This file is part of Videomass.
@@ -30,9 +30,7 @@ import wx
 from videomass.vdms_utils.utils import time_to_integer
 from videomass.vdms_utils.utils import integer_to_time
 from videomass.vdms_utils.utils import clockset
-from videomass.vdms_io.make_filelog import make_log_template
-from videomass.vdms_threads.generic_task import FFmpegGenericTask
-from videomass.vdms_io.io_tools import show_msg_notify
+from videomass.vdms_threads.frame_server import FRAMESERVERS, filter_frame
 
 
 class ColorEQ(wx.Dialog):
@@ -45,12 +43,8 @@ class ColorEQ(wx.Dialog):
     """
     get = wx.GetApp()
     OS = get.appset['ostype']
-    LOGDIR = get.appset['logdir']
     TMPROOT = os.path.join(get.appset['cachedir'], 'tmp', 'ColorEQ')
-    TMPSRC = os.path.join(TMPROOT, 'tmpsrc')
-    TMPEDIT = os.path.join(TMPROOT, 'tmpedit')
-    os.makedirs(TMPSRC, mode=0o777, exist_ok=True)
-    os.makedirs(TMPEDIT, mode=0o777, exist_ok=True)
+    os.makedirs(TMPROOT, mode=0o777, exist_ok=True)
     # BACKGROUND = '#1b0413'
 
     def __init__(self, parent, colorset, iconreset, **kwa):
@@ -64,13 +58,17 @@ class ColorEQ(wx.Dialog):
         """
         self.filename = kwa['filename']
         name = os.path.splitext(os.path.basename(self.filename))[0]
-        self.framesrc = os.path.join(ColorEQ.TMPSRC, f'{name}.png')
-        self.frameedit = os.path.join(ColorEQ.TMPEDIT, f'{name}.png')
         self.fileclock = os.path.join(ColorEQ.TMPROOT, f'{name}.clock')
         # resizing values preserving aspect ratio for monitors
         thr = 150 if kwa['height'] > kwa['width'] else 270
         self.h_ratio = int((kwa['height'] / kwa['width']) * thr)
         self.w_ratio = int((kwa['width'] / kwa['height']) * self.h_ratio)
+        self.ffmpeg_cmd = wx.GetApp().appset['ffmpeg_cmd']
+        self.server = FRAMESERVERS.get(self.filename, self.w_ratio,
+                                       self.h_ratio, self.ffmpeg_cmd)
+        self.framesrc = None  # raw RGB frame of the source
+        self.bmp_src = None  # StaticBitmap of panel 1 (source)
+        self.bmp_edit = None  # StaticBitmap of panel 2 (edit)
         self.contrast = ""
         self.brightness = ""
         self.saturation = ""
@@ -259,61 +257,59 @@ class ColorEQ(wx.Dialog):
         self.Bind(wx.EVT_BUTTON, self.on_ok, btn_ok)
         self.Bind(wx.EVT_BUTTON, self.on_reset, btn_reset)
         self.Bind(wx.EVT_BUTTON, self.on_help, btn_help)
+        self.Bind(wx.EVT_WINDOW_DESTROY, self.on_destroy)
 
         if not self.mills:
             self.sld_time.Disable()
 
         if colorset:  # previus values
             self.set_default(colorset)
-        self.process(self.framesrc)
-        self.loader_initial_source()
-        self.equalize_image(self.concat_filter())
+        if not self.process():
+            self.loader_initial_source()
+            self.equalize_image(self.concat_filter())
     # -----------------------------------------------------------------------#
 
-    def process(self, pathtosave, equalizer=''):
+    def process(self):
         """
-        Generate a new frame at the clock position using
-        ffmpeg `eq` filter.
+        Gets the source frame at the clock position from
+        the frame server. Returns the error message if any.
         """
-        logfile = make_log_template('generic_task.log',
-                                    ColorEQ.LOGDIR,
-                                    mode="w",
-                                    )
-        if not self.mills:
-            sseg = ''
-        else:
-            sseg = f'-ss {self.clock}'
-        eql = '' if not equalizer else f'-vf "{equalizer}"'
-        arg = (f'{sseg} -i "{self.filename}" -f image2 '
-               f'-update 1 -frames:v 1 {eql} "{pathtosave}"')
-        thread = FFmpegGenericTask(arg, 'ColorEQ', logfile)
-        thread.join()  # wait end thread
-        error = thread.status
-        if error:
-            show_msg_notify(self.GetParent(),
-                            logname=os.path.basename(logfile))
+        data = self.server.frame(time_to_integer(self.clock) / 1000)
+        if data is None:
+            error = self.server.error() or _('No frame decoded')
+            wx.MessageBox(f'{error}', _('Videomass - Error!'),
+                          wx.ICON_ERROR, self)
             return error
+        self.framesrc = data
         return None
     # -----------------------------------------------------------------------#
 
+    def frame_bitmap(self, panel, staticbmp, data):
+        """
+        Shows a raw RGB frame on `panel`, making its
+        StaticBitmap the first time.
+        """
+        bitmap = wx.Bitmap.FromBuffer(self.w_ratio, self.h_ratio, data)
+        if staticbmp is None:
+            return wx.StaticBitmap(panel, wx.ID_ANY, bitmap)
+        staticbmp.SetBitmap(bitmap)
+        return staticbmp
+    # -----------------------------------------------------------------------#
+
     def loader_initial_source(self):
         """
         Loads initial StaticBitmaps on panels 1 (source).
         """
-        img = wx.Image(self.framesrc, wx.BITMAP_TYPE_ANY)
-        img = img.Scale(self.w_ratio, self.h_ratio, wx.IMAGE_QUALITY_NORMAL)
-        bitmap = img.ConvertToBitmap()
-        wx.StaticBitmap(self.panel_img1, wx.ID_ANY, bitmap)
+        self.bmp_src = self.frame_bitmap(self.panel_img1, self.bmp_src,
+                                         self.framesrc)
     # -----------------------------------------------------------------------#
 
-    def loader_initial_edit(self):
+    def loader_initial_edit(self, data):
         """
         Loads initial StaticBitmaps on panels 2 (edit)
         """
-        img = wx.Image(self.frameedit, wx.BITMAP_TYPE_ANY)
-        img = img.Scale(self.w_ratio, self.h_ratio, wx.IMAGE_QUALITY_NORMAL)
-        bitmap = img.ConvertToBitmap()
-        wx.StaticBitmap(self.panel_img2, wx.ID_ANY, bitmap)
+        self.bmp_edit = self.frame_bitmap(self.panel_img2, self.bmp_edit,
+                                          data)
     # -----------------------------------------------------------------------#
 
     def set_default(self, colorset):
@@ -348,12 +344,21 @@ class ColorEQ(wx.Dialog):
 
     def equalize_image(self, equalizer=''):
         """
-        Sends the equalization values to the process
+        Applies the equalization values to the source frame,
+        passed raw to FFmpeg without seeking the source again.
         """
-        error = self.process(self.frameedit, equalizer=equalizer)
-        if error:
+        if self.framesrc is None:
+            return
+        if not equalizer:
+            self.loader_initial_edit(self.framesrc)
+            return
+        data, error = filter_frame(self.ffmpeg_cmd, self.framesrc,
+                                   self.w_ratio, self.h_ratio, equalizer)
+        if error is not None:
+            wx.MessageBox(f'{error}', _('Videomass - Error!'),
+                          wx.ICON_ERROR, self)
             return
-        self.loader_initial_edit()
+        self.loader_initial_edit(data)
     # -----------------------------------------------------------------------#
 
     def concat_filter(self):
@@ -380,6 +385,20 @@ class ColorEQ(wx.Dialog):
         self.txttime.SetLabel(clock)  # update StaticText
         if not self.btn_load.IsEnabled():
             self.btn_load.Enable()
+        self.server.request(seek / 1000,
+                            lambda sec, data: wx.CallAfter(self.show_source,
+                                                           data))
+    # -----------------------------------------------------------------------#
+
+    def show_source(self, data):
+        """
+        Displays a source frame received while scrubbing
+        the time slider.
+        """
+        if not self or data is None:  # dialog already destroyed
+            return
+        self.framesrc = data
+        self.loader_initial_source()
     # -----------------------------------------------------------------------#
 
     def on_load_at_time(self, event):
@@ -388,19 +407,10 @@ class ColorEQ(wx.Dialog):
         """
         seek = self.sld_time.GetValue()
         self.clock = integer_to_time(seek, False)  # to 24-hour
-        error = self.process(self.framesrc)
-        if error:
-            wx.MessageBox(f'{error}', _('Videomass - Error!'),
-                          wx.ICON_ERROR, self)
+        if self.process():
             return
         self.loader_initial_source()
-
-        error = self.process(self.frameedit, self.concat_filter())
-        if error:
-            wx.MessageBox(f'{error}', _('Videomass - Error!'),
-                          wx.ICON_ERROR, self)
-            return
-        self.loader_initial_edit()
+        self.equalize_image(self.concat_filter())
 
         with open(self.fileclock, "w", encoding='utf-8') as atime:
             atime.write(self.clock)
@@ -488,6 +498,16 @@ class ColorEQ(wx.Dialog):
         event.Skip()
     # -----------------------------------------------------------------------#
 
+    def on_destroy(self, event):
+        """
+        Terminates the decoder of the frame server, its
+        frames are kept for the next time.
+        """
+        if event.GetEventObject() is self:
+            self.server.suspend()
+        event.Skip()
+    # -----------------------------------------------------------------------#
+
     def on_ok(self, event):
         """
         Before destroying the dialog getvalue() will be called.
@@ -6,7 +6,7 @@ Compatibility: Python3, wxPython Phoenix
 Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
 Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
 license: GPL3
-Rev: Sep.18.2025
+Rev: Oct.18.2026
 Code checker: flake8, pylint
 
 This file is part of Videomass.
@@ -30,24 +30,10 @@ import wx
 import wx.lib.statbmp
 import wx.lib.colourselect as csel
 from pubsub import pub
-from videomass.vdms_threads.generic_task import FFmpegGenericTask
-from videomass.vdms_io.io_tools import show_msg_notify
 from videomass.vdms_utils.utils import time_to_integer
 from videomass.vdms_utils.utils import integer_to_time
 from videomass.vdms_utils.utils import clockset
-from videomass.vdms_io.make_filelog import make_log_template
-
-
-def make_bitmap(width, height, fname):
-    """
-    Resize the image to the given size and convert it to a
-    bitmap object.
-    Returns a wx.Bitmap object
-    """
-    img = wx.Image(fname)
-    img = img.Scale(int(width), int(height), wx.IMAGE_QUALITY_NORMAL)
-    bmp = img.ConvertToBitmap()
-    return bmp
+from videomass.vdms_threads.frame_server import FRAMESERVERS
 
 
 class Actor(wx.lib.statbmp.GenStaticBitmap):
@@ -178,10 +164,8 @@ class Crop(wx.Dialog):
     """
     get = wx.GetApp()
     OS = get.appset['ostype']
-    LOGDIR = get.appset['logdir']
     TMPROOT = os.path.join(get.appset['cachedir'], 'tmp', 'Crop')
-    TMPSRC = os.path.join(TMPROOT, 'tmpsrc')
-    os.makedirs(TMPSRC, mode=0o777, exist_ok=True)
+    os.makedirs(TMPROOT, mode=0o777, exist_ok=True)
     BACKGROUND = '#1b0413'
 
     def __init__(self, parent, *args, **kwa):
@@ -214,7 +198,11 @@ class Crop(wx.Dialog):
         self.w_scaled = round((self.width / self.height) * self.h_scaled)
         self.filename = kwa['filename']  # selected filename on file list
         name = os.path.splitext(os.path.basename(self.filename))[0]
-        self.frame = os.path.join(f'{Crop.TMPSRC}', f'{name}.png')  # image
+        self.server = FRAMESERVERS.get(self.filename,
+                                       self.w_scaled,
+                                       self.h_scaled,
+                                       wx.GetApp().appset['ffmpeg_cmd'],
+                                       )
         self.fileclock = os.path.join(Crop.TMPROOT, f'{name}.clock')
         tcheck = clockset(kwa['duration'], self.fileclock)
         self.clock = tcheck['duration']
@@ -320,14 +308,10 @@ class Crop(wx.Dialog):
         gridbtns.Add(boxaff, 0, wx.ALL | wx.ALIGN_RIGHT | wx.RIGHT, border=5)
         sizerBase.Add(gridbtns, 0, wx.EXPAND)
 
-        # instance to Actor widget
-        if os.path.exists(self.frame):
-            bmp = make_bitmap(self.w_scaled, self.h_scaled, self.frame)
-            self.bob = Actor(self.panelrect, bmp, 1, "")
-        else:  # make a temporary empty bitmap
-            bmp = wx.Bitmap(self.w_scaled, self.h_scaled)
-            self.bob = Actor(self.panelrect, bmp, 1, "")
-            self.make_frame_from_file(None)
+        # instance to Actor widget with a temporary empty bitmap
+        bmp = wx.Bitmap(self.w_scaled, self.h_scaled)
+        self.bob = Actor(self.panelrect, bmp, 1, "")
+        self.make_frame_from_file(None)
 
         # ----------------------Properties-----------------------#
         self.panelrect.SetBackgroundColour(wx.Colour(Crop.BACKGROUND))
@@ -364,6 +348,7 @@ class Crop(wx.Dialog):
         self.Bind(wx.EVT_BUTTON, self.on_ok, btn_ok)
         self.Bind(wx.EVT_BUTTON, self.on_reset, btn_reset)
         self.Bind(wx.EVT_BUTTON, self.on_help, btn_help)
+        self.Bind(wx.EVT_WINDOW_DESTROY, self.on_destroy)
         self.btn_color.Bind(csel.EVT_COLOURSELECT, self.bob.oncolor)
 
         pub.subscribe(self.to_real_scale_coords, "TO_REAL_SCALE")
@@ -400,40 +385,45 @@ class Crop(wx.Dialog):
         self.txttime.SetLabel(clock)  # update StaticText
         if not self.btn_load.IsEnabled():
             self.btn_load.Enable()
+        self.server.request(seek / 1000,
+                            lambda sec, data: wx.CallAfter(self.show_frame,
+                                                           data))
+    # ------------------------------------------------------------------#
+
+    def show_frame(self, data):
+        """
+        Displays a raw RGB frame of the frame server
+        by the `bob` actor.
+        """
+        if not self or data is None:  # dialog already destroyed
+            return
+        bmp = wx.Bitmap.FromBuffer(self.w_scaled, self.h_scaled, data)
+        self.bob.setbitmap(bmp)
     # ------------------------------------------------------------------#
 
     def make_frame_from_file(self, event):
         """
         This method is responsible for making available a
         new frame from a given time position of a video file,
-        converting it into a bitmap object and displaying it
+        reading it from the frame server and displaying it
         by the `bob` actor. Note, milliseconds must not be
         greater than the max time nor less than the min time
         (see the `seek` callback above)
         """
-        logfile = make_log_template('generic_task.log', Crop.LOGDIR, mode="w")
-        if not self.mills:
-            sseg = ''
-        else:
+        if self.mills:
             seek = self.sld_time.GetValue()
             self.clock = integer_to_time(seek, False)  # to 24-HH
-            sseg = f'-ss {self.clock}'
-
-        arg = (f'{sseg} -i "{self.filename}" -f image2 '
-               f'-update 1 -frames:v 1 "{self.frame}"')
-        thread = FFmpegGenericTask(arg, 'Crop', logfile)
-        thread.join()  # wait end thread
-        error = thread.status
-        if error:
-            show_msg_notify(self.GetParent(),
-                            logname=os.path.basename(logfile))
+        data = self.server.frame(time_to_integer(self.clock) / 1000)
+        if data is None:
+            wx.MessageBox(_('Unable to load a frame of the source:\n\n'
+                            '{}').format(self.server.error()),
+                          _('Videomass - Error!'), wx.ICON_ERROR, self)
             return
-        if sseg:
+        if self.mills:
             with open(self.fileclock, "w", encoding='utf-8') as atime:
                 atime.write(self.clock)
         self.btn_load.Disable()
-        bmp = make_bitmap(self.w_scaled, self.h_scaled, self.frame)
-        self.bob.setbitmap(bmp)
+        self.show_frame(data)
     # ------------------------------------------------------------------#
 
     def to_real_scale_coords(self, msg):
@@ -558,6 +548,16 @@ class Crop(wx.Dialog):
         event.Skip()
     # ------------------------------------------------------------------#
 
+    def on_destroy(self, event):
+        """
+        Terminates the decoder of the frame server, its
+        frames are kept for the next time.
+        """
+        if event.GetEventObject() is self:
+            self.server.suspend()
+        event.Skip()
+    # ------------------------------------------------------------------#
+
     def getvalue(self):
         """
         This method return values via the getvalue() interface
@@ -6,7 +6,7 @@ Compatibility: Python3, wxPython Phoenix
 Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
 Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
 license: GPL3
-Rev: Sep.18.2025
+Rev: Oct.18.2026
 Code checker: flake8, pylint
 
 This file is part of Videomass.
@@ -36,6 +36,7 @@ from videomass.vdms_threads.generic_task import FFmpegGenericTask
 from videomass.vdms_io.io_tools import show_msg_notify
 from videomass.vdms_dialogs.widget_utils import PopupDialog
 from videomass.vdms_io.make_filelog import make_log_template
+from videomass.vdms_io.trf_cache import TRFCACHE, TRF_NAME, detect_filter
 
 
 class VidstabSet(wx.Dialog):
@@ -499,7 +500,8 @@ class VidstabSet(wx.Dialog):
     def process(self, infile, outfile=None, args='', mode=None):
         """
         Generate a new frame at the clock position using
-        ffmpeg `eq` filter.
+        ffmpeg `eq` filter. The motion detection is skipped
+        when its transform file is found in the cache.
         """
         if not self.mills:
             sseg, tseg = '', ''
@@ -515,7 +517,11 @@ class VidstabSet(wx.Dialog):
             sseg = f'-ss {self.clock}.000'
             tseg = f'-t {duration}.000'
 
+        trfkey = None
         if mode == 'detect':
+            trfkey = TRFCACHE.key(infile, detect_filter(args), sseg, tseg)
+            if TRFCACHE.fetch(trfkey, os.path.join(os.getcwd(), TRF_NAME)):
+                return None
             nul = ('NUL' if VidstabSet.appdata['ostype']
                    == 'Windows' else '/dev/null')
             argstr = f'{sseg} -i "{infile}" {tseg} {args} -f null {nul}'
@@ -545,6 +551,7 @@ class VidstabSet(wx.Dialog):
                             logname=os.path.basename(self.logfile))
             return error
         dlgload.Destroy()
+        TRFCACHE.store(trfkey, os.path.join(os.getcwd(), TRF_NAME))
         return None
     # ------------------------------------------------------------------#
 
@@ -6,7 +6,7 @@ Compatibility: Python3, wxPython Phoenix
 Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
 Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
 license: GPL3
-Rev: June.05.2025
+Rev: Oct.18.2026
 Code checker: flake8, pylint
 
 This file is part of Videomass.
@@ -30,6 +30,10 @@ import webbrowser
 import wx
 from videomass.vdms_utils.utils import detect_binaries
 from videomass.vdms_io import io_tools
+from videomass.vdms_io.probe_cache import PROBECACHE
+from videomass.vdms_io.trf_cache import TRFCACHE
+from videomass.vdms_io.peak_cache import PEAKCACHE
+from videomass.vdms_io.filmstrip_cache import FILMSTRIPCACHE
 from videomass.vdms_sys.settings_manager import ConfigManager
 from videomass.vdms_sys.app_const import supLang
 
@@ -359,6 +363,59 @@ class SetUp(wx.Dialog):
                         | wx.TOP | wx.LEFT | wx.EXPAND, 5)
         griddefdirs.Add(self.btn_log, 0, wx.RIGHT | wx.TOP, 5)
         sizeradv.Add(griddefdirs, 0, wx.LEFT | wx.EXPAND, 5)
+        self.btn_probecache = wx.Button(tabFive, wx.ID_ANY,
+                                        _("Clear media info cache"))
+        sizeradv.Add(self.btn_probecache, 0, wx.ALL, 5)
+        sizeradv.Add((0, 20))
+        msg = _("Batch and queue processing")
+        labjobstitle = wx.StaticText(tabFive, wx.ID_ANY, msg)
+        sizeradv.Add(labjobstitle, 0, wx.ALL | wx.EXPAND, 5)
+        msg = _("Run multiple FFmpeg jobs at the same time")
+        self.ckbx_parallel = wx.CheckBox(tabFive, wx.ID_ANY, (msg))
+        sizeradv.Add(self.ckbx_parallel, 0, wx.LEFT, 5)
+        sizerjobs = wx.BoxSizer(wx.HORIZONTAL)
+        self.labjobs = wx.StaticText(tabFive, wx.ID_ANY,
+                                     _('Maximum concurrent jobs:'))
+        sizerjobs.Add(self.labjobs, 0, wx.LEFT | wx.ALIGN_CENTER, 5)
+        self.spin_jobs = wx.SpinCtrl(tabFive, wx.ID_ANY, "0", min=0,
+                                     max=64, size=(-1, -1),
+                                     style=wx.TE_PROCESS_ENTER
+                                     )
+        sizerjobs.Add(self.spin_jobs, 0, wx.ALL | wx.CENTER, 5)
+        sizeradv.Add(sizerjobs, 0, wx.LEFT, 5)
+        msg = _("Split long files into segments encoded at the same time")
+        self.ckbx_chunked = wx.CheckBox(tabFive, wx.ID_ANY, (msg))
+        sizeradv.Add(self.ckbx_chunked, 0, wx.LEFT, 5)
+        sizersegm = wx.BoxSizer(wx.HORIZONTAL)
+        self.labsegm = wx.StaticText(tabFive, wx.ID_ANY,
+                                     _('Number of segments:'))
+        sizersegm.Add(self.labsegm, 0, wx.LEFT | wx.ALIGN_CENTER, 5)
+        self.spin_segm = wx.SpinCtrl(tabFive, wx.ID_ANY, "0", min=0,
+                                     max=256, size=(-1, -1),
+                                     style=wx.TE_PROCESS_ENTER
+                                     )
+        sizersegm.Add(self.spin_segm, 0, wx.ALL | wx.CENTER, 5)
+        sizeradv.Add(sizersegm, 0, wx.LEFT, 5)
+        msg = _("Smart cut of time selections with video stream copy")
+        self.ckbx_smartcut = wx.CheckBox(tabFive, wx.ID_ANY, (msg))
+        sizeradv.Add(self.ckbx_smartcut, 0, wx.LEFT, 5)
+        sizervol = wx.BoxSizer(wx.HORIZONTAL)
+        labvol = wx.StaticText(tabFive, wx.ID_ANY,
+                               _('Concurrent audio peak analyses:'))
+        sizervol.Add(labvol, 0, wx.LEFT | wx.ALIGN_CENTER, 5)
+        self.spin_voljobs = wx.SpinCtrl(tabFive, wx.ID_ANY, "0", min=0,
+                                        max=64, size=(-1, -1),
+                                        style=wx.TE_PROCESS_ENTER
+                                        )
+        sizervol.Add(self.spin_voljobs, 0, wx.ALL | wx.CENTER, 5)
+        sizeradv.Add(sizervol, 0, wx.LEFT, 5)
+        msg = _("Reuse the outputs of identical jobs instead of encoding "
+                "them again")
+        self.ckbx_outcache = wx.CheckBox(tabFive, wx.ID_ANY, (msg))
+        sizeradv.Add(self.ckbx_outcache, 0, wx.LEFT, 5)
+        msg = _("Identify the source files by their whole content")
+        self.ckbx_fullprint = wx.CheckBox(tabFive, wx.ID_ANY, (msg))
+        sizeradv.Add(self.ckbx_fullprint, 0, wx.LEFT, 25)
         tabFive.SetSizer(sizeradv)
         notebook.AddPage(tabFive, _("Advanced"))
 
@@ -419,6 +476,7 @@ class SetUp(wx.Dialog):
             labrem.SetFont(wx.Font(13, wx.DEFAULT, wx.NORMAL, wx.BOLD))
             labenctitle.SetFont(wx.Font(13, wx.SWISS, wx.NORMAL, wx.BOLD))
             labencgen.SetFont(wx.Font(11, wx.SWISS, wx.NORMAL, wx.NORMAL))
+            labjobstitle.SetFont(wx.Font(13, wx.SWISS, wx.NORMAL, wx.BOLD))
         else:
             lablang.SetFont(wx.Font(10, wx.DEFAULT, wx.NORMAL, wx.BOLD))
             labdirtitle.SetFont(wx.Font(10, wx.DEFAULT, wx.NORMAL, wx.BOLD))
@@ -433,6 +491,7 @@ class SetUp(wx.Dialog):
             labrem.SetFont(wx.Font(10, wx.DEFAULT, wx.NORMAL, wx.BOLD))
             labenctitle.SetFont(wx.Font(10, wx.SWISS, wx.NORMAL, wx.BOLD))
             labencgen.SetFont(wx.Font(8, wx.SWISS, wx.NORMAL, wx.NORMAL))
+            labjobstitle.SetFont(wx.Font(10, wx.SWISS, wx.NORMAL, wx.BOLD))
 
         tip = (_("By assigning an additional suffix you could avoid "
                  "overwriting files"))
@@ -440,6 +499,52 @@ class SetUp(wx.Dialog):
         tip = (_("Type sudo password here, only for Unix-like operating "
                  "systems, not for MS Windows"))
         self.txtctrl_sudo.SetToolTip(tip)
+        tip = (_("Processes several files of a batch or queue at the same "
+                 "time. Useful when a single encoding does not use all "
+                 "the CPU cores, e.g. audio-only encodings or stream copy."))
+        self.ckbx_parallel.SetToolTip(tip)
+        tip = (_("Maximum number of FFmpeg processes running at the same "
+                 "time. Set to 0 to derive it from the number of CPUs."))
+        self.spin_jobs.SetToolTip(tip)
+        tip = (_("Files processed one at a time with a One pass or Two "
+                 "pass preset are cut at keyframes into segments whose "
+                 "video is encoded at the same time, then joined without "
+                 "re-encoding. Audio and subtitles are encoded once from "
+                 "the whole file. Not used with a time selection."))
+        self.ckbx_chunked.SetToolTip(tip)
+        tip = (_("When the video codec is \"Copy\" and a time segment "
+                 "is selected on the timeline, only the partial groups "
+                 "of pictures at the cut points are re-encoded (H.264 and "
+                 "HEVC), while everything between them is copied as is. "
+                 "The cut is frame accurate and takes seconds even on "
+                 "long files."))
+        self.ckbx_smartcut.SetToolTip(tip)
+        tip = (_("Number of files analyzed at the same time to get the "
+                 "audio peak level before the peak normalization. Set to "
+                 "0 to use the number of CPUs."))
+        self.spin_voljobs.SetToolTip(tip)
+        tip = (_("A job with the same source file, command line and FFmpeg "
+                 "build of a previous one is not encoded again: its "
+                 "destination becomes a copy of the previous output, as "
+                 "long as that file is unchanged. Use "
+                 "\"Tools > Force re-encode\" to bypass it."))
+        self.ckbx_outcache.SetToolTip(tip)
+        tip = (_("The output cache hashes the whole content of the source "
+                 "files, in background after the import, instead of "
+                 "sampled blocks of them. Slower on large files, but it "
+                 "also recognizes a source copied or restored with a "
+                 "different modification time."))
+        self.ckbx_fullprint.SetToolTip(tip)
+        tip = (_("Number of segments of a file, each one at least one "
+                 "minute long. Set to 0 to derive it from the number "
+                 "of CPUs."))
+        self.spin_segm.SetToolTip(tip)
+        tip = (_("Information about imported media files and their "
+                 "loudness measurements (Two pass EBU) and motion "
+                 "detection (Two pass VIDSTAB) are kept on disk "
+                 "and reused as long as the files are not modified. Clear "
+                 "it after updating FFmpeg."))
+        self.btn_probecache.SetToolTip(tip)
         self.SetTitle(_("Preferences"))
 
         # ------ set sizer
@@ -453,6 +558,8 @@ class SetUp(wx.Dialog):
         self.Bind(wx.EVT_BUTTON, self.opendir, self.btn_conf)
         self.Bind(wx.EVT_BUTTON, self.opendir, self.btn_log)
         self.Bind(wx.EVT_BUTTON, self.opendir, self.btn_cache)
+        self.Bind(wx.EVT_BUTTON, self.on_clear_probecache,
+                  self.btn_probecache)
         self.Bind(wx.EVT_RADIOBOX, self.logging_ffplay, self.rdbFFplay)
         self.Bind(wx.EVT_RADIOBOX, self.logging_ffmpeg, self.rdbFFmpeg)
         self.Bind(wx.EVT_BUTTON, self.on_outputdir, self.btn_fsave)
@@ -475,6 +582,15 @@ class SetUp(wx.Dialog):
         self.Bind(wx.EVT_CHECKBOX, self.clear_Cache, self.ckbx_cacheclr)
         self.Bind(wx.EVT_CHECKBOX, self.clear_logs, self.ckbx_logclr)
         self.Bind(wx.EVT_TEXT, self.on_char_encoding, self.txtctrl_charenc)
+        self.Bind(wx.EVT_CHECKBOX, self.on_parallel_jobs, self.ckbx_parallel)
+        self.Bind(wx.EVT_SPINCTRL, self.on_max_jobs, self.spin_jobs)
+        self.Bind(wx.EVT_CHECKBOX, self.on_chunked, self.ckbx_chunked)
+        self.Bind(wx.EVT_SPINCTRL, self.on_segments, self.spin_segm)
+        self.Bind(wx.EVT_CHECKBOX, self.on_smart_cut, self.ckbx_smartcut)
+        self.Bind(wx.EVT_SPINCTRL, self.on_volume_jobs, self.spin_voljobs)
+        self.Bind(wx.EVT_CHECKBOX, self.on_output_cache, self.ckbx_outcache)
+        self.Bind(wx.EVT_CHECKBOX, self.on_fingerprint_mode,
+                  self.ckbx_fullprint)
         self.Bind(wx.EVT_BUTTON, self.on_help, btn_help)
         self.Bind(wx.EVT_BUTTON, self.on_cancel, btn_cancel)
         self.Bind(wx.EVT_BUTTON, self.on_ok, btn_ok)
@@ -503,6 +619,22 @@ class SetUp(wx.Dialog):
 
         self.ckbx_exitapp.SetValue(self.appdata["auto_exit"])
         self.ckbx_turnoff.SetValue(self.appdata["shutdown"])
+        self.ckbx_parallel.SetValue(self.settings['parallel_jobs'])
+        self.spin_jobs.SetValue(self.settings['parallel_jobs_max'])
+        self.ckbx_chunked.SetValue(self.settings['chunked_encoding'])
+        self.spin_segm.SetValue(self.settings['chunked_segments'])
+        self.ckbx_smartcut.SetValue(self.settings['smart_cut'])
+        self.spin_voljobs.SetValue(self.settings['volumedetect_jobs'])
+        self.ckbx_outcache.SetValue(self.settings['output_cache'])
+        self.ckbx_fullprint.SetValue(self.settings.get('fingerprint_mode')
+                                     == 'content')
+        self.ckbx_fullprint.Enable(self.settings['output_cache'])
+        self.labsegm.Enable(self.settings['chunked_encoding'])
+        self.spin_segm.Enable(self.settings['chunked_encoding'])
+        workers = (self.settings['parallel_jobs']
+                   or self.settings['chunked_encoding'])
+        self.labjobs.Enable(workers)
+        self.spin_jobs.Enable(workers)
         self.txtctrl_sudo.SetValue(self.appdata.get("sudo_password", ''))
         if self.ckbx_turnoff.GetValue():
             if self.appdata['ostype'] != 'Windows':
@@ -897,6 +1029,93 @@ class SetUp(wx.Dialog):
         self.settings['encoding'] = self.txtctrl_charenc.GetValue().strip()
     # --------------------------------------------------------------------#
 
+    def on_clear_probecache(self, event):
+        """
+        Invalidates all the media information stored by the
+        ffprobe cache, the vid.stab transform files and the
+        timeline waveforms and filmstrips, e.g. after updating
+        FFmpeg.
+        """
+        PROBECACHE.clear()
+        TRFCACHE.clear()
+        PEAKCACHE.clear()
+        FILMSTRIPCACHE.clear()
+        wx.MessageBox(_("The media info cache has been cleared."),
+                      "Videomass", wx.ICON_INFORMATION, self)
+    # --------------------------------------------------------------------#
+
+    def on_parallel_jobs(self, event):
+        """
+        Enable/disable the processing of multiple jobs
+        at the same time.
+        """
+        check = self.ckbx_parallel.GetValue()
+        self.settings['parallel_jobs'] = check
+        workers = check or self.ckbx_chunked.GetValue()
+        self.labjobs.Enable(workers)
+        self.spin_jobs.Enable(workers)
+    # --------------------------------------------------------------------#
+
+    def on_max_jobs(self, event):
+        """
+        Set the maximum number of concurrent jobs, 0 is auto.
+        """
+        self.settings['parallel_jobs_max'] = self.spin_jobs.GetValue()
+    # --------------------------------------------------------------------#
+
+    def on_chunked(self, event):
+        """
+        Enable/disable the segment-parallel encoding of
+        long files.
+        """
+        check = self.ckbx_chunked.GetValue()
+        self.settings['chunked_encoding'] = check
+        self.labsegm.Enable(check)
+        self.spin_segm.Enable(check)
+        workers = check or self.ckbx_parallel.GetValue()
+        self.labjobs.Enable(workers)
+        self.spin_jobs.Enable(workers)
+    # --------------------------------------------------------------------#
+
+    def on_segments(self, event):
+        """
+        Set the number of segments of a file, 0 is auto.
+        """
+        self.settings['chunked_segments'] = self.spin_segm.GetValue()
+    # --------------------------------------------------------------------#
+
+    def on_smart_cut(self, event):
+        """
+        Enable/disable the smart cut of time selections.
+        """
+        self.settings['smart_cut'] = self.ckbx_smartcut.GetValue()
+    # --------------------------------------------------------------------#
+
+    def on_volume_jobs(self, event):
+        """
+        Set the number of concurrent audio peak analyses,
+        0 is auto.
+        """
+        self.settings['volumedetect_jobs'] = self.spin_voljobs.GetValue()
+    # --------------------------------------------------------------------#
+
+    def on_output_cache(self, event):
+        """
+        Enable/disable the reuse of the outputs of
+        identical jobs.
+        """
+        self.settings['output_cache'] = self.ckbx_outcache.GetValue()
+        self.ckbx_fullprint.Enable(self.settings['output_cache'])
+    # --------------------------------------------------------------------#
+
+    def on_fingerprint_mode(self, event):
+        """
+        Set how the output cache identifies the source files.
+        """
+        mode = 'content' if self.ckbx_fullprint.GetValue() else 'sampled'
+        self.settings['fingerprint_mode'] = mode
+    # --------------------------------------------------------------------#
+
     def on_help(self, event):
         """
         Open default web browser via Python Web-browser controller.
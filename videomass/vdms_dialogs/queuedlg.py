@@ -6,7 +6,7 @@ Compatibility: Python3, wxPython4
 Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
 Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
 license: GPL3
-Rev: Mar.25.2024
+Rev: Oct.18.2026
 Code checker: flake8, pylint
 
 This file is part of Videomass.
@@ -185,7 +185,7 @@ class QueueManager(wx.Dialog):
         with Edit_Queue_Item(self,
                              self.datalist[index]) as editsel:
             if editsel.ShowModal() == wx.ID_OK:
-                write_json_file_queue(self.datalist)
+                self.parent.queuestore.save()
                 self.on_select(None)
         return
     # ----------------------------------------------------------------------
@@ -210,7 +210,7 @@ class QueueManager(wx.Dialog):
             self.quelist.InsertItem(index, desttitle)
             index += 1
 
-        write_json_file_queue(self.datalist)
+        self.parent.queuestore.save()
 
         if not selidx == -1:
             self.quelist.Focus(selidx)  # make the line the current line
@@ -264,7 +264,7 @@ class QueueManager(wx.Dialog):
             self.datalist.pop(num)  # remove selected items
             self.quelist.Select(num - 1)  # select the previous one
 
-        write_json_file_queue(self.datalist)
+        self.parent.queuestore.save()
         self.parent.queue_tool_counter()
         return
     # ----------------------------------------------------------------------
@@ -277,10 +277,8 @@ class QueueManager(wx.Dialog):
         if self.quelist.GetItemCount() == 0:
             return
         self.quelist.DeleteAllItems()
-        self.datalist.clear()
+        self.parent.queuestore.clear()  # also clears datalist
         self.on_deselect(None)
-        queuebak = os.path.join(self.appdata["confdir"], 'queue.backup')
-        os.remove(queuebak)
         self.parent.queue_tool_counter()
     # ----------------------------------------------------------------------
 
@@ -6,7 +6,7 @@ Compatibility: Python3, wxPython Phoenix
 Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
 Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
 license: GPL3
-Rev: Sep.18.2025
+Rev: Oct.18.2026
 Code checker: flake8, pylint
 
 This file is part of Videomass.
@@ -27,6 +27,7 @@ This file is part of Videomass.
 import os
 import wx
 from pubsub import pub
+from videomass.vdms_io.make_filelog import flush_logs
 
 
 class ShowLogs(wx.Dialog):
@@ -169,6 +170,7 @@ class ShowLogs(wx.Dialog):
                          | wx.CANCEL | wx.YES_NO, self) != wx.YES:
             return
 
+        flush_logs(close=True)
         with open(os.path.join(self.dirlog, name),
                   'w', encoding='utf-8') as log:
             log.write('')
@@ -181,6 +183,7 @@ class ShowLogs(wx.Dialog):
         update data with new incoming
 
         """
+        flush_logs()
         sel = self.log_select.GetFocusedItem()
         selitem = sel if sel != -1 else 0
 
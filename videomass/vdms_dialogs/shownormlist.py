@@ -6,7 +6,7 @@ Compatibility: Python3, wxPython4
 Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
 Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
 license: GPL3
-Rev: March.09.2023
+Rev: Oct.18.2026
 Code checker: flake8, pylint
 
 This file is part of Videomass.
@@ -33,8 +33,8 @@ class AudioVolNormal(wx.Dialog):
     """
     It shows the target volume offset and the volume
     result obtained from the audio normalization process,
-    as well as some statistics given by the volumedetect
-    command.
+    as well as some statistics given by the volumedetect,
+    astats and loudnorm filters.
     """
     get = wx.GetApp()
     if get.appset['IS_DARK_THEME'] is True:
@@ -85,6 +85,10 @@ class AudioVolNormal(wx.Dialog):
         normlist.InsertColumn(2, _('Mean volume dBFS'), width=150)
         normlist.InsertColumn(3, _('Offset dBFS'), width=100)
         normlist.InsertColumn(4, _('Result dBFS'), width=120)
+        if any(len(items) > 6 for items in data):  # loudness statistics
+            normlist.InsertColumn(5, _('RMS level dBFS'), width=120)
+            normlist.InsertColumn(6, _('Loudness LUFS'), width=120)
+            normlist.InsertColumn(7, _('Loudness range LU'), width=140)
         sizer = wx.BoxSizer(wx.VERTICAL)
         sizer.Add(normlist, 1, wx.EXPAND | wx.ALL, 5)
         descript = wx.StaticText(self.panel,
@@ -186,6 +190,8 @@ class AudioVolNormal(wx.Dialog):
                     normlist.SetItem(index, 4, items[4])
                 else:
                     normlist.SetItem(index, 4, items[4])
+                for col, value in enumerate(items[6:9], 5):
+                    normlist.SetItem(index, col, value)
                 index += 1
 
         if title == _('PEAK-based volume statistics'):
@@ -206,6 +212,8 @@ class AudioVolNormal(wx.Dialog):
                     normlist.SetItem(index, 4, items[4])
                 else:
                     normlist.SetItem(index, 4, items[4])
+                for col, value in enumerate(items[6:9], 5):
+                    normlist.SetItem(index, col, value)
                 index += 1
     # --------------------------------------------------------------#
 
@@ -6,7 +6,7 @@ Compatibility: Python3, wxPython Phoenix
 Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
 Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
 license: GPL3
-Rev: Nov.27.2021
+Rev: Oct.18.2026
 Code checker: flake8, pylint
 
 This file is part of Videomass.
@@ -77,6 +77,8 @@ class PopupDialog(wx.Dialog):
         If your thread has the `stop` method you can pass a running
         `thread` as default arg to interface with the auto-displayed
         Stop button (See `VolumeDetectThread` class as example model).
+        The thread can update the message by sending a "POPUP_MSG_EVT"
+        message with a `msg` argument.
 
     Usage:
             loadDlg = PopupDialog(parent, caption, message, thread)
@@ -102,8 +104,9 @@ class PopupDialog(wx.Dialog):
             ai.Start()
             boxh.Add(ai, 0, wx.LEFT | wx.ALIGN_CENTER_VERTICAL | wx.ALL, 10)
         # Add the message
-        message = wx.StaticText(self, -1, msg, style=wx.ALIGN_CENTRE_VERTICAL)
-        boxh.Add(message, 0, wx.EXPAND | wx.ALL, 10)
+        self.message = wx.StaticText(self, -1, msg,
+                                     style=wx.ALIGN_CENTRE_VERTICAL)
+        boxh.Add(self.message, 0, wx.EXPAND | wx.ALL, 10)
         boxv.Add(boxh, 0, wx.EXPAND)
         # Add an Info graphic
         bitmap = wx.Bitmap(48, 48)
@@ -128,6 +131,17 @@ class PopupDialog(wx.Dialog):
         self.Layout()
 
         pub.subscribe(self.getMessage, "RESULT_EVT")
+        pub.subscribe(self.set_message, "POPUP_MSG_EVT")
+    # ----------------------------------------------------------#
+
+    def set_message(self, msg):
+        """
+        Updates the message of the dialog, e.g. with the
+        progress of the task.
+        """
+        self.message.SetLabel(msg)
+        self.Fit()
+        self.Layout()
     # ----------------------------------------------------------#
 
     def on_stop(self, event):
@@ -0,0 +1,48 @@
+# -*- coding: UTF-8 -*-
+"""
+Name: filmstrip_cache.py
+Porpose: persistent cache of the timeline filmstrips
+Compatibility: Python3
+Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
+Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
+license: GPL3
+Rev: Oct.18.2026
+Code checker: flake8, pylint
+
+This file is part of Videomass.
+
+   Videomass is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   Videomass is distributed in the hope that it will be useful,
+   but WITHOUT ANY WARRANTY; without even the implied warranty of
+   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+   GNU General Public License for more details.
+
+   You should have received a copy of the GNU General Public License
+   along with Videomass.  If not, see <http://www.gnu.org/licenses/>.
+"""
+from videomass.vdms_io.peak_cache import PeakCache
+
+
+class FilmstripCache(PeakCache):
+    """
+    Directory of the serialized timeline filmstrips (see
+    `Filmstrip.to_bytes`), one file for each source file
+    identity and thumbnail geometry, passed as the `detect`
+    argument of `key`.
+
+    Usage:
+        >>> FILMSTRIPCACHE.open('/path/to/cache/filmstrip')
+        >>> key = FILMSTRIPCACHE.key(source, '142x80 7')
+        >>> data = FILMSTRIPCACHE.read(key)
+        >>> if data is None:
+        >>>     FILMSTRIPCACHE.write(key, strip.to_bytes())
+    """
+    MAXSIZE = 128 * 1024 * 1024
+    SUFFIX = '.strip'
+
+
+FILMSTRIPCACHE = FilmstripCache()
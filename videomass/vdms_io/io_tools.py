@@ -6,7 +6,7 @@ Compatibility: Python3, wxPython4 Phoenix
 Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
 Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
 license: GPL3
-Rev: Sep.18.2025
+Rev: Oct.18.2026
 Code checker: flake8, pylint
 
 This file is part of Videomass.
@@ -31,8 +31,8 @@ from videomass.vdms_threads.volumedetect import VolumeDetectThread
 from videomass.vdms_threads.check_bin import (ff_conf,
                                               ff_formats,
                                               ff_codecs,
-                                              ff_topics,
                                               )
+from videomass.vdms_threads.ff_capabilities import FFCAPS
 from videomass.vdms_utils.utils import open_default_application
 from videomass.vdms_dialogs.widget_utils import PopupDialog
 
@@ -90,10 +90,13 @@ def show_msg_notify(parent, warnlev: str = 'error', logname: str = 'log',
 # ----------------------------------------------------------------#
 
 
-def volume_detect_process(filelist, timeseq, audiomap, parent=None):
+def volume_detect_process(filelist, timeseq, audiomap, parent=None,
+                          loudnorm=''):
     """
     Run thread to get audio peak level data
-    showing a pop-up message dialog.
+    showing a pop-up message dialog. The loudness is
+    also measured, with the targets of the `loudnorm`
+    filter, only if it is given.
     """
     if timeseq:
         splseq = timeseq.split()
@@ -101,10 +104,11 @@ def volume_detect_process(filelist, timeseq, audiomap, parent=None):
     else:
         tseq = '', ''
 
-    thread = VolumeDetectThread(tseq, filelist, audiomap)
+    thread = VolumeDetectThread(tseq, filelist, audiomap, loudnorm)
     dlgload = PopupDialog(parent,
                           _("Videomass - Loading..."),
-                          _("Wait....\nAudio peak analysis."),
+                          _("Wait....\nAudio peak analysis: {0}/{1} files.")
+                          .format(0, len(filelist)),
                           thread,
                           )
     dlgload.ShowModal()
@@ -129,8 +133,11 @@ def volume_detect_process(filelist, timeseq, audiomap, parent=None):
 def test_conf():
     """
     Call `check_bin.ffmpeg_conf` to get data to test the building
-    configurations of the used FFmpeg executable.
+    configurations of the used FFmpeg executable, unless they
+    are in the capability map.
     """
+    if FFCAPS.ready():
+        return tuple(FFCAPS.get('conf'))
     get = wx.GetApp()
     out = ff_conf(get.appset['ffmpeg_cmd'], get.appset['ostype'])
     return out
@@ -140,8 +147,10 @@ def test_conf():
 def test_formats():
     """
     Call `check_bin.ff_formats` to get available formats by
-    FFmpeg executable.
+    FFmpeg executable, unless they are in the capability map.
     """
+    if FFCAPS.ready():
+        return FFCAPS.get('formats')
     get = wx.GetApp()
     out = ff_formats(get.appset['ffmpeg_cmd'], get.appset['ostype'])
     return out
@@ -151,8 +160,11 @@ def test_formats():
 def test_codecs(type_opt):
     """
     Call `check_bin.ff_codecs` to get available encoders
-    and decoders by FFmpeg executable.
+    and decoders by FFmpeg executable, unless they are in
+    the capability map.
     """
+    if FFCAPS.ready():
+        return FFCAPS.get(type_opt.lstrip('-'))
     get = wx.GetApp()
     out = ff_codecs(get.appset['ffmpeg_cmd'],
                     type_opt,
@@ -165,10 +177,11 @@ def test_codecs(type_opt):
 def findtopic(topic):
     """
     Call * check_bin.ff_topic * to run the ffmpeg command to search
-    a certain topic..
+    a certain topic.. The output is kept in memory by `FFCAPS`.
     """
     get = wx.GetApp()
-    retcod = ff_topics(get.appset['ffmpeg_cmd'], topic, get.appset['ostype'])
+    retcod = FFCAPS.topic(get.appset['ffmpeg_cmd'], topic,
+                          get.appset['ostype'])
 
     if 'Not found' in retcod[0]:
         notf = f"\n{retcod[1]}"
@@ -0,0 +1,163 @@
+# -*- coding: UTF-8 -*-
+"""
+Name: job_journal.py
+Porpose: append-only state journal of the queue jobs
+Compatibility: Python3
+Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
+Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
+license: GPL3
+Rev: Oct.18.2026
+Code checker: flake8, pylint
+
+This file is part of Videomass.
+
+   Videomass is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   Videomass is distributed in the hope that it will be useful,
+   but WITHOUT ANY WARRANTY; without even the implied warranty of
+   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+   GNU General Public License for more details.
+
+   You should have received a copy of the GNU General Public License
+   along with Videomass.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import os
+import json
+import time
+import hashlib
+from threading import Lock
+from videomass.vdms_utils.utils import sampled_digest
+
+
+def job_key(item):
+    """
+    Returns a key which identifies a queue item by its
+    content, so that a modified item is never taken as
+    the same job.
+    """
+    data = json.dumps(item, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()
+# ----------------------------------------------------------------------
+
+
+def checksum(filename):
+    """
+    Returns the `sampled_digest` of `filename`, so that even
+    very large outputs are verified quickly. Raises OSError.
+    """
+    return sampled_digest(filename)
+# ----------------------------------------------------------------------
+
+
+class JobJournal:
+    """
+    Append-only journal (JSON lines) of the state of the
+    queue jobs: 'queued', 'running', 'done' or 'failed'.
+    Each record is flushed to disk as soon as it is written,
+    so that the state of an interrupted queue (crash, reboot
+    or stop) survives and the queue can be resumed. The last
+    record of each job wins.
+
+    Usage:
+        >>> journal = JobJournal('/path/to/queue.journal')
+        >>> journal.record(key, 'running', output=destination)
+        >>> journal.record(key, 'done', output=destination)
+        >>> journal.finished(key)  # True if output is verified
+    """
+    def __init__(self, filename):
+        """
+        The existing records of `filename` are loaded.
+        """
+        self.filename = filename
+        self.lock = Lock()
+        self.jobs = self.load()
+
+    def load(self):
+        """
+        Returns a dict of the last record of each job.
+        Truncated or invalid lines (e.g. due to a crash
+        while writing) are ignored.
+        """
+        jobs = {}
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as fln:
+                for line in fln:
+                    try:
+                        rec = json.loads(line)
+                        jobs[rec['key']] = rec
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except OSError:
+            pass
+        return jobs
+
+    def record(self, key, state, output=None):
+        """
+        Appends a new state of the `key` job. For the 'done'
+        state, size and checksum of `output` are recorded too.
+        """
+        rec = {'key': key, 'state': state, 'time': time.time(),
+               'output': output}
+        if state == 'done' and output:
+            try:
+                rec['size'] = os.path.getsize(output)
+                rec['checksum'] = checksum(output)
+            except OSError:
+                rec['state'] = 'failed'
+        line = json.dumps(rec, ensure_ascii=False) + '\n'
+        with self.lock:
+            self.jobs[key] = rec
+            try:
+                with open(self.filename, 'a', encoding='utf-8') as fln:
+                    fln.write(line)
+                    fln.flush()
+                    os.fsync(fln.fileno())
+            except OSError:
+                pass
+
+    def state(self, key):
+        """
+        Returns the last state of the `key` job, None if
+        it is unknown.
+        """
+        rec = self.jobs.get(key)
+        return rec['state'] if rec else None
+
+    def finished(self, key):
+        """
+        Returns True if the `key` job is done and its output
+        still has the recorded size and checksum.
+        """
+        rec = self.jobs.get(key)
+        if not rec or rec['state'] != 'done' or not rec.get('output'):
+            return False
+        try:
+            return (os.path.getsize(rec['output']) == rec.get('size')
+                    and checksum(rec['output']) == rec.get('checksum'))
+        except OSError:
+            return False
+
+    def discard_partial(self, key):
+        """
+        Removes the output left by an interrupted `key` job.
+        """
+        rec = self.jobs.get(key)
+        if rec and rec['state'] == 'running' and rec.get('output'):
+            try:
+                os.remove(rec['output'])
+            except OSError:
+                pass
+
+    def clear(self):
+        """
+        Removes all records along with the journal file.
+        """
+        with self.lock:
+            self.jobs.clear()
+            try:
+                os.remove(self.filename)
+            except OSError:
+                pass
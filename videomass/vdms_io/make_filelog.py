@@ -6,7 +6,7 @@ Compatibility: Python3, Python2
 Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
 Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
 license: GPL3
-Rev: Sep.19.2025
+Rev: Oct.18.2026
 Code checker: flake8, pylint
 
 This file is part of Videomass.
@@ -27,12 +27,208 @@ This file is part of Videomass.
 
 import time
 import os
+import queue
+from threading import Thread, Event, Lock
 
 
-def tolog(info, logfile, sep=False, wdate=False, txtenc="utf-8"):
+class LogWriter:
     """
-    This function writes log events as information messages
-    to a given `logfile` during the processes.
+    Buffered background writer of the log files.
+
+    Records are taken through a queue by a writer thread which
+    keeps one open handle per log file and writes the buffered
+    text when it exceeds `FLUSH_SIZE` bytes, after `FLUSH_TIME`
+    seconds, or on request (see `flush`), e.g. at the end of a
+    job. A log file larger than `MAX_SIZE` bytes is rotated to
+    `name.log.1` (one backup). Handles are closed and the thread
+    ends after `IDLE_TIME` seconds without records; it is started
+    again by the next record. If a log file cannot be written,
+    its text is kept (up to `MAX_SIZE` bytes) and written again
+    on the next flush, the error is reported once by calling
+    `onerror(logfile, error)`, if set, from the writer thread.
+
+    Usage:
+        >>> LOGWRITER.write('/path/to/file.log', 'text')
+        >>> LOGWRITER.flush()
+    """
+    FLUSH_SIZE = 64 * 1024
+    FLUSH_TIME = 1.0
+    MAX_SIZE = 10 * 1024 * 1024
+    IDLE_TIME = 10.0
+
+    def __init__(self):
+        """
+        `self.files` maps a log pathname to a dict with
+        the open handle (None until the first write) and
+        the buffered text.
+        """
+        self.records = queue.Queue()
+        self.files = {}
+        self.thread = None
+        self.lock = Lock()
+        self.onerror = None  # see `failed`
+
+    def write(self, logfile, text, txtenc="utf-8", mode="a"):
+        """
+        Appends `text` to `logfile`. With `mode="w"` the file
+        is truncated first. It can be called from any thread.
+        """
+        self.put(('write', logfile, text, txtenc, mode))
+
+    def flush(self, close=False, timeout=5):
+        """
+        Writes all the buffered text and waits for it (up to
+        `timeout` seconds). With `close=True` the handles are
+        also closed, e.g. before modifying the log files or
+        exiting the application.
+        """
+        done = Event()
+        self.put(('close' if close else 'flush', done))
+        done.wait(timeout)
+
+    def put(self, record):
+        """
+        Queues a record, starting the writer thread if needed.
+        """
+        with self.lock:
+            self.records.put(record)
+            if self.thread is None:
+                self.thread = Thread(target=self.run, daemon=True)
+                self.thread.start()
+
+    def run(self):
+        """
+        Writer thread.
+        """
+        lastflush = idle = time.monotonic()
+        while True:
+            try:
+                record = self.records.get(timeout=LogWriter.FLUSH_TIME)
+            except queue.Empty:
+                record = None
+
+            now = time.monotonic()
+            if record is None:
+                self.write_all()
+                if now - idle >= LogWriter.IDLE_TIME:
+                    self.close_all()
+                    with self.lock:
+                        if self.records.empty():
+                            self.thread = None
+                            return
+                continue
+
+            idle = now
+            if record[0] == 'write':
+                self.buffer(*record[1:])
+            else:
+                self.write_all()
+                if record[0] == 'close':
+                    self.close_all()
+                record[1].set()
+                lastflush = now
+
+            if now - lastflush >= LogWriter.FLUSH_TIME:
+                self.write_all()
+                lastflush = now
+
+    def buffer(self, logfile, text, txtenc, mode):
+        """
+        Adds `text` to the buffer of `logfile`.
+        """
+        entry = self.files.get(logfile)
+        if mode == 'w' or entry is None or entry['txtenc'] != txtenc:
+            if entry is not None:
+                self.write_file(logfile, entry)
+                if entry['handle']:
+                    entry['handle'].close()
+            entry = {'handle': None, 'mode': mode, 'txtenc': txtenc,
+                     'text': [], 'size': 0, 'error': None}
+            self.files[logfile] = entry
+
+        entry['text'].append(text)
+        entry['size'] += len(text)
+        if entry['size'] >= LogWriter.FLUSH_SIZE:
+            self.write_file(logfile, entry)
+
+    def write_file(self, logfile, entry):
+        """
+        Writes the buffered text of a log file, opening it
+        if needed and rotating it when it exceeds `MAX_SIZE`.
+        On error the text stays in the buffer.
+        """
+        if not entry['text']:
+            return
+        text = ''.join(entry['text'])
+        try:
+            handle = entry['handle']
+            if handle is None:
+                handle = open(logfile, entry['mode'],
+                              encoding=entry['txtenc'])
+                entry['handle'], entry['mode'] = handle, 'a'
+            if handle.tell() + len(text) > LogWriter.MAX_SIZE:
+                entry['handle'] = None
+                handle.close()
+                os.replace(logfile, f'{logfile}.1')
+                handle = open(logfile, 'a', encoding=entry['txtenc'])
+                entry['handle'] = handle
+            handle.write(text)
+            handle.flush()
+        except (OSError, ValueError) as err:
+            self.failed(logfile, entry, err)
+            return
+        entry['text'], entry['size'], entry['error'] = [], 0, None
+
+    def failed(self, logfile, entry, err):
+        """
+        Keeps the buffered text of a log file which cannot be
+        written, dropping the oldest one beyond `MAX_SIZE`,
+        and reports the error once until the next success.
+        """
+        while entry['size'] > LogWriter.MAX_SIZE and len(entry['text']) > 1:
+            entry['size'] -= len(entry['text'].pop(0))
+        if entry['handle'] is not None and entry['handle'].closed:
+            entry['handle'] = None
+        if entry['error'] is None and self.onerror is not None:
+            self.onerror(logfile, str(err))
+        entry['error'] = str(err)
+
+    def write_all(self):
+        """
+        Writes the buffered text of all log files.
+        """
+        for logfile, entry in self.files.items():
+            self.write_file(logfile, entry)
+
+    def close_all(self):
+        """
+        Writes the buffered text and closes all handles.
+        """
+        self.write_all()
+        for logfile, entry in list(self.files.items()):
+            if entry['handle']:
+                entry['handle'].close()
+                entry['handle'] = None
+            if not entry['text']:
+                del self.files[logfile]
+
+
+LOGWRITER = LogWriter()
+
+
+def flush_logs(close=False):
+    """
+    Writes the buffered text of all log files,
+    see `LogWriter.flush`.
+    """
+    LOGWRITER.flush(close=close)
+# ----------------------------------------------------------------#
+
+
+def log_entry(info, sep=False, wdate=False):
+    """
+    Returns the text of a log event formatted as `tolog`
+    writes it, with optional separator line and date.
     """
     if sep:
         line = '\n' + '-' * 80 + '\n'
@@ -45,10 +241,26 @@ def tolog(info, logfile, sep=False, wdate=False, txtenc="utf-8"):
     else:
         strdate = ''
 
-    apnd = f'{line}{strdate}{info}\n'
+    return f'{line}{strdate}{info}\n'
+# ----------------------------------------------------------------#
+
 
-    with open(logfile, "a", encoding=txtenc) as log:
-        log.write(apnd)
+def tolog(info, logfile, sep=False, wdate=False, txtenc="utf-8"):
+    """
+    This function writes log events as information messages
+    to a given `logfile` during the processes.
+    """
+    append_to_log(log_entry(info, sep=sep, wdate=wdate), logfile, txtenc)
+# ----------------------------------------------------------------#
+
+
+def append_to_log(text, logfile, txtenc="utf-8"):
+    """
+    Appends an already formatted `text` to the given `logfile`,
+    e.g. a whole section collected by a job during processing.
+    The text is written by the background `LOGWRITER`.
+    """
+    LOGWRITER.write(logfile, text, txtenc)
 # ----------------------------------------------------------------#
 
 
@@ -67,13 +279,13 @@ def make_log_template(logname, logdir, mode="a", txtenc="utf-8"):
     current_date = time.strftime("%c")  # date/time
     logfile = os.path.join(logdir, logname)
 
-    with open(logfile, mode, encoding=txtenc) as log:
-        log.write(f"""{sep}
+    LOGWRITER.write(logfile, f"""{sep}
 
 [PROGRAM NAME]: Videomass
 
 [SESSION DATE]: {current_date}
 
 [LOGFILE LOCATION]: "{logfile}"
-""")
+""", txtenc, mode)
+    LOGWRITER.flush()  # the file exists on return
     return logfile
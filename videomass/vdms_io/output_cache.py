@@ -0,0 +1,235 @@
+# -*- coding: UTF-8 -*-
+"""
+Name: output_cache.py
+Porpose: reuse the outputs of identical FFmpeg jobs
+Compatibility: Python3
+Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
+Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
+license: GPL3
+Rev: Oct.18.2026
+Code checker: flake8, pylint
+
+This file is part of Videomass.
+
+   Videomass is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   Videomass is distributed in the hope that it will be useful,
+   but WITHOUT ANY WARRANTY; without even the implied warranty of
+   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+   GNU General Public License for more details.
+
+   You should have received a copy of the GNU General Public License
+   along with Videomass.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import os
+import json
+import time
+import shutil
+import sqlite3
+import hashlib
+from threading import Lock
+from videomass.vdms_io.job_journal import checksum
+from videomass.vdms_utils.utils import fingerprint, stored_digest
+
+# placeholders of the pathnames in the fingerprinted command lines
+SOURCE = '{SOURCE}'
+OUTPUT = '{OUTPUT}'
+
+
+def place_output(found, dest):
+    """
+    Makes `dest` a copy of the cached output `found`. It is
+    never a hard link, which FFmpeg would later overwrite in
+    place along with the cached output. Returns None on
+    success, the error message otherwise.
+    """
+    if os.path.exists(dest) and os.path.samefile(found, dest):
+        return None
+    tmp = f'{dest}.part'
+    try:
+        shutil.copy2(found, tmp)
+        os.replace(tmp, dest)
+    except OSError as err:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        return str(err)
+    return None
+# ----------------------------------------------------------------------
+
+
+def unshare_output(dest):
+    """
+    Removes `dest` if it is a hard link (e.g. made by an older
+    `place_output`), so that encoding it again never overwrites
+    the content of the other links.
+    """
+    try:
+        if os.path.isfile(dest) and os.stat(dest).st_nlink > 1:
+            os.remove(dest)
+    except OSError:
+        pass
+# ----------------------------------------------------------------------
+
+
+class OutputCache:
+    """
+    SQLite database of the outputs produced by FFmpeg jobs,
+    keyed by a fingerprint of the job: identity of the source
+    file (absolute path and `fingerprint`, or the digest of its
+    whole content in the full content mode), command lines with
+    placeholders for the pathnames of the source and output
+    (SOURCE, OUTPUT), extension of the output (i.e. the container
+    chosen by FFmpeg) and the FFmpeg version. The entry
+    records the pathname, size and checksum of the output, so
+    that an output moved, deleted or modified is never reused.
+    The least recently used entries are evicted beyond
+    `maxentries`. The cache is disabled until `open` is called.
+
+    Usage:
+        >>> OUTPUTCACHE.open('/path/to/output_cache.db')
+        >>> fprint = OUTPUTCACHE.fingerprint(source, destination,
+        >>>                                  cmdlines, version)
+        >>> found = OUTPUTCACHE.lookup(fprint)
+        >>> if found is None:
+        >>>     ...  # encode
+        >>>     OUTPUTCACHE.record(fprint, destination)
+    """
+    MAXENTRIES = 20000
+
+    def __init__(self):
+        """
+        A single connection is shared by all threads.
+        """
+        self.conn = None
+        self.lock = Lock()
+        self.maxentries = OutputCache.MAXENTRIES
+
+    def open(self, dbpath, maxentries=None):
+        """
+        Opens (or creates) the database file `dbpath`.
+        Returns None on success, the error message otherwise.
+        """
+        try:
+            conn = sqlite3.connect(dbpath, check_same_thread=False)
+            conn.execute('CREATE TABLE IF NOT EXISTS outputs ('
+                         'fprint TEXT PRIMARY KEY, path TEXT, '
+                         'size INTEGER, checksum TEXT, atime REAL)')
+            conn.execute('CREATE INDEX IF NOT EXISTS outputs_atime '
+                         'ON outputs (atime)')
+            conn.commit()
+        except sqlite3.Error as err:
+            return str(err)
+
+        with self.lock:
+            self.conn = conn
+            if maxentries:
+                self.maxentries = maxentries
+        return None
+
+    def fingerprint(self, source, destination, cmdlines, version,
+                    store=None):
+        """
+        Returns the fingerprint of a job, None if the cache
+        is disabled or `source` is not a regular file. Only
+        the extension of `destination` is part of it.
+        Given a `store` (see `DigestThread`), the source is
+        identified by the digest of its whole content, which
+        is computed now if not stored yet.
+        """
+        if self.conn is None or not os.path.isfile(source):
+            return None
+        try:
+            if store is None:
+                ident = fingerprint(source)
+            else:
+                ident = f'content:{stored_digest(source, store, True)}'
+        except OSError:
+            return None
+        ext = os.path.splitext(destination)[1].lower()
+        data = json.dumps([os.path.abspath(source), ident,
+                           list(cmdlines), ext, version],
+                          ensure_ascii=False)
+        return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+    def lookup(self, fprint):
+        """
+        Returns the pathname of the output of `fprint`, None
+        if it is unknown or no longer has the recorded size
+        and checksum.
+        """
+        if self.conn is None or not fprint:
+            return None
+        with self.lock:
+            try:
+                row = self.conn.execute('SELECT path, size, checksum FROM '
+                                        'outputs WHERE fprint=?',
+                                        (fprint,)).fetchone()
+            except sqlite3.Error:
+                return None
+        if row is None:
+            return None
+        try:
+            valid = (os.path.getsize(row[0]) == row[1]
+                     and checksum(row[0]) == row[2])
+        except OSError:
+            valid = False
+        with self.lock:
+            try:
+                if valid:
+                    self.conn.execute('UPDATE outputs SET atime=? WHERE '
+                                      'fprint=?', (time.time(), fprint))
+                else:
+                    self.conn.execute('DELETE FROM outputs WHERE fprint=?',
+                                      (fprint,))
+                self.conn.commit()
+            except sqlite3.Error:
+                pass
+        return row[0] if valid else None
+
+    def record(self, fprint, output):
+        """
+        Stores `output` as the result of `fprint`, evicting
+        the least recently used entries if needed.
+        """
+        if self.conn is None or not fprint:
+            return
+        try:
+            output = os.path.abspath(output)
+            entry = (fprint, output, os.path.getsize(output),
+                     checksum(output), time.time())
+        except OSError:
+            return
+        with self.lock:
+            try:
+                self.conn.execute('INSERT OR REPLACE INTO outputs VALUES '
+                                  '(?, ?, ?, ?, ?)', entry)
+                count = self.conn.execute('SELECT COUNT(*) FROM '
+                                          'outputs').fetchone()[0]
+                if count > self.maxentries:
+                    self.conn.execute('DELETE FROM outputs WHERE rowid IN '
+                                      '(SELECT rowid FROM outputs ORDER BY '
+                                      'atime LIMIT ?)',
+                                      (count - self.maxentries,))
+                self.conn.commit()
+            except sqlite3.Error:
+                pass
+
+    def clear(self):
+        """
+        Forgets all the outputs (the files are not removed).
+        """
+        if self.conn is None:
+            return
+        with self.lock:
+            try:
+                self.conn.execute('DELETE FROM outputs')
+                self.conn.commit()
+                self.conn.execute('VACUUM')
+            except sqlite3.Error:
+                pass
+
+
+OUTPUTCACHE = OutputCache()
@@ -0,0 +1,85 @@
+# -*- coding: UTF-8 -*-
+"""
+Name: peak_cache.py
+Porpose: persistent cache of the timeline waveform peaks
+Compatibility: Python3
+Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
+Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
+license: GPL3
+Rev: Oct.18.2026
+Code checker: flake8, pylint
+
+This file is part of Videomass.
+
+   Videomass is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   Videomass is distributed in the hope that it will be useful,
+   but WITHOUT ANY WARRANTY; without even the implied warranty of
+   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+   GNU General Public License for more details.
+
+   You should have received a copy of the GNU General Public License
+   along with Videomass.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import os
+from videomass.vdms_io.trf_cache import TransformCache
+
+
+class PeakCache(TransformCache):
+    """
+    Directory of the serialized waveform peak pyramids (see
+    `PeakPyramid.to_bytes`), one file for each source file
+    identity and decoding `variant` (e.g. the audio stream
+    and sample rate), passed as the `detect` argument of
+    `key`. It shares the least recently used eviction of
+    the vid.stab transform cache.
+
+    Usage:
+        >>> PEAKCACHE.open('/path/to/cache/waveform')
+        >>> key = PEAKCACHE.key(source, 'a:0 8000 256')
+        >>> data = PEAKCACHE.read(key)
+        >>> if data is None:
+        >>>     PEAKCACHE.write(key, pyramid.to_bytes())
+    """
+    MAXSIZE = 64 * 1024 * 1024
+    SUFFIX = '.peaks'
+
+    def read(self, key):
+        """
+        Returns the bytes cached with `key`, None
+        on a cache miss.
+        """
+        if not key:
+            return None
+        cached = os.path.join(self.dirpath, f'{key}{self.SUFFIX}')
+        with self.lock:
+            try:
+                with open(cached, 'rb') as fname:
+                    data = fname.read()
+                os.utime(cached)  # most recently used
+            except OSError:
+                return None
+        return data
+
+    def write(self, key, data):
+        """
+        Stores the `data` bytes with `key`, then evicts
+        the oldest files if needed.
+        """
+        if not key:
+            return
+        cached = os.path.join(self.dirpath, f'{key}{self.SUFFIX}')
+        with self.lock:
+            try:
+                with open(f'{cached}.tmp', 'wb') as fname:
+                    fname.write(data)
+                os.replace(f'{cached}.tmp', cached)
+            except OSError:
+                return
+            self.evict()
+
+
+PEAKCACHE = PeakCache()
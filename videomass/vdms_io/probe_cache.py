@@ -0,0 +1,164 @@
+# -*- coding: UTF-8 -*-
+"""
+Name: probe_cache.py
+Porpose: persistent cache of the ffprobe data
+Compatibility: Python3
+Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
+Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
+license: GPL3
+Rev: Oct.18.2026
+Code checker: flake8, pylint
+
+This file is part of Videomass.
+
+   Videomass is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   Videomass is distributed in the hope that it will be useful,
+   but WITHOUT ANY WARRANTY; without even the implied warranty of
+   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+   GNU General Public License for more details.
+
+   You should have received a copy of the GNU General Public License
+   along with Videomass.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import os
+import time
+import sqlite3
+from threading import Lock
+
+
+class ProbeCache:
+    """
+    SQLite database of the ffprobe output of media files, keyed
+    by absolute pathname and by a `variant` string (e.g. the
+    ffprobe options used). An entry is only valid as long as the
+    size and the modification time of the file are unchanged.
+    The least recently used entries are evicted beyond
+    `maxentries`. The cache is disabled until `open` is called.
+
+    Usage:
+        >>> PROBECACHE.open('/path/to/probe_cache.db')
+        >>> text = PROBECACHE.get(filename, '-hide_banner')
+        >>> if text is None:
+        >>>     PROBECACHE.put(filename, '-hide_banner', text)
+    """
+    MAXENTRIES = 20000
+
+    def __init__(self):
+        """
+        A single connection is shared by all threads.
+        """
+        self.conn = None
+        self.lock = Lock()
+        self.maxentries = ProbeCache.MAXENTRIES
+
+    def open(self, dbpath, maxentries=None):
+        """
+        Opens (or creates) the database file `dbpath`.
+        Returns None on success, the error message otherwise.
+        """
+        try:
+            conn = sqlite3.connect(dbpath, check_same_thread=False)
+            conn.execute('CREATE TABLE IF NOT EXISTS probes ('
+                         'path TEXT, variant TEXT, size INTEGER, '
+                         'mtime INTEGER, atime REAL, data TEXT, '
+                         'PRIMARY KEY (path, variant))')
+            conn.execute('CREATE INDEX IF NOT EXISTS probes_atime '
+                         'ON probes (atime)')
+            conn.commit()
+        except sqlite3.Error as err:
+            return str(err)
+
+        with self.lock:
+            self.conn = conn
+            if maxentries:
+                self.maxentries = maxentries
+        return None
+
+    @staticmethod
+    def identity(filename):
+        """
+        Returns (abspath, size, mtime) of `filename`,
+        None if it is not a regular file.
+        """
+        try:
+            stat = os.stat(filename)
+        except (OSError, ValueError):
+            return None
+        if not os.path.isfile(filename):
+            return None
+        return os.path.abspath(filename), stat.st_size, stat.st_mtime_ns
+
+    def get(self, filename, variant=''):
+        """
+        Returns the cached text of `filename`, None if it
+        is missing or outdated.
+        """
+        ident = self.identity(filename)
+        if self.conn is None or ident is None:
+            return None
+        path, size, mtime = ident
+        with self.lock:
+            try:
+                row = self.conn.execute('SELECT size, mtime, data FROM '
+                                        'probes WHERE path=? AND variant=?',
+                                        (path, variant)).fetchone()
+                if row is None:
+                    return None
+                if row[:2] != (size, mtime):
+                    self.conn.execute('DELETE FROM probes WHERE path=?',
+                                      (path,))
+                    self.conn.commit()
+                    return None
+                self.conn.execute('UPDATE probes SET atime=? WHERE path=? '
+                                  'AND variant=?',
+                                  (time.time(), path, variant))
+                self.conn.commit()
+            except sqlite3.Error:
+                return None
+        return row[2]
+
+    def put(self, filename, variant, data):
+        """
+        Stores the `data` text of `filename`, evicting the
+        least recently used entries if needed.
+        """
+        ident = self.identity(filename)
+        if self.conn is None or ident is None:
+            return
+        with self.lock:
+            try:
+                self.conn.execute('INSERT OR REPLACE INTO probes VALUES '
+                                  '(?, ?, ?, ?, ?, ?)',
+                                  ident[:1] + (variant,) + ident[1:]
+                                  + (time.time(), data))
+                count = self.conn.execute('SELECT COUNT(*) FROM '
+                                          'probes').fetchone()[0]
+                if count > self.maxentries:
+                    self.conn.execute('DELETE FROM probes WHERE rowid IN '
+                                      '(SELECT rowid FROM probes ORDER BY '
+                                      'atime LIMIT ?)',
+                                      (count - self.maxentries,))
+                self.conn.commit()
+            except sqlite3.Error:
+                pass
+
+    def clear(self):
+        """
+        Invalidates all entries.
+        """
+        if self.conn is None:
+            return
+        with self.lock:
+            try:
+                self.conn.execute('DELETE FROM probes')
+                self.conn.commit()
+                self.conn.execute('VACUUM')
+            except sqlite3.Error:
+                pass
+
+
+PROBECACHE = ProbeCache()
@@ -0,0 +1,176 @@
+# -*- coding: UTF-8 -*-
+"""
+Name: trf_cache.py
+Porpose: size-bounded cache of the vid.stab transform files
+Compatibility: Python3
+Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
+Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
+license: GPL3
+Rev: Oct.18.2026
+Code checker: flake8, pylint
+
+This file is part of Videomass.
+
+   Videomass is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   Videomass is distributed in the hope that it will be useful,
+   but WITHOUT ANY WARRANTY; without even the implied warranty of
+   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+   GNU General Public License for more details.
+
+   You should have received a copy of the GNU General Public License
+   along with Videomass.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import os
+import re
+import shutil
+import hashlib
+from threading import Lock
+from videomass.vdms_utils.utils import fingerprint
+
+# file written by vidstabdetect and read by vidstabtransform
+# in the working directory of FFmpeg (default `result` option)
+TRF_NAME = 'transforms.trf'
+
+
+def detect_filter(args):
+    """
+    Returns the `vidstabdetect=...` filter of the FFmpeg
+    `args` string, None if there is not.
+    """
+    found = re.search(r'vidstabdetect=[^\s,;"\']*', args)
+    return found.group() if found else None
+# ----------------------------------------------------------------------
+
+
+class TransformCache:
+    """
+    Directory of vid.stab transform files (.trf), named by a
+    digest of everything the motion detection depends on: the
+    source file identity (absolute path and `fingerprint`),
+    the detection parameters and the time range. The
+    transform options (smoothing, zoom, tripod, ...) are not
+    part of the key, so changing them reuses the detection.
+    Once the total size exceeds `maxsize` bytes, the least
+    recently used files are removed. The cache is disabled
+    until `open` is called.
+
+    Usage:
+        >>> TRFCACHE.open('/path/to/cache/vidstab')
+        >>> key = TRFCACHE.key(source, detect, '-ss 10', '-t 30')
+        >>> if not TRFCACHE.fetch(key, 'transforms.trf'):
+        >>>     ...  # run vidstabdetect
+        >>>     TRFCACHE.store(key, 'transforms.trf')
+    """
+    MAXSIZE = 512 * 1024 * 1024
+    SUFFIX = '.trf'
+
+    def __init__(self):
+        """
+        `self.dirpath` is None while the cache is disabled.
+        """
+        self.dirpath = None
+        self.maxsize = self.MAXSIZE
+        self.lock = Lock()
+
+    def open(self, dirpath, maxsize=None):
+        """
+        Sets (and creates) the cache directory. Returns None
+        on success, the error message otherwise.
+        """
+        try:
+            os.makedirs(dirpath, exist_ok=True)
+        except OSError as err:
+            return str(err)
+        self.dirpath = dirpath
+        if maxsize:
+            self.maxsize = maxsize
+        return None
+
+    def key(self, source, detect, *extra):
+        """
+        Returns the key of the detection of `source` with the
+        `detect` filter and `extra` strings (e.g. time range),
+        None if the cache is disabled or `source` is missing.
+        """
+        if self.dirpath is None or not detect:
+            return None
+        try:
+            ident = [os.path.abspath(source), fingerprint(source),
+                     detect.strip()]
+        except (OSError, ValueError):
+            return None
+        ident.extend(' '.join(str(x).split()) for x in extra)
+        return hashlib.sha1('\0'.join(ident).encode('utf-8')).hexdigest()
+
+    def fetch(self, key, dest):
+        """
+        Copies the cached transform file of `key` to `dest`.
+        Returns True on a cache hit.
+        """
+        if not key:
+            return False
+        cached = os.path.join(self.dirpath, f'{key}{self.SUFFIX}')
+        with self.lock:
+            try:
+                shutil.copyfile(cached, dest)
+                os.utime(cached)  # most recently used
+            except OSError:
+                return False
+        return True
+
+    def store(self, key, src):
+        """
+        Adds the `src` transform file with `key`, then
+        evicts the oldest files if needed.
+        """
+        if not key or not os.path.isfile(src):
+            return
+        cached = os.path.join(self.dirpath, f'{key}{self.SUFFIX}')
+        with self.lock:
+            try:
+                shutil.copyfile(src, f'{cached}.tmp')
+                os.replace(f'{cached}.tmp', cached)
+            except OSError:
+                return
+            self.evict()
+
+    def evict(self):
+        """
+        Removes the least recently used files beyond `maxsize`.
+        """
+        files = []
+        try:
+            with os.scandir(self.dirpath) as entries:
+                for entry in entries:
+                    if entry.name.endswith(self.SUFFIX) and entry.is_file():
+                        stat = entry.stat()
+                        files.append((stat.st_mtime, stat.st_size,
+                                      entry.path))
+        except OSError:
+            return
+        total = sum(size for mtime, size, path in files)
+        for mtime, size, path in sorted(files):
+            if total <= self.maxsize:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                continue
+
+    def clear(self):
+        """
+        Removes all the cached files.
+        """
+        if self.dirpath is None:
+            return
+        with self.lock:
+            shutil.rmtree(self.dirpath, ignore_errors=True)
+            os.makedirs(self.dirpath, exist_ok=True)
+
+
+TRFCACHE = TransformCache()
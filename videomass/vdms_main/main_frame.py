@@ -6,7 +6,7 @@ Compatibility: Python3, wxPython Phoenix
 Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
 Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
 license: GPL3
-Rev: Sept.17.2025
+Rev: Oct.18.2026
 Code checker: flake8, pylint
 
 This file is part of Videomass.
@@ -26,41 +26,28 @@ This file is part of Videomass.
 """
 import os
 import sys
+import importlib
 import webbrowser
 import wx
 from pubsub import pub
 from videomass.vdms_utils.get_bmpfromsvg import get_bmp
+from videomass.vdms_io.job_journal import JobJournal
 from videomass.vdms_utils.queue_utils import load_json_file_queue
-from videomass.vdms_utils.queue_utils import write_json_file_queue
 from videomass.vdms_utils.queue_utils import extend_data_queue
-from videomass.vdms_dialogs import preferences
-from videomass.vdms_dialogs import set_timestamp
-from videomass.vdms_dialogs import about_dialog
-from videomass.vdms_dialogs import videomass_check_version
-from videomass.vdms_dialogs.while_playing import WhilePlaying
-from videomass.vdms_dialogs.ffmpeg_conf import FFmpegConf
-from videomass.vdms_dialogs.ffmpeg_codecs import FFmpegCodecs
-from videomass.vdms_dialogs.ffmpeg_formats import FFmpegFormats
-from videomass.vdms_dialogs.queuedlg import QueueManager
-from videomass.vdms_dialogs.mediainfo import MediaStreams
-from videomass.vdms_dialogs.showlogs import ShowLogs
-from videomass.vdms_dialogs.ffmpeg_help import FFmpegHelp
+from videomass.vdms_utils.queue_store import QueueStore
 from videomass.vdms_dialogs.widget_utils import CountDownDlg
 from videomass.vdms_miniframes import timeline
 from videomass.vdms_panels import choose_topic
 from videomass.vdms_panels import filedrop
-from videomass.vdms_panels import av_conversions
-from videomass.vdms_panels import concatenate
-from videomass.vdms_panels import video_to_sequence
-from videomass.vdms_panels import sequence_to_video
 from videomass.vdms_panels.long_processing_task import LogOut
-from videomass.vdms_panels import presets_manager
 from videomass.vdms_io import io_tools
+from videomass.vdms_io.make_filelog import LOGWRITER
 from videomass.vdms_sys.about_app import VERSION
 from videomass.vdms_sys.settings_manager import ConfigManager
 from videomass.vdms_sys.argparser import info_this_platform
 from videomass.vdms_utils.utils import copydir_recursively
 from videomass.vdms_threads.shutdown import shutdown_system
+from videomass.vdms_sys.startup_profile import STARTUP
 
 
 class MainFrame(wx.Frame):
@@ -79,6 +66,15 @@ class MainFrame(wx.Frame):
     DARK_BROWN = '#262222'
     WHITE = '#fbf4f4'
     BLACK = '#060505'
+    # topic panels built the first time they are shown, as
+    # {attribute name: (module of vdms_panels, class name)},
+    # see `__getattr__`.
+    TOPIC_PANELS = {'AVconvPanel': ('av_conversions', 'AV_Conv'),
+                    'PrstsPanel': ('presets_manager', 'PrstPan'),
+                    'ConcatDemuxer': ('concatenate', 'Conc_Demuxer'),
+                    'toPictures': ('video_to_sequence', 'VideoToSequence'),
+                    'toSlideshow': ('sequence_to_video', 'SequenceToVideo'),
+                    }
     # -------------------------------------------------------------#
 
     def __init__(self, appdata):
@@ -102,7 +98,9 @@ class MainFrame(wx.Frame):
         self.autoexit = True  # set autoexit during ffplay playback
         self.movetotrash = self.appdata['move_file_to_trash']  # boolean
         self.emptylist = self.appdata['move_file_to_trash']  # boolean
-        self.queuelist = None  # list data to process queue
+        self.queuestore = QueueStore(os.path.join(self.appdata["confdir"],
+                                                  'queue.backup'))
+        self.queuelist = self.queuestore.items  # list data to process queue
         self.removequeue = True  # Remove items queue when finished
         self.mediastreams = False
         self.showlogs = False
@@ -130,42 +128,32 @@ class MainFrame(wx.Frame):
 
         wx.Frame.__init__(self, None, -1, style=wx.DEFAULT_FRAME_STYLE)
 
-        # panel instances:
-        self.ChooseTopic = choose_topic.Choose_Topic(self)
-        self.AVconvPanel = av_conversions.AV_Conv(self)
-        self.fileDnDTarget = filedrop.FileDnD(self,
-                                              self.outputnames,
-                                              self.data_files,
-                                              self.file_src,
-                                              self.duration,
-                                              )
-        self.ProcessPanel = LogOut(self)
-        self.PrstsPanel = presets_manager.PrstPan(self)
-        self.ConcatDemuxer = concatenate.Conc_Demuxer(self)
-        self.toPictures = video_to_sequence.VideoToSequence(self)
-        self.toSlideshow = sequence_to_video.SequenceToVideo(self)
+        # panel instances (topic panels are built on demand):
+        with STARTUP.span('build Choose_Topic'):
+            self.ChooseTopic = choose_topic.Choose_Topic(self)
+        with STARTUP.span('build FileDnD'):
+            self.fileDnDTarget = filedrop.FileDnD(self,
+                                                  self.outputnames,
+                                                  self.data_files,
+                                                  self.file_src,
+                                                  self.duration,
+                                                  )
+        with STARTUP.span('build LogOut'):
+            self.ProcessPanel = LogOut(self)
         # miniframes
-        self.TimeLine = timeline.Float_TL(parent=wx.GetTopLevelParent(self))
+        with STARTUP.span('build Float_TL'):
+            self.TimeLine = timeline.Float_TL(
+                parent=wx.GetTopLevelParent(self))
         self.TimeLine.Hide()
         # hide all panels
         self.fileDnDTarget.Hide()
-        self.AVconvPanel.Hide()
         self.ProcessPanel.Hide()
-        self.PrstsPanel.Hide()
-        self.ConcatDemuxer.Hide()
-        self.toPictures.Hide()
-        self.toSlideshow.Hide()
         # global sizer base
         self.mainSizer = wx.BoxSizer(wx.VERTICAL)
         # Layout external panels:
         self.mainSizer.Add(self.ChooseTopic, 1, wx.EXPAND)
         self.mainSizer.Add(self.fileDnDTarget, 1, wx.EXPAND)
-        self.mainSizer.Add(self.AVconvPanel, 1, wx.EXPAND)
         self.mainSizer.Add(self.ProcessPanel, 1, wx.EXPAND)
-        self.mainSizer.Add(self.PrstsPanel, 1, wx.EXPAND)
-        self.mainSizer.Add(self.ConcatDemuxer, 1, wx.EXPAND)
-        self.mainSizer.Add(self.toPictures, 1, wx.EXPAND)
-        self.mainSizer.Add(self.toSlideshow, 1, wx.EXPAND)
 
         # Set frame properties
         self.SetTitle("Videomass")
@@ -179,9 +167,11 @@ class MainFrame(wx.Frame):
         self.SetSize(tuple(self.appdata['main_window_size']))
         self.Move(tuple(self.appdata['main_window_pos']))
         # create menu bar
-        self.videomass_menu_bar()
+        with STARTUP.span('menu bar'):
+            self.videomass_menu_bar()
         # cretae tool bar
-        self.videomass_tool_bar()
+        with STARTUP.span('tool bar'):
+            self.videomass_tool_bar()
         # create status bar
         self.sb = self.CreateStatusBar(1)
         self.statusbar_msg(_('Ready'), None)
@@ -197,24 +187,65 @@ class MainFrame(wx.Frame):
         pub.subscribe(self.check_modeless_window, "DESTROY_ORPHANED_WINDOWS")
         pub.subscribe(self.process_terminated, "PROCESS TERMINATED")
         pub.subscribe(self.end_queue_processing, "QUEUE PROCESS SUCCESSFULLY")
+        LOGWRITER.onerror = self.log_write_error
 
         # this block need to initilizes queue.backup on startup
-        fque = os.path.join(self.appdata["confdir"], 'queue.backup')
-        if os.path.exists(fque):
+        if self.queuestore.exists():
             if wx.MessageBox(_('Not all items in the queue were completed.\n\n'
                                'Would you like to keep them in the queue?'),
                              _('Please confirm'), wx.ICON_QUESTION | wx.CANCEL
                              | wx.YES_NO, self) == wx.YES:
 
-                queue = load_json_file_queue(fque)
-                if queue:
-                    self.queuelist = queue
+                if self.queuestore.load():
                     self.queue_tool_counter()
             else:
-                os.remove(fque)
+                self.queuestore.clear()
+                JobJournal(os.path.join(self.appdata["confdir"],
+                                        'queue.journal')).clear()
 
     # ------------------------------------------------------------------#
 
+    def __getattr__(self, name):
+        """
+        Builds a topic panel of `TOPIC_PANELS` on first access,
+        importing its module only then.
+        """
+        if name not in MainFrame.TOPIC_PANELS:
+            raise AttributeError(f"'MainFrame' object has no "
+                                 f"attribute '{name}'")
+        modname, clsname = MainFrame.TOPIC_PANELS[name]
+        with STARTUP.span(f'build {clsname}'):
+            module = importlib.import_module(f'videomass.vdms_panels.'
+                                             f'{modname}')
+            panel = getattr(module, clsname)(self)
+        panel.Hide()
+        self.mainSizer.Add(panel, 1, wx.EXPAND)
+        setattr(self, name, panel)
+        return panel
+    # ------------------------------------------------------------------#
+
+    def topic_shown(self, name):
+        """
+        Returns True if the topic panel `name` is built and
+        shown, without building it.
+        """
+        return name in self.__dict__ and getattr(self, name).IsShown()
+    # ------------------------------------------------------------------#
+
+    def show_panel(self, panel):
+        """
+        Shows `panel` hiding all the others, the topic
+        panels not built yet are left alone.
+        """
+        panels = [self.ChooseTopic, self.fileDnDTarget, self.ProcessPanel]
+        panels += [getattr(self, name) for name in MainFrame.TOPIC_PANELS
+                   if name in self.__dict__]
+        for item in panels:
+            if item is not panel:
+                item.Hide()
+        panel.Show()
+    # ------------------------------------------------------------------#
+
     def queue_tool_counter(self):
         """
         Set a counter aside Queue text when adding items
@@ -231,6 +262,16 @@ class MainFrame(wx.Frame):
             self.toolbar.Realize()
     # ------------------------------------------------------------------#
 
+    def log_write_error(self, logfile, error):
+        """
+        Called by the `LOGWRITER` thread when a log file
+        cannot be written, it shows the error on the status bar.
+        """
+        msg = _('Cannot write the log file "{0}": {1}').format(logfile,
+                                                               error)
+        wx.CallAfter(self.statusbar_msg, msg, None)
+    # ------------------------------------------------------------------#
+
     def statusbar_msg(self, msg, bcolor, fcolor=None):
         """
         Set the status-bar message and color.
@@ -319,6 +360,7 @@ class MainFrame(wx.Frame):
         else:
             indx = 0
 
+        from videomass.vdms_dialogs.mediainfo import MediaStreams
         self.mediastreams = MediaStreams(self.data_files, selindx=indx)
         self.mediastreams.Show()
     # ------------------------------------------------------------------#
@@ -366,12 +408,13 @@ class MainFrame(wx.Frame):
         sett = confmanager.read_options()
         sett['main_window_size'] = list(self.GetSize())
         sett['main_window_pos'] = list(self.GetPosition())
-        prstcolwidth = [self.PrstsPanel.lctrl.GetColumnWidth(0),
-                        self.PrstsPanel.lctrl.GetColumnWidth(1),
-                        self.PrstsPanel.lctrl.GetColumnWidth(2),
-                        self.PrstsPanel.lctrl.GetColumnWidth(3),
-                        ]
-        sett['prstmng_column_width'] = prstcolwidth
+        if 'PrstsPanel' in self.__dict__:
+            prstcolwidth = [self.PrstsPanel.lctrl.GetColumnWidth(0),
+                            self.PrstsPanel.lctrl.GetColumnWidth(1),
+                            self.PrstsPanel.lctrl.GetColumnWidth(2),
+                            self.PrstsPanel.lctrl.GetColumnWidth(3),
+                            ]
+            sett['prstmng_column_width'] = prstcolwidth
         filedropcolwidth = [self.fileDnDTarget.flCtrl.GetColumnWidth(0),
                             self.fileDnDTarget.flCtrl.GetColumnWidth(1),
                             self.fileDnDTarget.flCtrl.GetColumnWidth(2),
@@ -436,6 +479,7 @@ class MainFrame(wx.Frame):
         Permanent exit from the application.
         Do not use this method directly.
         """
+        LOGWRITER.onerror = None
         self.Destroy()
     # ------------------------------------------------------------------#
 
@@ -469,6 +513,10 @@ class MainFrame(wx.Frame):
         dscrp = _("Import files\tCtrl+O")
         self.openmedia = fileButton.Append(wx.ID_OPEN, dscrp)
         self.openmedia.Enable(False)
+        dscrp = (_("Import folder"),
+                 _("Import the media files of a folder and its subfolders"))
+        self.openfolder = fileButton.Append(wx.ID_ANY, dscrp[0], dscrp[1])
+        self.openfolder.Enable(False)
         dscrp = _("Open destination folder of encodings\tCtrl+D")
         opendest = fileButton.Append(wx.ID_ANY, dscrp)
         fileButton.AppendSeparator()
@@ -531,6 +579,12 @@ class MainFrame(wx.Frame):
         dscrp = (_("Work notes\tCtrl+N"),
                  _("Read and write useful notes and reminders."))
         notepad = toolsButton.Append(wx.ID_ANY, dscrp[0], dscrp[1])
+        toolsButton.AppendSeparator()
+        dscrp = (_("Force re-encode"),
+                 _("If checked, identical jobs are encoded again even if "
+                   "their outputs are found in the output cache"))
+        self.forcenc = toolsButton.Append(wx.ID_ANY, dscrp[0], dscrp[1],
+                                          kind=wx.ITEM_CHECK)
         self.menuBar.Append(toolsButton, _("Tools"))
 
         # ------------------ View menu
@@ -663,6 +717,7 @@ class MainFrame(wx.Frame):
         # -----------------------Binding menu bar-------------------------#
         # ----FILE----
         self.Bind(wx.EVT_MENU, self.open_media_files, self.openmedia)
+        self.Bind(wx.EVT_MENU, self.open_media_folder, self.openfolder)
         self.Bind(wx.EVT_MENU, self.open_dest_encodings, opendest)
         self.Bind(wx.EVT_MENU, self.on_load_queue, self.loadqueue)
         self.Bind(wx.EVT_MENU, self.open_trash_folder, dir_trash)
@@ -680,6 +735,7 @@ class MainFrame(wx.Frame):
         self.Bind(wx.EVT_MENU, self.prst_downloader, self.prstdownload)
         self.Bind(wx.EVT_MENU, self.prst_checkversion, self.prstcheck)
         self.Bind(wx.EVT_MENU, self.reminder, notepad)
+        self.Bind(wx.EVT_MENU, self.on_force_reencode, self.forcenc)
         # ---- VIEW ----
         self.Bind(wx.EVT_MENU, self.get_ffmpeg_conf, checkconf)
         self.Bind(wx.EVT_MENU, self.get_ffmpeg_formats, ckformats)
@@ -744,10 +800,24 @@ class MainFrame(wx.Frame):
                 return
 
             self.switch_file_import(self)
-            paths = filedlg.GetPaths()
-            for path in paths:
-                self.fileDnDTarget.flCtrl.dropUpdate(path)
-            self.fileDnDTarget.flCtrl.rejected_files()
+            self.fileDnDTarget.flCtrl.import_files(filedlg.GetPaths())
+    # -------------------------------------------------------------------#
+
+    def open_media_folder(self, event):
+        """
+        Open the directory dialog to choose a folder whose
+        media files are imported recursively.
+        """
+        with wx.DirDialog(self, _("Import folder"),
+                          defaultPath=os.path.expanduser('~'),
+                          style=wx.DD_DEFAULT_STYLE
+                          | wx.DD_DIR_MUST_EXIST) as dirdlg:
+
+            if dirdlg.ShowModal() == wx.ID_CANCEL:
+                return
+
+            self.switch_file_import(self)
+            self.fileDnDTarget.flCtrl.import_files([dirdlg.GetPath()])
     # -------------------------------------------------------------------#
 
     def open_dest_encodings(self, event):
@@ -832,6 +902,7 @@ class MainFrame(wx.Frame):
         if self.helptopic:
             self.helptopic.Raise()
             return
+        from videomass.vdms_dialogs.ffmpeg_help import FFmpegHelp
         self.helptopic = FFmpegHelp(self, self.appdata['ostype'])
         self.helptopic.Show()
     # -------------------------------------------------------------------#
@@ -930,6 +1001,14 @@ class MainFrame(wx.Frame):
                 text.write("")
             io_tools.openpath(fname)
     # ------------------------------------------------------------------#
+
+    def on_force_reencode(self, event):
+        """
+        Bypasses the output cache for the current session
+        (see the `output_cache` option).
+        """
+        self.appdata['force_reencode'] = self.forcenc.IsChecked()
+    # ------------------------------------------------------------------#
     # --------- Menu View ###
 
     def get_ffmpeg_conf(self, event):
@@ -945,6 +1024,7 @@ class MainFrame(wx.Frame):
             wx.MessageBox(f"\n{out[1]}", _('Videomass - Error!'),
                           wx.ICON_ERROR, self)
             return
+        from videomass.vdms_dialogs.ffmpeg_conf import FFmpegConf
         self.ffmpegconf = FFmpegConf(out,
                                      self.appdata['ffmpeg_cmd'],
                                      self.appdata['ffprobe_cmd'],
@@ -967,6 +1047,7 @@ class MainFrame(wx.Frame):
             wx.MessageBox(f"\n{out['Not found']}", _('Videomass - Error!'),
                           wx.ICON_ERROR, self)
             return
+        from videomass.vdms_dialogs.ffmpeg_formats import FFmpegFormats
         self.ffmpegformats = FFmpegFormats(out, self.appdata['ostype'])
         self.ffmpegformats.Show()
     # ------------------------------------------------------------------#
@@ -985,6 +1066,7 @@ class MainFrame(wx.Frame):
             wx.MessageBox(f"\n{out['Not found']}", _('Videomass - Error!'),
                           wx.ICON_ERROR, self)
             return
+        from videomass.vdms_dialogs.ffmpeg_codecs import FFmpegCodecs
         self.ffmpegcodecs = FFmpegCodecs(out,
                                          self.appdata['ostype'],
                                          '-encoders')
@@ -1005,6 +1087,7 @@ class MainFrame(wx.Frame):
             wx.MessageBox(f"\n{out['Not found']}", _('Videomass - Error!'),
                           wx.ICON_ERROR, self)
             return
+        from videomass.vdms_dialogs.ffmpeg_codecs import FFmpegCodecs
         self.ffmpegdecoders = FFmpegCodecs(out,
                                            self.appdata['ostype'],
                                            '-decoders')
@@ -1019,6 +1102,7 @@ class MainFrame(wx.Frame):
         if self.whileplay:
             self.whileplay.Raise()
             return
+        from videomass.vdms_dialogs.while_playing import WhilePlaying
         self.whileplay = WhilePlaying(self.appdata['ostype'])
         self.whileplay.Show()
     # ------------------------------------------------------------------#
@@ -1033,6 +1117,7 @@ class MainFrame(wx.Frame):
             self.showlogs.on_flog_select(flog)
             return
 
+        from videomass.vdms_dialogs.showlogs import ShowLogs
         self.showlogs = ShowLogs(self,
                                  self.appdata['logdir'],
                                  speclogname=flog,
@@ -1100,6 +1185,7 @@ class MainFrame(wx.Frame):
         FFplay submenu: customize the timestamp filter
 
         """
+        from videomass.vdms_dialogs import set_timestamp
         with set_timestamp.Set_Timestamp(self, self.cmdtimestamp) as dialog:
             if dialog.ShowModal() == wx.ID_OK:
                 data = dialog.getvalue()
@@ -1125,6 +1211,7 @@ class MainFrame(wx.Frame):
         to get the return code from getvalue interface.
         """
         msg = _("Some changes require restarting the application.")
+        from videomass.vdms_dialogs import preferences
         with preferences.SetUp(self) as set_up:
             if set_up.ShowModal() == wx.ID_OK:
                 changes = set_up.getvalue()
@@ -1220,6 +1307,7 @@ class MainFrame(wx.Frame):
             msg = _('Congratulation! You are already '
                     'using the latest version.\n')
 
+        from videomass.vdms_dialogs import videomass_check_version
         dlg = videomass_check_version.CheckNewVersion(self,
                                                       msg,
                                                       version,
@@ -1240,6 +1328,7 @@ class MainFrame(wx.Frame):
         """
         Display the program informations and developpers
         """
+        from videomass.vdms_dialogs import about_dialog
         about_dialog.show_about_dlg(self, self.icons['videomass'])
 
     # -----------------  BUILD THE TOOL BAR  --------------------###
@@ -1397,16 +1486,10 @@ class MainFrame(wx.Frame):
         "Back" toolbar button.
         """
         self.topicname = None
-        self.ProcessPanel.Hide()
-        self.fileDnDTarget.Hide()
-        self.AVconvPanel.Hide()
-        self.PrstsPanel.Hide()
-        self.ConcatDemuxer.Hide()
-        self.toPictures.Hide()
-        self.toSlideshow.Hide()
         [self.toolbar.EnableTool(x, False) for x in (3, 4, 5, 6, 7, 8, 35, 36)]
-        self.ChooseTopic.Show()
+        self.show_panel(self.ChooseTopic)
         self.openmedia.Enable(False)
+        self.openfolder.Enable(False)
         self.menu_go_items((0, 1, 1, 1, 1, 1, 1))  # Go menu items
         self.delfile.Enable(False)
         self.clearall.Enable(False)
@@ -1422,14 +1505,7 @@ class MainFrame(wx.Frame):
         Shared event by menubar and toolbar
         to switch on Drag&Drop panel.
         """
-        self.ProcessPanel.Hide()
-        self.AVconvPanel.Hide()
-        self.ChooseTopic.Hide()
-        self.PrstsPanel.Hide()
-        self.ConcatDemuxer.Hide()
-        self.toPictures.Hide()
-        self.toSlideshow.Hide()
-        self.fileDnDTarget.Show()
+        self.show_panel(self.fileDnDTarget)
         pub.sendMessage("SET_DRAG_AND_DROP_TOPIC", topic=self.topicname)
         self.menu_go_items((1, 1, 1, 1, 1, 1, 1))  # Go menu items
         if self.filedropselected:
@@ -1439,6 +1515,7 @@ class MainFrame(wx.Frame):
             self.clearall.Enable(True)
             self.rename_batch.Enable(True)
         self.openmedia.Enable(True)
+        self.openfolder.Enable(True)
         [self.toolbar.EnableTool(x, True) for x in (3, 4, 5, 6, 35)]
         [self.toolbar.EnableTool(x, False) for x in (7, 8, 36)]
         if self.queuelist:
@@ -1455,14 +1532,7 @@ class MainFrame(wx.Frame):
         Menu bar event to show Video converter panel
         """
         self.topicname = 'Audio/Video Conversions'
-        self.ProcessPanel.Hide()
-        self.ChooseTopic.Hide()
-        self.fileDnDTarget.Hide()
-        self.PrstsPanel.Hide()
-        self.ConcatDemuxer.Hide()
-        self.toPictures.Hide()
-        self.toSlideshow.Hide()
-        self.AVconvPanel.Show()
+        self.show_panel(self.AVconvPanel)
         self.SetTitle(_('Videomass - AV Conversions'))
         self.menu_go_items((1, 1, 0, 1, 1, 1, 1))  # Go menu items
         self.delfile.Enable(False)
@@ -1470,6 +1540,7 @@ class MainFrame(wx.Frame):
         self.rename.Enable(False)
         self.rename_batch.Enable(False)
         self.openmedia.Enable(True)
+        self.openfolder.Enable(True)
         self.loadqueue.Enable(True)
         [self.toolbar.EnableTool(x, True) for x in (3, 4, 5, 6, 7, 35, 36)]
         self.toolbar.EnableTool(8, False)
@@ -1484,14 +1555,7 @@ class MainFrame(wx.Frame):
         Menu bar event to show presets manager panel
         """
         self.topicname = 'Presets Manager'
-        self.ProcessPanel.Hide()
-        self.ChooseTopic.Hide()
-        self.fileDnDTarget.Hide()
-        self.AVconvPanel.Hide()
-        self.ConcatDemuxer.Hide()
-        self.toPictures.Hide()
-        self.toSlideshow.Hide()
-        self.PrstsPanel.Show()
+        self.show_panel(self.PrstsPanel)
         self.SetTitle(_('Videomass - Presets Manager'))
         self.menu_go_items((1, 0, 1, 1, 1, 1, 1))  # Go menu items
         self.delfile.Enable(False)
@@ -1499,6 +1563,7 @@ class MainFrame(wx.Frame):
         self.rename.Enable(False)
         self.rename_batch.Enable(False)
         self.openmedia.Enable(True)
+        self.openfolder.Enable(True)
         self.loadqueue.Enable(True)
         [self.toolbar.EnableTool(x, True) for x in (3, 4, 5, 6, 7, 35, 36)]
         self.toolbar.EnableTool(8, False)
@@ -1514,14 +1579,7 @@ class MainFrame(wx.Frame):
         Menu bar event to show `ConcatDemuxer` panel
         """
         self.topicname = 'Concatenate Demuxer'
-        self.ProcessPanel.Hide()
-        self.ChooseTopic.Hide()
-        self.fileDnDTarget.Hide()
-        self.AVconvPanel.Hide()
-        self.PrstsPanel.Hide()
-        self.toPictures.Hide()
-        self.toSlideshow.Hide()
-        self.ConcatDemuxer.Show()
+        self.show_panel(self.ConcatDemuxer)
         self.SetTitle(_('Videomass - Concatenate Demuxer'))
         self.menu_go_items((1, 1, 1, 0, 1, 1, 1))  # Go menu items
         self.delfile.Enable(False)
@@ -1529,6 +1587,7 @@ class MainFrame(wx.Frame):
         self.rename.Enable(False)
         self.rename_batch.Enable(False)
         self.openmedia.Enable(True)
+        self.openfolder.Enable(True)
         self.loadqueue.Enable(True)
         [self.toolbar.EnableTool(x, True) for x in (3, 4, 5, 6, 7, 35)]
         [self.toolbar.EnableTool(x, False) for x in (8, 36)]
@@ -1543,14 +1602,7 @@ class MainFrame(wx.Frame):
         Menu bar event to show `toPictures` panel
         """
         self.topicname = 'Video to Pictures'
-        self.ProcessPanel.Hide()
-        self.ChooseTopic.Hide()
-        self.fileDnDTarget.Hide()
-        self.AVconvPanel.Hide()
-        self.PrstsPanel.Hide()
-        self.ConcatDemuxer.Hide()
-        self.toSlideshow.Hide()
-        self.toPictures.Show()
+        self.show_panel(self.toPictures)
         self.SetTitle(_('Videomass - From Movie to Pictures'))
         self.menu_go_items((1, 1, 1, 1, 1, 0, 1))  # Go menu items
         self.delfile.Enable(False)
@@ -1558,6 +1610,7 @@ class MainFrame(wx.Frame):
         self.rename.Enable(False)
         self.rename_batch.Enable(False)
         self.openmedia.Enable(True)
+        self.openfolder.Enable(True)
         self.loadqueue.Enable(True)
         [self.toolbar.EnableTool(x, True) for x in (3, 4, 5, 6, 7, 35)]
         [self.toolbar.EnableTool(x, False) for x in (8, 36)]
@@ -1572,14 +1625,7 @@ class MainFrame(wx.Frame):
         Menu bar event to show `toSlideshow` panel
         """
         self.topicname = 'Image Sequence to Video'
-        self.ProcessPanel.Hide()
-        self.ChooseTopic.Hide()
-        self.fileDnDTarget.Hide()
-        self.AVconvPanel.Hide()
-        self.PrstsPanel.Hide()
-        self.ConcatDemuxer.Hide()
-        self.toPictures.Hide()
-        self.toSlideshow.Show()
+        self.show_panel(self.toSlideshow)
         self.SetTitle(_('Videomass - Still Image Maker'))
         self.menu_go_items((1, 1, 1, 1, 0, 1, 1))  # Go menu items
         self.delfile.Enable(False)
@@ -1587,6 +1633,7 @@ class MainFrame(wx.Frame):
         self.rename.Enable(False)
         self.rename_batch.Enable(False)
         self.openmedia.Enable(True)
+        self.openfolder.Enable(True)
         self.loadqueue.Enable(True)
         [self.toolbar.EnableTool(x, True) for x in (3, 4, 5, 6, 7, 35)]
         [self.toolbar.EnableTool(x, False) for x in (8, 36)]
@@ -1604,14 +1651,13 @@ class MainFrame(wx.Frame):
             return
 
         if not self.queuelist:
-            self.queuelist = []
             self.queuelist.extend(queue)
         else:
             update = extend_data_queue(self, self.queuelist, queue)
             if not update:
                 return
 
-        write_json_file_queue(self.queuelist)
+        self.queuestore.save()
         self.queue_tool_counter()
     # ------------------------------------------------------------------#
 
@@ -1619,6 +1665,7 @@ class MainFrame(wx.Frame):
         """
         process queue data if any
         """
+        from videomass.vdms_dialogs.queuedlg import QueueManager
         with QueueManager(self,
                           self.queuelist,
                           self.movetotrash,
@@ -1627,7 +1674,6 @@ class MainFrame(wx.Frame):
                           ) as queman:
             if queman.ShowModal() == wx.ID_OK:
                 data = queman.getvalue()
-                self.queuelist = data[0]
                 self.movetotrash = data[1]
                 self.emptylist = data[2]
                 self.removequeue = data[3]
@@ -1650,9 +1696,7 @@ class MainFrame(wx.Frame):
         pub/sub protocol. see `long_processing_task.end_proc()`)
         """
         if self.removequeue and msg == 'Done':
-            queuef = os.path.join(self.appdata["confdir"], 'queue.backup')
-            os.remove(queuef)  # remove queue.backup
-            self.queuelist.clear()
+            self.queuestore.clear()  # remove queue.backup
             self.toolbar.EnableTool(37, False)
             self.queue_tool_counter()
         else:
@@ -1669,35 +1713,23 @@ class MainFrame(wx.Frame):
             return
 
         kwargs = None
-        if self.AVconvPanel.IsShown():
+        if self.topic_shown('AVconvPanel'):
             kwargs = self.AVconvPanel.queue_mode()
-        elif self.PrstsPanel.IsShown():
+        elif self.topic_shown('PrstsPanel'):
             kwargs = self.PrstsPanel.queue_mode()
 
         if not kwargs:
             return
-        if not self.queuelist:
-            self.queuelist = []
-            self.queuelist.append(kwargs)
-            self.toolbar.EnableTool(37, True)
-        else:
-            dup = None
-            for idx, item in enumerate(self.queuelist):
-                if item["destination"] == kwargs["destination"]:
-                    dup = idx
-            if dup is not None:
-                if wx.MessageBox(_('An item with the same destination file '
-                                   'already exists.\n\nDo you want to replace '
-                                   'it by adding the new item to the queue?'),
-                                 _('Please confirm'), wx.ICON_QUESTION
-                                 | wx.CANCEL | wx.YES_NO, self) != wx.YES:
-                    return
-                self.queuelist[dup] = kwargs
-
-            else:
-                self.queuelist.append(kwargs)
+        if self.queuestore.find(kwargs["destination"]) is not None:
+            if wx.MessageBox(_('An item with the same destination file '
+                               'already exists.\n\nDo you want to replace '
+                               'it by adding the new item to the queue?'),
+                             _('Please confirm'), wx.ICON_QUESTION
+                             | wx.CANCEL | wx.YES_NO, self) != wx.YES:
+                return
 
-        write_json_file_queue(self.queuelist)
+        self.queuestore.put(kwargs)  # appends to queue.backup
+        self.toolbar.EnableTool(37, True)
         self.queue_tool_counter()
     # ------------------------------------------------------------------#
 
@@ -1708,14 +1740,7 @@ class MainFrame(wx.Frame):
         method assigning the corresponding thread.
         """
         self.SetTitle(_('Videomass - FFmpeg Message Monitoring'))
-        self.ChooseTopic.Hide()
-        self.fileDnDTarget.Hide()
-        self.AVconvPanel.Hide()
-        self.PrstsPanel.Hide()
-        self.ConcatDemuxer.Hide()
-        self.toPictures.Hide()
-        self.toSlideshow.Hide()
-        self.ProcessPanel.Show()
+        self.show_panel(self.ProcessPanel)
         self.delfile.Enable(False)
         self.clearall.Enable(False)
         self.rename.Enable(False)
@@ -1723,6 +1748,7 @@ class MainFrame(wx.Frame):
         if not args[0] == 'View':
             self.menu_go_items((0, 0, 0, 0, 0, 0, 0))  # Go menu items
             self.openmedia.Enable(False)
+            self.openfolder.Enable(False)
             self.loadqueue.Enable(False)
             self.setupItem.Enable(False)
             [self.toolbar.EnableTool(x, True) for x in (6, 8)]
@@ -1749,15 +1775,15 @@ class MainFrame(wx.Frame):
             self.switch_file_import(None)
             return
 
-        if self.AVconvPanel.IsShown():
+        if self.topic_shown('AVconvPanel'):
             self.AVconvPanel.batch_mode()
-        elif self.PrstsPanel.IsShown():
+        elif self.topic_shown('PrstsPanel'):
             self.PrstsPanel.batch_mode()
-        elif self.ConcatDemuxer.IsShown():
+        elif self.topic_shown('ConcatDemuxer'):
             self.ConcatDemuxer.on_start()
-        elif self.toPictures.IsShown():
+        elif self.topic_shown('toPictures'):
             self.toPictures.on_start()
-        elif self.toSlideshow.IsShown():
+        elif self.topic_shown('toSlideshow'):
             self.toSlideshow.on_start()
         elif self.ProcessPanel.IsShown():
             self.panelShown(self.topicname)
@@ -1780,6 +1806,7 @@ class MainFrame(wx.Frame):
         """
         self.menu_go_items((1, 1, 1, 1, 1, 1, 0))  # Go menu items
         self.openmedia.Enable(False)
+        self.openfolder.Enable(False)
         self.loadqueue.Enable(False)
         self.setupItem.Enable(True)
 
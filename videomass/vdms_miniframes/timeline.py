@@ -6,7 +6,7 @@ Compatibility: Python3, wxPython Phoenix
 Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
 Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
 license: GPL3
-Rev: Sep.18.2025
+Rev: Oct.18.2026
 Code checker: flake8, pylint
 
 This file is part of Videomass.
@@ -24,7 +24,6 @@ This file is part of Videomass.
    You should have received a copy of the GNU General Public License
    along with Videomass.  If not, see <http://www.gnu.org/licenses/>.
 """
-import os
 import sys
 import wx
 import wx.adv
@@ -33,9 +32,10 @@ from videomass.vdms_utils.get_bmpfromsvg import get_bmp
 from videomass.vdms_utils.utils import integer_to_time
 from videomass.vdms_utils.utils import time_to_integer
 from videomass.vdms_dialogs.widget_utils import NormalTransientPopup
-from videomass.vdms_io.make_filelog import make_log_template
-from videomass.vdms_threads.generic_task import FFmpegGenericTask
-from videomass.vdms_io.io_tools import show_msg_notify
+from videomass.vdms_threads.waveform import WaveformThread
+from videomass.vdms_threads.keyframe_scan import KeyframeThread
+from videomass.vdms_threads.filmstrip import FilmstripThread
+from videomass.vdms_utils.filmstrip import strip_geometry
 from videomass.vdms_threads.ffplay_file import FilePlayback_GetOutput
 
 
@@ -160,10 +160,6 @@ class Float_TL(wx.MiniFrame):
     ICONS = get.iconset
     # COLORSCHEME = get.appset['colorscheme']
     OS = get.appset['ostype']
-    LOGDIR = get.appset['logdir']
-    TMPROOT = os.path.join(get.appset['cachedir'], 'tmp', 'Waveforms')
-    TMPSRC = os.path.join(TMPROOT, 'tmpsrc')
-    os.makedirs(TMPSRC, mode=0o777, exist_ok=True)
 
     # Used Colours
     YELLOW = '#bd9f00'  # for warnings
@@ -176,6 +172,8 @@ class Float_TL(wx.MiniFrame):
     # SELECTION = '#B1F2E8'  # Light CYAN
     DELIMITER_COLOR = '#009DCB'  # Azure for margin selection
     TEXT_PEN_COLOR = '#020D0F'  # black for draw lines
+    WAVE_COLOR = '#FFFFFF'  # white for the audio waveform
+    KEYFRAME_COLOR = '#5C3566'  # purple for the keyframe snap points
     DURATION_START = '#E95420'  # Light orange for duration/start indicators
     READMEGREEN = '#52ee7d'  # readme btn background
     READMEBLACK = '#1f1f1f'  # readme btn foreground
@@ -224,7 +222,14 @@ class Float_TL(wx.MiniFrame):
         self.pointpx = [0, 0]  # mouse points (see on_move(), on_leftdown())
         self.sourcedur = _('No source duration:')
         self.filename = None  # selected filename on file list
-        self.frame = None  # waveform image located on cache dir
+        self.pyramid = None  # waveform PeakPyramid of the selected file
+        self.wavelines = []  # waveform lines drawn on the ruler
+        self.kfindex = None  # KeyframeIndex of the selected file
+        self.kfoffset = 0.0  # start time of the selected file (seconds)
+        self.kflines = []  # keyframe lines drawn on the ruler
+        self.stripthread = None  # FilmstripThread of the selected file
+        self.stripwidth = 0  # width of the filmstrip thumbnails
+        self.stripbmps = {}  # filmstrip bitmaps by slot
         self.invalidselection = False  # booleaan reference
         self.playpoint = 0  # `x` point pixel representation
 
@@ -241,7 +246,7 @@ class Float_TL(wx.MiniFrame):
                                    )
         sizer_base.Add(self.panelruler, 0, wx.ALL | wx.CENTRE, 2)
         sizer_btns = wx.BoxSizer(wx.HORIZONTAL)
-        sizer_btns = wx.FlexGridSizer(0, 7, 0, 0)
+        sizer_btns = wx.FlexGridSizer(0, 9, 0, 0)
         sizer_base.Add(sizer_btns, 0, wx.ALL | wx.CENTRE, 8)
         self.btn_play = wx.Button(self.panelbase, wx.ID_ANY, "", size=(40, -1))
         self.btn_play.SetBitmap(bmp_play, wx.LEFT)
@@ -272,6 +277,12 @@ class Float_TL(wx.MiniFrame):
                                         size=(-1, -1))
         self.btn_wave.SetBitmap(bmp_wave, wx.LEFT)
         sizer_btns.Add(self.btn_wave, 0, wx.LEFT | wx.CENTRE, 20)
+        self.btn_keyfr = wx.ToggleButton(self.panelbase, wx.ID_ANY,
+                                         _("Keyframes"), size=(-1, -1))
+        sizer_btns.Add(self.btn_keyfr, 0, wx.LEFT | wx.CENTRE, 5)
+        self.btn_strip = wx.ToggleButton(self.panelbase, wx.ID_ANY,
+                                         _("Filmstrip"), size=(-1, -1))
+        sizer_btns.Add(self.btn_strip, 0, wx.LEFT | wx.CENTRE, 5)
         btn_readme = wx.Button(self.panelbase, wx.ID_ANY, _("Read me"),
                                size=(-1, -1))
         btn_readme.SetBackgroundColour(wx.Colour(Float_TL.READMEGREEN))
@@ -314,6 +325,13 @@ class Float_TL(wx.MiniFrame):
         tip = (_('Toggles the display of the audio waveform in the '
                  'background ruler'))
         self.btn_wave.SetToolTip(tip)
+        tip = (_('Shows the keyframes in the background ruler and snaps '
+                 'the start point to them, for cuts that are safe with '
+                 'stream copy (codec copy)'))
+        self.btn_keyfr.SetToolTip(tip)
+        tip = (_('Toggles the display of evenly spaced video thumbnails '
+                 'in the background ruler'))
+        self.btn_strip.SetToolTip(tip)
         tip = _('Reset segment on timeline')
         self.btn_reset.SetToolTip(tip)
         tip = _('Timeline Editor Usage')
@@ -323,6 +341,8 @@ class Float_TL(wx.MiniFrame):
 
         # ----------------------Binding (EVT)----------------------#
         self.Bind(wx.EVT_TOGGLEBUTTON, self.on_load_waveform, self.btn_wave)
+        self.Bind(wx.EVT_TOGGLEBUTTON, self.on_load_keyframes, self.btn_keyfr)
+        self.Bind(wx.EVT_TOGGLEBUTTON, self.on_load_filmstrip, self.btn_strip)
         self.Bind(wx.EVT_BUTTON,
                   lambda event: self.on_set_pos(event, mode='duration'),
                   self.btn_tend)
@@ -342,6 +362,9 @@ class Float_TL(wx.MiniFrame):
         pub.subscribe(self.set_values, "RESET_ON_CHANGED_LIST")
         pub.subscribe(self.update_counter_thread, "UPDATE_PLAY_COUNTER")
         pub.subscribe(self.end_playback_thread, "END_PLAY")
+        pub.subscribe(self.on_waveform, "WAVEFORM_EVT")
+        pub.subscribe(self.on_keyframes, "KEYFRAMES_EVT")
+        pub.subscribe(self.on_filmstrip, "FILMSTRIP_EVT")
 
     def file_selection(self):
         """
@@ -357,29 +380,93 @@ class Float_TL(wx.MiniFrame):
         return (self.filename, self.parent.file_src.index(self.filename))
     # ------------------------------------------------------------------#
 
-    def make_frame_from_file(self):
+    def waveform_lines(self):
         """
-        This method is responsible for making available
-        an audio waveform frame from a selected file.
-        Return None type if error, str(frame) as pathname otherwise.
+        Returns the vertical lines of the waveform, one for
+        each pixel of the ruler, from the peaks of the source
+        duration read from `self.pyramid`.
         """
-        logfile = make_log_template('generic_task.log', Float_TL.LOGDIR,
-                                    mode="w")
-        name = os.path.splitext(os.path.basename(self.filename))[0]
-        self.frame = os.path.join(f'{Float_TL.TMPSRC}', f'{name}.png')  # image
+        center = Float_TL.PH / 2
+        height = center - 2
+        peaks = self.pyramid.peaks(Float_TL.RW, 0.0,
+                                   self.milliseconds / 1000)
+        return [(x + Float_TL.RM, round(center - high * height),
+                 x + Float_TL.RM, round(center - low * height))
+                for x, (low, high) in enumerate(peaks)]
+    # ------------------------------------------------------------------#
 
-        arg = (f'-i "{self.filename}" -filter_complex '
-               f'"showwavespic=s={Float_TL.RW + 10}x{Float_TL.PH}'
-               f':colors=white:split_channels=1" -update 1 '
-               f'-frames:v 1 "{self.frame}"')
-        thread = FFmpegGenericTask(arg, 'Timeline Waveform', logfile)
-        thread.join()  # wait end thread
-        error = thread.status
-        if error:
-            self.frame = None
-            show_msg_notify(self.GetParent(),
-                            logname=os.path.basename(logfile))
-        return self.frame
+    def keyframe_lines(self):
+        """
+        Returns the short vertical lines drawn at the bottom
+        of the ruler for the keyframes of `self.kfindex`, at
+        most one for each pixel.
+        """
+        points = {round((pts - self.kfoffset) * 1000 * self.pix)
+                  for pts in self.kfindex.times}
+        return [(x + Float_TL.RM, Float_TL.PH - 14, x + Float_TL.RM,
+                 Float_TL.PH - 4) for x in sorted(points)
+                if 0 <= x < Float_TL.RW]
+    # ------------------------------------------------------------------#
+
+    def snap_to_keyframe(self, mills):
+        """
+        Returns the position in milliseconds of the keyframe
+        nearest to `mills`, `mills` itself if no keyframe
+        index is loaded.
+        """
+        if not self.kfindex:
+            return mills
+        pts = self.kfindex.nearest(mills / 1000 + self.kfoffset)
+        return max(0, int(round((pts - self.kfoffset) * 1000)))
+    # ------------------------------------------------------------------#
+
+    def video_aspect(self, fileselected):
+        """
+        Returns the display aspect ratio (float) of the first
+        video stream of a selected media file (object of type
+        `file_selection()`), None if it has no video.
+        """
+        selected = self.parent.data_files[fileselected[1]].get('streams')
+        for stream in selected:
+            if stream.get('codec_type') != 'video':
+                continue
+            num, _sep, den = stream.get('display_aspect_ratio',
+                                        '').partition(':')
+            try:
+                if int(num) > 0 and int(den) > 0:
+                    return int(num) / int(den)
+            except ValueError:
+                pass
+            try:
+                return int(stream['width']) / int(stream['height'])
+            except (KeyError, ValueError, ZeroDivisionError):
+                return None
+        return None
+    # ------------------------------------------------------------------#
+
+    def stop_filmstrip(self):
+        """
+        Stops the filmstrip thread, if any, and removes
+        the thumbnails from the ruler.
+        """
+        if self.stripthread is not None:
+            self.stripthread.stop()
+            self.stripthread = None
+        self.stripbmps = {}
+    # ------------------------------------------------------------------#
+
+    def get_video_stream(self, fileselected):
+        """
+        Given a selected media file (object of type `file_selection()`),
+        it evaluates whether it contains any video streams.
+        If no video streams Returns None, True otherwise.
+        """
+        selected = self.parent.data_files[fileselected[1]].get('streams')
+        isvideo = [v for v in selected if 'video' in v.get('codec_type')
+                   and not v.get('disposition', {}).get('attached_pic')]
+        if isvideo:
+            return True
+        return None
     # ------------------------------------------------------------------#
 
     def get_audio_stream(self, fileselected):
@@ -502,12 +589,146 @@ class Float_TL(wx.MiniFrame):
                 self.btn_wave.SetValue(False)
                 return
 
-            if not self.make_frame_from_file():
-                self.btn_wave.SetValue(False)
+            self.btn_wave.Disable()  # until the "WAVEFORM_EVT" message
+            WaveformThread(self.filename)
+            return
+
+        self.pyramid = None
+        self.wavelines = []
+        self.onRedraw(wx.ClientDC(self.panelruler))
+    # ----------------------------------------------------------------------
+
+    def on_waveform(self, filename, pyramid, error):
+        """
+        Receives the waveform of `filename` from the
+        `WaveformThread`. This method is called using
+        pub/sub protocol subscribing "WAVEFORM_EVT".
+        """
+        self.btn_wave.Enable()
+        if filename != self.filename or not self.btn_wave.GetValue():
+            return  # selection changed or waveform toggled off meanwhile
+        if error:
+            wx.MessageBox(_('Unable to create waveform:\n\n{}').format(error),
+                          _('Videomass - Error!'), wx.ICON_ERROR, self)
+            self.btn_wave.SetValue(False)
+            return
+
+        self.pyramid = pyramid
+        self.wavelines = self.waveform_lines()
+        self.onRedraw(wx.ClientDC(self.panelruler))
+    # ----------------------------------------------------------------------
+
+    def on_load_keyframes(self, event):
+        """
+        Event on toggle keyframes button
+        """
+        if self.btn_keyfr.GetValue() is True:
+            if not self.file_selection():
+                self.btn_keyfr.SetValue(False)
+                return
+
+            if not self.get_video_stream(self.file_selection()):
+                wx.MessageBox(_('Unable to find keyframes.\nThe selected '
+                                'source file does not contain any video '
+                                'streams:\n"{}"'
+                                ).format(self.file_selection()[0]),
+                              _('Videomass - Warning!'), wx.ICON_WARNING, self)
+                self.btn_keyfr.SetValue(False)
                 return
-        else:
-            self.frame = None
 
+            self.btn_keyfr.Disable()  # until the "KEYFRAMES_EVT" message
+            KeyframeThread(self.filename)
+            return
+
+        self.kfindex = None
+        self.kflines = []
+        self.onRedraw(wx.ClientDC(self.panelruler))
+    # ----------------------------------------------------------------------
+
+    def on_keyframes(self, filename, index, error):
+        """
+        Receives the keyframe index of `filename` from the
+        `KeyframeThread`. This method is called using
+        pub/sub protocol subscribing "KEYFRAMES_EVT".
+        """
+        self.btn_keyfr.Enable()
+        if filename != self.filename or not self.btn_keyfr.GetValue():
+            return  # selection changed or keyframes toggled off meanwhile
+        if error:
+            wx.MessageBox(_('Unable to find keyframes:\n\n{}').format(error),
+                          _('Videomass - Error!'), wx.ICON_ERROR, self)
+            self.btn_keyfr.SetValue(False)
+            return
+
+        fmt = self.parent.data_files[self.file_selection()[1]].get('format')
+        try:
+            self.kfoffset = float(fmt.get('start_time', 0))
+        except (AttributeError, ValueError):
+            self.kfoffset = 0.0
+        self.kfindex = index
+        self.kflines = self.keyframe_lines()
+        stats = index.stats()
+        msg = _('{0} keyframes  |  GOP length: min {1:.2f}s, max {2:.2f}s, '
+                'mean {3:.2f}s').format(stats['keyframes'], stats['min'],
+                                        stats['max'], stats['mean'])
+        self.statusbar_msg(msg, None)
+        self.onRedraw(wx.ClientDC(self.panelruler))
+    # ----------------------------------------------------------------------
+
+    def on_load_filmstrip(self, event):
+        """
+        Event on toggle filmstrip button
+        """
+        if self.btn_strip.GetValue() is True:
+            if not self.file_selection():
+                self.btn_strip.SetValue(False)
+                return
+
+            aspect = self.video_aspect(self.file_selection())
+            if not aspect or not self.get_video_stream(self.file_selection()):
+                wx.MessageBox(_('Unable to create filmstrip.\nThe selected '
+                                'source file does not contain any video '
+                                'streams:\n"{}"'
+                                ).format(self.file_selection()[0]),
+                              _('Videomass - Warning!'), wx.ICON_WARNING, self)
+                self.btn_strip.SetValue(False)
+                return
+
+            self.stripwidth, slots = strip_geometry(Float_TL.RW,
+                                                    Float_TL.PH, aspect)
+            self.stripthread = FilmstripThread(self.filename,
+                                               self.milliseconds / 1000,
+                                               self.stripwidth,
+                                               Float_TL.PH, slots)
+            return
+
+        self.stop_filmstrip()
+        self.onRedraw(wx.ClientDC(self.panelruler))
+    # ----------------------------------------------------------------------
+
+    def on_filmstrip(self, filename, slot, data, error):
+        """
+        Receives the thumbnails of `filename` from the
+        `FilmstripThread`, one at a time as they are decoded.
+        This method is called using pub/sub protocol
+        subscribing "FILMSTRIP_EVT".
+        """
+        if (self.stripthread is None or filename != self.filename
+                or not self.btn_strip.GetValue()):
+            return  # selection changed or filmstrip toggled off meanwhile
+        if slot is None:
+            self.stripthread = None
+            if error:
+                wx.MessageBox(_('Unable to create filmstrip:\n\n{}'
+                                ).format(error),
+                              _('Videomass - Error!'), wx.ICON_ERROR, self)
+                self.btn_strip.SetValue(False)
+                self.stop_filmstrip()
+                self.onRedraw(wx.ClientDC(self.panelruler))
+            return
+
+        self.stripbmps[slot] = wx.Bitmap.FromBuffer(self.stripwidth,
+                                                    Float_TL.PH, data)
         self.onRedraw(wx.ClientDC(self.panelruler))
     # ----------------------------------------------------------------------
 
@@ -589,7 +810,13 @@ class Float_TL(wx.MiniFrame):
                 self.overalltime = integer_to_time(self.milliseconds)
 
         self.btn_wave.SetValue(False)
-        self.frame = None
+        self.pyramid = None
+        self.wavelines = []
+        self.btn_keyfr.SetValue(False)
+        self.kfindex = None
+        self.kflines = []
+        self.btn_strip.SetValue(False)
+        self.stop_filmstrip()
         self.on_trim_time_reset(None)
     # ------------------------------------------------------------------#
 
@@ -624,6 +851,9 @@ class Float_TL(wx.MiniFrame):
         elif self.pointpx[1] < 30:
             self.bar_x = self.pointpx[0]
             self.mills_start = int(round(self.bar_x / self.pix))
+            if self.kfindex:  # snaps to stream copy safe cut points
+                self.mills_start = self.snap_to_keyframe(self.mills_start)
+                self.bar_x = self.mills_start * self.pix
             self.clock_start = integer_to_time(self.mills_start)
             self.onRedraw(wx.ClientDC(self.panelruler))
     # ------------------------------------------------------------------#
@@ -735,6 +965,9 @@ class Float_TL(wx.MiniFrame):
             self.panelruler.SetDoubleBuffered(True)  # prevents flickers
         dc.Clear()
 
+        for slot, bitmap in self.stripbmps.items():  # filmstrip background
+            dc.DrawBitmap(bitmap, slot * self.stripwidth + Float_TL.RM, 0)
+
         # set start/end text colors
         if self.bar_w == 0 and self.bar_x == 0:
             self.invalidselection = False
@@ -750,19 +983,19 @@ class Float_TL(wx.MiniFrame):
             self.invalidselection = False
             selcolor, textcolor = Float_TL.SELECTION, Float_TL.DURATION_START
 
-        if self.frame and Float_TL.OS != 'Windows':
-            bmp = wx.Image(self.frame, wx.BITMAP_TYPE_ANY).ConvertToBitmap()
-            dc.DrawBitmap(bmp, 0, 0, True)
+        if self.wavelines:
+            dc.SetPen(wx.Pen(Float_TL.WAVE_COLOR, 1, wx.PENSTYLE_SOLID))
+            dc.DrawLineList(self.wavelines)
+
+        if self.kflines:
+            dc.SetPen(wx.Pen(Float_TL.KEYFRAME_COLOR, 1, wx.PENSTYLE_SOLID))
+            dc.DrawLineList(self.kflines)
 
         self.text_time_indicator(dc, textcolor, selcolor)
         self.ruler_notches(dc)
 
         if self.playpoint:
             self.move_play_cursor(dc)
-
-        if self.frame and Float_TL.OS == 'Windows':
-            bmp = wx.Image(self.frame, wx.BITMAP_TYPE_ANY).ConvertToBitmap()
-            dc.DrawBitmap(bmp, 0, 0, True)
     # ------------------------------------------------------------------#
 
     def text_time_indicator(self, dc, textcolor, selcolor):
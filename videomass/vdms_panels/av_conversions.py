@@ -6,7 +6,7 @@ Compatibility: Python3, wxPython4 Phoenix
 Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
 Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
 license: GPL3
-Rev: Sep.18.2025
+Rev: Oct.18.2026
 Code checker: flake8, pylint
 
 This file is part of Videomass.
@@ -45,6 +45,7 @@ from videomass.vdms_dialogs.filter_colorcorrection import ColorEQ
 from videomass.vdms_dialogs.singlechoicedlg import SingleChoice
 from videomass.vdms_dialogs.avconv_cmd_line import Raw_Cmd_Line
 from videomass.vdms_threads.ffmpeg import get_raw_cmdline_args
+from videomass.vdms_threads.ff_capabilities import FFCAPS
 from . video_encoders.video_no_enc import Video_No_Enc
 from . video_encoders.mpeg4 import Mpeg_4
 from . video_encoders.av1_aom import AV1_Aom
@@ -797,6 +798,12 @@ class AV_Conv(wx.Panel):
         Note, this filter is incompatible with two-pass encoding that
         includes `-pass 1` and` -pass 2` ffmpeg args/options.
         """
+        if FFCAPS.has_filter('vidstabdetect') is False:
+            wx.MessageBox(_('The FFmpeg in use was built without '
+                            'libvidstab, video stabilization is not '
+                            'available.'),
+                          _('Videomass - Warning!'), wx.ICON_WARNING, self)
+            return
         sdf = self.get_video_stream()
         if not sdf:
             return
@@ -6,7 +6,7 @@ Compatibility: Python3, wxPython Phoenix
 Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
 Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
 license: GPL3
-Rev: Aug.20.2025
+Rev: Oct.18.2026
 Code checker: flake8, pylint
 
 This file is part of Videomass.
@@ -26,12 +26,18 @@ This file is part of Videomass.
 """
 import os
 import re
+import sys
+from array import array
 import wx
 from pubsub import pub
 from videomass.vdms_threads.ffplay_file import FilePlay
-from videomass.vdms_threads.ffprobe import ffprobe
-from videomass.vdms_utils.utils import time_to_integer
-from videomass.vdms_utils.utils import to_bytes
+from videomass.vdms_threads.media_import import MediaImport, scan_folder
+from videomass.vdms_io.probe_cache import PROBECACHE
+from videomass.vdms_utils.utils import to_bytes, DigestThread
+from videomass.vdms_utils.list_model import (sort_order,
+                                             remaining_rows,
+                                             reorder_columns,
+                                             )
 from videomass.vdms_dialogs.renamer import Renamer
 from videomass.vdms_dialogs.list_warning import ListWarning
 
@@ -96,10 +102,51 @@ def filename_sanitize(newname, outputnames):
 # ----------------------------------------------------------------------
 
 
+def media_type(probe):
+    """
+    Returns the "Media type" string of the given probe data.
+    """
+    media = probe['streams'][0]['codec_type']
+    return f"{media}: {probe['format']['format_long_name']}"
+# ----------------------------------------------------------------------
+
+
+def duration_label(probe):
+    """
+    Returns the "Duration" string of the given probe data.
+    """
+    if not probe['format']['duration']:
+        return 'N/A'
+    tdur = probe['format']['time'].split(':')
+    sec, msec = tdur[2].split('.')[0], tdur[2].split('.')[1]
+    return f'{tdur[0]}h : {tdur[1]}m : {sec} : {msec}'
+# ----------------------------------------------------------------------
+
+
+def size_in_bytes(probe):
+    """
+    Returns the file size of the given probe data as a
+    number, for sorting purposes. Unknown sizes are 0.
+    """
+    try:
+        return to_bytes(''.join(probe['format']['size'].split()))
+    except (KeyError, AttributeError, ValueError, UnboundLocalError):
+        return 0.0
+# ----------------------------------------------------------------------
+
+
 class MyListCtrl(wx.ListCtrl):
     """
     This is the listControl widget.
     Note that this wideget has DnDPanel parented.
+
+    The control is virtual (wx.LC_VIRTUAL): rows are not stored
+    by the widget but rendered on demand from a columnar model,
+    that is the `file_src`, `duration`, `outputnames` and `data`
+    lists shared with the main frame, plus the `sizes` (bytes)
+    and `formats` (media type) columns kept here. Use the
+    `append_item`, `remove_items`, `reorder_items` and
+    `clear_items` methods to change the model.
     """
     def __init__(self, parent):
         """
@@ -115,75 +162,230 @@ class MyListCtrl(wx.ListCtrl):
         self.file_src = self.parent.file_src
         self.duration = self.parent.duration
         self.outputnames = self.parent.outputnames
+        self.sizes = array('d')
+        self.formats = []
         self.errors = {}
+        self.importer = None  # MediaImport thread
+        self.digester = None  # DigestThread
+        self.progress = None  # wx.ProgressDialog
+        self.imported = 0
+        self.summary = None  # rejected files by reason
         wx.ListCtrl.__init__(self,
                              parent,
                              style=wx.LC_REPORT
+                             | wx.LC_VIRTUAL
                              | wx.LC_SINGLE_SEL,
                              )
     # ----------------------------------------------------------------------#
 
-    def dropUpdate(self, path, newname=None):
+    def OnGetItemText(self, item, column):
+        """
+        Returns the text of a cell from the model, it is
+        only called by wx for the visible rows.
+        """
+        if column == 0:
+            return str(item + 1)
+        if column == 1:
+            return self.file_src[item]
+        if column == 2:
+            return duration_label(self.data[item])
+        if column == 3:
+            return self.formats[item]
+        if column == 4:
+            return self.data[item]['format']['size']
+        return self.outputnames[item]
+    # ----------------------------------------------------------------------#
+
+    def GetItemText(self, item, col=0):
+        """
+        Overrides the wx.ListCtrl method to read the
+        text directly from the model.
+        """
+        return self.OnGetItemText(item, col)
+    # ----------------------------------------------------------------------#
+
+    def append_item(self, path, probe, outputname):
+        """
+        Adds a row at the end of the model.
+        """
+        self.data.append(probe)
+        self.file_src.append(path)
+        self.duration.append(probe['format']['duration'])
+        self.outputnames.append(outputname)
+        self.sizes.append(size_in_bytes(probe))
+        self.formats.append(sys.intern(media_type(probe)))
+        self.SetItemCount(len(self.file_src))
+    # ----------------------------------------------------------------------#
+
+    def columns(self):
+        """
+        Returns the columns of the model.
+        """
+        return (self.data, self.file_src, self.duration,
+                self.outputnames, self.formats, self.sizes)
+    # ----------------------------------------------------------------------#
+
+    def remove_items(self, indexes):
+        """
+        Removes the rows at the given `indexes`.
+        """
+        self.reorder_items(remaining_rows(len(self.file_src), indexes))
+    # ----------------------------------------------------------------------#
+
+    def reorder_items(self, order):
+        """
+        Rearranges all the columns of the model according
+        to `order`, a list of row indexes (rows not listed
+        are removed), then refreshes the control.
+        """
+        reorder_columns(self.columns(), order)
+        self.SetItemCount(len(self.file_src))
+        self.Refresh()
+    # ----------------------------------------------------------------------#
+
+    def clear_items(self):
         """
-        Update list-control during drag and drop.
-        Note that the optional 'newname' argument is given by
-        the 'on_col_click' method in the 'FileDnD' class to preserve
-        the related renames in column 5 of wx.ListCtrl.
+        Empties the model and the control.
+        """
+        for column in self.columns():
+            del column[:]
+        self.SetItemCount(0)
+        self.Refresh()
+    # ----------------------------------------------------------------------#
 
+    def import_files(self, paths):
         """
-        self.index = self.GetItemCount()
-        warn = fullpathname_sanitize(path)  # check for fullname sanitize
-        if warn:
-            self.errors[f'"{path}"'] = warn
+        Imports the given files into the list. Folders are
+        scanned recursively keeping only the files allowed by
+        the `import_allowlist` option (see `scan_folder`).
+        Files are probed by a pool of concurrent ffprobe
+        processes (see `MediaImport`) and the rows are added as
+        results arrive, keeping the order of `paths`. A progress
+        dialog with cancel button is shown when importing more
+        files. Rejected files are reported at the end, grouped
+        by reason when folders are imported.
+        """
+        if self.importer and self.importer.is_alive():
+            wx.Bell()
             return
 
-        if not [x for x in self.data if x['format']['filename'] == path]:
-            probe = ffprobe(path, cmd=self.appdata['ffprobe_cmd'],
-                            txtenc=self.appdata['encoding'],
-                            hide_banner=None, pretty=None)
-            if probe[1]:
-                self.errors[f'"{path}"'] = probe[1]
-                return
+        folders = any(os.path.isdir(path) for path in paths)
+        self.summary = {} if folders else None
+        self.imported = 0
+        if folders or len(paths) > 1:
+            self.progress = wx.ProgressDialog(_("Import files"),
+                                              _("Reading media "
+                                                "information..."),
+                                              maximum=len(paths),
+                                              parent=self.parent,
+                                              style=wx.PD_CAN_ABORT
+                                              | wx.PD_AUTO_HIDE
+                                              | wx.PD_ELAPSED_TIME,
+                                              )
+        rejected = []
+        self.importer = MediaImport(self.candidates(paths, folders,
+                                                    rejected),
+                                    self.on_import_result,
+                                    self.on_import_end,
+                                    rejected=rejected)
+    # ----------------------------------------------------------------------#
 
-            probe = probe[0]
-            self.InsertItem(self.index, str(self.index + 1))
-            self.SetItem(self.index, 1, path)
+    def candidates(self, paths, folders, rejected):
+        """
+        Generator of the files to probe, consumed by the
+        `MediaImport` thread. Duplicates are detected by a
+        set of the paths already in the list. Since it runs
+        on that thread, the rejected files are only appended
+        to the `rejected` list as (path, reason) tuples, which
+        `on_import_end` receives.
+        """
+        known = set(self.file_src)
+        reasons = {'hidden': _("Hidden file or folder"),
+                   'filtered': _("File type not allowed for import"),
+                   'unreadable': _("Not a regular file or unreadable"),
+                   }
+        allowlist = self.appdata['import_allowlist']
+        for path in paths:
+            if folders and os.path.isdir(path):
+                files = scan_folder(path, allowlist,
+                                    lambda name, why: rejected.append(
+                                        (name, reasons[why])))
+            else:
+                files = (path,)
+            for name in files:
+                warn = fullpathname_sanitize(name)  # check for sanitize
+                if warn:
+                    rejected.append((name, warn))
+                elif name in known:
+                    rejected.append((name, _("Duplicate file, it has "
+                                             "already been added to the "
+                                             "list.")))
+                else:
+                    known.add(name)
+                    yield name
+    # ----------------------------------------------------------------------#
 
-            if 'duration' not in probe['format'].keys():
-                self.SetItem(self.index, 2, 'N/A')
-                # NOTE these are my custom adds to probe data
-                probe['format']['time'] = '00:00:00.000'
-                probe['format']['duration'] = 0
+    def reject(self, path, reason):
+        """
+        Records a rejected file, counting it by reason
+        when importing folders.
+        """
+        if self.summary is None:
+            self.errors[f'"{path}"'] = reason
+        else:
+            self.summary[reason] = self.summary.get(reason, 0) + 1
+    # ----------------------------------------------------------------------#
 
+    def on_import_result(self, path, probe, error):
+        """
+        Receives the probe data of a file from `MediaImport`
+        and adds the related row.
+        """
+        self.imported += 1
+        if self.progress:
+            if self.summary is None:
+                cont = self.progress.Update(self.imported,
+                                            os.path.basename(path))[0]
             else:
-                tdur = probe['format']['duration'].split(':')
-                sec, msec = tdur[2].split('.')[0], tdur[2].split('.')[1]
-                tdur = f'{tdur[0]}h : {tdur[1]}m : {sec} : {msec}'
-                self.SetItem(self.index, 2, tdur)
-                probe['format']['time'] = probe.get('format').pop('duration')
-                time = time_to_integer(probe.get('format')['time'])
-                probe['format']['duration'] = time
-
-            media = probe['streams'][0]['codec_type']
-            formatname = probe['format']['format_long_name']
-            self.SetItem(self.index, 3, f'{media}: {formatname}')
-            self.SetItem(self.index, 4, probe['format']['size'])
-            if newname:
-                self.SetItem(self.index, 5, newname)
-                self.outputnames.append(newname)
+                cont = self.progress.Pulse(_("{0} files read: {1}").format(
+                    self.imported, os.path.basename(path)))[0]
+            if not cont:
+                self.importer.stop()
+        if error:
+            if self.summary is None:
+                self.reject(path, error)
             else:
-                fname = os.path.splitext(os.path.basename(path))[0]
-                self.SetItem(self.index, 5, fname)
-                self.outputnames.append(fname)
-            self.index += 1
-            self.data.append(probe)
-            self.file_src.append(path)
-            self.duration.append(probe['format']['duration'])
-            # self.parent.statusbar_msg('', None)
+                self.reject(path, _("Not recognized by FFprobe"))
+            return
+
+        self.append_item(path, probe,
+                         os.path.splitext(os.path.basename(path))[0])
+    # ----------------------------------------------------------------------#
+
+    def on_import_end(self, cancelled, rejected):
+        """
+        Called by `MediaImport` when done, with the
+        files rejected by `candidates`.
+        """
+        for path, reason in rejected:
+            self.reject(path, reason)
+        if self.progress:
+            self.progress.Destroy()
+            self.progress = None
+        if self.data:
             self.parent.changes_in_progress()
-        else:
-            mess = _("Duplicate file, it has already been added to the list.")
-            self.errors[f'"{path}"'] = mess
+        if cancelled:
+            self.parent.parent.statusbar_msg(_('Import cancelled'), None)
+        if self.summary:
+            for reason, count in self.summary.items():
+                self.errors[reason] = _("{0} files").format(count)
+            self.summary = None
+        self.rejected_files()
+        if (self.appdata.get('output_cache')
+                and self.appdata.get('fingerprint_mode') == 'content'):
+            if self.digester and self.digester.is_alive():
+                self.digester.stop()
+            self.digester = DigestThread(self.file_src, PROBECACHE)
     # ----------------------------------------------------------------------#
 
     def rejected_files(self):
@@ -220,9 +422,7 @@ class FileDrop(wx.FileDropTarget):
         When files are dropped, write where they were dropped and then
         the file paths themselves
         """
-        for filepath in filenames:
-            self.window.dropUpdate(filepath)  # update list control
-        self.window.rejected_files()  # call parent.rejected_files at end
+        self.window.import_files(filenames)  # update list control
 
         return True
     # ----------------------------------------------------------------------#
@@ -419,9 +619,9 @@ class FileDnD(wx.Panel):
         """
         Sort items by LEFT clicking on column headers
         (from ascending to descending and back to ascending).
-        For this feature is required to delete all items from
-        listctrl and data list before re-loading the same
-        items with the new sorted order using `dropUpdate` method.
+        The columns of the list model are reordered in place
+        using typed keys (e.g. duration in milliseconds, size
+        in bytes), no file is probed again.
 
         if plane to use wx.EVT_LIST_COL_RIGHT_CLICK event:
             `if event.GetEventType() == wx.EVT_LIST_COL_RIGHT_CLICK.typeId:`
@@ -429,44 +629,30 @@ class FileDnD(wx.Panel):
         see: <https://discuss.wxpython.org/t/event-geteventtype/22860/4>
         """
         count = self.flCtrl.GetItemCount()
-        curritems = []
-        if count > 1:
-            if event.GetColumn() in (0, -1):
-                return
+        column = event.GetColumn()
+        if count < 2 or column in (0, -1):
+            return
 
-            for x in range(count):
-                curritems.append((self.flCtrl.GetItemText(x, col=1),
-                                  self.flCtrl.GetItemText(x, col=2),
-                                  self.flCtrl.GetItemText(x, col=3),
-                                  self.flCtrl.GetItemText(x, col=4),
-                                  self.flCtrl.GetItemText(x, col=5),
-                                  ))
-            if event.GetColumn() == 1:
-                curritems.sort(key=lambda item: item[0])
-            elif event.GetColumn() == 2:
-                curritems.sort(key=lambda item: item[1])
-            elif event.GetColumn() == 3:
-                curritems.sort(key=lambda item: item[2])
-            elif event.GetColumn() == 4:
-                curritems.sort(key=lambda item:
-                               to_bytes(''.join(item[3].split())))
-            elif event.GetColumn() == 5:
-                curritems.sort(key=lambda item: item[4])
-
-            self.delete_all(None, setstate=False)  # no event, no setstate here
-
-            if self.sortingstate == 'descending':
-                self.sortingstate = 'ascending'
-            elif self.sortingstate == 'ascending':
-                self.sortingstate = 'descending'
-            elif not self.sortingstate:
-                self.sortingstate = 'ascending'
-
-            if self.sortingstate == 'descending':
-                curritems.reverse()
-
-            for data in curritems:
-                self.flCtrl.dropUpdate(data[0], data[4])
+        keys = {1: self.file_src,
+                2: self.duration,
+                3: self.flCtrl.formats,
+                4: self.flCtrl.sizes,
+                5: self.outputnames,
+                }
+        if self.sortingstate == 'ascending':
+            self.sortingstate = 'descending'
+        else:
+            self.sortingstate = 'ascending'
+
+        order = sort_order(keys[column], self.sortingstate == 'descending')
+
+        focused = self.flCtrl.GetFocusedItem()
+        if focused != -1:
+            self.flCtrl.Select(focused, on=0)
+        self.flCtrl.reorder_items(order)
+        if focused != -1:
+            self.flCtrl.Focus(order.index(focused))
+        self.changes_in_progress()
     # ----------------------------------------------------------------------
 
     def changes_in_progress(self, setfocus=True):
@@ -542,19 +728,12 @@ class FileDnD(wx.Panel):
             self.delete_all(self)
             return
 
-        for num in sorted(indexes, reverse=True):
-            self.flCtrl.DeleteItem(num)  # remove selected items
-            self.data.pop(num)  # remove selected items
-            self.outputnames.pop(num)  # remove selected items
-            self.file_src.pop(num)
-            self.duration.pop(num)
-            self.flCtrl.Select(num - 1)  # select the previous one
+        for num in indexes:
+            self.flCtrl.Select(num, on=0)
+        self.flCtrl.remove_items(indexes)  # remove selected items
+        self.flCtrl.Focus(max(0, min(indexes) - 1))  # the previous one
         self.changes_in_progress(setfocus=True)  # reset timeline
         # self.on_deselect(self)  # deselect removed file
-
-        for x in range(self.flCtrl.GetItemCount()):
-            self.flCtrl.SetItem(x, 0, str(x + 1))  # re-load counter
-        return
     # ----------------------------------------------------------------------
 
     def delete_all(self, event, setstate=True):
@@ -564,12 +743,7 @@ class FileDnD(wx.Panel):
         """
         if self.flCtrl.GetItemCount() == 0:
             return
-        # self.flCtrl.ClearAll()
-        self.flCtrl.DeleteAllItems()
-        del self.data[:]
-        del self.outputnames[:]
-        del self.file_src[:]
-        del self.duration[:]
+        self.flCtrl.clear_items()
         if event:
             self.changes_in_progress(setfocus=False)
             self.parent.rename.Enable(False)
@@ -654,8 +828,8 @@ class FileDnD(wx.Panel):
             self.parent.statusbar_msg(sanitize, FileDnD.YELLOW, FileDnD.BLACK)
             return
 
-        self.flCtrl.SetItem(row_id, 5, newname)
         self.outputnames[row_id] = newname
+        self.flCtrl.RefreshItem(row_id)
         self.parent.statusbar_msg(_('Add Files'), None)
 # -----------------------------------------------------------------------
 
@@ -683,8 +857,7 @@ class FileDnD(wx.Panel):
                                           FileDnD.BLACK)
                 return
 
-        for num, name in enumerate(newname):
-            self.flCtrl.SetItem(num, 5, name)
-            self.outputnames[num] = name
+        self.outputnames[:] = newname
+        self.flCtrl.RefreshItems(0, len(newname) - 1)
 
         self.parent.statusbar_msg(_('Add Files'), None)
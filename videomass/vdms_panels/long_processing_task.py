@@ -6,7 +6,7 @@ Compatibility: Python3, wxPython4 Phoenix
 Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
 Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
 license: GPL3
-Rev: Aug.07.2025
+Rev: Oct.18.2026
 Code checker: flake8, pylint
 
 This file is part of Videomass.
@@ -30,12 +30,14 @@ from shutil import move
 from pubsub import pub
 import wx
 from videomass.vdms_dialogs.widget_utils import notification_area
-from videomass.vdms_io.make_filelog import make_log_template
-from videomass.vdms_threads.ffmpeg import FFmpeg
-from videomass.vdms_threads.image_extractor import PicturesFromVideo
-from videomass.vdms_threads.concat_demuxer import ConcatDemuxer
-from videomass.vdms_threads.slideshow import SlideshowMaker
-from videomass.vdms_utils.utils import (time_to_integer, integer_to_time)
+from videomass.vdms_io.job_journal import JobJournal
+from videomass.vdms_io.make_filelog import (make_log_template,
+                                            tolog,
+                                            append_to_log,
+                                            flush_logs,
+                                            )
+from videomass.vdms_threads.dispatcher import DISPATCHER
+from videomass.vdms_utils.utils import integer_to_time
 from videomass.vdms_io import io_tools
 
 
@@ -68,36 +70,6 @@ def delete_file_source(flist, trashdir):
                 move(name, dest)
 
 
-def pairwise(iterable):
-    """
-    Return a zip object from iterable.
-    This function is used by the update_display method.
-    ----
-    USE:
-
-    after splitting ffmpeg's progress strings such as:
-    output = "frame= 1178 fps=155 q=29.0 size=    2072kB time=00:00:39.02
-              bitrate= 435.0kbits/s speed=5.15x  "
-    in a list as:
-    iterable = ['frame', '1178', 'fps', '155', 'q', '29.0', 'size', '2072kB',
-                'time', '00:00:39.02', 'bitrate', '435.0kbits/s', speed',
-                '5.15x']
-    1)
-        for x, y in pairwise(iterable):
-            x, y
-    2)
-        dict(pairwise(iterable))
-
-    Return: a zip object pairs from list iterable object.
-
-    <https://stackoverflow.com/questions/5389507/iterating-over-every-
-    two-elements-in-a-list>
-    """
-    itobj = iter(iterable)  # list_iterator object
-    return zip(itobj, itobj)  # zip object pairs from list iterable object
-# ----------------------------------------------------------------------#
-
-
 class LogOut(wx.Panel):
     """
     displays a text control for the output logging, a progress bar
@@ -141,6 +113,8 @@ class LogOut(wx.Panel):
         self.logfile = None  # log pathname, None otherwise
         self.result = []  # result of the final process
         self.count = 0  # keeps track of the counts (see `update_count`)
+        self.jobs = {}  # progress of parallel jobs (see `setup_jobs_view`)
+        self.jobs_total = 0  # overall amount of work of the parallel jobs
         self.clr = self.appdata['colorscheme']
 
         wx.Panel.__init__(self, parent=parent)
@@ -157,6 +131,18 @@ class LogOut(wx.Panel):
                                   | wx.TE_READONLY
                                   | wx.TE_RICH2
                                   )
+        self.jobsview = wx.ListCtrl(self, wx.ID_ANY,
+                                    style=wx.LC_REPORT
+                                    | wx.LC_SINGLE_SEL
+                                    | wx.SUNKEN_BORDER
+                                    )
+        self.jobsview.InsertColumn(0, '#', width=40)
+        self.jobsview.InsertColumn(1, _('Source file'), width=300)
+        self.jobsview.InsertColumn(2, _('Progress'), width=90)
+        self.jobsview.InsertColumn(3, _('Speed'), width=90)
+        self.jobsview.InsertColumn(4, _('ETA'), width=120)
+        self.jobsview.InsertColumn(5, _('Status'), width=200)
+        self.jobsview.Hide()
         self.barprog = wx.Gauge(self, wx.ID_ANY, range=0)
         self.labprog = wx.StaticText(self, label="")
         self.labffmpeg = wx.StaticText(self, label="")
@@ -164,6 +150,7 @@ class LogOut(wx.Panel):
         sizer.Add((0, 10))
         sizer.Add(lbl, 0, wx.ALL, 5)
         sizer.Add(self.txtout, 1, wx.EXPAND | wx.ALL, 5)
+        sizer.Add(self.jobsview, 1, wx.EXPAND | wx.ALL, 5)
         sizer.Add(self.btn_viewlog, 0, wx.ALL, 5)
         sizer.Add(self.barprog, 0, wx.EXPAND | wx.ALL, 5)
         sizer.Add(self.labprog, 0, wx.ALL, 5)
@@ -180,6 +167,7 @@ class LogOut(wx.Panel):
         self.Bind(wx.EVT_BUTTON, self.view_log, self.btn_viewlog)
 
         pub.subscribe(self.update_display, "UPDATE_EVT")
+        pub.subscribe(self.update_progress, "PROGRESS_EVT")
         pub.subscribe(self.update_count, "COUNT_EVT")
         pub.subscribe(self.end_proc, "END_EVT")
     # ----------------------------------------------------------------------
@@ -189,6 +177,7 @@ class LogOut(wx.Panel):
         Opens the log file corresponding to the last executed process.
         """
         if self.logfile:
+            flush_logs()
             fname = str(self.logfile)
             if os.path.exists(fname) and os.path.isfile(fname):
                 io_tools.openpath(fname)
@@ -197,7 +186,8 @@ class LogOut(wx.Panel):
     def topic_thread(self, args, data, previous='View', mode='w'):
         """
         This method is resposible to create the Thread instance.
-
+        The thread modules are imported here, on the first job,
+        to keep them off the startup path.
         """
         self.previous = previous  # stores the panel from which it starts
 
@@ -208,6 +198,9 @@ class LogOut(wx.Panel):
         self.labprog.SetLabel('')
         self.labffmpeg.SetLabel('')
         self.btn_viewlog.Disable()
+        self.jobsview.DeleteAllItems()
+        self.jobsview.Hide()
+        self.jobs.clear()
 
         self.logfile = make_log_template(args[1],
                                          self.appdata['logdir'],
@@ -215,55 +208,222 @@ class LogOut(wx.Panel):
                                          )
         if args[0] in ('One pass', 'Two pass', 'Two pass EBU',
                        'Two pass VIDSTAB', 'Queue Processing'):
-            self.thread_type = FFmpeg(self.logfile, data)
+            from videomass.vdms_threads.ffmpeg import FFmpeg
+            if args[0] == 'Queue Processing':
+                journal = JobJournal(os.path.join(self.appdata['confdir'],
+                                                  'queue.journal'))
+                self.thread_type = FFmpeg(self.logfile, data, journal)
+            else:
+                self.thread_type = FFmpeg(self.logfile, data)
+            if self.thread_type.maxjobs > 1:
+                self.setup_jobs_view(data)
 
         elif args[0] == 'video_to_sequence':
+            from videomass.vdms_threads.image_extractor import (
+                PicturesFromVideo)
             self.with_eta = False
             self.thread_type = PicturesFromVideo(self.logfile, **data)
 
         elif args[0] == 'sequence_to_video':
+            from videomass.vdms_threads.slideshow import SlideshowMaker
             self.with_eta = False
             self.thread_type = SlideshowMaker(self.logfile, **data)
 
         elif args[0] == 'concat_demuxer':
+            from videomass.vdms_threads.concat_demuxer import ConcatDemuxer
             self.with_eta = False
             self.thread_type = ConcatDemuxer(self.logfile, **data)
     # ----------------------------------------------------------------------
 
-    def append_messages(self, output):
+    def setup_jobs_view(self, data):
+        """
+        Shows a row for each job of a parallel processing and
+        sets the progress bar to display the overall progress
+        (in thousandths, since the total amount of milliseconds
+        can exceed the range of the wx.Gauge).
+        """
+        self.jobs_total = 0
+        for jobid, kwa in enumerate(data, start=1):
+            passes = 2 if kwa['args'][1] else 1
+            self.jobs[jobid] = {'row': jobid - 1,
+                                'duration': kwa['duration'],
+                                'passes': passes,
+                                'done': 0,  # completed passes
+                                'msec': 0,  # progress of current pass
+                                }
+            self.jobs_total += kwa['duration'] * passes
+            row = self.jobsview.InsertItem(jobid - 1, str(jobid))
+            self.jobsview.SetItem(row, 1, os.path.basename(kwa['source']))
+            self.jobsview.SetItem(row, 2, '0%')
+            self.jobsview.SetItem(row, 5, _('Queued'))
+
+        self.barprog.SetRange(1000)
+        self.barprog.SetValue(0)
+        self.jobsview.Show()
+        self.Layout()
+    # ----------------------------------------------------------------------
+
+    def update_jobs_progress(self):
+        """
+        Updates the overall progress bar and label of
+        the jobs running in parallel.
         """
-        Append all others lines on the textctrl and log file.
+        progress = sum(job['done'] * job['duration'] + job['msec']
+                       for job in self.jobs.values())
+        finished = len([job for job in self.jobs.values()
+                        if job['done'] >= job['passes']])
+        if self.jobs_total:
+            value = min(round(progress / self.jobs_total * 1000), 1000)
+        else:
+            value = 1000
+        self.barprog.SetValue(value)
+        self.labprog.SetLabel(f'Processing: {value // 10}%   '
+                              f'Jobs: {finished}/{len(self.jobs)}')
+    # ----------------------------------------------------------------------
+
+    def update_job(self, output, duration, status, jobid):
+        """
+        Same as `update_display` but for a single job of
+        a parallel processing.
+        """
+        job = self.jobs.get(jobid)
+        if job is None:
+            return
+
+        if status != 0:  # error, exit status of the p.wait
+            if output == 'STOP':
+                msg, color = LogOut.MSG_stop, self.clr['ABORT']
+                self.jobsview.SetItem(job['row'], 5, _('Interrupted'))
+            else:
+                msg, color = LogOut.MSG_failed, self.clr['ERR1']
+                self.jobsview.SetItem(job['row'], 5, _('Failed'))
+            job['done'], job['msec'] = job['passes'], 0
+            self.txtout.SetDefaultStyle(wx.TextAttr(color))
+            self.txtout.AppendText(f"\n\n[#{jobid}] {msg}")
+            self.result.append('failed')
+            self.update_jobs_progress()
+            return
+
+        self.append_messages([f'[#{jobid}] {line}' for line in output],
+                             writelog=False)
+    # ----------------------------------------------------------------------
+
+    def update_job_progress(self, progress, duration, jobid):
+        """
+        Same as `update_progress` but for a single job of
+        a parallel processing.
+        """
+        job = self.jobs.get(jobid)
+        if job is None:
+            return
+
+        job['msec'] = min(progress.msec, duration)
+        percentage = round((job['msec'] / duration) * 100 if
+                           duration != 0 else 100)
+        eta, speed = 'N/A', 'N/A'
+        if progress.speed:
+            rem = (duration - job['msec']) / progress.speed
+            eta = integer_to_time(round(rem))
+            speed = f'{progress.speed:.2f}x'
+        self.jobsview.SetItem(job['row'], 2, f'{percentage}%')
+        self.jobsview.SetItem(job['row'], 3, speed)
+        self.jobsview.SetItem(job['row'], 4, eta)
+        self.update_jobs_progress()
+    # ----------------------------------------------------------------------
+
+    def update_job_count(self, count, end, jobid):
+        """
+        Same as `update_count` but for a single job of
+        a parallel processing.
+        """
+        job = self.jobs.get(jobid)
+        if job is None:
+            return
+
+        if end == 'DONE':
+            job['done'] += 1
+            job['msec'] = 0
+            if job['done'] >= job['passes']:
+                self.jobsview.SetItem(job['row'], 2, '100%')
+                self.jobsview.SetItem(job['row'], 4, '00:00:00.000')
+                self.jobsview.SetItem(job['row'], 5, _('Done'))
+                self.txtout.SetDefaultStyle(wx.TextAttr(self.clr['SUCCESS']))
+                self.txtout.AppendText(f"\n[#{jobid}] {LogOut.MSG_done}")
+            self.update_jobs_progress()
+            return
+
+        if end == 'ERROR':
+            self.jobsview.SetItem(job['row'], 5, _('Error'))
+            self.txtout.SetDefaultStyle(wx.TextAttr(self.clr['ERR1']))
+            self.txtout.AppendText(f'\n[#{jobid}] ERROR: {count}\n')
+            self.error = True
+        else:
+            self.jobsview.SetItem(job['row'], 2, '0%')
+            self.jobsview.SetItem(job['row'], 5, str(count).split('\n')[0])
+            self.txtout.SetDefaultStyle(wx.TextAttr(self.clr['TXT0']))
+            self.txtout.AppendText(f'\n[#{jobid}] {count}\n')
+        self.count += 1
+    # ----------------------------------------------------------------------
+
+    def message_color(self, line):
+        """
+        Returns the text color of a FFmpeg message line.
         Since not all ffmpeg messages are errors, sometimes
         it happens to see more output marked with yellow color.
         """
-        with open(self.logfile, "a", encoding='utf-8') as logerr:
-            logerr.write(f"[FFMPEG]: {output}")
+        if [x for x in ('info', 'Info') if x in line]:
+            return self.clr['INFO']
 
-        if [x for x in ('info', 'Info') if x in output]:
-            self.txtout.SetDefaultStyle(wx.TextAttr(self.clr['INFO']))
-            self.txtout.AppendText(f'{output}')
+        if [x for x in ('Failed', 'failed', 'Error', 'error') if x in line]:
+            return self.clr['ERR0']
 
-        elif [x for x in ('Failed', 'failed', 'Error', 'error')
-                if x in output]:
-            self.txtout.SetDefaultStyle(wx.TextAttr(self.clr['ERR0']))
-            self.txtout.AppendText(f'{output}')
+        if [x for x in ('warning', 'Warning', 'warn') if x in line]:
+            return self.clr['WARN']
 
-        elif [x for x in ('warning', 'Warning', 'warn') if x in output]:
-            self.txtout.SetDefaultStyle(wx.TextAttr(self.clr['WARN']))
-            self.txtout.AppendText(f'{output}')
+        return self.clr['TXT3']
+    # ----------------------------------------------------------------------
 
-        else:
-            self.txtout.SetDefaultStyle(wx.TextAttr(self.clr['TXT3']))
-            self.txtout.AppendText(f'{output}')
+    def append_messages(self, output, writelog=True):
+        """
+        Append a batch of lines (a list, or a single str) on
+        the textctrl and log file. Consecutive lines of the
+        same color are appended by a single call.
+        Jobs running in parallel write their own log sections,
+        so `writelog` is False for them.
+        """
+        lines = [output] if isinstance(output, str) else output
+        if writelog:
+            append_to_log(''.join(f"[FFMPEG]: {line}" for line in lines),
+                          self.logfile)
+
+        text, color = [], None
+        for line in lines:
+            linecolor = self.message_color(line)
+            if text and linecolor != color:
+                self.txtout.SetDefaultStyle(wx.TextAttr(color))
+                self.txtout.AppendText(''.join(text))
+                text = []
+            color = linecolor
+            text.append(line)
+        if text:
+            self.txtout.SetDefaultStyle(wx.TextAttr(color))
+            self.txtout.AppendText(''.join(text))
     # ----------------------------------------------------------------------
 
-    def update_display(self, output, duration, status):
+    def update_display(self, output, duration, status, jobid=None):
         """
         Receive message from thread by pubsub UPDATE_EVT protocol.
-        The received 'output' is parsed for calculate the bar
-        progress value, percentage label and errors management.
+        The received 'output' is a batch (list) of diagnostics lines
+        of FFmpeg or a status (errors management), the progress is
+        received by `update_progress`. See also `EventDispatcher`.
         This method can be used even for non-loop threads.
+        The optional `jobid` identifies a job of a parallel
+        processing (see `update_job`).
         """
+        if jobid is not None:
+            self.update_job(output, duration, status, jobid)
+            return
+
         if status != 0:  # error, exit status of the p.wait
             if output == 'STOP':
                 msg, color = LogOut.MSG_stop, self.clr['ABORT']
@@ -274,48 +434,45 @@ class LogOut(wx.Panel):
             self.result.append('failed')
             return  # must be return here
 
-        if 'time=' in output:  # ...in processing
-            i = output.index('time=') + 5
-            pos = output[i:].split()[0]
-            msec = time_to_integer(pos)
+        self.append_messages(output)
+    # ----------------------------------------------------------------------
 
-            if msec > duration:
-                self.barprog.SetValue(duration)
-            elif msec == 0:
-                self.barprog.SetValue(self.barprog.GetValue())
-            else:
-                self.barprog.SetValue(msec)
-
-            percentage = round((msec / duration) * 100 if
-                               duration != 0 else 100)
-            out = [a for a in "=".join(output.split()).split('=') if a]
-            ffprog = []
-            for key, val in pairwise(out):
-                ffprog.append(f"{key}: {val}")
-            if self.with_eta:
-                if 'speed=' in output:
-                    speed = output.split('speed=')[-1].strip().split('x')[0]
-                    if speed in ('N/A', '0') or 'N/A' in speed:
-                        eta = "   ETA: N/A"
-                    else:  # is float
-                        rem = (duration - msec) / float(speed)
-                        remaining = integer_to_time(round(rem))
-                        eta = f"   ETA: {remaining}"
-                else:
-                    eta = "   ETA: N/A"
-            else:
-                eta = ""
-            self.labprog.SetLabel(f'Processing: {str(int(percentage))}% {eta}')
-            self.labffmpeg.SetLabel(' | '.join(ffprog))
+    def update_progress(self, progress, duration, jobid=None):
+        """
+        Receive a `ProgressRecord` from thread by pubsub PROGRESS_EVT
+        protocol, to update the bar progress value, percentage label
+        and ETA. The optional `jobid` identifies a job of a parallel
+        processing (see `update_job_progress`).
+        """
+        if jobid is not None:
+            self.update_job_progress(progress, duration, jobid)
+            return
 
+        msec = min(progress.msec, duration)
+        if msec:
+            self.barprog.SetValue(msec)
+        percentage = round((msec / duration) * 100 if
+                           duration != 0 else 100)
+        if self.with_eta:
+            if progress.speed:
+                rem = (duration - msec) / progress.speed
+                eta = f"   ETA: {integer_to_time(round(rem))}"
+            else:
+                eta = "   ETA: N/A"
         else:
-            self.append_messages(output)
+            eta = ""
+        self.labprog.SetLabel(f'Processing: {percentage}% {eta}')
+        self.labffmpeg.SetLabel(' | '.join(progress.labels()))
     # ----------------------------------------------------------------------
 
-    def update_count(self, count, duration, end):
+    def update_count(self, count, duration, end, jobid=None):
         """
         Receive messages from file count, loop or non-loop thread.
         """
+        if jobid is not None:
+            self.update_job_count(count, end, jobid)
+            return
+
         if end == 'DONE':
             self.txtout.SetDefaultStyle(wx.TextAttr(self.clr['SUCCESS']))
             self.txtout.AppendText(f"\n{LogOut.MSG_done}")
@@ -386,6 +543,10 @@ class LogOut(wx.Panel):
                     delete_file_source(filetotrash, trashdir)  # filelist, dir
 
         self.txtout.AppendText('\n')
+        posted, merged = DISPATCHER.stats(reset=True)
+        tolog(f'[VIDEOMASS]: GUI messages: {posted} received, '
+              f'{merged} merged', self.logfile)
+        flush_logs()
         self.reset_all()
         pub.sendMessage("PROCESS TERMINATED", msg='Terminated')
     # ----------------------------------------------------------------------
@@ -6,7 +6,7 @@ Compatibility: Python3
 Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
 Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
 license: GPL3
-Rev: May.29.2023
+Rev: Oct.18.2026
 Code checker: flake8, pylint
 
 This file is part of Videomass.
@@ -87,6 +87,12 @@ def arguments():
                               ),
                         metavar='DIRNAME',
                         )
+    parser.add_argument('--profile-startup',
+                        help=('Print a breakdown of the time spent importing '
+                              'modules and building the main window at '
+                              'start-up.'),
+                        action="store_true",
+                        )
 
     argmts = parser.parse_args()
 
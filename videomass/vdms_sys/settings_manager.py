@@ -6,7 +6,7 @@ Compatibility: Python3
 Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
 Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
 license: GPL3
-Rev: July.10.2025
+Rev: Oct.18.2026
 Code checker: flake8, pylint
 
  This file is part of Videomass.
@@ -149,8 +149,55 @@ class ConfigManager:
     filedrop_column_width (list of int)
         column width in the File Drop panel.
 
+    parallel_jobs (bool):
+        If True, the items of batch and queue processing are
+        processed by several FFmpeg subprocesses at the same time,
+        default is False.
+
+    parallel_jobs_max (int):
+        Maximum number of FFmpeg jobs running at the same time
+        when `parallel_jobs` is True. With 0 (auto) it is derived
+        from the CPU count, default is 0. It is also the number of
+        segments encoded at the same time by `chunked_encoding`.
+
+    chunked_encoding (bool):
+        If True, long files processed one at a time by One pass and
+        Two pass presets are split at keyframes into segments
+        encoded at the same time and then joined, default is False.
+
+    chunked_segments (int):
+        Number of segments of a file when `chunked_encoding` is True.
+        With 0 (auto) it is the CPU count, default is 0.
+
+    smart_cut (bool):
+        If True, the time selections of One pass items which copy
+        the video stream are cut with frame accuracy by re-encoding
+        only the partial GOPs at the cut points, default is False.
+
+    volumedetect_jobs (int):
+        Number of audio peak analyses (volumedetect) running at
+        the same time before the peak level normalization. With
+        0 (auto) it is the CPU count, default is 0.
+
+    output_cache (bool):
+        If True, the items of batch and queue processing identical
+        to a job already done (same source file, command line and
+        FFmpeg build) reuse its output, if still valid, instead of
+        being encoded again, default is False.
+
+    fingerprint_mode (str):
+        How the output cache identifies the source files: "sampled"
+        (size, time and a hash of sampled blocks) or "content" (a
+        hash of the whole content, computed in background after
+        the import), default is "sampled".
+
+    import_allowlist (list):
+        Files allowed when importing folders, given as file
+        extensions without dot (e.g. "mkv") or MIME type patterns
+        (e.g. "video/*"), default are audio and video files.
+
     """
-    VERSION = 8.5
+    VERSION = 8.6
     DEFAULT_OPTIONS = {"confversion": VERSION,
                        "shutdown": False,
                        "sudo_password": "",
@@ -180,6 +227,19 @@ class ConfigManager:
                        "locale_name": "Default",
                        "prstmng_column_width": [250, 350, 200, 220],
                        "filedrop_column_width": [30, 200, 200, 200, 150, 200],
+                       "parallel_jobs": False,
+                       "parallel_jobs_max": 0,
+                       "chunked_encoding": False,
+                       "chunked_segments": 0,
+                       "smart_cut": False,
+                       "volumedetect_jobs": 0,
+                       "output_cache": False,
+                       "fingerprint_mode": "sampled",
+                       "import_allowlist": ["video/*", "audio/*", "mkv",
+                                            "webm", "ts", "m2ts", "mts",
+                                            "vob", "flv", "ogv", "flac",
+                                            "opus", "m4a", "oga", "mka",
+                                            "ac3", "dts", "wv", "ape"],
                        }
 
     def __init__(self, filename, makeportable=None):
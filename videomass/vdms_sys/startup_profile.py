@@ -0,0 +1,105 @@
+# -*- coding: UTF-8 -*-
+"""
+Name: startup_profile.py
+Porpose: timing breakdown of the application start-up
+Compatibility: Python3
+Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
+Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
+license: GPL3
+Rev: Oct.18.2026
+Code checker: flake8, pylint
+
+This file is part of Videomass.
+
+   Videomass is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   Videomass is distributed in the hope that it will be useful,
+   but WITHOUT ANY WARRANTY; without even the implied warranty of
+   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+   GNU General Public License for more details.
+
+   You should have received a copy of the GNU General Public License
+   along with Videomass.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import sys
+import time
+from contextlib import contextmanager
+
+
+class StartupProfile:
+    """
+    Collects the time spent by the start-up steps (imports,
+    panel construction, etc.) as nested spans. Recording is
+    always on, since it is cheap, while the breakdown is only
+    printed when enabled by the `--profile-startup` option.
+
+    Usage:
+        >>> with STARTUP.span('import main_frame'):
+        >>>     from videomass.vdms_main.main_frame import MainFrame
+        >>> STARTUP.mark('first paint')
+        >>> STARTUP.report()
+    """
+    def __init__(self):
+        """
+        The origin is the import time of this module, which
+        is imported first by `gui_app`.
+        """
+        self.origin = time.perf_counter()
+        self.enabled = False
+        self.spans = []  # [depth, label, seconds] in starting order
+        self.depth = 0
+
+    def enable(self):
+        """
+        Enables the report.
+        """
+        self.enabled = True
+
+    @contextmanager
+    def span(self, label):
+        """
+        Times the enclosed block of code.
+        """
+        entry = [self.depth, label, 0.0]
+        self.spans.append(entry)
+        self.depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry[2] = time.perf_counter() - start
+            self.depth -= 1
+
+    def mark(self, label):
+        """
+        Records a milestone as the time elapsed from the origin.
+        """
+        self.spans.append([self.depth, f'@ {label}',
+                           time.perf_counter() - self.origin])
+
+    def lines(self):
+        """
+        Returns the breakdown as a list of strings.
+        """
+        rows = ['Start-up profile (milliseconds):']
+        for depth, label, seconds in self.spans:
+            rows.append(f'{seconds * 1000:10.1f}  {"  " * depth}{label}')
+        modules = len([name for name in sys.modules
+                       if name.startswith('videomass')])
+        rows.append(f'Videomass modules loaded: {modules}')
+        return rows
+
+    def report(self):
+        """
+        Prints the breakdown on stdout if enabled, once.
+        """
+        if not self.enabled:
+            return
+        self.enabled = False
+        print('\n'.join(self.lines()))
+
+
+STARTUP = StartupProfile()
@@ -0,0 +1,240 @@
+# -*- coding: UTF-8 -*-
+"""
+Name: audio_analysis.py
+Porpose: single-decode audio statistics (volumedetect, astats, loudnorm)
+Compatibility: Python3
+Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
+Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
+license: GPL3
+Rev: Oct.18.2026
+Code checker: flake8, pylint
+
+This file is part of Videomass.
+
+   Videomass is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   Videomass is distributed in the hope that it will be useful,
+   but WITHOUT ANY WARRANTY; without even the implied warranty of
+   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+   GNU General Public License for more details.
+
+   You should have received a copy of the GNU General Public License
+   along with Videomass.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import re
+import json
+
+# loudnorm defaults, used for the targets not given
+LOUDNORM_TARGETS = (('I', -24.0), ('TP', -2.0), ('LRA', 7.0))
+
+# keys of the loudnorm JSON report and of the summary read
+# by the first pass of 'Two pass EBU' (see `one_pass_ebu`)
+SUMMARY_KEYS = (('input_i', 'Input Integrated:'),
+                ('input_tp', 'Input True Peak:'),
+                ('input_lra', 'Input LRA:'),
+                ('input_thresh', 'Input Threshold:'),
+                ('output_i', 'Output Integrated:'),
+                ('output_tp', 'Output True Peak:'),
+                ('output_lra', 'Output LRA:'),
+                ('output_thresh', 'Output Threshold:'),
+                ('normalization_type', 'Normalization Type:'),
+                ('target_offset', 'Target Offset:'))
+
+
+def loudnorm_targets(text):
+    """
+    Returns the I, TP and LRA targets of the loudnorm filter
+    found in `text` in a canonical form, e.g. 'I=-23:TP=-1:LRA=7',
+    so that equal targets always give the same string.
+    """
+    found = re.search(r'loudnorm=(\S*)', text or '')
+    opts = dict(opt.partition('=')[::2] for opt in
+                (found.group(1).split(':') if found else []))
+    targets = []
+    for key, default in LOUDNORM_TARGETS:
+        try:
+            value = float(opts.get(key, default))
+        except ValueError:
+            value = default
+        targets.append(f'{key}={value:g}')
+    return ':'.join(targets)
+# ----------------------------------------------------------------------
+
+
+def audio_stream(text):
+    """
+    Returns the index of the audio stream mapped by the
+    arguments `text` (e.g. '-map 0:a:1?' gives '1'), '' if
+    no single stream is. In the latter case the statistics
+    refer to the default audio stream, which is the only one
+    of most files.
+    """
+    found = re.search(r'-map\s+0:a:(\d+)', text or '')
+    return found.group(1) if found else ''
+# ----------------------------------------------------------------------
+
+
+def analysis_filter(targets=''):
+    """
+    Returns the audio filter chain of the analysis: volumedetect
+    alone, which is all the PEAK and RMS normalizations need,
+    or with the loudnorm `targets` (see `loudnorm_targets`)
+    also astats and loudnorm, whose 4x oversampled true peak
+    makes it several times slower. The filters pass the audio
+    through, so they all measure the same decoded samples;
+    loudnorm is the last one since it resamples its output.
+    """
+    if not targets:
+        return 'volumedetect'
+    return f'volumedetect,astats,loudnorm={targets}:print_format=json'
+# ----------------------------------------------------------------------
+
+
+def analysis_variant(start, end, mapargs, loudnorm='', preinput=''):
+    """
+    Returns the key under which the statistics of a source
+    are cached along with its probe data (see `ProbeCache`),
+    given the time range (`start`, `end`), the arguments
+    mapping the audio stream and the loudnorm filter, if
+    any, i.e. the filters of `analysis_filter` which ran.
+    This is also the key of the loudness measurements of
+    the first pass of 'Two pass EBU', whose input options
+    `preinput` may affect the decoded audio.
+    """
+    timeseq = ' '.join(f'{preinput} {start} {end}'.split())
+    variant = f'audiostats {timeseq} a:{audio_stream(mapargs)}'
+    if 'loudnorm=' in (loudnorm or ''):
+        variant += f' {loudnorm_targets(loudnorm)}'
+    return variant
+# ----------------------------------------------------------------------
+
+
+class AudioStats:
+    """
+    Statistics of an audio stream measured by a single decode
+    (see `analysis_filter`).
+
+    Attributes:
+        max_volume (str): maximum volume by volumedetect, e.g. '-0.5 dB'
+        mean_volume (str): mean volume by volumedetect
+        astats (dict): overall values by astats, e.g. 'RMS level dB'
+        loudness (dict): loudnorm report (print_format=json)
+    """
+    __slots__ = ('max_volume', 'mean_volume', 'astats', 'loudness')
+
+    def __init__(self, max_volume='', mean_volume='', astats=None,
+                 loudness=None):
+        """
+        All the values are strings as written by FFmpeg.
+        """
+        self.max_volume = max_volume
+        self.mean_volume = mean_volume
+        self.astats = astats or {}
+        self.loudness = loudness or {}
+
+    def volumedetect(self):
+        """
+        Returns a tuple (max_volume, mean_volume), see
+        `get_volume_data`.
+        """
+        return self.max_volume, self.mean_volume
+
+    def complete(self, loudness):
+        """
+        Returns True if the record has the volumedetect values
+        and, if `loudness`, the loudness measurements.
+        """
+        return bool(self.max_volume and (not loudness
+                                         or self.loudnorm_summary()))
+
+    def loudnorm_summary(self):
+        """
+        Returns the loudness measurements in the form of the
+        summary of the first pass of 'Two pass EBU', None if
+        any of them is missing.
+        """
+        summary = {}
+        for key, name in SUMMARY_KEYS:
+            value = self.loudness.get(key)
+            if value in (None, ''):
+                return None
+            summary[name] = str(value).split()[0]
+        return summary
+
+    @classmethod
+    def from_summary(cls, summary):
+        """
+        Makes a record out of the loudness measurements in the
+        form of `loudnorm_summary`.
+        """
+        names = dict(SUMMARY_KEYS)
+        return cls(loudness={key: summary.get(names[key])
+                             for key in names})
+
+    def to_json(self):
+        """
+        Returns the record as a JSON string.
+        """
+        return json.dumps({key: getattr(self, key)
+                           for key in AudioStats.__slots__})
+
+    @classmethod
+    def from_json(cls, text):
+        """
+        Makes a record out of a `to_json` string,
+        None if it is not valid.
+        """
+        try:
+            return cls(**json.loads(text))
+        except (TypeError, ValueError):
+            return None
+# ----------------------------------------------------------------------
+
+
+class AnalysisParser:
+    """
+    Reads the FFmpeg diagnostics of the analysis line by line
+    and fills an AudioStats record: the volumedetect values,
+    the 'Overall' section of astats (the per channel ones are
+    skipped) and the JSON report of loudnorm.
+    """
+    def __init__(self):
+        """
+        `self.record` is complete at the end of the output.
+        """
+        self.record = AudioStats()
+        self.overall = False
+        self.report = None
+
+    def feed(self, line):
+        """
+        Parses a line of the FFmpeg stderr.
+        """
+        if self.report is not None:
+            self.report.append(line)
+            if line.strip() == '}':
+                try:
+                    self.record.loudness = json.loads(''.join(self.report))
+                except ValueError:
+                    pass
+                self.report = None
+            return
+
+        if line.strip() == '{':
+            self.report = [line]
+        elif 'max_volume:' in line:
+            self.record.max_volume = line.split(':')[1].strip()
+        elif 'mean_volume:' in line:
+            self.record.mean_volume = line.split(':')[1].strip()
+        elif '[Parsed_astats' in line:
+            text = line.split('] ', 1)[-1].strip()
+            if text.startswith('Channel:'):
+                self.overall = False
+            elif text == 'Overall':
+                self.overall = True
+            elif self.overall and ':' in text:
+                key, value = text.split(':', 1)
+                self.record.astats[key.strip()] = value.strip()
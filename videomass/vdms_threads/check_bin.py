@@ -6,7 +6,7 @@ Compatibility: Python3 (Unix, Windows)
 Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
 Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
 license: GPL3
-Rev: May.15.2021
+Rev: Oct.18.2026
 Code checker: flake8, pylint
 
 This file is part of Videomass.
@@ -64,6 +64,19 @@ def subp(args, ostype):
 # -----------------------------------------------------------#
 
 
+def ff_version(ffmpeg_url, ostype):
+    """
+    Returns the output of `ffmpeg -version` (version, build
+    and configuration), which identifies the FFmpeg build,
+    None if errors.
+    """
+    version = subp([ffmpeg_url, '-loglevel', 'error', '-version'], ostype)
+    if 'Not found' in version[0]:
+        return None
+    return version[1].strip()
+# -----------------------------------------------------------#
+
+
 def ff_conf(ffmpeg_url, ostype):
     """
     Receive output of the passed command to parse
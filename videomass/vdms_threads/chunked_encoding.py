@@ -0,0 +1,103 @@
+# -*- coding: UTF-8 -*-
+"""
+Name: chunked_encoding.py
+Porpose: helpers for the segment-parallel encoding of a long source
+Compatibility: Python3
+Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
+Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
+license: GPL3
+Rev: Oct.18.2026
+Code checker: flake8, pylint
+
+This file is part of Videomass.
+
+   Videomass is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   Videomass is distributed in the hope that it will be useful,
+   but WITHOUT ANY WARRANTY; without even the implied warranty of
+   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+   GNU General Public License for more details.
+
+   You should have received a copy of the GNU General Public License
+   along with Videomass.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import os
+from bisect import bisect_left
+from videomass.vdms_threads.ffprobe import ffprobe
+
+# shortest segment worth an FFmpeg process of its own (seconds)
+MIN_SEGMENT_LENGTH = 60.0
+
+# tolerance of the duration check on the joined output (seconds)
+DURATION_TOLERANCE = 1.0
+
+
+def chunk_segments(appdata, duration):
+    """
+    Returns the number of segments in which a source of
+    `duration` seconds is split, according to the
+    `chunked_segments` option (0 is auto, i.e. the number
+    of CPUs), never shorter than MIN_SEGMENT_LENGTH.
+    """
+    segments = int(appdata.get('chunked_segments', 0))
+    if segments < 1:
+        segments = os.cpu_count() or 1
+    return max(1, min(segments, int(duration // MIN_SEGMENT_LENGTH)))
+# ----------------------------------------------------------------------
+
+
+def split_points(keyframes, duration, segments):
+    """
+    Cuts a timeline of `duration` seconds in `segments` parts
+    of about the same length, moving each cut to the nearest
+    keyframe time of the `keyframes` sorted list.
+    Returns a list of (start, end) tuples in seconds, where
+    the `end` of the last segment is None (up to the end).
+    """
+    cuts = []
+    for num in range(1, segments):
+        target = duration * num / segments
+        idx = bisect_left(keyframes, target)
+        near = keyframes[max(0, idx - 1):idx + 1]
+        if not near:
+            continue
+        point = min(near, key=lambda k, t=target: abs(k - t))
+        if 0 < point < duration and (not cuts or point > cuts[-1]):
+            cuts.append(point)
+
+    bounds = [0.0] + cuts
+    return list(zip(bounds, cuts + [None]))
+# ----------------------------------------------------------------------
+
+
+def write_concat_list(filenames, listfile):
+    """
+    Writes a script file for the FFmpeg concat demuxer.
+    """
+    with open(listfile, 'w', encoding='utf-8') as lst:
+        for name in filenames:
+            name = name.replace("'", "'\\''")
+            lst.write(f"file '{name}'\n")
+# ----------------------------------------------------------------------
+
+
+def video_frames(filename, cmd='ffprobe', txtenc='utf-8'):
+    """
+    Counts the packets of the first video stream of `filename`
+    and reads the container duration.
+    Returns a tuple ((frames, duration), error) like `ffprobe`.
+    """
+    probe = ffprobe(filename, cmd=cmd, txtenc=txtenc, cache=False,
+                    v='error', select_streams='v:0', count_packets=None)
+    if probe[1]:
+        return None, probe[1]
+    try:
+        frames = int(probe[0]['streams'][0]['nb_read_packets'])
+        duration = float(probe[0]['format']['duration'])
+    except (KeyError, IndexError, ValueError) as err:
+        return None, f'ffprobe: missing data {err}'
+
+    return (frames, duration), None
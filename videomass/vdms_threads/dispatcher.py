@@ -0,0 +1,148 @@
+# -*- coding: UTF-8 -*-
+"""
+Name: dispatcher.py
+Porpose: coalesced and rate-limited delivery of thread events to the GUI
+Compatibility: Python3, wxPython4 Phoenix
+Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
+Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
+license: GPL3
+Rev: Oct.18.2026
+Code checker: flake8, pylint
+
+This file is part of Videomass.
+
+   Videomass is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   Videomass is distributed in the hope that it will be useful,
+   but WITHOUT ANY WARRANTY; without even the implied warranty of
+   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+   GNU General Public License for more details.
+
+   You should have received a copy of the GNU General Public License
+   along with Videomass.  If not, see <http://www.gnu.org/licenses/>.
+"""
+from threading import Thread, Lock
+import time
+import wx
+from pubsub import pub
+
+
+class EventDispatcher:
+    """
+    Collects the pubsub messages sent by the processing threads
+    and delivers them to the main loop in batches, at most
+    `RATE` times per second, using a single `wx.CallAfter`
+    for each batch:
+
+        - PROGRESS_EVT messages are collapsed to the latest
+          value of each job;
+        - UPDATE_EVT diagnostics lines (status 0) of each job
+          are joined in a list, delivered by a single message;
+        - any other message (COUNT_EVT, END_EVT, UPDATE_EVT
+          with a status) is delivered as is and closes the
+          current batch, so that the order of the messages
+          is never changed across it.
+
+    The delivering thread ends itself when idle and it is
+    started again by the next message.
+    """
+    RATE = 10  # batches per second
+    IDLE = 20  # empty batches before ending the delivering thread
+
+    def __init__(self):
+        """
+        `self.slots` maps the coalescible messages of the
+        current batch to their index in `self.pending`.
+        """
+        self.lock = Lock()
+        self.pending = []
+        self.slots = {}
+        self.running = False
+        self.posted = 0  # messages received from threads
+        self.merged = 0  # messages merged into previous ones
+
+    def send(self, topic, **kwargs):
+        """
+        Same arguments as `pub.sendMessage`, it can be
+        called from any thread.
+        """
+        with self.lock:
+            self.posted += 1
+            jobid = kwargs.get('jobid')
+            if topic == 'PROGRESS_EVT':
+                key = ('progress', jobid)
+            elif topic == 'UPDATE_EVT' and kwargs.get('status') == 0:
+                key = ('lines', jobid)
+                kwargs['output'] = [kwargs['output']]
+            else:
+                key = None
+
+            idx = self.slots.get(key)
+            if key is None:
+                self.pending.append((topic, kwargs))
+                self.slots.clear()
+            elif idx is None:
+                self.slots[key] = len(self.pending)
+                self.pending.append((topic, kwargs))
+            elif key[0] == 'progress':
+                self.pending[idx] = (topic, kwargs)
+                self.merged += 1
+            else:
+                self.pending[idx][1]['output'].extend(kwargs['output'])
+                self.merged += 1
+
+            if not self.running:
+                self.running = True
+                Thread(target=self.run, daemon=True).start()
+
+    def run(self):
+        """
+        Delivering thread.
+        """
+        idle = 0
+        while True:
+            time.sleep(1 / EventDispatcher.RATE)
+            with self.lock:
+                batch, self.pending = self.pending, []
+                self.slots.clear()
+                if not batch:
+                    idle += 1
+                    if idle >= EventDispatcher.IDLE:
+                        self.running = False
+                        return
+                    continue
+            idle = 0
+            wx.CallAfter(self.deliver, batch)
+
+    @staticmethod
+    def deliver(batch):
+        """
+        Sends the messages of a batch on the main thread.
+        """
+        for topic, kwargs in batch:
+            pub.sendMessage(topic, **kwargs)
+
+    def stats(self, reset=False):
+        """
+        Returns a tuple (posted, merged) with the counters
+        of the messages, optionally resetting them.
+        """
+        with self.lock:
+            counters = self.posted, self.merged
+            if reset:
+                self.posted, self.merged = 0, 0
+        return counters
+
+
+DISPATCHER = EventDispatcher()
+
+
+def send_event(topic, **kwargs):
+    """
+    Sends a pubsub message to the GUI through the
+    dispatcher, see `EventDispatcher`.
+    """
+    DISPATCHER.send(topic, **kwargs)
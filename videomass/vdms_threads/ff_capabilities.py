@@ -0,0 +1,293 @@
+# -*- coding: UTF-8 -*-
+"""
+Name: ff_capabilities.py
+Porpose: persistent map of the capabilities of the FFmpeg build
+Compatibility: Python3
+Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
+Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
+license: GPL3
+Rev: Oct.18.2026
+Code checker: flake8, pylint
+
+This file is part of Videomass.
+
+   Videomass is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   Videomass is distributed in the hope that it will be useful,
+   but WITHOUT ANY WARRANTY; without even the implied warranty of
+   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+   GNU General Public License for more details.
+
+   You should have received a copy of the GNU General Public License
+   along with Videomass.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import os
+import re
+import json
+from shutil import which
+from threading import Thread, Lock
+from videomass.vdms_threads.check_bin import (subp,
+                                              ff_version,
+                                              ff_conf,
+                                              ff_formats,
+                                              ff_codecs,
+                                              ff_topics,
+                                              )
+
+# format of the cache file, increase it when the map changes
+SCHEMA = 1
+
+
+def codec_names(codecs):
+    """
+    Returns the set of names of a `ff_codecs` dictionary,
+    whose items are lines like 'V....D libx264  description'.
+    """
+    return {line.split()[1] for lines in codecs.values()
+            for line in lines if len(line.split()) > 1}
+# ----------------------------------------------------------------------
+
+
+def parse_filters(text):
+    """
+    Returns a dict {name: description} of the filters
+    listed by `ffmpeg -filters`.
+    """
+    filters = {}
+    for line in text.split('\n'):
+        parts = line.split(None, 3)
+        if (len(parts) > 2 and re.fullmatch(r'[TSC.|]{2,3}', parts[0])
+                and '->' in parts[2]):
+            filters[parts[1]] = parts[3].strip() if len(parts) > 3 else ''
+    return filters
+# ----------------------------------------------------------------------
+
+
+def parse_hwaccels(text):
+    """
+    Returns the list of methods of `ffmpeg -hwaccels`.
+    """
+    lines = [line.strip() for line in text.split('\n')]
+    if 'Hardware acceleration methods:' in lines:
+        lines = lines[lines.index('Hardware acceleration methods:') + 1:]
+    return [line for line in lines if line and ' ' not in line]
+# ----------------------------------------------------------------------
+
+
+def parse_pix_fmts(text):
+    """
+    Returns the list of the supported pixel formats read
+    from `ffmpeg -h encoder=NAME`, empty if not given.
+    """
+    for line in text.split('\n'):
+        if 'Supported pixel formats:' in line:
+            return line.split(':', 1)[1].split()
+    return []
+# ----------------------------------------------------------------------
+
+
+def binary_key(ffmpeg_url):
+    """
+    Returns a dict identifying the `ffmpeg_url` binary on
+    disk (path, size and modification time), None if it is
+    not found or not executable.
+    """
+    path = which(ffmpeg_url, mode=os.F_OK | os.X_OK)
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError):
+        return None
+    return {'path': os.path.abspath(path), 'size': stat.st_size,
+            'mtime': stat.st_mtime_ns}
+# ----------------------------------------------------------------------
+
+
+def build_capabilities(ffmpeg_url, ostype):
+    """
+    Runs FFmpeg to get its whole capability map, returns a
+    dict or None if FFmpeg fails. It takes a few seconds,
+    mostly to read the pixel formats of each video encoder.
+    """
+    version = ff_version(ffmpeg_url, ostype)
+    if version is None:
+        return None
+    conf = ff_conf(ffmpeg_url, ostype)
+    formats = ff_formats(ffmpeg_url, ostype)
+    encoders = ff_codecs(ffmpeg_url, '-encoders', ostype)
+    decoders = ff_codecs(ffmpeg_url, '-decoders', ostype)
+    if (not isinstance(conf, tuple) or len(conf) != 4
+            or 'Not found' in formats or not isinstance(encoders, dict)
+            or not isinstance(decoders, dict)):
+        return None
+    out = subp([ffmpeg_url, '-loglevel', 'error', '-filters'], ostype)
+    filters = parse_filters(out[1]) if out[0] == 'None' else {}
+    out = subp([ffmpeg_url, '-loglevel', 'error', '-hwaccels'], ostype)
+    hwaccels = parse_hwaccels(out[1]) if out[0] == 'None' else []
+    pix_fmts = {}
+    for name in codec_names({'Video': encoders['Video']}):
+        out = subp([ffmpeg_url, '-loglevel', 'error', '-h',
+                    f'encoder={name}'], ostype)
+        if out[0] == 'None':
+            pix_fmts[name] = parse_pix_fmts(out[1])
+
+    return {'version': version, 'conf': list(conf), 'formats': formats,
+            'encoders': encoders, 'decoders': decoders, 'filters': filters,
+            'hwaccels': hwaccels, 'pix_fmts': pix_fmts}
+# ----------------------------------------------------------------------
+
+
+class FFCapabilities:
+    """
+    Capability map of the FFmpeg binary in use (build info,
+    formats, encoders, decoders, filters, hardware accelerations
+    and pixel formats of each video encoder), built once per
+    binary and persisted to a JSON file keyed by binary path,
+    size, modification time and `-version` output.
+
+    `open` loads the map immediately if the binary is unchanged
+    on disk, then checks the `-version` output and (re)builds
+    the map if needed in a background thread. Lookups are O(1);
+    while the map is not ready they return None, so that the
+    callers fall back to running FFmpeg (see `io_tools`).
+
+    Usage:
+        >>> FFCAPS.open('/path/to/ffmpeg_caps.json', 'ffmpeg', 'Linux')
+        >>> FFCAPS.has_encoder('libx264')
+        >>> FFCAPS.get('formats')
+    """
+    def __init__(self):
+        """
+        The map is empty until `open` is called.
+        """
+        self.lock = Lock()
+        self.filename = None
+        self.data = None
+        self.sets = {}
+        self.topics = {}
+
+    def open(self, filename, ffmpeg_url, ostype, key=None):
+        """
+        Loads the map of `ffmpeg_url` from `filename`, then
+        starts the background refresh. `key` is the
+        `binary_key` of `ffmpeg_url`, if already known.
+        """
+        self.filename = filename
+        key = key or binary_key(ffmpeg_url)
+        try:
+            with open(filename, 'r', encoding='utf-8') as fln:
+                stored = json.load(fln)
+        except (OSError, ValueError):
+            stored = {}
+        if (key and stored.get('schema') == SCHEMA
+                and stored.get('key') == key):
+            self.set_data(stored.get('data'))
+        else:
+            self.set_data(None)
+        Thread(target=self.refresh, args=(ffmpeg_url, ostype, key),
+               daemon=True).start()
+
+    def set_data(self, data):
+        """
+        Replaces the map and the sets used by the lookups.
+        """
+        sets = {}
+        if data:
+            sets = {'encoders': codec_names(data['encoders']),
+                    'decoders': codec_names(data['decoders']),
+                    'filters': set(data['filters']),
+                    'hwaccels': set(data['hwaccels'])}
+        with self.lock:
+            self.data = data
+            self.sets = sets
+            self.topics = {}
+
+    def refresh(self, ffmpeg_url, ostype, key):
+        """
+        Background thread: rebuilds and saves the map if it
+        is missing or the `-version` output has changed.
+        """
+        version = ff_version(ffmpeg_url, ostype)
+        if version is None:
+            return
+        with self.lock:
+            if self.data and self.data.get('version') == version:
+                return
+        data = build_capabilities(ffmpeg_url, ostype)
+        if data is None:
+            return
+        self.set_data(data)
+        if not key:
+            return
+        tmp = f'{self.filename}.tmp'
+        try:
+            with open(tmp, 'w', encoding='utf-8') as fln:
+                json.dump({'schema': SCHEMA, 'key': key, 'data': data},
+                          fln, ensure_ascii=False)
+            os.replace(tmp, self.filename)
+        except OSError:
+            pass
+
+    def ready(self):
+        """
+        Returns True if the map is available.
+        """
+        return self.data is not None
+
+    def get(self, name):
+        """
+        Returns the `name` item of the map (e.g. 'conf',
+        'formats', 'encoders', 'decoders', 'filters',
+        'hwaccels', 'version'), None if not ready.
+        """
+        data = self.data
+        return data.get(name) if data else None
+
+    def has(self, kind, name):
+        """
+        Returns True if `name` is in the `kind` set ('encoders',
+        'decoders', 'filters', 'hwaccels'), None if not ready.
+        """
+        items = self.sets.get(kind)
+        return None if items is None else name in items
+
+    def has_encoder(self, name):
+        """
+        Returns True if the `name` encoder is available.
+        """
+        return self.has('encoders', name)
+
+    def has_filter(self, name):
+        """
+        Returns True if the `name` filter is available.
+        """
+        return self.has('filters', name)
+
+    def pix_fmts(self, encoder):
+        """
+        Returns the list of pixel formats supported by the
+        `encoder` video encoder, None if unknown.
+        """
+        data = self.data
+        return data['pix_fmts'].get(encoder) if data else None
+
+    def topic(self, ffmpeg_url, topic, ostype):
+        """
+        Same as `check_bin.ff_topics`, but the output of each
+        topic is kept in memory as long as the map is valid.
+        """
+        key = tuple(topic)
+        with self.lock:
+            found = self.topics.get(key)
+        if found is not None:
+            return found
+        ret = ff_topics(ffmpeg_url, topic, ostype)
+        if 'Not found' not in ret[0]:
+            with self.lock:
+                self.topics[key] = ret
+        return ret
+
+
+FFCAPS = FFCapabilities()
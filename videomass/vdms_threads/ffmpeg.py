@@ -6,7 +6,7 @@ Compatibility: Python3, wxPython4 Phoenix
 Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
 Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
 license: GPL3
-Rev: Aug.13.2025
+Rev: Oct.18.2026
 Code checker: flake8, pylint
 
 This file is part of Videomass.
@@ -24,14 +24,49 @@ This file is part of Videomass.
    You should have received a copy of the GNU General Public License
    along with Videomass.  If not, see <http://www.gnu.org/licenses/>.
 """
-from threading import Thread
+import os
+import json
+from threading import Thread, Lock
+from concurrent.futures import ThreadPoolExecutor
+import tempfile
 import time
 import subprocess
 import platform
 import wx
-from pubsub import pub
 from videomass.vdms_utils.utils import Popen
-from videomass.vdms_io.make_filelog import tolog
+from videomass.vdms_threads.dispatcher import send_event
+from videomass.vdms_io.job_journal import job_key
+from videomass.vdms_io.probe_cache import PROBECACHE
+from videomass.vdms_io.trf_cache import TRFCACHE, TRF_NAME, detect_filter
+from videomass.vdms_io.output_cache import (OUTPUTCACHE, SOURCE, OUTPUT,
+                                            place_output, unshare_output)
+from videomass.vdms_threads.audio_analysis import AudioStats, analysis_variant
+from videomass.vdms_io.make_filelog import (tolog,
+                                            log_entry,
+                                            append_to_log,
+                                            )
+from videomass.vdms_threads.ffprobe import ffprobe, keyframes, keyframe_index
+from videomass.vdms_threads.check_bin import ff_version
+from videomass.vdms_threads.ff_capabilities import FFCAPS
+from videomass.vdms_threads.ffmpeg_progress import (progress_cmd,
+                                                    FFmpegPipes,
+                                                    ProgressRecord,
+                                                    )
+from videomass.vdms_threads.chunked_encoding import (chunk_segments,
+                                                     split_points,
+                                                     write_concat_list,
+                                                     video_frames,
+                                                     DURATION_TOLERANCE,
+                                                     )
+from videomass.vdms_threads.smart_cut import (SMART_ENCODERS,
+                                              is_stream_copy,
+                                              cut_range,
+                                              smart_cut_plan,
+                                              encoder_args,
+                                              piece_args,
+                                              cut_points,
+                                              decode_check,
+                                              )
 if not platform.system() == 'Windows':
     import shlex
 
@@ -86,14 +121,44 @@ def get_raw_cmdline_args(**kwa):
 # ----------------------------------------------------------------------
 
 
+def max_workers(appdata):
+    """
+    Returns the maximum number of FFmpeg subprocesses that
+    can run at the same time. If `parallel_jobs_max` is 0
+    (auto) the number is derived from the CPU count.
+    """
+    maxjobs = int(appdata.get('parallel_jobs_max', 0))
+    if maxjobs < 1:
+        maxjobs = max(1, (os.cpu_count() or 1) // 2)
+    return maxjobs
+# ----------------------------------------------------------------------
+
+
+def concurrent_jobs(appdata):
+    """
+    Returns the maximum number of items of a batch or queue
+    that can be processed at the same time. Returns 1 if the
+    `parallel_jobs` option is disabled.
+    """
+    if not appdata.get('parallel_jobs'):
+        return 1
+    return max_workers(appdata)
+# ----------------------------------------------------------------------
+
+
 def ffmpeg_cmd_args():
     """
-    Get ffmpeg command and default args
+    Get ffmpeg command and default args.
+    Note that a relative pathname of the executable is made
+    absolute, since jobs can run in a different working dir.
     """
     get = wx.GetApp()
     appdata = get.appset
     defargs = f'-y -stats -hide_banner {appdata["ffmpeg_loglev"]}'
-    return {"ffmpeg_cmd": appdata["ffmpeg_cmd"],
+    ffmpeg = appdata["ffmpeg_cmd"]
+    if os.path.dirname(ffmpeg):
+        ffmpeg = os.path.abspath(ffmpeg)
+    return {"ffmpeg_cmd": ffmpeg,
             "ffmpeg-default-args": defargs}
 # ----------------------------------------------------------------------
 
@@ -300,6 +365,28 @@ class FFmpeg(Thread):
     It is able to pipe up to two FFmpeg subprocesses to execute
     tasks in succession using command concatenation.
 
+    If the `parallel_jobs` option is enabled, the items of a batch
+    or queue are dispatched to a pool of worker threads, each one
+    driving its own FFmpeg subprocesses (see `concurrent_jobs`).
+    In this case each job runs in its own temporary working
+    directory (so that pass log files do not collide) and its log
+    messages are written as a single section at the end of the job.
+
+    If the `chunked_encoding` option is enabled, the items processed
+    one at a time by 'One pass' and 'Two pass' are split into segments
+    encoded at the same time (see `process_chunked`).
+    If the `smart_cut` option is enabled, the time selections of
+    'One pass' items which copy the video stream are cut with frame
+    accuracy re-encoding only the partial GOPs at the cut points
+    (see `process_smartcut`).
+
+    When a `JobJournal` is given (queue processing), the state of each
+    item is recorded as it goes, so that an interrupted queue resumes
+    at the first unfinished item (see `process_entry`).
+    With the `output_cache` option, items identical to a job already
+    done reuse its output instead of being encoded again (see
+    `process_cached`).
+
     NOTE capturing output in real-time (Windows, Unix):
     https://stackoverflow.com/questions/1388753/how-to-get-output-
     from-subprocess-popen-proc-stdout-readline-blocks-no-dat?rq=1
@@ -309,15 +396,22 @@ class FFmpeg(Thread):
         """
         Called from `long_processing_task.topic_thread`.
         Also see `main_frame.switch_to_processing`.
+        The optional third argument is a `JobJournal`.
 
         """
         get = wx.GetApp()  # get data from bootstrap
         self.appdata = get.appset
         self.stop_work_thread = False  # set stop ffmpeg
+        self.fatal_error = False  # set to not start any other job
         self.count = 0  # count for loop
         self.logfile = args[0]  # log filename
         self.kwargs = args[1]  # it is a list of dictionaries
         self.nargs = len(self.kwargs)  # how many items...
+        self.maxjobs = min(concurrent_jobs(self.appdata), self.nargs)
+        self.loglock = Lock()  # serializes the job sections on log file
+        self.journal = args[2] if len(args) > 2 else None
+        self.keys = [job_key(kwa) for kwa in self.kwargs]
+        self.ffversion = None  # see `run`
 
         Thread.__init__(self)
         self.start()
@@ -326,188 +420,912 @@ class FFmpeg(Thread):
         """
         Run the separated thread.
         """
+        if self.appdata.get('output_cache'):
+            self.ffversion = (FFCAPS.get('version')
+                              or ff_version(self.appdata['ffmpeg_cmd'],
+                                            self.appdata['ostype']))
+        if self.journal is not None:
+            for key in self.keys:
+                if self.journal.state(key) is None:
+                    self.journal.record(key, 'queued')
+
+        if self.maxjobs > 1:
+            self.run_parallel()
+            return
+
         filedone = []
         for kwa in self.kwargs:
             self.count += 1
-            if kwa['type'] == 'One pass':
-                model = simple_one_pass(self.count, self.nargs, **kwa)
+            status = self.process_entry(self.count, kwa)
+            if status == 'STOP':
+                time.sleep(.5)
+                send_event("END_EVT", filetotrash=None)
+                return
+            if status == 'ERROR':
+                break
+            if status == 'DONE':
+                filedone.append(kwa["source"])
 
-            elif kwa['type'] == 'Two pass EBU':
-                model = one_pass_ebu(self.count, self.nargs, **kwa)
+        self.end_journal()
+        time.sleep(.5)
+        send_event("END_EVT", filetotrash=filedone)
+    # --------------------------------------------------------------------#
 
-            elif kwa['type'] == 'Two pass VIDSTAB':
-                model = one_pass_stab(self.count, self.nargs, **kwa)
+    def run_parallel(self):
+        """
+        Runs up to `self.maxjobs` items at the same time.
+        The `filetotrash` list keeps the same order as the
+        given items.
+        """
+        with ThreadPoolExecutor(max_workers=self.maxjobs) as executor:
+            status = list(executor.map(self.process_job,
+                                       range(1, self.nargs + 1),
+                                       self.kwargs))
+        if 'STOP' not in status:
+            self.end_journal()
+        time.sleep(.5)
+        if 'STOP' in status:
+            send_event("END_EVT", filetotrash=None)
+            return
+        filedone = [kwa["source"] for kwa, stat in zip(self.kwargs, status)
+                    if stat == 'DONE']
+        send_event("END_EVT", filetotrash=filedone)
+    # --------------------------------------------------------------------#
 
-            elif kwa['type'] == 'Two pass':
-                model = one_pass(self.count, self.nargs, **kwa)
-            else:
-                return
+    def process_job(self, count, kwa):
+        """
+        Worker of the parallel mode. Each job gets absolute
+        pathnames and a private working directory, and keeps
+        its log messages in a buffer until it is finished.
+        """
+        if self.stop_work_thread or self.fatal_error:
+            return 'SKIP'
+
+        kwa = dict(kwa,
+                   source=os.path.abspath(kwa['source']),
+                   destination=os.path.abspath(kwa['destination']))
+        logbuf = []
+        tmpdir = os.path.join(self.appdata['cachedir'], 'tmp')
+        with tempfile.TemporaryDirectory(dir=tmpdir,
+                                         prefix='job-') as workdir:
+            status = self.process_entry(count, kwa, jobid=count,
+                                        workdir=workdir, logbuf=logbuf)
+        with self.loglock:
+            append_to_log(''.join(logbuf), self.logfile)
+
+        return status
+    # --------------------------------------------------------------------#
 
-            wx.CallAfter(pub.sendMessage,
-                         "COUNT_EVT",
-                         count=model['count1'],
-                         duration=kwa['duration'],
-                         end='CONTINUE',
-                         )
-            tolog(model['stamp1'], self.logfile, sep=True, wdate=True)
-            try:
-                with Popen(model['pass1'],
-                           stderr=subprocess.PIPE,
-                           stdin=subprocess.PIPE,
-                           bufsize=1,
-                           universal_newlines=True,
-                           encoding=self.appdata['encoding'],
-                           ) as proc1:
-
-                    for line in proc1.stderr:
-                        wx.CallAfter(pub.sendMessage,
-                                     "UPDATE_EVT",
-                                     output=line,
-                                     duration=kwa['duration'],
-                                     status=0
-                                     )
-                        if self.stop_work_thread:
-                            proc1.stdin.write('q')  # stop ffmpeg
-                            out = proc1.communicate()[1]
-                            proc1.wait()
-                            wx.CallAfter(pub.sendMessage,
-                                         "UPDATE_EVT",
-                                         output='STOP',
-                                         duration=kwa['duration'],
-                                         status=1,
-                                         )
-                            tolog(out, self.logfile)
-
-                            time.sleep(.5)
-                            wx.CallAfter(pub.sendMessage, "END_EVT",
-                                         filetotrash=None)
-                            return
-
-                        if kwa["type"] == 'Two pass EBU':
-                            summary = model['summary']
-                            for k in summary:
-                                if line.startswith(k):
-                                    summary[k] = line.split(':')[1].split()[0]
-
-                    if proc1.wait():  # ..Failed
-                        out = proc1.communicate()[1]
-                        wx.CallAfter(pub.sendMessage,
-                                     "UPDATE_EVT",
-                                     output='FAILED',
-                                     duration=kwa['duration'],
-                                     status=proc1.wait(),
-                                     )
-                        tolog(f"[VIDEOMASS]: Error Exit Status: "
-                              f"{proc1.wait()} {out}", self.logfile
-                              )
-                        time.sleep(1)
-                        continue
-
-            except (OSError, FileNotFoundError) as err:
-                wx.CallAfter(pub.sendMessage,
-                             "COUNT_EVT",
-                             count=err,
-                             duration=0,
-                             end='ERROR'
-                             )
-                tolog(err, self.logfile)
+    def process_entry(self, count, kwa, **kwargs):
+        """
+        Runs `process_item` keeping the journal, if any, up to
+        date. Items whose output is recorded as done and still
+        verified are not processed again, while the output left
+        by an interrupted item is removed before retrying.
+        """
+        if self.journal is None:
+            return self.process_cached(count, kwa, **kwargs)
+
+        key = self.keys[count - 1]
+        if self.journal.finished(key):
+            self.skip_item(count, kwa, kwargs.get('jobid'),
+                           kwargs.get('logbuf'))
+            return 'DONE'
+
+        self.journal.discard_partial(key)
+        output = os.path.abspath(kwa['destination'])
+        self.journal.record(key, 'running', output)
+        status = self.process_cached(count, kwa, **kwargs)
+        if status == 'DONE':
+            self.journal.record(key, 'done', output)
+        elif status in ('FAILED', 'ERROR'):
+            self.journal.record(key, 'failed', output)
+        return status
+    # --------------------------------------------------------------------#
+
+    def process_cached(self, count, kwa, **kwargs):
+        """
+        Runs `process_item` unless the output of an identical
+        job is found in the output cache: the destination is
+        then a copy of it. The "force re-encode" setting skips
+        the lookup, but the new output is still recorded. A
+        destination which is a hard link is always removed
+        before encoding, whatever the cache state, since
+        FFmpeg would overwrite the shared file in place.
+        """
+        fprint = None
+        if self.ffversion:
+            cmdlines = get_raw_cmdline_args(**dict(kwa, source=SOURCE,
+                                                   destination=OUTPUT))
+            if cmdlines:
+                store = (PROBECACHE if self.appdata.get('fingerprint_mode')
+                         == 'content' else None)
+                fprint = OUTPUTCACHE.fingerprint(kwa['source'],
+                                                 kwa['destination'],
+                                                 cmdlines, self.ffversion,
+                                                 store)
+        if fprint and not self.appdata.get('force_reencode'):
+            found = OUTPUTCACHE.lookup(fprint)
+            if found and not place_output(found, kwa['destination']):
+                self.skip_item(count, kwa, kwargs.get('jobid'),
+                               kwargs.get('logbuf'),
+                               reason='Identical output found in cache, '
+                               'not encoded again')
+                return 'DONE'
+        unshare_output(kwa['destination'])
+
+        status = self.process_item(count, kwa, **kwargs)
+        if status == 'DONE' and fprint:
+            OUTPUTCACHE.record(fprint, kwa['destination'])
+        return status
+    # --------------------------------------------------------------------#
+
+    def skip_item(self, count, kwa, jobid, logbuf,
+                  reason='Already done, skipped'):
+        """
+        Reports an item which is not processed, e.g. because
+        it was already done by a previous run of the queue.
+        """
+        msg = (f'File {count}/{self.nargs} - {reason}\n'
+               f'Destination: "{kwa["destination"]}"')
+        self.log(f'INFO: {msg}', logbuf, sep=True, wdate=True)
+        send_event("COUNT_EVT",
+                   count=msg,
+                   duration=kwa['duration'],
+                   end='CONTINUE',
+                   jobid=jobid,
+                   )
+        passes = 2 if kwa['args'][1] and jobid is not None else 1
+        for _ in range(passes):
+            send_event("COUNT_EVT",
+                       count='',
+                       duration=kwa['duration'],
+                       end='DONE',
+                       jobid=jobid,
+                       )
+    # --------------------------------------------------------------------#
+
+    def end_journal(self):
+        """
+        The journal is only kept for interrupted queues, it
+        is cleared when all the items have been processed.
+        """
+        if self.journal is not None and not self.fatal_error:
+            self.journal.clear()
+    # --------------------------------------------------------------------#
+
+    def process_item(self, count, kwa, jobid=None, workdir=None,
+                     logbuf=None):
+        """
+        Performs all the passes of a single item.
+        Returns one of 'DONE', 'FAILED', 'STOP', 'ERROR'.
+        """
+        if (self.appdata.get('smart_cut') and kwa['type'] == 'One pass'
+                and kwa['start-time'].strip()):
+            status = self.process_smartcut(count, kwa, jobid, workdir,
+                                           logbuf)
+            if status:
+                return status
+
+        if (jobid is None and self.appdata.get('chunked_encoding')
+                and kwa['type'] in ('One pass', 'Two pass')
+                and not kwa['start-time'].strip()):
+            status = self.process_chunked(count, kwa)
+            if status:
+                return status
+
+        if kwa['type'] == 'One pass':
+            model = simple_one_pass(count, self.nargs, **kwa)
+
+        elif kwa['type'] == 'Two pass EBU':
+            model = one_pass_ebu(count, self.nargs, **kwa)
+
+        elif kwa['type'] == 'Two pass VIDSTAB':
+            model = one_pass_stab(count, self.nargs, **kwa)
+
+        elif kwa['type'] == 'Two pass':
+            model = one_pass(count, self.nargs, **kwa)
+        else:
+            self.fatal_error = True  # keeps the journal, see `end_journal`
+            return 'ERROR'
+
+        summary = model.get('summary')
+        variant = (analysis_variant(kwa['start-time'], kwa['end-time'],
+                                    kwa['args'][0],
+                                    kwa.get('EBU') or kwa['args'][0],
+                                    kwa.get('pre-input-1', ''))
+                   if summary is not None else None)
+        detect = (detect_filter(kwa['args'][0]) if kwa['type'] in
+                  ('Two pass EBU', 'Two pass VIDSTAB') else None)
+        trfkey = TRFCACHE.key(kwa['source'], detect,
+                              kwa.get('pre-input-1', ''),
+                              kwa['start-time'], kwa['end-time'])
+        trfpath = os.path.join(workdir or os.getcwd(), TRF_NAME)
+        cached = self.cached_analysis(kwa['source'], variant, summary,
+                                      detect, trfkey, trfpath)
+        if cached:  # the UI shows that the cached values are used
+            msg = (f'File {count}/{self.nargs} - Pass One\n'
+                   f'{" and ".join(cached)} found in cache, analysis '
+                   f'skipped.\n\nSource: "{kwa["source"]}"')
+            send_event("COUNT_EVT",
+                       count=msg,
+                       duration=kwa['duration'],
+                       end='CONTINUE',
+                       jobid=jobid,
+                       )
+            if variant:
+                msg += f'\n\n[CACHED MEASUREMENTS]:\n{json.dumps(summary)}'
+            self.log(msg, logbuf, sep=True, wdate=True)
+        else:
+            send_event("COUNT_EVT",
+                       count=model['count1'],
+                       duration=kwa['duration'],
+                       end='CONTINUE',
+                       jobid=jobid,
+                       )
+            self.log(model['stamp1'], logbuf, sep=True, wdate=True)
+            status = self.execute(model['pass1'], kwa, jobid, workdir,
+                                  logbuf, summary)
+            if status != 'DONE':
+                return status
+            if variant and None not in summary.values():
+                PROBECACHE.put(kwa['source'], variant,
+                               AudioStats.from_summary(summary).to_json())
+            if detect:
+                TRFCACHE.store(trfkey, trfpath)
+
+        send_event("COUNT_EVT",
+                   count='',
+                   duration=kwa['duration'],
+                   end='DONE',
+                   jobid=jobid,
+                   )
+        if not kwa["args"][1]:
+            return 'DONE'
+
+        # --------------- second pass ----------------#
+        if kwa["type"] == 'Two pass EBU':
+            filters = (f'{kwa["EBU"]}'
+                       f':measured_I={summary["Input Integrated:"]}'
+                       f':measured_LRA={summary["Input LRA:"]}'
+                       f':measured_TP={summary["Input True Peak:"]}'
+                       f':measured_thresh={summary["Input Threshold:"]}'
+                       f':offset={summary["Target Offset:"]}'
+                       f':linear=true:dual_mono=true'
+                       )
+            model = two_pass_ebu(count, self.nargs, filters, **kwa)
+            time.sleep(.5)
+
+        elif kwa['type'] == 'Two pass VIDSTAB':
+            model = two_pass_stab(count, self.nargs, **kwa)
+
+        elif kwa['type'] == 'Two pass':
+            model = two_pass(count, self.nargs, **kwa)
+
+        send_event("COUNT_EVT",
+                   count=model['count2'],
+                   duration=kwa['duration'],
+                   end='CONTINUE',
+                   jobid=jobid,
+                   )
+        self.log(model['stamp2'], logbuf)
+        status = self.execute(model['pass2'], kwa, jobid, workdir, logbuf)
+        if status == 'DONE':
+            send_event("COUNT_EVT",
+                       count='',
+                       duration=kwa['duration'],
+                       end='DONE',
+                       jobid=jobid,
+                       )
+        return status
+    # --------------------------------------------------------------------#
+
+    @staticmethod
+    def cached_analysis(source, variant, summary, detect, trfkey, trfpath):
+        """
+        Looks for the results of the analysis pass of an item
+        in the caches: the loudness measurements if `variant`,
+        which update `summary`, and the vid.stab transform file
+        if `detect`, which is restored to `trfpath`. `variant`
+        is the key of the statistics of the audio analysis (see
+        `analysis_variant`), stored by a previous pass or by the
+        volume detection. The pass can only be skipped if all
+        of them are found: returns the list of their names,
+        None otherwise.
+        """
+        if not variant and not detect:
+            return None
+        found = []
+        if variant:
+            stats = PROBECACHE.get(source, variant)
+            stats = AudioStats.from_json(stats) if stats else None
+            measures = stats.loudnorm_summary() if stats else None
+            if not measures:
+                return None
+            found.append('Loudness measurements')
+        if detect:
+            if not TRFCACHE.fetch(trfkey, trfpath):
+                return None
+            found.append('Motion detection')
+        if variant:
+            summary.update(measures)
+        return found
+    # --------------------------------------------------------------------#
+
+    def process_chunked(self, count, kwa):
+        """
+        Segment-parallel encoding of a single long item: the
+        source is cut at keyframes into segments whose video is
+        encoded at the same time with the same arguments of the
+        item. Each segment runs in its own working directory, so
+        two-pass log files never collide. Audio, subtitles and
+        other streams are encoded once from the whole source,
+        then everything is joined losslessly by the concat
+        demuxer and the result is checked.
+        Returns None if the item is not suitable for this mode
+        (no video, too short, no keyframes), otherwise one of
+        'DONE', 'FAILED', 'STOP', 'ERROR'.
+        """
+        ffprobe_cmd = self.appdata['ffprobe_cmd']
+        txtenc = self.appdata['encoding']
+        source = os.path.abspath(kwa['source'])
+        probe = ffprobe(source, cmd=ffprobe_cmd, txtenc=txtenc, v='error')
+        if probe[1]:
+            return None
+        streams = probe[0].get('streams', [])
+        if not [s for s in streams if s.get('codec_type') == 'video'
+                and not s.get('disposition', {}).get('attached_pic')]:
+            return None
+        try:
+            duration = float(probe[0]['format']['duration'])
+            offset = float(probe[0]['format'].get('start_time', 0))
+        except (KeyError, ValueError):
+            return None
+
+        segments = chunk_segments(self.appdata, duration)
+        if segments < 2:
+            return None
+        keyfr = keyframes(source, cmd=ffprobe_cmd, txtenc=txtenc)
+        if keyfr[1] or not keyfr[0]:
+            return None
+        chunks = split_points([k - offset for k in keyfr[0]],
+                              duration, segments)
+        if len(chunks) < 2:
+            return None
+
+        kwa = dict(kwa, source=source,
+                   destination=os.path.abspath(kwa['destination']))
+        codecs = [s.get('codec_type') for s in streams]
+        argsplit = kwa['args'][1 if kwa['type'] == 'Two pass' else 0].split()
+        otherstreams = (('audio' in codecs and '-an' not in argsplit)
+                        or ('subtitle' in codecs and '-sn' not in argsplit))
+        tmpdir = os.path.join(self.appdata['cachedir'], 'tmp')
+        with tempfile.TemporaryDirectory(dir=tmpdir,
+                                         prefix='chunks-') as workdir:
+            return self.encode_chunks(count, kwa, chunks, otherstreams,
+                                      os.path.abspath(workdir))
+    # --------------------------------------------------------------------#
+
+    def encode_chunks(self, count, kwa, chunks, otherstreams, workdir):
+        """
+        Encodes the `chunks` of `kwa` in `workdir`, then joins
+        them. See `process_chunked`.
+        """
+        ext = os.path.splitext(kwa['destination'])[1]
+        ffprobe_cmd = self.appdata['ffprobe_cmd']
+        txtenc = self.appdata['encoding']
+        track = {'msec': [0] * len(chunks),
+                 'records': [None] * len(chunks),
+                 'passes': 2 if kwa['type'] == 'Two pass' else 1,
+                 'started': time.time(),
+                 'duration': kwa['duration'],
+                 'done': 0,
+                 }
+        chunkfiles = [os.path.join(workdir, f'chunk{idx:03d}{ext}')
+                      for idx in range(len(chunks))]
+        count1 = (f'File {count}/{self.nargs} - Segment-parallel encoding '
+                  f'({len(chunks)} segments)\nSource: "{kwa["source"]}"\n'
+                  f'Destination: "{kwa["destination"]}"')
+        send_event("COUNT_EVT",
+                   count=count1,
+                   duration=kwa['duration'],
+                   end='CONTINUE',
+                   )
+        self.log(count1, sep=True, wdate=True)
+
+        with ThreadPoolExecutor(max_workers=max_workers(self.appdata)
+                                ) as executor:
+            status = list(executor.map(self.encode_chunk,
+                                       range(len(chunks)),
+                                       chunks,
+                                       chunkfiles,
+                                       [kwa] * len(chunks),
+                                       [track] * len(chunks),
+                                       ))
+        for stat in ('ERROR', 'STOP', 'FAILED'):
+            if stat in status:
+                if stat != 'ERROR':
+                    send_event("UPDATE_EVT",
+                               output=stat,
+                               duration=kwa['duration'],
+                               status=1,
+                               )
+                    time.sleep(1)
+                return stat
+
+        send_event("COUNT_EVT",
+                   count='',
+                   duration=kwa['duration'],
+                   end='DONE',
+                   )
+        # --------------- audio, subtitles and other streams --------#
+        streamsfile = None
+        if otherstreams:
+            streamsfile = os.path.join(workdir, f'streams{ext}')
+            args = kwa['args'][1 if kwa['type'] == 'Two pass' else 0]
+            model = simple_one_pass(count, self.nargs,
+                                    **dict(kwa, args=[f'{args} -vn', ''],
+                                           destination=streamsfile))
+            status = self.execute_step(model['pass1'], model['stamp1'],
+                                       'Audio, subtitles and other streams',
+                                       kwa)
+            if status != 'DONE':
+                return status
+
+        # --------------- join segments ----------------#
+        listfile = os.path.join(workdir, 'segments.txt')
+        write_concat_list(chunkfiles, listfile)
+        join, stamp = self.join_cmd(listfile, streamsfile,
+                                    kwa['destination'])
+        status = self.execute_step(join, stamp, 'Joining segments', kwa)
+        if status != 'DONE':
+            return status
+
+        # --------------- check frame count and duration ------------#
+        frames, length, error = 0, 0.0, None
+        for name in chunkfiles:
+            res = video_frames(name, ffprobe_cmd, txtenc)
+            if res[1]:
+                error = res[1]
                 break
+            frames += res[0][0]
+            length += res[0][1]
+        if not error:
+            res = video_frames(kwa['destination'], ffprobe_cmd, txtenc)
+            if res[1]:
+                error = res[1]
+            elif res[0][0] != frames:
+                error = (f'joined output has {res[0][0]} video frames, '
+                         f'{frames} were expected')
+            elif abs(res[0][1] - length) > DURATION_TOLERANCE:
+                error = (f'joined output lasts {res[0][1]:.3f} seconds, '
+                         f'{length:.3f} were expected')
+        if error:
+            send_event("UPDATE_EVT",
+                       output='FAILED',
+                       duration=kwa['duration'],
+                       status=1,
+                       )
+            self.log(f'[VIDEOMASS]: ERROR: segment check failed: {error}')
+            time.sleep(1)
+            return 'FAILED'
+
+        self.log(f'[VIDEOMASS]: segment check passed: {frames} '
+                 f'video frames, {length:.3f} seconds')
+        return 'DONE'
+    # --------------------------------------------------------------------#
 
-            if proc1.wait() == 0:  # ..Finished
-                if not kwa["args"][1]:
-                    filedone.append(kwa["source"])
-                wx.CallAfter(pub.sendMessage,
-                             "COUNT_EVT",
-                             count='',
-                             duration=kwa['duration'],
-                             end='DONE'
-                             )
-
-            if not kwa["args"][1]:
-                continue
-
-            # --------------- second pass ----------------#
-            if kwa["type"] == 'Two pass EBU':
-                filters = (f'{kwa["EBU"]}'
-                           f':measured_I={summary["Input Integrated:"]}'
-                           f':measured_LRA={summary["Input LRA:"]}'
-                           f':measured_TP={summary["Input True Peak:"]}'
-                           f':measured_thresh={summary["Input Threshold:"]}'
-                           f':offset={summary["Target Offset:"]}'
-                           f':linear=true:dual_mono=true'
-                           )
-                model = two_pass_ebu(self.count, self.nargs, filters, **kwa)
-                time.sleep(.5)
+    @staticmethod
+    def join_cmd(listfile, streamsfile, destination):
+        """
+        Returns the command (and its log stamp) that joins the
+        video files of the `listfile` concat script, along with
+        the other streams of `streamsfile` if any, without
+        re-encoding.
+        """
+        cmd = ffmpeg_cmd_args()
+        join = (f'"{cmd["ffmpeg_cmd"]}" '
+                f'{cmd["ffmpeg-default-args"]} '
+                f'-f concat -safe 0 -i "{listfile}" ')
+        if streamsfile:
+            join += (f'-i "{streamsfile}" -map 0:v -map 1 '
+                     f'-map_metadata 1 -map_chapters 1 ')
+        join += f'-c copy "{destination}"'
+        stamp = f'\n[COMMAND]:\n{join}'
+        if not platform.system() == 'Windows':
+            join = shlex.split(join)
+        return join, stamp
+    # --------------------------------------------------------------------#
+
+    def process_smartcut(self, count, kwa, jobid=None, workdir=None,
+                         logbuf=None):
+        """
+        Smart cut of a time selection which copies the video
+        stream: only the partial GOPs at the cut points are
+        re-encoded, with the codec parameters of the source
+        (see `encoder_args`), while the whole GOPs between them
+        are stream copied. The pieces are written as Annex B
+        MPEG-TS, with in-band parameter sets, and cut only at the
+        keyframes of closed GOPs, since the leading pictures of an
+        open GOP reference the previous one. Other streams are
+        processed once over the whole selection with the arguments
+        of the item, then everything is joined losslessly by the
+        concat demuxer.
+        Returns None if the item is not suitable for this mode
+        (no video stream copy, unsupported codec, encoder or pixel
+        format missing in FFmpeg, no keyframes inside the
+        selection), otherwise one of 'DONE', 'FAILED', 'STOP',
+        'ERROR'.
+        """
+        cutrange = cut_range(kwa['start-time'], kwa['end-time'])
+        if not cutrange or not is_stream_copy(kwa['args'][0]):
+            return None
+        ffprobe_cmd = self.appdata['ffprobe_cmd']
+        txtenc = self.appdata['encoding']
+        source = os.path.abspath(kwa['source'])
+        probe = ffprobe(source, cmd=ffprobe_cmd, txtenc=txtenc, v='error')
+        if probe[1]:
+            return None
+        streams = probe[0].get('streams', [])
+        video = [s for s in streams if s.get('codec_type') == 'video']
+        if not video or video[0].get('disposition', {}).get('attached_pic'):
+            return None
+        encargs = encoder_args(video[0])
+        pieceargs = piece_args(video[0])
+        if not encargs or not pieceargs:
+            return None
+        encoder = SMART_ENCODERS[video[0]['codec_name']]
+        pixfmts = FFCAPS.pix_fmts(encoder)
+        if (FFCAPS.has_encoder(encoder) is False
+                or (pixfmts and video[0].get('pix_fmt') not in pixfmts)):
+            return None
+        try:
+            offset = float(probe[0]['format'].get('start_time', 0))
+        except (KeyError, ValueError):
+            return None
+        index = keyframe_index(source, cmd=ffprobe_cmd, txtenc=txtenc)
+        if index[1] or not index[0]:
+            return None
+        plan = smart_cut_plan([k - offset for k in index[0].closed_times()],
+                              *cutrange)
+        if not plan:
+            return None
+
+        kwa = dict(kwa, source=source,
+                   destination=os.path.abspath(kwa['destination']))
+        codecs = [s.get('codec_type') for s in streams]
+        argsplit = kwa['args'][0].split()
+        otherstreams = (('audio' in codecs and '-an' not in argsplit)
+                        or ('subtitle' in codecs and '-sn' not in argsplit))
+        tmpdir = workdir or os.path.join(self.appdata['cachedir'], 'tmp')
+        vargs = {'encode': f'{encargs} {pieceargs}',
+                 'copy': f'-c:v copy {pieceargs}'}
+        with tempfile.TemporaryDirectory(dir=tmpdir,
+                                         prefix='smartcut-') as cutdir:
+            return self.encode_smartcut(count, kwa, plan, vargs,
+                                        otherstreams, os.path.abspath(cutdir),
+                                        jobid, logbuf)
+    # --------------------------------------------------------------------#
+
+    def encode_smartcut(self, count, kwa, plan, vargs, otherstreams,
+                        cutdir, jobid, logbuf):
+        """
+        Makes the pieces of the smart cut `plan` in `cutdir`,
+        with the video options of `vargs` for each mode, then
+        joins them. See `process_smartcut`.
+        """
+        ext = os.path.splitext(kwa['destination'])[1]
+        cmd = ffmpeg_cmd_args()
+        copied = sum(end - start for mode, start, end in plan
+                     if mode == 'copy')
+        msg = (f'File {count}/{self.nargs} - Smart cut ({copied:.3f} '
+               f'seconds stream copied)\nSource: "{kwa["source"]}"\n'
+               f'Destination: "{kwa["destination"]}"')
+        send_event("COUNT_EVT",
+                   count=msg,
+                   duration=kwa['duration'],
+                   end='CONTINUE',
+                   jobid=jobid,
+                   )
+        self.log(msg, logbuf, sep=True, wdate=True)
+
+        pieces = []
+        for idx, (mode, start, end) in enumerate(plan):
+            piece = os.path.join(cutdir, f'piece{idx}.ts')
+            args = (f'"{cmd["ffmpeg_cmd"]}" '
+                    f'{cmd["ffmpeg-default-args"]} '
+                    f'-ss {start:.6f} -i "{kwa["source"]}" '
+                    f'-t {end - start:.6f} -map 0:v:0 {vargs[mode]} '
+                    f'-an -sn -dn "{piece}"')
+            self.log(f'\n[{mode.upper()} {start:.3f}-{end:.3f}]\n'
+                     f'[COMMAND]:\n{args}', logbuf)
+            if not platform.system() == 'Windows':
+                args = shlex.split(args)
+            status = self.execute(args, kwa, jobid, cutdir, logbuf)
+            if status != 'DONE':
+                return status
+            pieces.append(piece)
+
+        streamsfile = None
+        if otherstreams:
+            streamsfile = os.path.join(cutdir, f'streams{ext}')
+            model = simple_one_pass(count, self.nargs,
+                                    **dict(kwa, args=[f'{kwa["args"][0]} '
+                                                      f'-vn', ''],
+                                           destination=streamsfile))
+            self.log(f'\n[STREAMS]\n{model["stamp1"]}', logbuf)
+            status = self.execute(model['pass1'], kwa, jobid, cutdir,
+                                  logbuf)
+            if status != 'DONE':
+                return status
+
+        listfile = os.path.join(cutdir, 'pieces.txt')
+        write_concat_list(pieces, listfile)
+        join, stamp = self.join_cmd(listfile, streamsfile,
+                                    kwa['destination'])
+        self.log(f'\n[JOIN]{stamp}', logbuf)
+        status = self.execute(join, kwa, jobid, cutdir, logbuf)
+        if status != 'DONE':
+            return status
+
+        length = plan[-1][2] - plan[0][1]
+        res = video_frames(kwa['destination'], self.appdata['ffprobe_cmd'],
+                           self.appdata['encoding'])
+        error = res[1]
+        if not error and abs(res[0][1] - length) > DURATION_TOLERANCE:
+            error = (f'joined output lasts {res[0][1]:.3f} seconds, '
+                     f'{length:.3f} were expected')
+        if not error:
+            error = decode_check(kwa['destination'], cut_points(plan),
+                                 cmd=cmd['ffmpeg_cmd'],
+                                 txtenc=self.appdata['encoding'])
+        if error:
+            send_event("UPDATE_EVT",
+                       output='FAILED',
+                       duration=kwa['duration'],
+                       status=1,
+                       jobid=jobid,
+                       )
+            self.log(f'[VIDEOMASS]: ERROR: smart cut check failed: {error}',
+                     logbuf)
+            time.sleep(1)
+            return 'FAILED'
+
+        self.log(f'[VIDEOMASS]: smart cut check passed: {res[0][0]} '
+                 f'video frames, {res[0][1]:.3f} seconds, decoded '
+                 f'without errors at {len(plan) - 1} cut points', logbuf)
+        send_event("COUNT_EVT",
+                   count='',
+                   duration=kwa['duration'],
+                   end='DONE',
+                   jobid=jobid,
+                   )
+        return 'DONE'
+    # --------------------------------------------------------------------#
+
+    def encode_chunk(self, idx, chunk, chunkfile, kwa, track):
+        """
+        Worker of the segment-parallel encoding, it encodes the
+        video of a single segment in a private working directory.
+        Returns one of 'DONE', 'FAILED', 'STOP', 'ERROR'.
+        """
+        if self.stop_work_thread or self.fatal_error:
+            return 'STOP'
+
+        start, end = chunk
+        chunkdir = os.path.splitext(chunkfile)[0]
+        os.mkdir(chunkdir)
+        ckwa = dict(kwa)
+        ckwa.update({'start-time': f'-ss {start:.6f}',
+                     'end-time': '' if end is None else
+                     f'-t {end - start:.6f}',
+                     'destination': chunkfile,
+                     'volume': '',
+                     'args': [f'{arg} -an -sn -dn' if arg else arg
+                              for arg in kwa['args']],
+                     })
+        if kwa['type'] == 'Two pass':
+            model1 = one_pass(idx + 1, len(track['msec']), **ckwa)
+            model2 = two_pass(idx + 1, len(track['msec']), **ckwa)
+            passes = ((model1['pass1'], model1['stamp1']),
+                      (model2['pass2'], model2['stamp2']))
+        else:
+            model1 = simple_one_pass(idx + 1, len(track['msec']), **ckwa)
+            passes = ((model1['pass1'], model1['stamp1']),)
+
+        elapsed = 0
+        for cmd, stamp in passes:
+            self.log(f'\n[SEGMENT {idx + 1}] {stamp}')
+            status = self.execute_chunk(cmd, idx, chunkdir, track, elapsed)
+            if status != 'DONE':
+                return status
+            elapsed = track['msec'][idx]
+
+        track['done'] += 1
+        return 'DONE'
+    # --------------------------------------------------------------------#
 
-            elif kwa['type'] == 'Two pass VIDSTAB':
-                model = two_pass_stab(self.count, self.nargs, **kwa)
+    def execute_chunk(self, cmd, idx, workdir, track, elapsed):
+        """
+        Runs a FFmpeg subprocess of a segment and sends the
+        overall progress of all segments to the `LogOut` panel.
+        """
+        try:
+            with Popen(progress_cmd(cmd),
+                       stdout=subprocess.PIPE,
+                       stderr=subprocess.PIPE,
+                       stdin=subprocess.PIPE,
+                       bufsize=1,
+                       universal_newlines=True,
+                       encoding=self.appdata['encoding'],
+                       cwd=workdir,
+                       ) as proc:
+                pipes = FFmpegPipes(proc)
+                for item in pipes:
+                    if isinstance(item, ProgressRecord):
+                        track['msec'][idx] = elapsed + item.msec
+                        track['records'][idx] = item
+                        self.chunks_progress(track)
+                    else:
+                        send_event("UPDATE_EVT",
+                                   output=f'[segment {idx + 1}] {item}',
+                                   duration=0,
+                                   status=0,
+                                   )
+                    if self.stop_work_thread:
+                        out = pipes.quit()  # stop ffmpeg
+                        proc.wait()
+                        self.log(out)
+                        return 'STOP'
+
+                if proc.wait():  # ..Failed
+                    self.log(f"[VIDEOMASS]: Segment {idx + 1}: Error Exit "
+                             f"Status: {proc.wait()}")
+                    return 'FAILED'
+
+        except (OSError, FileNotFoundError) as err:
+            self.fatal_error = True
+            send_event("COUNT_EVT",
+                       count=err,
+                       duration=0,
+                       end='ERROR',
+                       )
+            self.log(err)
+            return 'ERROR'
+
+        return 'DONE'
+    # --------------------------------------------------------------------#
 
-            elif kwa['type'] == 'Two pass':
-                model = two_pass(self.count, self.nargs, **kwa)
+    def chunks_progress(self, track):
+        """
+        Sends a progress record summarizing all the segments.
+        """
+        msec = round(sum(track['msec']) / track['passes'])
+        wall = time.time() - track['started']
+        records = [rec for rec in track['records'] if rec]
+        progress = ProgressRecord(
+            frame=sum(rec.frame for rec in records),
+            fps=sum(rec.fps for rec in records),
+            out_time_us=msec * 1000,
+            total_size=sum(rec.total_size for rec in records),
+            speed=msec / 1000 / wall if wall > 0 else 0.0,
+        )
+        send_event("PROGRESS_EVT",
+                   progress=progress,
+                   duration=track['duration'],
+                   )
+    # --------------------------------------------------------------------#
 
-            wx.CallAfter(pub.sendMessage,
-                         "COUNT_EVT",
-                         count=model['count2'],
-                         duration=kwa['duration'],
-                         end='CONTINUE',
-                         )
-            tolog(model['stamp2'], self.logfile)
+    def execute_step(self, cmd, stamp, title, kwa):
+        """
+        Runs one of the final steps of the segment-parallel
+        encoding (see `encode_chunks`).
+        """
+        send_event("COUNT_EVT",
+                   count=f'{title}...',
+                   duration=kwa['duration'],
+                   end='CONTINUE',
+                   )
+        self.log(f'\n{title}...\n{stamp}')
+        status = self.execute(cmd, kwa)
+        if status == 'DONE':
+            send_event("COUNT_EVT",
+                       count='',
+                       duration=kwa['duration'],
+                       end='DONE',
+                       )
+        return status
+    # --------------------------------------------------------------------#
 
-            with Popen(model['pass2'],
+    def execute(self, cmd, kwa, jobid=None, workdir=None, logbuf=None,
+                summary=None):
+        """
+        Run a single FFmpeg subprocess and pipe its output
+        to the `LogOut` panel: progress records by PROGRESS_EVT
+        and diagnostics lines by UPDATE_EVT. If `summary` dict
+        is given, it is filled with the loudnorm measurements.
+        Returns one of 'DONE', 'FAILED', 'STOP', 'ERROR'.
+        """
+        try:
+            with Popen(progress_cmd(cmd),
+                       stdout=subprocess.PIPE,
                        stderr=subprocess.PIPE,
                        stdin=subprocess.PIPE,
                        bufsize=1,
                        universal_newlines=True,
                        encoding=self.appdata['encoding'],
-                       ) as proc2:
-
-                for line2 in proc2.stderr:
-                    wx.CallAfter(pub.sendMessage,
-                                 "UPDATE_EVT",
-                                 output=line2,
-                                 duration=kwa['duration'],
-                                 status=0,
-                                 )
+                       cwd=workdir,
+                       ) as proc:
+                pipes = FFmpegPipes(proc)
+                for item in pipes:
+                    if isinstance(item, ProgressRecord):
+                        send_event("PROGRESS_EVT",
+                                   progress=item,
+                                   duration=kwa['duration'],
+                                   jobid=jobid,
+                                   )
+                    else:
+                        send_event("UPDATE_EVT",
+                                   output=item,
+                                   duration=kwa['duration'],
+                                   status=0,
+                                   jobid=jobid,
+                                   )
+                        if logbuf is not None:
+                            logbuf.append(f"[FFMPEG]: {item}")
+
+                        if summary is not None:
+                            for k in summary:
+                                if item.startswith(k):
+                                    summary[k] = item.split(':')[1].split()[0]
+
                     if self.stop_work_thread:
-                        proc2.stdin.write('q')  # stop ffmpeg
-                        out = proc2.communicate()[1]
-                        proc2.wait()
-                        wx.CallAfter(pub.sendMessage,
-                                     "UPDATE_EVT",
-                                     output='STOP',
-                                     duration=kwa['duration'],
-                                     status=1,
-                                     )
-                        tolog(out, self.logfile)
-                        time.sleep(.5)
-                        wx.CallAfter(pub.sendMessage, "END_EVT",
-                                     filetotrash=None)
-                        return
-
-                if proc2.wait():  # ..Failed
-                    out = proc2.communicate()[1]
-                    wx.CallAfter(pub.sendMessage,
-                                 "UPDATE_EVT",
-                                 output='FAILED',
-                                 duration=kwa['duration'],
-                                 status=proc2.wait(),
-                                 )
-                    tolog(f"[VIDEOMASS]: Error Exit Status: "
-                          f"{proc2.wait()} {out}", self.logfile
-                          )
+                        out = pipes.quit()  # stop ffmpeg
+                        proc.wait()
+                        send_event("UPDATE_EVT",
+                                   output='STOP',
+                                   duration=kwa['duration'],
+                                   status=1,
+                                   jobid=jobid,
+                                   )
+                        self.log(out, logbuf)
+                        return 'STOP'
+
+                if proc.wait():  # ..Failed
+                    send_event("UPDATE_EVT",
+                               output='FAILED',
+                               duration=kwa['duration'],
+                               status=proc.wait(),
+                               jobid=jobid,
+                               )
+                    self.log(f"[VIDEOMASS]: Error Exit Status: "
+                             f"{proc.wait()}", logbuf)
                     time.sleep(1)
-                    continue
+                    return 'FAILED'
+
+        except (OSError, FileNotFoundError) as err:
+            self.fatal_error = True
+            send_event("COUNT_EVT",
+                       count=err,
+                       duration=0,
+                       end='ERROR',
+                       jobid=jobid,
+                       )
+            self.log(err, logbuf)
+            return 'ERROR'
+
+        return 'DONE'
+    # --------------------------------------------------------------------#
 
-            if proc2.wait() == 0:  # ..Finished
-                filedone.append(kwa["source"])
-                wx.CallAfter(pub.sendMessage,
-                             "COUNT_EVT",
-                             count='',
-                             duration=kwa['duration'],
-                             end='DONE'
-                             )
-        time.sleep(.5)
-        wx.CallAfter(pub.sendMessage, "END_EVT", filetotrash=filedone)
+    def log(self, info, logbuf=None, sep=False, wdate=False):
+        """
+        Writes `info` to the log file, or appends it to
+        the `logbuf` list of a job running in parallel mode.
+        """
+        if logbuf is None:
+            tolog(info, self.logfile, sep=sep, wdate=wdate)
+        else:
+            logbuf.append(log_entry(info, sep=sep, wdate=wdate))
     # --------------------------------------------------------------------#
 
     def stop(self):
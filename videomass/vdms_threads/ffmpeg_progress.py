@@ -0,0 +1,216 @@
+# -*- coding: UTF-8 -*-
+"""
+Name: ffmpeg_progress.py
+Porpose: read the FFmpeg `-progress` output on a dedicated pipe
+Compatibility: Python3
+Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
+Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
+license: GPL3
+Rev: Oct.18.2026
+Code checker: flake8, pylint
+
+This file is part of Videomass.
+
+   Videomass is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   Videomass is distributed in the hope that it will be useful,
+   but WITHOUT ANY WARRANTY; without even the implied warranty of
+   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+   GNU General Public License for more details.
+
+   You should have received a copy of the GNU General Public License
+   along with Videomass.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import queue
+from threading import Thread
+from videomass.vdms_utils.utils import integer_to_time, format_bytes
+
+# Progress information goes to stdout, while the periodic
+# statistics line is disabled so that stderr only carries
+# diagnostics messages.
+PROGRESS_ARGS = ['-progress', 'pipe:1', '-nostats']
+
+
+def progress_cmd(cmd):
+    """
+    Adds the PROGRESS_ARGS to a FFmpeg command, given as a list
+    of arguments or as a string starting with the quoted
+    executable (MS Windows). The `-stats` option, if any, is
+    removed, since it would take precedence over `-nostats`.
+    """
+    if isinstance(cmd, str):
+        end = cmd.index('"', 1) + 1
+        rest = cmd[end:].replace(' -stats ', ' ')
+        return f'{cmd[:end]} {" ".join(PROGRESS_ARGS)}{rest}'
+
+    return cmd[:1] + PROGRESS_ARGS + [arg for arg in cmd[1:]
+                                      if arg != '-stats']
+# ----------------------------------------------------------------------
+
+
+def to_number(value, cast=int):
+    """
+    Converts a value of the progress output, returns
+    0 for not available values (e.g. 'N/A').
+    """
+    try:
+        return cast(value.rstrip('x'))
+    except (AttributeError, ValueError):
+        return cast(0)
+# ----------------------------------------------------------------------
+
+
+class ProgressRecord:
+    """
+    Typed representation of a block of `key=value` lines
+    written by `ffmpeg -progress`.
+
+    Attributes:
+        frame (int): number of frames encoded so far
+        fps (float): encoding frame rate
+        out_time_us (int): output position in microseconds
+        total_size (int): size of the output in bytes
+        speed (float): encoding speed factor, 0.0 if unknown
+        end (bool): True on the last record of the process
+    """
+    __slots__ = ('frame', 'fps', 'out_time_us', 'total_size',
+                 'speed', 'end')
+
+    def __init__(self, frame=0, fps=0.0, out_time_us=0, total_size=0,
+                 speed=0.0, end=False):
+        """
+        All arguments are already converted values.
+        """
+        self.frame = frame
+        self.fps = fps
+        self.out_time_us = out_time_us
+        self.total_size = total_size
+        self.speed = speed
+        self.end = end
+
+    @classmethod
+    def from_block(cls, block):
+        """
+        Makes a record out of a dict of raw `key=value` pairs.
+        Older FFmpeg versions only write `out_time_ms`, which
+        is in microseconds despite its name.
+        """
+        return cls(frame=to_number(block.get('frame')),
+                   fps=to_number(block.get('fps'), float),
+                   out_time_us=to_number(block.get('out_time_us',
+                                                   block.get('out_time_ms'))),
+                   total_size=to_number(block.get('total_size')),
+                   speed=to_number(block.get('speed'), float),
+                   end=block.get('progress') == 'end',
+                   )
+
+    @property
+    def msec(self):
+        """
+        Output position in milliseconds.
+        """
+        return max(0, self.out_time_us // 1000)
+
+    def labels(self):
+        """
+        Returns a list of human readable "key: value" strings.
+        """
+        speed = f'{self.speed:.2f}x' if self.speed else 'N/A'
+        return [f'frame: {self.frame}',
+                f'fps: {self.fps:.1f}',
+                f'size: {format_bytes(float(self.total_size))}',
+                f'time: {integer_to_time(self.msec)}',
+                f'speed: {speed}',
+                ]
+# ----------------------------------------------------------------------
+
+
+class ProgressParser:
+    """
+    Collects the `key=value` lines of `ffmpeg -progress`,
+    each block is terminated by a `progress=...` line.
+    """
+    def __init__(self):
+        """
+        The current block is kept in a dict.
+        """
+        self.block = {}
+
+    def feed(self, line):
+        """
+        Returns a ProgressRecord when `line` terminates a
+        block, None otherwise.
+        """
+        key, sep, value = line.strip().partition('=')
+        if not sep:
+            return None
+        self.block[key] = value
+        if key != 'progress':
+            return None
+        record = ProgressRecord.from_block(self.block)
+        self.block = {}
+        return record
+# ----------------------------------------------------------------------
+
+
+class FFmpegPipes:
+    """
+    Reads both the progress pipe (stdout) and the diagnostics
+    (stderr) of a FFmpeg subprocess started with `progress_cmd`.
+    Each pipe is drained by its own thread, so that neither can
+    fill up and block FFmpeg. Iterating over an instance yields
+    a `ProgressRecord` for each progress block and a `str` for
+    each stderr line, in order of arrival.
+
+    USAGE:
+        >>> with Popen(progress_cmd(cmd), stdout=PIPE, stderr=PIPE,
+                       stdin=PIPE, universal_newlines=True) as proc:
+        >>>     for item in FFmpegPipes(proc):
+        >>>         if isinstance(item, ProgressRecord):
+        >>>             ...
+    """
+    def __init__(self, proc):
+        """
+        `proc` is a Popen instance with piped stdout and stderr.
+        """
+        self.proc = proc
+        self.items = queue.Queue()
+        self.running = 2
+        Thread(target=self.reader, args=(proc.stdout, ProgressParser()),
+               daemon=True).start()
+        Thread(target=self.reader, args=(proc.stderr, None),
+               daemon=True).start()
+
+    def reader(self, pipe, parser):
+        """
+        Puts the items read from `pipe` on the queue,
+        then None at the end of the pipe.
+        """
+        for line in pipe:
+            item = parser.feed(line) if parser else line
+            if item is not None:
+                self.items.put(item)
+        self.items.put(None)
+
+    def __iter__(self):
+        while self.running:
+            item = self.items.get()
+            if item is None:
+                self.running -= 1
+                continue
+            yield item
+
+    def quit(self):
+        """
+        Sends the quit command to FFmpeg and returns the
+        remaining diagnostics as a string.
+        """
+        try:
+            self.proc.stdin.write('q')
+            self.proc.stdin.close()
+        except (BrokenPipeError, OSError, ValueError):
+            pass
+        return ''.join(item for item in self if isinstance(item, str))
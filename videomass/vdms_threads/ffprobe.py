@@ -7,7 +7,7 @@ Platform: all platforms
 Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
 Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
 license: GPL3
-Rev: Feb.17.2022
+Rev: Oct.18.2026
 Code checker: flake8, pylint
 
 This file is part of FFcuesplitter.
@@ -30,6 +30,8 @@ import shlex
 import platform
 import json
 from videomass.vdms_utils.utils import Popen
+from videomass.vdms_io.probe_cache import PROBECACHE
+from videomass.vdms_utils.keyframe_index import KeyframeIndex
 
 
 def from_kwargs_to_args(kwargs):
@@ -46,9 +48,12 @@ def from_kwargs_to_args(kwargs):
     return args
 
 
-def ffprobe(filename, cmd='ffprobe', txtenc='utf-8', **kwargs):
+def ffprobe(filename, cmd='ffprobe', txtenc='utf-8', cache=True, **kwargs):
     """
     Run ffprobe subprocess on the specified file.
+    Unless `cache` is False, the output is first looked up in
+    the persistent `PROBECACHE` (keyed by the file identity and
+    by the given options) and stored there afterwards.
     This function always returns a tuple of two items (data, error),
     where `data` is the data representation given from the subprocess
     output, and `error` is the current status error.
@@ -74,8 +79,14 @@ def ffprobe(filename, cmd='ffprobe', txtenc='utf-8', **kwargs):
         >>> else:
         >>>     probe[0]
     """
+    options = " ".join(from_kwargs_to_args(kwargs))
+    if cache:
+        cached = PROBECACHE.get(filename, options)
+        if cached is not None:
+            return json.loads(cached), None
+
     args = (f'"{cmd}" -show_format -show_streams -of json '
-            f'{" ".join(from_kwargs_to_args(kwargs))} '
+            f'{options} '
             f'"{filename}"'
             )
     args = shlex.split(args) if platform.system() != 'Windows' else args
@@ -95,4 +106,68 @@ def ffprobe(filename, cmd='ffprobe', txtenc='utf-8', **kwargs):
     except (OSError, FileNotFoundError, UnicodeDecodeError) as excepterr:
         return (None, excepterr)
 
+    if cache:
+        PROBECACHE.put(filename, options, output)
     return json.loads(output), None
+
+
+def keyframe_index(filename, cmd='ffprobe', txtenc='utf-8', stream='v:0',
+                   cache=True):
+    """
+    Get the KeyframeIndex of the given video `stream` of
+    `filename`. It only reads the packet flags of the container
+    (no decoding), so it is fast even on long files. Unless
+    `cache` is False, the index is first looked up in the
+    persistent `PROBECACHE`, next to the ffprobe data of
+    the same file, and stored there afterwards.
+    This function always returns a tuple of two items (data, error),
+    where `data` is a `KeyframeIndex` object.
+    """
+    variant = f'keyframes {stream}'
+    if cache:
+        cached = PROBECACHE.get(filename, variant)
+        if cached is not None:
+            try:
+                return KeyframeIndex.from_json(cached), None
+            except ValueError:
+                pass
+
+    args = (f'"{cmd}" -v error -select_streams {stream} '
+            f'-show_entries packet=pts_time,flags '
+            f'-of csv=print_section=0 "{filename}"'
+            )
+    args = shlex.split(args) if platform.system() != 'Windows' else args
+    try:
+        with Popen(args,
+                   stdout=subprocess.PIPE,
+                   stderr=subprocess.PIPE,
+                   bufsize=1,
+                   universal_newlines=True,
+                   encoding=txtenc,
+                   ) as proc:
+            output, error = proc.communicate()
+
+            if proc.returncode != 0:
+                return (None, f'ffprobe: {error}')
+
+    except (OSError, FileNotFoundError, UnicodeDecodeError) as excepterr:
+        return (None, excepterr)
+
+    index = KeyframeIndex.from_packets(output)
+    if cache:
+        PROBECACHE.put(filename, variant, index.to_json())
+    return index, None
+
+
+def keyframes(filename, cmd='ffprobe', txtenc='utf-8', stream='v:0'):
+    """
+    Get the presentation times (in seconds) of the keyframes of
+    the given video `stream` of `filename`, see `keyframe_index`.
+    This function always returns a tuple of two items (data, error),
+    where `data` is a sorted list of float.
+    """
+    index, error = keyframe_index(filename, cmd=cmd, txtenc=txtenc,
+                                  stream=stream)
+    if error:
+        return None, error
+    return index.times, None
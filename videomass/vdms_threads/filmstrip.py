@@ -0,0 +1,184 @@
+# -*- coding: UTF-8 -*-
+"""
+Name: filmstrip.py
+Porpose: background generation of the timeline filmstrip
+Compatibility: Python3, wxPython4 Phoenix
+Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
+Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
+license: GPL3
+Rev: Oct.18.2026
+Code checker: flake8, pylint
+
+This file is part of Videomass.
+
+   Videomass is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   Videomass is distributed in the hope that it will be useful,
+   but WITHOUT ANY WARRANTY; without even the implied warranty of
+   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+   GNU General Public License for more details.
+
+   You should have received a copy of the GNU General Public License
+   along with Videomass.  If not, see <http://www.gnu.org/licenses/>.
+"""
+from threading import Thread
+from collections import deque
+import queue
+import subprocess
+import wx
+from pubsub import pub
+from videomass.vdms_utils.utils import Popen
+from videomass.vdms_utils.filmstrip import Filmstrip, showinfo_time
+from videomass.vdms_io.filmstrip_cache import FILMSTRIPCACHE
+
+# seconds to wait for the `showinfo` line of a decoded thumbnail
+INFO_TIMEOUT = 10
+
+
+def filmstrip_cmd(ffmpeg_cmd, filename, step, width, height):
+    """
+    Returns the FFmpeg command (list of arguments) that decodes
+    only the keyframes of the first video stream of `filename`,
+    selects one every `step` seconds at least and writes them
+    as raw RGB thumbnails of `width` x `height` on stdout. The
+    time of each thumbnail is logged by the `showinfo` filter.
+    """
+    select = f"select='isnan(prev_selected_t)+gte(t-prev_selected_t,{step})'"
+    return [ffmpeg_cmd, '-nostdin', '-hide_banner', '-nostats',
+            '-loglevel', 'info', '-skip_frame', 'nokey', '-i', filename,
+            '-map', '0:v:0', '-an', '-sn', '-dn',
+            '-vf', f'{select},showinfo,scale={width}:{height}',
+            '-fps_mode', 'vfr', '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-']
+# ----------------------------------------------------------------------
+
+
+class FilmstripThread(Thread):
+    """
+    Makes the Filmstrip of a video file in a single FFmpeg
+    pass, or reads it from FILMSTRIPCACHE. Each thumbnail is
+    sent to the GUI as soon as it is decoded, by the
+    "FILMSTRIP_EVT" message with the `filename`, the `slot`
+    and the thumbnail `data` arguments; the last message has
+    `slot` None and the `error` message, if any.
+
+    Usage:
+        >>> pub.subscribe(self.on_filmstrip, "FILMSTRIP_EVT")
+        >>> thread = FilmstripThread(filename, 90.0, 142, 80, 7)
+        >>> thread.stop()
+    """
+    def __init__(self, filename, duration, width, height, slots):
+        """
+        `duration` is the source duration in seconds.
+        The thread starts immediately.
+        """
+        self.appdata = wx.GetApp().appset
+        self.filename = filename
+        self.duration = duration
+        self.strip = Filmstrip(width, height, slots)
+        self.stop_work_thread = False
+        self.proc = None
+        Thread.__init__(self, daemon=True)
+        self.start()
+
+    def run(self):
+        """
+        Looks up the cache, decodes on a miss.
+        """
+        strip = self.strip
+        key = FILMSTRIPCACHE.key(self.filename,
+                                 f'{strip.width}x{strip.height} '
+                                 f'{strip.slots}')
+        data = FILMSTRIPCACHE.read(key)
+        cached = None
+        if data is not None:
+            try:
+                cached = Filmstrip.from_bytes(data)
+            except ValueError:
+                cached = None
+        if cached is not None:
+            for slot, thumb in sorted(cached.thumbs.items()):
+                self.send(slot, thumb)
+            self.send(None, None)
+            return
+
+        error = self.decode()
+        if not error and strip.thumbs:
+            FILMSTRIPCACHE.write(key, strip.to_bytes())
+        if not self.stop_work_thread:
+            self.send(None, None, error)
+
+    def send(self, slot, data, error=None):
+        """
+        Sends a "FILMSTRIP_EVT" message to the GUI.
+        """
+        wx.CallAfter(pub.sendMessage,
+                     "FILMSTRIP_EVT",
+                     filename=self.filename,
+                     slot=slot,
+                     data=data,
+                     error=error,
+                     )
+
+    def reader(self, times, errors):
+        """
+        Puts the thumbnail times of the FFmpeg log on the
+        `times` queue, keeps the other lines in `errors`.
+        """
+        for line in self.proc.stderr:
+            pts = showinfo_time(line)
+            if pts is not None:
+                times.put(pts)
+            elif b'showinfo' not in line:
+                errors.append(line)
+
+    def decode(self):
+        """
+        Returns None on success, the error message otherwise.
+        """
+        strip = self.strip
+        times, errors = queue.Queue(), deque(maxlen=20)
+        cmd = filmstrip_cmd(self.appdata['ffmpeg_cmd'], self.filename,
+                            f'{self.duration / strip.slots:.3f}',
+                            strip.width, strip.height)
+        try:
+            with Popen(cmd,
+                       stdout=subprocess.PIPE,
+                       stderr=subprocess.PIPE,
+                       ) as self.proc:
+                drain = Thread(target=self.reader, args=(times, errors),
+                               daemon=True)
+                drain.start()
+                for data in iter(lambda: self.proc.stdout.read(
+                        strip.framesize), b''):
+                    if self.stop_work_thread:
+                        self.proc.kill()
+                        return 'STOP'
+                    if len(data) < strip.framesize:
+                        break
+                    try:
+                        pts = times.get(timeout=INFO_TIMEOUT)
+                    except queue.Empty:
+                        self.proc.kill()
+                        return 'No frame information from FFmpeg'
+                    slot = strip.slot(pts, self.duration)
+                    if strip.add(slot, data):
+                        self.send(slot, data)
+                status = self.proc.wait()
+                drain.join()
+                if status:
+                    errors = b''.join(errors).decode('utf-8', 'replace')
+                    return errors.strip() or f'exit status {status}'
+
+        except (OSError, FileNotFoundError) as err:
+            return str(err)
+
+        return None
+
+    def stop(self):
+        """
+        Stops the decoding, if any.
+        """
+        self.stop_work_thread = True
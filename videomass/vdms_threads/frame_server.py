@@ -0,0 +1,356 @@
+# -*- coding: UTF-8 -*-
+"""
+Name: frame_server.py
+Porpose: long-lived FFmpeg decoder of preview frames
+Compatibility: Python3
+Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
+Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
+license: GPL3
+Rev: Oct.18.2026
+Code checker: flake8, pylint
+
+This file is part of Videomass.
+
+   Videomass is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   Videomass is distributed in the hope that it will be useful,
+   but WITHOUT ANY WARRANTY; without even the implied warranty of
+   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+   GNU General Public License for more details.
+
+   You should have received a copy of the GNU General Public License
+   along with Videomass.  If not, see <http://www.gnu.org/licenses/>.
+"""
+from collections import OrderedDict, deque
+from threading import Thread, Lock, Condition
+import subprocess
+from videomass.vdms_utils.utils import Popen
+
+# preview frames decoded for each second of the source
+FPS = 10
+# seconds read forward on the running decoder instead of seeking
+WINDOW = 5.0
+# frames decoded ahead after each asynchronous request
+PREFETCH = 10
+# recently decoded frames kept by each server
+MAXFRAMES = 150
+
+
+def preview_cmd(ffmpeg_cmd, filename, start, width, height, fps=FPS):
+    """
+    Returns the FFmpeg command (list of arguments) that decodes
+    the first video stream of `filename` from `start` seconds
+    to raw RGB frames of `width` x `height` on stdout, `fps`
+    frames per second of source.
+    """
+    return [ffmpeg_cmd, '-nostdin', '-hide_banner', '-v', 'error',
+            '-ss', f'{start:.3f}', '-i', filename, '-map', '0:v:0',
+            '-an', '-sn', '-dn', '-vf', f'fps={fps},scale={width}:{height}',
+            '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-']
+# ----------------------------------------------------------------------
+
+
+def filter_frame(ffmpeg_cmd, data, width, height, vfilter):
+    """
+    Applies the `vfilter` filtergraph to a raw RGB frame of
+    `width` x `height` passed on stdin, without demuxing or
+    seeking the source again.
+    Returns a tuple (bytes, None) on success, (None, error
+    message) otherwise.
+    """
+    cmd = [ffmpeg_cmd, '-nostdin', '-hide_banner', '-v', 'error',
+           '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-s', f'{width}x{height}',
+           '-i', '-', '-vf', vfilter, '-frames:v', '1',
+           '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-']
+    try:
+        with Popen(cmd,
+                   stdin=subprocess.PIPE,
+                   stdout=subprocess.PIPE,
+                   stderr=subprocess.PIPE,
+                   ) as proc:
+            output, errors = proc.communicate(data)
+    except OSError as err:
+        return None, str(err)
+    if proc.returncode or len(output) != len(data):
+        return None, errors.decode('utf-8', 'replace').strip()
+    return output, None
+# ----------------------------------------------------------------------
+
+
+class FrameServer:
+    """
+    Serves the preview frames of a video source from a single
+    FFmpeg process, which decodes forward from the last seek
+    point at FPS frames per second of source and is started
+    again only when a frame is requested behind it or beyond
+    WINDOW seconds ahead. The frames (raw RGB bytes, see
+    `wx.Bitmap.FromBuffer`) are kept in a LRU of `maxframes`,
+    so that scrubbing back and forth reuses them.
+
+    `frame` returns a frame synchronously, `request` returns
+    it to a callback from a worker thread, which then decodes
+    PREFETCH frames ahead while no other request is pending.
+
+    Usage:
+        >>> server = FrameServer(filename, 320, 180, 'ffmpeg')
+        >>> data = server.frame(12.5)
+        >>> bmp = wx.Bitmap.FromBuffer(320, 180, data)
+        >>> server.request(13.0, callback)  # callback(seconds, data)
+        >>> server.suspend()  # when the preview is closed
+    """
+    def __init__(self, filename, width, height, ffmpeg_cmd='ffmpeg',
+                 fps=FPS, maxframes=MAXFRAMES, command=preview_cmd):
+        """
+        `command` makes the decoder command line,
+        see `preview_cmd`.
+        """
+        self.filename = filename
+        self.width = width
+        self.height = height
+        self.ffmpeg_cmd = ffmpeg_cmd
+        self.fps = fps
+        self.maxframes = maxframes
+        self.command = command
+        self.framesize = width * height * 3
+        self.frames = OrderedDict()  # {slot: bytes}
+        self.lock = Lock()  # the decoder process
+        self.proc = None
+        self.slot = 0  # slot of the next frame read from the decoder
+        self.first = 0  # slot at which the decoder was started
+        self.end = None  # slot past the last frame, once known
+        self.errors = deque(maxlen=20)  # last stderr lines
+        self.pending = None  # (seconds, callback) of `request`
+        self.cond = Condition()
+        self.worker = None
+        self.closed = False
+        self.suspended = False  # no decoder until the next call
+
+    def tslot(self, seconds):
+        """
+        Returns the frame slot of a time position.
+        """
+        return max(0, int(round(seconds * self.fps)))
+
+    def cached(self, slot):
+        """
+        Returns the frame of `slot` from the LRU, None if missing.
+        """
+        with self.cond:
+            data = self.frames.get(slot)
+            if data is not None:
+                self.frames.move_to_end(slot)
+        return data
+
+    def store(self, slot, data):
+        """
+        Adds a frame to the LRU, evicting the oldest one.
+        """
+        with self.cond:
+            self.frames[slot] = data
+            self.frames.move_to_end(slot)
+            if len(self.frames) > self.maxframes:
+                self.frames.popitem(last=False)
+
+    def error(self):
+        """
+        Returns the last messages of the decoder.
+        """
+        return b''.join(self.errors).decode('utf-8', 'replace').strip()
+
+    def start(self, slot):
+        """
+        (Re)starts the decoder at the time of `slot`.
+        Must be called holding `self.lock`.
+        """
+        self.stop()
+        self.errors.clear()
+        cmd = self.command(self.ffmpeg_cmd, self.filename, slot / self.fps,
+                           self.width, self.height, self.fps)
+        try:
+            self.proc = Popen(cmd,
+                              stdin=subprocess.DEVNULL,
+                              stdout=subprocess.PIPE,
+                              stderr=subprocess.PIPE,
+                              )
+        except OSError as err:
+            self.errors.append(str(err).encode())
+            return
+        self.slot = slot
+        self.first = slot
+        Thread(target=self.errors.extend, args=(self.proc.stderr,),
+               daemon=True).start()
+
+    def stop(self):
+        """
+        Terminates the decoder, if any.
+        Must be called holding `self.lock`.
+        """
+        if self.proc is None:
+            return
+        self.proc.kill()
+        self.proc.stdout.close()
+        self.proc.wait()
+        self.proc = None
+
+    def read(self):
+        """
+        Reads the next frame of the decoder into the LRU.
+        Returns False at the end of the stream.
+        Must be called holding `self.lock`.
+        """
+        if self.proc is None:
+            return False
+        data = self.proc.stdout.read(self.framesize)
+        if len(data) < self.framesize:
+            if self.slot > self.first:
+                self.end = self.slot
+            self.stop()
+            return False
+        self.store(self.slot, data)
+        self.slot += 1
+        return True
+
+    def frame(self, seconds):
+        """
+        Returns the frame at `seconds`, decoding it if needed.
+        Beyond the end of the stream it returns the last frame,
+        None if nothing can be decoded (see `error`).
+        """
+        with self.cond:
+            self.suspended = False
+        return self.serve(seconds)
+
+    def serve(self, seconds):
+        """
+        Does the job of `frame`, but once suspended it only
+        returns the frames of the LRU, without starting the
+        decoder again.
+        """
+        slot = self.tslot(seconds)
+        if self.end and slot >= self.end:
+            slot = self.end - 1
+        data = self.cached(slot)
+        if data is not None:
+            return data
+        with self.lock:
+            if self.suspended:
+                return None
+            if (self.proc is None or slot < self.slot
+                    or slot > self.slot + WINDOW * self.fps):
+                self.start(slot)
+            while self.slot <= slot and self.read():
+                pass
+            data = self.cached(slot)
+            if data is None and self.end and slot >= self.end:
+                data = self.cached(self.end - 1)
+        return data
+
+    def request(self, seconds, callback):
+        """
+        Asks for the frame at `seconds` without waiting, a
+        newer request replaces a pending one. `callback` is
+        called with (seconds, data) from the worker thread.
+        """
+        with self.cond:
+            self.pending = (seconds, callback)
+            self.suspended = False
+            if self.worker is None:
+                self.worker = Thread(target=self.work, daemon=True)
+                self.worker.start()
+            self.cond.notify()
+
+    def work(self):
+        """
+        Worker thread of `request`.
+        """
+        while True:
+            with self.cond:
+                while self.pending is None and not self.closed:
+                    self.cond.wait()
+                if self.closed:
+                    self.worker = None
+                    return
+                seconds, callback = self.pending
+                self.pending = None
+            data = self.serve(seconds)
+            if data is None and self.suspended:
+                continue
+            callback(seconds, data)
+            self.prefetch()
+
+    def prefetch(self):
+        """
+        Decodes PREFETCH frames ahead, stopping as soon
+        as a new request arrives.
+        """
+        for _ in range(PREFETCH):
+            if self.pending is not None or self.closed or self.suspended:
+                return
+            with self.lock:
+                if self.suspended or not self.read():
+                    return
+
+    def suspend(self):
+        """
+        Terminates the decoder keeping the decoded frames and
+        drops the pending request, so that the worker does not
+        start it again: only the next call to `frame` or
+        `request` does.
+        """
+        with self.cond:
+            self.pending = None
+            self.suspended = True
+        with self.lock:
+            self.stop()
+
+    def close(self):
+        """
+        Terminates the decoder and the worker thread.
+        """
+        with self.cond:
+            self.closed = True
+            self.cond.notify()
+        self.suspend()
+# ----------------------------------------------------------------------
+
+
+class FrameServers:
+    """
+    Registry of the FrameServer of the recently previewed
+    sources, so that reopening a preview dialog on the same
+    source finds its frames again. Beyond `maxservers` the
+    least recently used server is closed.
+    """
+    MAXSERVERS = 2
+
+    def __init__(self):
+        """
+        Servers are keyed by (filename, width, height).
+        """
+        self.servers = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, filename, width, height, ffmpeg_cmd):
+        """
+        Returns the server of `filename` at the given
+        size, making it if needed.
+        """
+        key = (filename, width, height)
+        with self.lock:
+            server = self.servers.get(key)
+            if server is not None and server.ffmpeg_cmd != ffmpeg_cmd:
+                server.close()
+                server = None
+            if server is None:
+                server = FrameServer(filename, width, height, ffmpeg_cmd)
+                self.servers[key] = server
+            self.servers.move_to_end(key)
+            while len(self.servers) > FrameServers.MAXSERVERS:
+                self.servers.popitem(last=False)[1].close()
+        return server
+
+
+FRAMESERVERS = FrameServers()
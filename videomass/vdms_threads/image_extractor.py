@@ -6,7 +6,7 @@ Compatibility: Python3, wxPython4 Phoenix (OS Unix-like only)
 Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
 Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
 license: GPL3
-Rev: Apr.24.2024
+Rev: Oct.18.2026
 Code checker: flake8, pylint
 
 This file is part of Videomass.
@@ -29,9 +29,13 @@ import time
 import subprocess
 import platform
 import wx
-from pubsub import pub
 from videomass.vdms_utils.utils import Popen
+from videomass.vdms_threads.dispatcher import send_event
 from videomass.vdms_io.make_filelog import tolog
+from videomass.vdms_threads.ffmpeg_progress import (progress_cmd,
+                                                    FFmpegPipes,
+                                                    ProgressRecord,
+                                                    )
 if not platform.system() == 'Windows':
     import shlex
 
@@ -86,55 +90,57 @@ class PicturesFromVideo(Thread):
                   f'Destination: "{self.outputdir}"')
         com = f'{count1}\n\n[COMMAND]:\n{cmd}'
 
-        wx.CallAfter(pub.sendMessage,
-                     "COUNT_EVT",
-                     count=count1,
-                     duration=self.duration,
-                     end='CONTINUE',
-                     )
+        send_event("COUNT_EVT",
+                   count=count1,
+                   duration=self.duration,
+                   end='CONTINUE',
+                   )
         tolog(com, self.logfile, sep=True, wdate=True)
 
         if not platform.system() == 'Windows':
             cmd = shlex.split(cmd)
         try:
-            with Popen(cmd,
+            with Popen(progress_cmd(cmd),
+                       stdout=subprocess.PIPE,
                        stderr=subprocess.PIPE,
                        stdin=subprocess.PIPE,
                        bufsize=1,
                        universal_newlines=True,
                        encoding=self.appdata['encoding'],
                        ) as proc:
-                for line in proc.stderr:
-                    wx.CallAfter(pub.sendMessage,
-                                 "UPDATE_EVT",
-                                 output=line,
-                                 duration=self.duration,
-                                 status=0,
-                                 )
+                pipes = FFmpegPipes(proc)
+                for item in pipes:
+                    if isinstance(item, ProgressRecord):
+                        send_event("PROGRESS_EVT",
+                                   progress=item,
+                                   duration=self.duration,
+                                   )
+                    else:
+                        send_event("UPDATE_EVT",
+                                   output=item,
+                                   duration=self.duration,
+                                   status=0,
+                                   )
                     if self.stop_work_thread:
-                        proc.stdin.write('q')  # stop ffmpeg
-                        out = proc.communicate()[1]
+                        out = pipes.quit()  # stop ffmpeg
                         proc.wait()
-                        wx.CallAfter(pub.sendMessage,
-                                     "UPDATE_EVT",
-                                     output='STOP',
-                                     duration=self.kwa['duration'],
-                                     status=1,
-                                     )
+                        send_event("UPDATE_EVT",
+                                   output='STOP',
+                                   duration=self.kwa['duration'],
+                                   status=1,
+                                   )
                         tolog(out, self.logfile)
                         time.sleep(1)
-                        wx.CallAfter(pub.sendMessage, "END_EVT",
-                                     filetotrash=None)
+                        send_event("END_EVT", filetotrash=None)
                         return
 
                 if proc.wait():  # error
                     out = proc.communicate()[1]
-                    wx.CallAfter(pub.sendMessage,
-                                 "UPDATE_EVT",
-                                 output='FAILED',
-                                 duration=self.kwa['duration'],
-                                 status=proc.wait(),
-                                 )
+                    send_event("UPDATE_EVT",
+                               output='FAILED',
+                               duration=self.kwa['duration'],
+                               status=proc.wait(),
+                               )
                     tolog(f"[VIDEOMASS]: Error Exit Status: "
                           f"{proc.wait()} {out}", self.logfile
                           )
@@ -142,23 +148,21 @@ class PicturesFromVideo(Thread):
 
                 else:  # Done
                     filedone.append(self.fname)
-                    wx.CallAfter(pub.sendMessage,
-                                 "COUNT_EVT",
-                                 count='',
-                                 duration='',
-                                 end='DONE'
-                                 )
+                    send_event("COUNT_EVT",
+                               count='',
+                               duration='',
+                               end='DONE'
+                               )
         except (OSError, FileNotFoundError) as err:
-            wx.CallAfter(pub.sendMessage,
-                         "COUNT_EVT",
-                         count=err,
-                         duration=0,
-                         end='ERROR',
-                         )
+            send_event("COUNT_EVT",
+                       count=err,
+                       duration=0,
+                       end='ERROR',
+                       )
             tolog(err, self.logfile)
 
         time.sleep(.5)
-        wx.CallAfter(pub.sendMessage, "END_EVT", filetotrash=filedone)
+        send_event("END_EVT", filetotrash=filedone)
     # --------------------------------------------------------------------#
 
     def stop(self):
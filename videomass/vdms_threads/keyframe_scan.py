@@ -0,0 +1,70 @@
+# -*- coding: UTF-8 -*-
+"""
+Name: keyframe_scan.py
+Porpose: background scan of the keyframe index of a source
+Compatibility: Python3, wxPython4 Phoenix
+Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
+Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
+license: GPL3
+Rev: Oct.18.2026
+Code checker: flake8, pylint
+
+This file is part of Videomass.
+
+   Videomass is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   Videomass is distributed in the hope that it will be useful,
+   but WITHOUT ANY WARRANTY; without even the implied warranty of
+   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+   GNU General Public License for more details.
+
+   You should have received a copy of the GNU General Public License
+   along with Videomass.  If not, see <http://www.gnu.org/licenses/>.
+"""
+from threading import Thread
+import wx
+from pubsub import pub
+from videomass.vdms_threads.ffprobe import keyframe_index
+
+
+class KeyframeThread(Thread):
+    """
+    Gets the KeyframeIndex of the first video stream of a file
+    (see `keyframe_index`) without blocking the GUI.
+    The result is sent by the "KEYFRAMES_EVT" message with the
+    `filename`, the `index` (None on error) and the `error`
+    message (None on success) arguments.
+
+    Usage:
+        >>> pub.subscribe(self.on_keyframes, "KEYFRAMES_EVT")
+        >>> thread = KeyframeThread(filename)
+    """
+    def __init__(self, filename):
+        """
+        The thread starts immediately.
+        """
+        self.appdata = wx.GetApp().appset
+        self.filename = filename
+        Thread.__init__(self, daemon=True)
+        self.start()
+
+    def run(self):
+        """
+        Scans the packets, or reads the cached index.
+        """
+        index, error = keyframe_index(self.filename,
+                                      cmd=self.appdata['ffprobe_cmd'],
+                                      txtenc=self.appdata['encoding'],
+                                      )
+        if not error and not index:
+            index, error = None, 'No keyframes found'
+
+        wx.CallAfter(pub.sendMessage,
+                     "KEYFRAMES_EVT",
+                     filename=self.filename,
+                     index=index,
+                     error=str(error) if error else None,
+                     )
@@ -0,0 +1,211 @@
+# -*- coding: UTF-8 -*-
+"""
+Name: media_import.py
+Porpose: concurrent probing of the imported media files
+Compatibility: Python3, wxPython4 Phoenix
+Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
+Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
+license: GPL3
+Rev: Oct.18.2026
+Code checker: flake8, pylint
+
+This file is part of Videomass.
+
+   Videomass is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   Videomass is distributed in the hope that it will be useful,
+   but WITHOUT ANY WARRANTY; without even the implied warranty of
+   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+   GNU General Public License for more details.
+
+   You should have received a copy of the GNU General Public License
+   along with Videomass.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import os
+import mimetypes
+from fnmatch import fnmatch
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, CancelledError
+from threading import Thread
+import wx
+from videomass.vdms_threads.ffprobe import ffprobe
+from videomass.vdms_utils.utils import time_to_integer
+
+# upper bound of concurrent ffprobe processes
+MAX_PROBES = 8
+
+# files submitted to the probe pool ahead of the delivered ones
+BATCH = 32
+
+
+def allowed_file(name, allowlist):
+    """
+    Returns True if the file `name` matches the `allowlist`,
+    a list of file extensions without dot (e.g. 'mkv') and
+    MIME type patterns (e.g. 'video/*'). Case insensitive.
+    """
+    ext = os.path.splitext(name)[1][1:].lower()
+    if not ext:
+        return False
+    mime = None
+    for item in allowlist:
+        item = item.lower()
+        if '/' not in item:
+            if item == ext:
+                return True
+            continue
+        if mime is None:
+            mime = mimetypes.guess_type(name, strict=False)[0] or ''
+        if mime and fnmatch(mime, item):
+            return True
+    return False
+# ----------------------------------------------------------------------
+
+
+def scan_folder(top, allowlist, reject):
+    """
+    Generator that walks the `top` directory recursively with
+    `os.scandir`, yielding the pathnames of the files allowed
+    by `allowlist` (see `allowed_file`), each directory sorted
+    by name. Symbolic links to directories are not followed.
+    Any other entry is reported calling `reject(pathname,
+    reason)`, where `reason` is one of 'hidden', 'filtered'
+    or 'unreadable'.
+    """
+    stack = [top]
+    while stack:
+        folder = stack.pop()
+        try:
+            with os.scandir(folder) as entries:
+                entries = sorted(entries, key=lambda e: e.name)
+        except OSError:
+            reject(folder, 'unreadable')
+            continue
+
+        subdirs = []
+        for entry in entries:
+            if entry.name.startswith('.'):
+                reject(entry.path, 'hidden')
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                    continue
+                isfile = entry.is_file()
+            except OSError:
+                isfile = False
+            if not isfile:
+                reject(entry.path, 'unreadable')
+            elif allowed_file(entry.name, allowlist):
+                yield entry.path
+            else:
+                reject(entry.path, 'filtered')
+        stack.extend(reversed(subdirs))
+
+
+def probe_media(filename, cmd='ffprobe', txtenc='utf-8'):
+    """
+    Gets the ffprobe data of `filename` as used by the file
+    list, i.e. with the custom `time` (the duration string)
+    and `duration` (milliseconds) format keys.
+    Returns a tuple (data, error) like `ffprobe`.
+    """
+    probe = ffprobe(filename, cmd=cmd, txtenc=txtenc,
+                    hide_banner=None, pretty=None)
+    if probe[1]:
+        return probe
+
+    fmt = probe[0]['format']
+    if 'duration' not in fmt:
+        fmt['time'] = '00:00:00.000'
+        fmt['duration'] = 0
+    else:
+        fmt['time'] = fmt.pop('duration')
+        fmt['duration'] = time_to_integer(fmt['time'])
+
+    return probe
+# ----------------------------------------------------------------------
+
+
+class MediaImport(Thread):
+    """
+    Probes files using a bounded pool of concurrent ffprobe
+    processes. `paths` can be any iterable, e.g. a generator
+    (see `scan_folder`), which is consumed by this thread and
+    fed to the pool BATCH files ahead. Results are delivered on
+    the main thread as soon as they are available but always
+    in the order of `paths`, calling `onresult(path, data,
+    error)` for each file and `onend(cancelled, rejected)` at
+    the end.
+
+    USAGE:
+        >>> thread = MediaImport(paths, onresult, onend)
+        >>> thread.stop()  # to cancel the remaining files
+    """
+    def __init__(self, paths, onresult, onend, workers=None,
+                 rejected=None):
+        """
+        `workers` defaults to the number of CPUs,
+        at most MAX_PROBES. `rejected` is a list which
+        `paths` fills, on this thread, with the tuples
+        (path, reason) of the files it skips: it is
+        handed over to `onend` only at the end.
+        """
+        get = wx.GetApp()
+        self.appdata = get.appset
+        self.paths = paths
+        self.onresult = onresult
+        self.onend = onend
+        self.rejected = [] if rejected is None else rejected
+        self.workers = workers or min(MAX_PROBES, os.cpu_count() or 1)
+        self.stop_work_thread = False
+
+        Thread.__init__(self, daemon=True)
+        self.start()
+    # ----------------------------------------------------------------#
+
+    def run(self):
+        """
+        Submits the files and collects the results in order.
+        """
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for path in self.paths:
+                if self.stop_work_thread:
+                    break
+                pending.append((path, pool.submit(probe_media, path,
+                                                  self.appdata['ffprobe_cmd'],
+                                                  self.appdata['encoding'])))
+                if len(pending) >= BATCH:
+                    self.deliver(*pending.popleft())
+
+            while pending and not self.stop_work_thread:
+                self.deliver(*pending.popleft())
+
+            if self.stop_work_thread:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+        wx.CallAfter(self.onend, self.stop_work_thread, self.rejected)
+    # ----------------------------------------------------------------#
+
+    def deliver(self, path, future):
+        """
+        Waits for the result of `path` and sends it
+        to the main thread.
+        """
+        try:
+            data, error = future.result()
+        except CancelledError:
+            return
+        wx.CallAfter(self.onresult, path, data, error)
+    # ----------------------------------------------------------------#
+
+    def stop(self):
+        """
+        Sets the stop work thread to cancel the files
+        not yet probed.
+        """
+        self.stop_work_thread = True
@@ -6,7 +6,7 @@ Compatibility: Python3, wxPython4 Phoenix
 Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
 Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
 license: GPL3
-Rev: Mar.08.2024
+Rev: Oct.18.2026
 Code checker: flake8, pylint
 
 This file is part of Videomass.
@@ -31,9 +31,13 @@ import time
 import subprocess
 import platform
 import wx
-from pubsub import pub
 from videomass.vdms_utils.utils import Popen
+from videomass.vdms_threads.dispatcher import send_event
 from videomass.vdms_io.make_filelog import tolog
+from videomass.vdms_threads.ffmpeg_progress import (progress_cmd,
+                                                    FFmpegPipes,
+                                                    ProgressRecord,
+                                                    )
 if not platform.system() == 'Windows':
     import shlex
 
@@ -50,12 +54,11 @@ def convert_images(*varargs, **kwargs):
 
     count1 = (f'Preparing temporary files...\nSource: Imported file list\n'
               f'Destination: "{tmpdir}"\n')
-    wx.CallAfter(pub.sendMessage,
-                 "COUNT_EVT",
-                 count=count1,
-                 duration=len(flist),
-                 end='CONTINUE',
-                 )
+    send_event("COUNT_EVT",
+               count=count1,
+               duration=len(flist),
+               end='CONTINUE',
+               )
     prognum = 0
     args = (f'"{kwargs["ffmpeg_cmd"]}" '
             f'{kwargs["ffmpeg-default-args"]} '
@@ -81,12 +84,11 @@ def convert_images(*varargs, **kwargs):
 
             if proc1.returncode:  # ffmpeg error
                 if error:
-                    wx.CallAfter(pub.sendMessage,
-                                 "UPDATE_EVT",
-                                 output='FAILED',
-                                 duration=0,
-                                 status=proc1.wait(),
-                                 )
+                    send_event("UPDATE_EVT",
+                               output='FAILED',
+                               duration=0,
+                               status=proc1.wait(),
+                               )
                     tolog(f"[VIDEOMASS]: Error Exit Status: "
                           f"{proc1.wait()} {error}", logfile
                           )
@@ -94,28 +96,25 @@ def convert_images(*varargs, **kwargs):
                     return error
 
             else:  # ok
-                wx.CallAfter(pub.sendMessage,
-                             "UPDATE_EVT",
-                             output=f' |{prognum}|  {files}  >  {tmpf}\n',
-                             duration=0,
-                             status=0,
-                             )
+                send_event("UPDATE_EVT",
+                           output=f' |{prognum}|  {files}  >  {tmpf}\n',
+                           duration=0,
+                           status=0,
+                           )
         except (OSError, FileNotFoundError) as err:  # cmd not found
-            wx.CallAfter(pub.sendMessage,
-                         "COUNT_EVT",
-                         count=err,
-                         duration=0,
-                         end='ERROR',
-                         )
+            send_event("COUNT_EVT",
+                       count=err,
+                       duration=0,
+                       end='ERROR',
+                       )
             return err
 
     time.sleep(.5)
-    wx.CallAfter(pub.sendMessage,
-                 "COUNT_EVT",
-                 count='',
-                 duration=0,
-                 end='DONE'
-                 )
+    send_event("COUNT_EVT",
+               count='',
+               duration=0,
+               end='DONE'
+               )
     return None
 
 
@@ -133,12 +132,11 @@ def resizing_process(*varargs, **kwargs):
     count1 = (f'\n\nFile resizing...\nSource: Temporary directory\n'
               f'Destination: "{tmpdir}"')
 
-    wx.CallAfter(pub.sendMessage,
-                 "COUNT_EVT",
-                 count=count1,
-                 duration=len(flist),
-                 end='CONTINUE',
-                 )
+    send_event("COUNT_EVT",
+               count=count1,
+               duration=len(flist),
+               end='CONTINUE',
+               )
 
     tmpf = os.path.join(tmpdir, 'TMP_%d.bmp')
     tmpfout = os.path.join(tmpdir, 'IMAGE_%d.bmp')
@@ -162,12 +160,11 @@ def resizing_process(*varargs, **kwargs):
 
         if proc1.returncode:  # ffmpeg error
             if error:
-                wx.CallAfter(pub.sendMessage,
-                             "UPDATE_EVT",
-                             output='FAILED',
-                             duration=0,
-                             status=proc1.wait(),
-                             )
+                send_event("UPDATE_EVT",
+                           output='FAILED',
+                           duration=0,
+                           status=proc1.wait(),
+                           )
                 tolog(f"[VIDEOMASS]: Error Exit Status: "
                       f"{proc1.wait()} {error}", logfile
                       )
@@ -175,31 +172,28 @@ def resizing_process(*varargs, **kwargs):
                 return error
 
         else:  # ok
-            wx.CallAfter(pub.sendMessage,
-                         "UPDATE_EVT",
-                         output='',
-                         duration=0,
-                         status=0,
-                         )
+            send_event("UPDATE_EVT",
+                       output='',
+                       duration=0,
+                       status=0,
+                       )
             tolog(error, logfile)
             time.sleep(1)
 
     except (OSError, FileNotFoundError) as err:  # cmd not found
-        wx.CallAfter(pub.sendMessage,
-                     "COUNT_EVT",
-                     count=err,
-                     duration=0,
-                     end='ERROR',
-                     )
+        send_event("COUNT_EVT",
+                   count=err,
+                   duration=0,
+                   end='ERROR',
+                   )
         return err
 
     time.sleep(.5)
-    wx.CallAfter(pub.sendMessage,
-                 "COUNT_EVT",
-                 count='',
-                 duration=0,
-                 end='DONE'
-                 )
+    send_event("COUNT_EVT",
+               count='',
+               duration=0,
+               end='DONE'
+               )
     return None
 
 
@@ -243,12 +237,11 @@ class SlideshowMaker(Thread):
                                       **self.appdata,
                                       )
             if tmpproc1 is not None or self.stop_work_thread:
-                wx.CallAfter(pub.sendMessage,
-                             "UPDATE_EVT",
-                             output='ERROR',
-                             duration=self.kwa['duration'],
-                             status=1,
-                             )
+                send_event("UPDATE_EVT",
+                           output='ERROR',
+                           duration=self.kwa['duration'],
+                           status=1,
+                           )
                 self.end_process(None)
                 return
 
@@ -261,12 +254,11 @@ class SlideshowMaker(Thread):
                                             )
 
                 if tmpproc2 is not None or self.stop_work_thread:
-                    wx.CallAfter(pub.sendMessage,
-                                 "UPDATE_EVT",
-                                 output='ERROR',
-                                 duration=self.kwa['duration'],
-                                 status=1,
-                                 )
+                    send_event("UPDATE_EVT",
+                               output='ERROR',
+                               duration=self.kwa['duration'],
+                               status=1,
+                               )
                     self.end_process(None)
                     return
 
@@ -284,12 +276,11 @@ class SlideshowMaker(Thread):
                      f'Destination: "{self.destination}"\n')
             log = f'{count}\n\n[COMMAND]:\n{cmd_2}'
 
-            wx.CallAfter(pub.sendMessage,
-                         "COUNT_EVT",
-                         count=count,
-                         duration=self.duration,
-                         end='CONTINUE',
-                         )
+            send_event("COUNT_EVT",
+                       count=count,
+                       duration=self.duration,
+                       end='CONTINUE',
+                       )
             tolog(log, self.logfile)
             time.sleep(1)
 
@@ -297,30 +288,35 @@ class SlideshowMaker(Thread):
                 cmd_2 = shlex.split(cmd_2)
 
             try:
-                with Popen(cmd_2,
+                with Popen(progress_cmd(cmd_2),
+                           stdout=subprocess.PIPE,
                            stderr=subprocess.PIPE,
                            stdin=subprocess.PIPE,
                            bufsize=1,
                            universal_newlines=True,
                            encoding=self.appdata['encoding'],
                            ) as proc2:
-                    for line in proc2.stderr:
-                        wx.CallAfter(pub.sendMessage,
-                                     "UPDATE_EVT",
-                                     output=line,
-                                     duration=self.duration,
-                                     status=0,
-                                     )
+                    pipes = FFmpegPipes(proc2)
+                    for item in pipes:
+                        if isinstance(item, ProgressRecord):
+                            send_event("PROGRESS_EVT",
+                                       progress=item,
+                                       duration=self.duration,
+                                       )
+                        else:
+                            send_event("UPDATE_EVT",
+                                       output=item,
+                                       duration=self.duration,
+                                       status=0,
+                                       )
                         if self.stop_work_thread:
-                            proc2.stdin.write('q')  # stop ffmpeg
-                            out = proc2.communicate()[1]
+                            out = pipes.quit()  # stop ffmpeg
                             proc2.wait()
-                            wx.CallAfter(pub.sendMessage,
-                                         "UPDATE_EVT",
-                                         output='STOP',
-                                         duration=self.kwa['duration'],
-                                         status=1,
-                                         )
+                            send_event("UPDATE_EVT",
+                                       output='STOP',
+                                       duration=self.kwa['duration'],
+                                       status=1,
+                                       )
                             tolog(out, self.logfile)
                             time.sleep(1)
                             self.end_process(None)
@@ -328,12 +324,11 @@ class SlideshowMaker(Thread):
 
                     if proc2.wait():  # error
                         out = proc2.communicate()[1]
-                        wx.CallAfter(pub.sendMessage,
-                                     "UPDATE_EVT",
-                                     output='FAILED',
-                                     duration=self.kwa['duration'],
-                                     status=proc2.wait(),
-                                     )
+                        send_event("UPDATE_EVT",
+                                   output='FAILED',
+                                   duration=self.kwa['duration'],
+                                   status=proc2.wait(),
+                                   )
                         tolog(f"[VIDEOMASS]: Error Exit Status: "
                               f"{proc2.wait()} {out}", self.logfile
                               )
@@ -341,19 +336,17 @@ class SlideshowMaker(Thread):
 
                     else:  # status ok
                         filedone = self.kwa['source']
-                        wx.CallAfter(pub.sendMessage,
-                                     "COUNT_EVT",
-                                     count='',
-                                     duration=self.duration,
-                                     end='DONE'
-                                     )
+                        send_event("COUNT_EVT",
+                                   count='',
+                                   duration=self.duration,
+                                   end='DONE'
+                                   )
             except (OSError, FileNotFoundError) as err:
-                wx.CallAfter(pub.sendMessage,
-                             "COUNT_EVT",
-                             count=err,
-                             duration=0,
-                             end='ERROR',
-                             )
+                send_event("COUNT_EVT",
+                           count=err,
+                           duration=0,
+                           end='ERROR',
+                           )
                 tolog(err, self.logfile)
         self.end_process(filedone)
 
@@ -362,7 +355,7 @@ class SlideshowMaker(Thread):
         The process is finished
         """
         time.sleep(.5)
-        wx.CallAfter(pub.sendMessage, "END_EVT", filetotrash=filedone)
+        send_event("END_EVT", filetotrash=filedone)
 
     def stop(self):
         """
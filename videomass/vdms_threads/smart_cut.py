@@ -0,0 +1,195 @@
+# -*- coding: UTF-8 -*-
+"""
+Name: smart_cut.py
+Porpose: helpers for the smart cut of a time selection
+Compatibility: Python3
+Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
+Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
+license: GPL3
+Rev: Oct.18.2026
+Code checker: flake8, pylint
+
+This file is part of Videomass.
+
+   Videomass is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   Videomass is distributed in the hope that it will be useful,
+   but WITHOUT ANY WARRANTY; without even the implied warranty of
+   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+   GNU General Public License for more details.
+
+   You should have received a copy of the GNU General Public License
+   along with Videomass.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import subprocess
+import shlex
+import platform
+from videomass.vdms_utils.utils import time_to_integer, Popen
+
+# encoders of the partial GOPs for each source video codec
+SMART_ENCODERS = {'h264': 'libx264', 'hevc': 'libx265'}
+
+# bitstream filters which write the parameter sets (SPS/PPS/VPS)
+# in-band, so that each piece is decoded with its own ones
+ANNEXB_FILTERS = {'h264': 'h264_mp4toannexb', 'hevc': 'hevc_mp4toannexb'}
+
+# ffprobe profile names to encoder `-profile:v` values
+PROFILES = {'libx264': {'Baseline': 'baseline',
+                        'Constrained Baseline': 'baseline',
+                        'Main': 'main',
+                        'High': 'high',
+                        'High 10': 'high10',
+                        'High 4:2:2': 'high422',
+                        'High 4:4:4 Predictive': 'high444',
+                        },
+            'libx265': {'Main': 'main',
+                        'Main 10': 'main10',
+                        'Main Still Picture': 'mainstillpicture',
+                        },
+            }
+
+# quality of the re-encoded partial GOPs, visually lossless
+QUALITY = '-crf 16 -preset medium'
+
+# a cut point closer than this to a keyframe is on the keyframe (seconds)
+KEYFRAME_TOLERANCE = 0.001
+
+# shortest stream copied interior worth a smart cut (seconds)
+MIN_COPY_LENGTH = 1.0
+
+# decoded time on each side of a cut point by the output check (seconds)
+CHECK_WINDOW = 2.0
+
+
+def is_stream_copy(args):
+    """
+    Returns True if the FFmpeg `args` string copies the
+    video stream without re-encoding.
+    """
+    tokens = args.split()
+    return any(opt in ('-c:v', '-vcodec', '-codec:v') and val == 'copy'
+               for opt, val in zip(tokens, tokens[1:]))
+# ----------------------------------------------------------------------
+
+
+def cut_range(start_time, end_time):
+    """
+    Converts the `-ss HH:MM:SS.ms` and `-t HH:MM:SS.ms`
+    options of a time selection to a tuple (start, end)
+    in seconds. Returns None if they are not given.
+    """
+    try:
+        start = time_to_integer(start_time.split()[1]) / 1000
+        length = time_to_integer(end_time.split()[1]) / 1000
+    except IndexError:
+        return None
+    if length <= 0:
+        return None
+    return start, start + length
+# ----------------------------------------------------------------------
+
+
+def smart_cut_plan(keyframes, start, end):
+    """
+    Splits the time selection from `start` to `end` seconds
+    at the first and the last keyframe inside it, given the
+    sorted `keyframes` times relative to the beginning of the
+    source. Returns a list of (mode, start, end) tuples where
+    `mode` is 'encode' for the partial GOPs at the cut points
+    and 'copy' for the whole GOPs between them, None if the
+    interior is shorter than MIN_COPY_LENGTH.
+    """
+    inner = [k for k in keyframes
+             if start - KEYFRAME_TOLERANCE <= k <= end + KEYFRAME_TOLERANCE]
+    if len(inner) < 2 or inner[-1] - inner[0] < MIN_COPY_LENGTH:
+        return None
+    first, last = inner[0], inner[-1]
+    plan = []
+    if first - start > KEYFRAME_TOLERANCE:
+        plan.append(('encode', start, first))
+    plan.append(('copy', first, last))
+    if end - last > KEYFRAME_TOLERANCE:
+        plan.append(('encode', last, end))
+    return plan
+# ----------------------------------------------------------------------
+
+
+def encoder_args(stream):
+    """
+    Returns the FFmpeg video options that re-encode the partial
+    GOPs with the codec, profile and pixel format of the source
+    video `stream` (a dict of ffprobe), so that they can be joined
+    to its stream copied GOPs. Returns None if the codec of the
+    stream is not supported.
+    """
+    encoder = SMART_ENCODERS.get(stream.get('codec_name'))
+    if not encoder:
+        return None
+    args = [f'-c:v {encoder}', QUALITY]
+    profile = PROFILES[encoder].get(stream.get('profile'))
+    if profile:
+        args.append(f'-profile:v {profile}')
+    if stream.get('pix_fmt'):
+        args.append(f'-pix_fmt {stream["pix_fmt"]}')
+    return ' '.join(args)
+# ----------------------------------------------------------------------
+
+
+def piece_args(stream):
+    """
+    Returns the FFmpeg output options of the pieces of a smart
+    cut of the video `stream`: Annex B in MPEG-TS, which carries
+    the parameter sets in-band, since those of the re-encoded
+    pieces differ from the ones of the source. Returns None if
+    the codec of the stream is not supported.
+    """
+    bsf = ANNEXB_FILTERS.get(stream.get('codec_name'))
+    if not bsf:
+        return None
+    return f'-bsf:v {bsf} -f mpegts'
+# ----------------------------------------------------------------------
+
+
+def cut_points(plan):
+    """
+    Returns the times (in seconds) of the joins between the
+    pieces of a smart cut `plan`, relative to the beginning
+    of the joined output.
+    """
+    return [start - plan[0][1] for _, start, _ in plan[1:]]
+# ----------------------------------------------------------------------
+
+
+def decode_check(filename, points, cmd='ffmpeg', txtenc='utf-8'):
+    """
+    Decodes the first video stream of `filename` for CHECK_WINDOW
+    seconds around each time of `points`, stopping at the first
+    error (`-xerror`). Returns None if everything is decoded
+    cleanly, otherwise an error message.
+    """
+    for point in points:
+        start = max(0.0, point - CHECK_WINDOW)
+        args = (f'"{cmd}" -nostdin -hide_banner -v error -xerror '
+                f'-ss {start:.6f} -i "{filename}" '
+                f'-t {point + CHECK_WINDOW - start:.6f} '
+                f'-map 0:v:0 -f null -')
+        if not platform.system() == 'Windows':
+            args = shlex.split(args)
+        try:
+            with Popen(args,
+                       stdout=subprocess.DEVNULL,
+                       stderr=subprocess.PIPE,
+                       universal_newlines=True,
+                       encoding=txtenc,
+                       ) as proc:
+                error = proc.communicate()[1]
+        except (OSError, UnicodeDecodeError) as excepterr:
+            return str(excepterr)
+
+        if proc.returncode != 0 or error.strip():
+            return (f'decoding error near {point:.3f} seconds: '
+                    f'{error.strip() or proc.returncode}')
+    return None
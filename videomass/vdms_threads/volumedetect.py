@@ -6,7 +6,7 @@ Compatibility: Python3, wxPython Phoenix
 Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
 Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
 license: GPL3
-Rev: Sep.18.2025
+Rev: Oct.18.2026
 Code checker: flake8, pylint
 
 This file is part of Videomass.
@@ -26,21 +26,51 @@ This file is part of Videomass.
 """
 import os
 from threading import Thread
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import subprocess
 import platform
 import wx
 from pubsub import pub
 from videomass.vdms_utils.utils import Popen
 from videomass.vdms_io.make_filelog import make_log_template, tolog
+from videomass.vdms_io.probe_cache import PROBECACHE
+from videomass.vdms_threads.audio_analysis import (AnalysisParser,
+                                                   AudioStats,
+                                                   analysis_filter,
+                                                   analysis_variant,
+                                                   loudnorm_targets,
+                                                   )
 if not platform.system() == 'Windows':
     import shlex
 
 
+def volume_workers(appdata, nfiles):
+    """
+    Returns the number of concurrent volumedetect processes
+    for `nfiles` files, according to the `volumedetect_jobs`
+    option (0 is auto, i.e. the number of CPUs).
+    """
+    workers = int(appdata.get('volumedetect_jobs', 0))
+    if workers < 1:
+        workers = os.cpu_count() or 1
+    return max(1, min(workers, nfiles))
+# ----------------------------------------------------------------------
+
+
 class VolumeDetectThread(Thread):
     """
     This class represents a separate subprocess thread to get
     audio volume peak level when required for audio normalization
-    process.
+    process. The files are analyzed by a pool of concurrent
+    FFmpeg processes (see `volume_workers`), the progress is
+    shown by the pop-up dialog and the results keep the order
+    of the file list.
+
+    Each file is decoded once by volumedetect, plus astats and
+    loudnorm when the loudness statistics are requested (see
+    `audio_analysis`), and the results are cached along with
+    the probe data of the file.
 
     NOTE: all error handling (including verification of the
     existence of files) is entrusted to ffmpeg, except for the
@@ -50,16 +80,19 @@ class VolumeDetectThread(Thread):
     STOP = ('WARNING: [VIDEOMASS]: STOP command received by signal '
             'event.\nTerminated process ')
 
-    def __init__(self, timeseq, filelist, audiomap):
+    def __init__(self, timeseq, filelist, audiomap, loudnorm=''):
         """
         Replace /dev/null with NUL on Windows.
 
         self.status: None, if nothing error,
                      tuple(str(message), str(info/error/warn)) if errors.
-        self.data: it is a tuple containing the list of audio volume
-                   parameters and the self.status of the output error,
+        self.data: it is a tuple containing the list of AudioStats
+                   records and the self.status of the output error,
                    in the form:
-                   ([[maxvol, medvol], [etc,etc]], None or "str errors")
+                   ([AudioStats, AudioStats, etc], None or "str errors")
+        `loudnorm` is a loudnorm filter whose targets are used
+        for the loudness measurements, which are skipped if it
+        is not given.
         """
         get = wx.GetApp()
         self.appdata = get.appset
@@ -67,6 +100,9 @@ class VolumeDetectThread(Thread):
         self.filelist = filelist
         self.time_seq = timeseq
         self.audiomap = audiomap
+        self.targets = loudnorm_targets(loudnorm) if loudnorm else ''
+        self.variant = analysis_variant(timeseq[0], timeseq[1], audiomap,
+                                        loudnorm)
         self.status = None
         self.data = None
         self.nul = 'NUL' if platform.system() == 'Windows' else '/dev/null'
@@ -83,68 +119,31 @@ class VolumeDetectThread(Thread):
         """
         Audio volume data is getted by the thread's caller using
         the thread.data method (see io_tools).
+        An error stops the analysis of the remaining files.
         NOTE: wx.callafter(pub...) do not send data to pop-up
               dialog, but a empty string that is useful to get
               the end of the process to close of the pop-up
 
         """
-        volume = []
-        for files in self.filelist:
-            cmd = (f'"{self.appdata["ffmpeg_cmd"]}" '
-                   f'{self.appdata["ffmpeg-default-args"]} '
-                   f'{self.appdata["ffmpeg_loglev"]} '
-                   f'{self.time_seq[0]} '
-                   f'-i "{files}" '
-                   f'{self.time_seq[1]} '
-                   f'{self.audiomap} '
-                   f'-af volumedetect -vn -sn -dn -f null '
-                   f'{self.nul}'
-                   )
-            tolog(f'INFO: VIDEOMASS COMMAND: {cmd}',
-                  self.logfile, sep=True, wdate=True)
-
-            if not platform.system() == 'Windows':
-                cmd = shlex.split(cmd)
-            try:
-                with Popen(cmd,
-                           stderr=subprocess.PIPE,
-                           stdin=subprocess.PIPE,
-                           bufsize=1,
-                           universal_newlines=True,
-                           encoding=self.appdata['encoding'],
-                           ) as proc:
-                    meanv, maxv = '', ''
-                    for line in proc.stderr:
-                        if 'max_volume:' in line:
-                            maxv = line.split(':')[1].strip()
-                        if 'mean_volume:' in line:
-                            meanv = line.split(':')[1].strip()
-
-                        if self.stop_work_thread:
-                            proc.stdin.write('q')  # stop ffmpeg
-                            proc.communicate()[1]
-                            out = (VolumeDetectThread.STOP
-                                   + f'with PID {proc.pid}')
-                            tolog(out, self.logfile)
-                            proc.wait()
-                            self.status = 'STOP'
-                            break
-
-                        if proc.wait():
-                            output = proc.communicate()[1]
-                            tolog(f"[FFMPEG] ERROR:\n{output}", self.logfile)
-                            self.status = 'ERROR'
-                            break
-
-                    volume.append((maxv, meanv))
-
-            except (OSError, FileNotFoundError) as err:
-                tolog(f'[VIDEOMASS]: ERROR: {err}', self.logfile)
-                self.status = 'ERROR'
-
-            if self.status:
-                break
-
+        total = len(self.filelist)
+        workers = volume_workers(self.appdata, total)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(self.detect, files)
+                       for files in self.filelist]
+            for done, future in enumerate(as_completed(futures), 1):
+                if future.cancelled():
+                    continue
+                status = future.result()[1]
+                if status and not self.status:
+                    self.status = status
+                    self.stop()
+                    for pending in futures:
+                        pending.cancel()
+                msg = (_("Wait....\nAudio peak analysis: {0}/{1} files.")
+                       .format(done, total))
+                wx.CallAfter(pub.sendMessage, "POPUP_MSG_EVT", msg=msg)
+
+        volume = [] if self.status else [fut.result()[0] for fut in futures]
         self.data = (volume, self.status)
 
         wx.CallAfter(pub.sendMessage,
@@ -153,8 +152,80 @@ class VolumeDetectThread(Thread):
                      )
     # ----------------------------------------------------------------#
 
+    def detect(self, files):
+        """
+        Runs the analysis of `files` in a worker thread of the
+        pool, unless its statistics are cached. Returns a tuple
+        (AudioStats, status), where status is None, 'STOP' or
+        'ERROR'.
+        """
+        if self.stop_work_thread:
+            return AudioStats(), 'STOP'
+        cached = PROBECACHE.get(files, self.variant)
+        record = AudioStats.from_json(cached) if cached else None
+        if record is not None and record.complete(self.targets):
+            tolog(f'INFO: "{files}": statistics found in cache.',
+                  self.logfile, sep=True, wdate=True)
+            return record, None
+
+        cmd = (f'"{self.appdata["ffmpeg_cmd"]}" '
+               f'{self.appdata["ffmpeg-default-args"]} '
+               f'{self.appdata["ffmpeg_loglev"]} '
+               f'{self.time_seq[0]} '
+               f'-i "{files}" '
+               f'{self.time_seq[1]} '
+               f'{self.audiomap} '
+               f'-af {analysis_filter(self.targets)} -vn -sn -dn -f null '
+               f'{self.nul}'
+               )
+        tolog(f'INFO: VIDEOMASS COMMAND: {cmd}',
+              self.logfile, sep=True, wdate=True)
+
+        if not platform.system() == 'Windows':
+            cmd = shlex.split(cmd)
+        parser = AnalysisParser()
+        lines = deque(maxlen=30)  # last lines, logged on error
+        try:
+            with Popen(cmd,
+                       stderr=subprocess.PIPE,
+                       stdin=subprocess.PIPE,
+                       bufsize=1,
+                       universal_newlines=True,
+                       encoding=self.appdata['encoding'],
+                       ) as proc:
+                for line in proc.stderr:
+                    lines.append(line)
+                    parser.feed(line)
+
+                    if self.stop_work_thread:
+                        try:
+                            proc.stdin.write('q')  # stop ffmpeg
+                            proc.communicate()
+                        except (BrokenPipeError, OSError, ValueError):
+                            pass
+                        out = (VolumeDetectThread.STOP
+                               + f'with PID {proc.pid}')
+                        tolog(out, self.logfile)
+                        proc.wait()
+                        return parser.record, 'STOP'
+
+                if proc.wait():
+                    tolog(f'[FFMPEG] ERROR: "{files}":\n{"".join(lines)}',
+                          self.logfile)
+                    return parser.record, 'ERROR'
+
+        except (OSError, FileNotFoundError) as err:
+            tolog(f'[VIDEOMASS]: ERROR: {err}', self.logfile)
+            return parser.record, 'ERROR'
+
+        if parser.record.complete(self.targets):
+            PROBECACHE.put(files, self.variant, parser.record.to_json())
+        return parser.record, None
+    # ----------------------------------------------------------------#
+
     def stop(self):
         """
-        Sets the stop work thread to terminate the process
+        Sets the stop work thread to terminate all the
+        running processes and skip the pending files.
         """
         self.stop_work_thread = True
@@ -0,0 +1,154 @@
+# -*- coding: UTF-8 -*-
+"""
+Name: waveform.py
+Porpose: decodes the audio waveform peaks of the timeline
+Compatibility: Python3, wxPython4 Phoenix
+Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
+Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
+license: GPL3
+Rev: Oct.18.2026
+Code checker: flake8, pylint
+
+This file is part of Videomass.
+
+   Videomass is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   Videomass is distributed in the hope that it will be useful,
+   but WITHOUT ANY WARRANTY; without even the implied warranty of
+   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+   GNU General Public License for more details.
+
+   You should have received a copy of the GNU General Public License
+   along with Videomass.  If not, see <http://www.gnu.org/licenses/>.
+"""
+from threading import Thread
+import subprocess
+import wx
+from pubsub import pub
+from videomass.vdms_utils.utils import Popen
+from videomass.vdms_utils.peak_pyramid import (PeakPyramid,
+                                               block_peaks,
+                                               BLOCK,
+                                               SAMPLE_RATE,
+                                               SAMPLE_SIZE,
+                                               )
+from videomass.vdms_io.peak_cache import PEAKCACHE
+
+# blocks of samples read from the pipe at once
+READ_BLOCKS = 1024
+
+
+def pcm_cmd(ffmpeg_cmd, filename, stream='0:a:0'):
+    """
+    Returns the FFmpeg command (list of arguments) that decodes
+    the audio `stream` of `filename` to mono PCM on stdout.
+    """
+    return [ffmpeg_cmd, '-nostdin', '-hide_banner', '-v', 'error',
+            '-i', filename, '-map', stream, '-vn', '-sn', '-dn',
+            '-ac', '1', '-ar', str(SAMPLE_RATE), '-f', 's16le', '-']
+# ----------------------------------------------------------------------
+
+
+class WaveformThread(Thread):
+    """
+    Makes the PeakPyramid of the first audio stream of a file,
+    reading it from PEAKCACHE or decoding the audio once: the
+    PCM is streamed from FFmpeg and reduced block by block, so
+    that it is never held in memory as a whole.
+    The result is sent to the GUI by the "WAVEFORM_EVT" message
+    with the `filename`, the `pyramid` (None on error) and the
+    `error` message (None on success) arguments.
+
+    Usage:
+        >>> pub.subscribe(self.on_waveform, "WAVEFORM_EVT")
+        >>> thread = WaveformThread(filename)
+    """
+    VARIANT = f'0:a:0 mono {SAMPLE_RATE} {BLOCK}'
+
+    def __init__(self, filename):
+        """
+        The thread starts immediately.
+        """
+        self.appdata = wx.GetApp().appset
+        self.filename = filename
+        self.stop_work_thread = False
+        self.proc = None
+        Thread.__init__(self, daemon=True)
+        self.start()
+
+    def run(self):
+        """
+        Looks up the cache, decodes on a miss.
+        """
+        key = PEAKCACHE.key(self.filename, WaveformThread.VARIANT)
+        data = PEAKCACHE.read(key)
+        pyramid, error = None, None
+        if data is not None:
+            try:
+                pyramid = PeakPyramid.from_bytes(data)
+            except ValueError:
+                pyramid = None
+        if pyramid is None:
+            pyramid, error = self.decode()
+            if pyramid is not None:
+                PEAKCACHE.write(key, pyramid.to_bytes())
+
+        wx.CallAfter(pub.sendMessage,
+                     "WAVEFORM_EVT",
+                     filename=self.filename,
+                     pyramid=pyramid,
+                     error=error,
+                     )
+
+    def decode(self):
+        """
+        Returns a tuple (PeakPyramid, None) on success,
+        (None, error message) otherwise.
+        """
+        blocksize = BLOCK * SAMPLE_SIZE
+        mins, maxs, rest, errors = [], [], b'', []
+        cmd = pcm_cmd(self.appdata['ffmpeg_cmd'], self.filename)
+        try:
+            with Popen(cmd,
+                       stdout=subprocess.PIPE,
+                       stderr=subprocess.PIPE,
+                       ) as self.proc:
+                # drains stderr so that it can never block FFmpeg
+                drain = Thread(target=errors.extend,
+                               args=(self.proc.stderr,), daemon=True)
+                drain.start()
+                for chunk in iter(lambda: self.proc.stdout.read(
+                        blocksize * READ_BLOCKS), b''):
+                    if self.stop_work_thread:
+                        self.proc.kill()
+                        return None, 'STOP'
+                    chunk = rest + chunk
+                    whole = len(chunk) - len(chunk) % blocksize
+                    lows, highs = block_peaks(chunk[:whole])
+                    mins.extend(lows)
+                    maxs.extend(highs)
+                    rest = chunk[whole:]
+                status = self.proc.wait()
+                drain.join()
+                if status:
+                    errors = b''.join(errors).decode('utf-8', 'replace')
+                    return None, errors.strip() or f'exit status {status}'
+
+        except (OSError, FileNotFoundError) as err:
+            return None, str(err)
+
+        if len(rest) >= SAMPLE_SIZE:  # last partial block
+            rest = rest[:len(rest) - len(rest) % SAMPLE_SIZE]
+            lows, highs = block_peaks(rest, len(rest) // SAMPLE_SIZE)
+            mins.extend(lows)
+            maxs.extend(highs)
+        return PeakPyramid(mins, maxs), None
+
+    def stop(self):
+        """
+        Stops the decoding, if any.
+        """
+        self.stop_work_thread = True
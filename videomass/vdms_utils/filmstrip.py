@@ -0,0 +1,153 @@
+# -*- coding: UTF-8 -*-
+"""
+Name: filmstrip.py
+Porpose: thumbnails of a video source laid out along the timeline
+Compatibility: Python3
+Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
+Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
+license: GPL3
+Rev: Oct.18.2026
+Code checker: flake8, pylint
+
+This file is part of Videomass.
+
+   Videomass is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   Videomass is distributed in the hope that it will be useful,
+   but WITHOUT ANY WARRANTY; without even the implied warranty of
+   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+   GNU General Public License for more details.
+
+   You should have received a copy of the GNU General Public License
+   along with Videomass.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import re
+import math
+import struct
+
+# magic, version, thumbnail width and height, slots, thumbnails stored
+HEADER = struct.Struct('<4sHIIII')
+SLOT = struct.Struct('<I')
+MAGIC = b'VMFS'
+VERSION = 1
+
+# presentation time of a frame in the log lines of the `showinfo` filter
+SHOWINFO_TIME = re.compile(rb'showinfo.*\bpts_time:\s*(-?[0-9.]+)')
+
+
+def strip_geometry(length, height, aspect):
+    """
+    Returns a tuple (width, slots) with the width of the
+    thumbnails of `height` pixels of a video with `aspect`
+    display ratio (float), and the number of thumbnails
+    needed to fill `length` pixels.
+    """
+    width = max(1, int(round(height * aspect)))
+    width += width % 2  # even sizes for the scale filter
+    return width, max(1, math.ceil(length / width))
+# ----------------------------------------------------------------------
+
+
+def showinfo_time(line):
+    """
+    Returns the `pts_time` (float) of a log line (bytes)
+    of the `showinfo` filter, None for any other line.
+    """
+    found = SHOWINFO_TIME.search(line)
+    if not found:
+        return None
+    try:
+        return float(found.group(1))
+    except ValueError:
+        return None
+# ----------------------------------------------------------------------
+
+
+class Filmstrip:
+    """
+    Evenly spaced thumbnails of a video source: the duration
+    is divided in `slots` of the same length and each slot
+    gets the raw RGB thumbnail (see `wx.Bitmap.FromBuffer`)
+    of a keyframe inside it, if any. Slots are filled in any
+    order, as the thumbnails are decoded.
+
+    Usage:
+        >>> strip = Filmstrip(142, 80, 7)
+        >>> strip.add(strip.slot(pts_time, duration), data)
+        >>> data = strip.to_bytes()
+        >>> strip = Filmstrip.from_bytes(data)
+    """
+    def __init__(self, width, height, slots):
+        """
+        `self.thumbs` maps slot numbers to thumbnails.
+        """
+        self.width = width
+        self.height = height
+        self.slots = slots
+        self.thumbs = {}
+
+    @property
+    def framesize(self):
+        """
+        Size in bytes of a thumbnail.
+        """
+        return self.width * self.height * 3
+
+    def slot(self, seconds, duration):
+        """
+        Returns the slot of the time position `seconds` of
+        a source lasting `duration` seconds.
+        """
+        if duration <= 0:
+            return 0
+        return min(self.slots - 1, max(0, int(seconds / duration
+                                              * self.slots)))
+
+    def add(self, slot, data):
+        """
+        Stores a thumbnail, the first one of each slot is kept.
+        Returns True if the slot was empty.
+        """
+        if slot in self.thumbs or len(data) != self.framesize:
+            return False
+        self.thumbs[slot] = data
+        return True
+
+    def to_bytes(self):
+        """
+        Serializes the thumbnails, see `from_bytes`.
+        """
+        data = [HEADER.pack(MAGIC, VERSION, self.width, self.height,
+                            self.slots, len(self.thumbs))]
+        for slot in sorted(self.thumbs):
+            data.append(SLOT.pack(slot))
+            data.append(self.thumbs[slot])
+        return b''.join(data)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Makes a filmstrip out of the `to_bytes` output.
+        Raises ValueError.
+        """
+        try:
+            (magic, version, width, height,
+             slots, count) = HEADER.unpack_from(data)
+        except struct.error as err:
+            raise ValueError(err) from err
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('not a filmstrip file')
+
+        strip = cls(width, height, slots)
+        offset = HEADER.size
+        for _ in range(count):
+            end = offset + SLOT.size + strip.framesize
+            if end > len(data):
+                raise ValueError('truncated filmstrip file')
+            strip.thumbs[SLOT.unpack_from(data, offset)[0]] = data[
+                offset + SLOT.size:end]
+            offset = end
+        return strip
@@ -0,0 +1,166 @@
+# -*- coding: UTF-8 -*-
+"""
+Name: keyframe_index.py
+Porpose: keyframe times and GOP statistics of a video stream
+Compatibility: Python3
+Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
+Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
+license: GPL3
+Rev: Oct.18.2026
+Code checker: flake8, pylint
+
+This file is part of Videomass.
+
+   Videomass is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   Videomass is distributed in the hope that it will be useful,
+   but WITHOUT ANY WARRANTY; without even the implied warranty of
+   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+   GNU General Public License for more details.
+
+   You should have received a copy of the GNU General Public License
+   along with Videomass.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import json
+from bisect import bisect_left, bisect_right
+
+
+class KeyframeIndex:
+    """
+    Keyframe index of a video stream, made from the packet
+    list of ffprobe (`-show_entries packet=pts_time,flags`),
+    without decoding. It holds the sorted presentation times
+    (in seconds) of the keyframes and, for each of them, the
+    number of packets of its GOP (i.e. up to the next keyframe
+    in decoding order) and whether the GOP is closed: an open
+    GOP (e.g. HEVC CRA) has leading pictures, decoded after the
+    keyframe but presented before it, which can reference the
+    previous GOP, so it is not a safe point to start decoding.
+
+    Usage:
+        >>> index = KeyframeIndex.from_packets(csv_output)
+        >>> index.before(62.3)  # stream copy safe start point
+        >>> index.nearest(62.3)
+        >>> index.stats()['mean']
+    """
+    def __init__(self, times, gops=None, closed=None):
+        """
+        `times` is a list of float, `gops` a list of int of
+        the same length (packets of each GOP) and `closed` a
+        list of bool (closed GOPs), both optional.
+        """
+        items = sorted(zip(times, gops or [0] * len(times),
+                           closed or [True] * len(times)))
+        self.times = [pts for pts, _, _ in items]
+        self.gops = [num for _, num, _ in items]
+        self.closed = [bool(flag) for _, _, flag in items]
+
+    @classmethod
+    def from_packets(cls, output):
+        """
+        Parses the csv lines `pts_time,flags` written by
+        ffprobe, in decoding order. Packets before the first
+        keyframe are not counted. A GOP is open if any of its
+        packets is presented before its keyframe.
+        """
+        times, gops, closed = [], [], []
+        for line in output.splitlines():
+            pts, _, flags = line.strip().partition(',')
+            try:
+                pts = float(pts)
+            except ValueError:
+                pts = None
+            if 'K' in flags and pts is not None:
+                times.append(pts)
+                gops.append(1)
+                closed.append(True)
+            elif gops and line.strip():
+                gops[-1] += 1
+                if pts is not None and pts < times[-1]:
+                    closed[-1] = False
+        return cls(times, gops, closed)
+
+    @classmethod
+    def from_json(cls, text):
+        """
+        Makes an index out of the string of `to_json`.
+        Raises ValueError on malformed data.
+        """
+        try:
+            data = json.loads(text)
+            return cls(data['times'], data['gops'], data['closed'])
+        except (KeyError, TypeError) as err:
+            raise ValueError(f'malformed keyframe index: {err}') from err
+
+    def to_json(self):
+        """
+        Returns the index as a JSON string.
+        """
+        return json.dumps({'times': self.times, 'gops': self.gops,
+                           'closed': self.closed})
+
+    def closed_times(self):
+        """
+        Returns the times of the keyframes of closed GOPs,
+        where decoding can start without the previous GOP.
+        """
+        return [pts for pts, flag in zip(self.times, self.closed) if flag]
+
+    def __len__(self):
+        return len(self.times)
+
+    def before(self, seconds):
+        """
+        Returns the time of the last keyframe at or before
+        `seconds`, i.e. where a stream copy starting from
+        `seconds` actually begins. None if there is not.
+        """
+        idx = bisect_right(self.times, seconds)
+        return self.times[idx - 1] if idx else None
+
+    def after(self, seconds):
+        """
+        Returns the time of the first keyframe at or after
+        `seconds`, None if there is not.
+        """
+        idx = bisect_left(self.times, seconds)
+        return self.times[idx] if idx < len(self.times) else None
+
+    def nearest(self, seconds):
+        """
+        Returns the time of the keyframe closest to `seconds`,
+        None if the index is empty.
+        """
+        near = [pts for pts in (self.before(seconds), self.after(seconds))
+                if pts is not None]
+        if not near:
+            return None
+        return min(near, key=lambda pts: abs(pts - seconds))
+
+    def between(self, start, end):
+        """
+        Returns the times of the keyframes from `start` to
+        `end` seconds (both included).
+        """
+        return self.times[bisect_left(self.times, start):
+                          bisect_right(self.times, end)]
+
+    def stats(self):
+        """
+        Returns a dict with the GOP statistics: number of
+        `keyframes`, `min`, `max` and `mean` distance between
+        keyframes in seconds (0.0 with less than two keyframes)
+        and the `mean_packets` per GOP.
+        """
+        gaps = [b - a for a, b in zip(self.times, self.times[1:])]
+        counted = [num for num in self.gops if num]
+        return {'keyframes': len(self.times),
+                'min': min(gaps) if gaps else 0.0,
+                'max': max(gaps) if gaps else 0.0,
+                'mean': sum(gaps) / len(gaps) if gaps else 0.0,
+                'mean_packets': (sum(counted) / len(counted)
+                                 if counted else 0.0),
+                }
@@ -0,0 +1,62 @@
+# -*- coding: UTF-8 -*-
+"""
+Name: list_model.py
+Porpose: row operations on the columnar model of the file list
+Compatibility: Python3
+Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
+Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
+license: GPL3
+Rev: Oct.18.2026
+Code checker: flake8, pylint
+
+This file is part of Videomass.
+
+   Videomass is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   Videomass is distributed in the hope that it will be useful,
+   but WITHOUT ANY WARRANTY; without even the implied warranty of
+   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+   GNU General Public License for more details.
+
+   You should have received a copy of the GNU General Public License
+   along with Videomass.  If not, see <http://www.gnu.org/licenses/>.
+"""
+from array import array
+
+
+def sort_order(column, descending=False):
+    """
+    Returns the row indexes of a column of the list model,
+    sorted by its typed values (e.g. durations in milliseconds,
+    sizes in bytes). Rows with equal values keep their order.
+    """
+    return sorted(range(len(column)), key=column.__getitem__,
+                  reverse=descending)
+# ----------------------------------------------------------------------
+
+
+def remaining_rows(count, indexes):
+    """
+    Returns the row indexes out of `count` rows which
+    are not in `indexes`, i.e. those left by removing them.
+    """
+    drop = set(indexes)
+    return [idx for idx in range(count) if idx not in drop]
+# ----------------------------------------------------------------------
+
+
+def reorder_columns(columns, order):
+    """
+    Rearranges in place the `columns` of the list model, lists
+    or arrays of the same length, according to `order`, a list
+    of row indexes: rows not listed are removed.
+    """
+    for column in columns:
+        if isinstance(column, array):
+            column[:] = array(column.typecode, (column[idx]
+                                                for idx in order))
+        else:
+            column[:] = [column[idx] for idx in order]
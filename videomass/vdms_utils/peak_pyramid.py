@@ -0,0 +1,202 @@
+# -*- coding: UTF-8 -*-
+"""
+Name: peak_pyramid.py
+Porpose: multi-resolution min/max peaks of an audio waveform
+Compatibility: Python3
+Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
+Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
+license: GPL3
+Rev: Oct.18.2026
+Code checker: flake8, pylint
+
+This file is part of Videomass.
+
+   Videomass is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   Videomass is distributed in the hope that it will be useful,
+   but WITHOUT ANY WARRANTY; without even the implied warranty of
+   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+   GNU General Public License for more details.
+
+   You should have received a copy of the GNU General Public License
+   along with Videomass.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import sys
+import struct
+from array import array
+
+# PCM decoded for the waveform: mono, signed 16 bit little-endian
+SAMPLE_RATE = 8000
+SAMPLE_SIZE = 2
+# samples reduced to a min/max pair by the base level
+BLOCK = 256
+
+# magic, version, sample rate, block, bins of the base level
+HEADER = struct.Struct('<4sHIII')
+MAGIC = b'VMPK'
+VERSION = 1
+
+
+def block_peaks(data, block=BLOCK):
+    """
+    Returns two lists with the minimum and the maximum of
+    each `block` samples of the PCM `data` (bytes), whose
+    length must be a multiple of block * SAMPLE_SIZE.
+    NumPy is used if available, it is imported here and not
+    at module level to keep it off the startup path.
+    """
+    try:
+        import numpy
+    except ModuleNotFoundError:
+        numpy = None
+    if numpy is not None:
+        samples = numpy.frombuffer(data, dtype='<i2').reshape(-1, block)
+        return samples.min(axis=1).tolist(), samples.max(axis=1).tolist()
+
+    samples = array('h', data)
+    if sys.byteorder == 'big':
+        samples.byteswap()
+    mins, maxs = [], []
+    for idx in range(0, len(samples), block):
+        chunk = samples[idx:idx + block]
+        mins.append(min(chunk))
+        maxs.append(max(chunk))
+    return mins, maxs
+# ----------------------------------------------------------------------
+
+
+def halve(mins, maxs):
+    """
+    Returns the next level of a pyramid, merging the
+    pairs of bins of the `mins` and `maxs` arrays.
+    """
+    odd = len(mins) % 2
+    nmins = array('h', map(min, mins[0::2], mins[1::2]))
+    nmaxs = array('h', map(max, maxs[0::2], maxs[1::2]))
+    if odd:
+        nmins.append(mins[-1])
+        nmaxs.append(maxs[-1])
+    return nmins, nmaxs
+# ----------------------------------------------------------------------
+
+
+class PeakPyramid:
+    """
+    Waveform of an audio stream as a pyramid of min/max peaks.
+    The base level has a bin for each `block` samples, each
+    next level halves the bins of the previous one, so that
+    any time range can be drawn at any width reading from
+    one to two bins per pixel, without decoding again.
+
+    Usage:
+        >>> pyramid = PeakPyramid(mins, maxs)
+        >>> for low, high in pyramid.peaks(900, 0.0, 60.0):
+        >>>     ...  # draw a column
+        >>> data = pyramid.to_bytes()
+        >>> pyramid = PeakPyramid.from_bytes(data)
+    """
+    def __init__(self, mins, maxs, rate=SAMPLE_RATE, block=BLOCK):
+        """
+        `mins` and `maxs` are the sequences of the base
+        level, see `block_peaks`.
+        """
+        self.rate = rate
+        self.block = block
+        self.levels = [(array('h', mins), array('h', maxs))]
+        while len(self.levels[-1][0]) > 1:
+            self.levels.append(halve(*self.levels[-1]))
+
+    @property
+    def bins(self):
+        """
+        Number of bins of the base level.
+        """
+        return len(self.levels[0][0])
+
+    @property
+    def duration(self):
+        """
+        Duration of the waveform in seconds.
+        """
+        return self.bins * self.block / self.rate
+
+    def peaks(self, width, start=0.0, end=None):
+        """
+        Returns `width` tuples (min, max) in the range -1.0,
+        1.0, one for each pixel column of the time range from
+        `start` to `end` seconds (default up to the end).
+        Columns beyond the end of the waveform are (0.0, 0.0).
+        """
+        if end is None:
+            end = self.duration
+        if width < 1 or end <= start or not self.bins:
+            return []
+        binsec = self.block / self.rate
+        first = start / binsec
+        step = (end - start) / binsec / width  # base bins per column
+        level = 0
+        while (level + 1 < len(self.levels)
+               and 2 ** (level + 1) <= step):
+            level += 1
+        mins, maxs = self.levels[level]
+        scale = 2 ** level
+        columns = []
+        for col in range(width):
+            low = int((first + col * step) / scale)
+            high = max(low + 1, int((first + (col + 1) * step) / scale))
+            if low >= len(mins) or low < 0:
+                columns.append((0.0, 0.0))
+                continue
+            columns.append((min(mins[low:high]) / 32768,
+                            max(maxs[low:high]) / 32768))
+        return columns
+
+    def to_bytes(self):
+        """
+        Serializes all the levels, see `from_bytes`.
+        """
+        data = [HEADER.pack(MAGIC, VERSION, self.rate, self.block,
+                            self.bins)]
+        for mins, maxs in self.levels:
+            for values in (mins, maxs):
+                if sys.byteorder == 'big':
+                    values = array('h', values)
+                    values.byteswap()
+                data.append(values.tobytes())
+        return b''.join(data)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Makes a pyramid out of the `to_bytes` output, the
+        levels are read as they are. Raises ValueError.
+        """
+        try:
+            magic, version, rate, block, bins = HEADER.unpack_from(data)
+        except struct.error as err:
+            raise ValueError(err) from err
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('not a waveform peaks file')
+
+        pyramid = cls.__new__(cls)
+        pyramid.rate, pyramid.block, pyramid.levels = rate, block, []
+        offset = HEADER.size
+        while True:
+            size = bins * SAMPLE_SIZE
+            if offset + 2 * size > len(data):
+                raise ValueError('truncated waveform peaks file')
+            level = []
+            for _ in range(2):
+                values = array('h', data[offset:offset + size])
+                if sys.byteorder == 'big':
+                    values.byteswap()
+                level.append(values)
+                offset += size
+            pyramid.levels.append(tuple(level))
+            if bins <= 1:
+                break
+            bins = (bins + 1) // 2
+        return pyramid
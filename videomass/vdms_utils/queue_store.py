@@ -0,0 +1,167 @@
+# -*- coding: UTF-8 -*-
+"""
+Name: queue_store.py
+Porpose: indexed and incrementally saved store of the queue items
+Compatibility: Python3
+Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
+Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
+license: GPL3
+Rev: Oct.18.2026
+Code checker: flake8, pylint
+
+This file is part of Videomass.
+
+   Videomass is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   Videomass is distributed in the hope that it will be useful,
+   but WITHOUT ANY WARRANTY; without even the implied warranty of
+   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+   GNU General Public License for more details.
+
+   You should have received a copy of the GNU General Public License
+   along with Videomass.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import os
+import json
+
+
+class QueueStore:
+    """
+    Keeps the queue items in the `items` list, indexed by
+    their 'destination' key (which is unique in a queue), and
+    saves them incrementally to a JSON lines file: adding an
+    item only appends a line, while the whole file is rewritten
+    (compacted) when it contains too many replaced items or
+    after changes made directly on `items` (see `save`).
+    The last line with a given destination wins on loading.
+    Queue files of older versions (JSON array) are loaded too.
+
+    Usage:
+        >>> store = QueueStore('/path/to/queue.backup')
+        >>> store.load()
+        >>> store.put(item)  # True if it replaces an item
+        >>> store.items.pop(0)
+        >>> store.save()
+    """
+    def __init__(self, filename):
+        """
+        `items` is never replaced by another list object, so
+        that it can be shared with the callers.
+        """
+        self.filename = filename
+        self.items = []
+        self.index = {}  # destination -> position in `items`
+        self.lines = 0  # lines of the file
+
+    def reindex(self):
+        """
+        Rebuilds the destination index.
+        """
+        self.index = {item['destination']: pos for pos, item
+                      in enumerate(self.items)}
+
+    def find(self, destination):
+        """
+        Returns the position of the item with the given
+        `destination`, None if there is not.
+        """
+        pos = self.index.get(destination)
+        if pos is None or pos >= len(self.items) or (
+                self.items[pos]['destination'] != destination):
+            self.reindex()  # `items` changed by the caller
+            pos = self.index.get(destination)
+        return pos
+
+    def exists(self):
+        """
+        True if the queue file exists.
+        """
+        return os.path.exists(self.filename)
+
+    def load(self):
+        """
+        Loads the items of the queue file, replacing the
+        current ones. Truncated or invalid lines are skipped.
+        """
+        self.items.clear()
+        self.lines = 0
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as fln:
+                text = fln.read()
+        except OSError:
+            text = ''
+
+        if text.lstrip().startswith('['):  # older versions
+            try:
+                records = json.loads(text)
+            except ValueError:
+                records = []
+        else:
+            records = []
+            for line in text.splitlines():
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+
+        self.index = {}
+        for item in records:
+            if not isinstance(item, dict) or 'destination' not in item:
+                continue
+            self.lines += 1
+            pos = self.index.get(item['destination'])
+            if pos is None:
+                self.index[item['destination']] = len(self.items)
+                self.items.append(item)
+            else:
+                self.items[pos] = item
+        return self.items
+
+    def put(self, item):
+        """
+        Adds `item`, or replaces the item with the same
+        destination keeping its position. Returns True if
+        an item has been replaced.
+        """
+        pos = self.find(item['destination'])
+        if pos is None:
+            self.index[item['destination']] = len(self.items)
+            self.items.append(item)
+        else:
+            self.items[pos] = item
+
+        if self.lines > 2 * len(self.items) + 100:
+            self.save()
+        else:
+            with open(self.filename, 'a', encoding='utf-8') as fln:
+                fln.write(json.dumps(item, ensure_ascii=False) + '\n')
+            self.lines += 1
+        return pos is not None
+
+    def save(self):
+        """
+        Rewrites the whole queue file atomically, e.g.
+        after items have been edited or removed.
+        """
+        self.reindex()
+        tmpfile = f'{self.filename}.tmp'
+        with open(tmpfile, 'w', encoding='utf-8') as fln:
+            for item in self.items:
+                fln.write(json.dumps(item, ensure_ascii=False) + '\n')
+        os.replace(tmpfile, self.filename)
+        self.lines = len(self.items)
+
+    def clear(self):
+        """
+        Removes all the items and the queue file.
+        """
+        self.items.clear()
+        self.index.clear()
+        self.lines = 0
+        try:
+            os.remove(self.filename)
+        except OSError:
+            pass
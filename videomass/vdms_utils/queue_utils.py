@@ -6,7 +6,7 @@ Compatibility: Python3, wxPython Phoenix
 Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
 Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
 license: GPL3
-Rev: Mar.23.2024
+Rev: Oct.18.2026
 Code checker: flake8, pylint .
 
 This file is part of Videomass.
@@ -32,14 +32,17 @@ from videomass.vdms_dialogs.singlechoicedlg import SingleChoice
 
 def write_json_file_queue(data, queuefile=None):
     """
-    Write queue json file
+    Write queue json file. The file is replaced atomically,
+    so that a crash never leaves a truncated queue file.
     """
     if not queuefile:
         get = wx.GetApp()
         appdata = get.appset
         queuefile = os.path.join(appdata["confdir"], 'queue.backup')
-    with open(queuefile, 'w', encoding='utf-8') as outfile:
+    tmpfile = f'{queuefile}.tmp'
+    with open(tmpfile, 'w', encoding='utf-8') as outfile:
         json.dump(data, outfile, ensure_ascii=False, indent=4)
+    os.replace(tmpfile, queuefile)
 # --------------------------------------------------------------------
 
 
@@ -85,13 +88,11 @@ def load_json_file_queue(newincoming=None):
                               None
                               )
                 return None
-    occurences = []
     msg = (_('ERROR: invalid data found loading queue file.\n'
              '«{0}»\n\nCannot contain multiple occurrences '
              'in `destination` keys value.').format(newincoming))
-    for item in newdata:
-        occurences.append(item['destination'])
-    if any(occurences.count(x) > 1 for x in occurences):
+    occurences = {item['destination'] for item in newdata}
+    if len(occurences) < len(newdata):
         wx.MessageBox(msg, _('Videomass - Error!'),
                       wx.STAY_ON_TOP | wx.ICON_ERROR | wx.OK, None)
         return None
@@ -105,16 +106,13 @@ def extend_data_queue(parent, currentqueue: list, newqueue: list) -> list:
     the `currentqueue` list while maintaining the same ID.
     The result varies based on the index of a specific
     selection given by the `selected` object.
+    Occurrences are found by sets of destinations, so that
+    the cost is linear in the size of both queues.
     """
-    indx_orig = []
-    indx_new = []
-    for indx1, olditem in enumerate(currentqueue):
-        for indx2, newitem in enumerate(newqueue):
-            if olditem['destination'] == newitem['destination']:
-                indx_orig.append(indx1)
-                indx_new.append(indx2)
-
-    if indx_orig and indx_new:
+    dest_orig = {item['destination'] for item in currentqueue}
+    dest_new = {item['destination'] for item in newqueue}
+
+    if not dest_orig.isdisjoint(dest_new):
         caption = _('Videomass - Add Items to Queue')
         message = (_('Multiple items with identical names and destination '
                      'paths cannot coexist.\nPlease choose one of the '
@@ -131,15 +129,12 @@ def extend_data_queue(parent, currentqueue: list, newqueue: list) -> list:
                 selected = dlg.getvalue()
 
         if selected == 0:
-            indx_orig.sort(reverse=True)  # IMPORTANT before iterate
-            for idx in indx_orig:
-                del currentqueue[idx]
+            currentqueue[:] = [item for item in currentqueue
+                               if item['destination'] not in dest_new]
             currentqueue.extend(newqueue)
         elif selected == 1:
-            indx_new.sort(reverse=True)  # IMPORTANT before iterate
-            for idx in indx_new:
-                del newqueue[idx]
-            currentqueue.extend(newqueue)
+            currentqueue.extend([item for item in newqueue
+                                 if item['destination'] not in dest_orig])
         elif selected == 2:
             currentqueue.clear()
             currentqueue.extend(newqueue)
@@ -6,7 +6,7 @@ Compatibility: Python3, wxPython Phoenix
 Author: Gianluca Pernigotto <jeanlucperni@gmail.com>
 Copyleft - 2025 Gianluca Pernigotto <jeanlucperni@gmail.com>
 license: GPL3
-Rev: Aug.20.2025
+Rev: Oct.18.2026
 Code checker: flake8, pylint .
 
 This file is part of Videomass.
@@ -31,6 +31,16 @@ import shutil
 import os
 import glob
 import math
+import hashlib
+from threading import Thread
+
+# sampled blocks of `sampled_digest`: size of each block and
+# number of blocks evenly spaced between the head and the tail
+FINGERPRINT_BLOCK = 64 * 1024
+FINGERPRINT_SAMPLES = 8
+
+# key under which `DigestThread` stores the full content digests
+DIGEST_VARIANT = 'content-digest'
 
 
 class Popen(subprocess.Popen):
@@ -105,7 +115,14 @@ def get_volume_data(filename, detect: list,
     syntax. Get 'PEAK' or 'RMS', default is 'PEAK'. It also
     supports audio map indexing if the audio stream itself is
     contained within a video.
-    """
+    If `detect` is an AudioStats record (see `audio_analysis`)
+    with the loudness statistics, the volumedata object also
+    includes the RMS level (dBFS), the integrated loudness
+    (LUFS) and the loudness range (LU).
+    """
+    stats = None
+    if hasattr(detect, 'volumedetect'):
+        stats, detect = detect, detect.volumedetect()
     volumedata = []
     volumedata.append(filename)
     if target == 'PEAK':
@@ -138,6 +155,11 @@ def get_volume_data(filename, detect: list,
             volume = f'-filter:a:{audiomap} volume={-offset:f}dB'
         volumedata.append(volume)
 
+    if stats is not None and stats.loudness:
+        volumedata.append(stats.astats.get('RMS level dB', ''))
+        volumedata.append(stats.loudness.get('input_i', ''))
+        volumedata.append(stats.loudness.get('input_lra', ''))
+
     return tuple(volumedata)
 # ------------------------------------------------------------------------
 
@@ -586,3 +608,133 @@ def detect_binaries(name, extradir=None):
         if os.path.isfile(execpath):
             return 'provided', execpath
     return 'not installed', None
+# ------------------------------------------------------------------#
+
+
+def read_block(fdesc, size, offset):
+    """
+    Reads `size` bytes at `offset` of the open file descriptor
+    `fdesc`, using `os.pread` where available (it does not
+    move the file position, so it is safe in threads).
+    """
+    if hasattr(os, 'pread'):
+        return os.pread(fdesc, size, offset)
+    os.lseek(fdesc, offset, os.SEEK_SET)
+    return os.read(fdesc, size)
+# ------------------------------------------------------------------#
+
+
+def sampled_digest(filename, samples=FINGERPRINT_SAMPLES,
+                   blocksize=FINGERPRINT_BLOCK):
+    """
+    Returns a BLAKE2 digest of the size and of sampled blocks
+    of `filename`: the head, the tail and `samples` blocks
+    evenly spaced between them. It reads at most
+    (samples + 2) * blocksize bytes whatever the file size,
+    files smaller than that are read in full. Raises OSError.
+    """
+    fdesc = os.open(filename, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        size = os.fstat(fdesc).st_size
+        digest = hashlib.blake2b(str(size).encode(), digest_size=16)
+        if size <= (samples + 2) * blocksize:
+            offsets = range(0, size, blocksize)
+        else:
+            step = (size - blocksize) / (samples + 1)
+            offsets = [round(step * num) for num in range(samples + 2)]
+        for offset in offsets:
+            digest.update(read_block(fdesc, blocksize, offset))
+    finally:
+        os.close(fdesc)
+    return digest.hexdigest()
+# ------------------------------------------------------------------#
+
+
+def fingerprint(filename, samples=FINGERPRINT_SAMPLES,
+                blocksize=FINGERPRINT_BLOCK):
+    """
+    Returns a cheap identity of `filename` for cache keys,
+    combining size, modification time, inode and the
+    `sampled_digest` of the content, so that a file which is
+    replaced or modified in place gets a new fingerprint even
+    if its size and time are unchanged. Raises OSError.
+    """
+    stat = os.stat(filename)
+    digest = sampled_digest(filename, samples, blocksize)
+    return f'{stat.st_size}:{stat.st_mtime_ns}:{stat.st_ino}:{digest}'
+# ------------------------------------------------------------------#
+
+
+def content_digest(filename, blocksize=1024 * 1024):
+    """
+    Returns a BLAKE2 digest of the whole content of `filename`.
+    It reads the whole file, see `DigestThread` to compute it
+    off the GUI thread. Raises OSError.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(filename, 'rb') as fname:
+        for block in iter(lambda: fname.read(blocksize), b''):
+            digest.update(block)
+    return digest.hexdigest()
+# ------------------------------------------------------------------#
+
+
+class DigestThread(Thread):
+    """
+    Opt-in full content mode of the file identity: computes
+    the `content_digest` of `filenames` in background and
+    stores it in `store`, an object with the `get(filename,
+    variant)` and `put(filename, variant, data)` methods of
+    ProbeCache, which drops the digest as soon as the file
+    is modified. Files already stored are skipped, see
+    `stored_digest` to reuse the results.
+
+    Usage:
+        >>> thread = DigestThread(filenames, PROBECACHE)
+        >>> stored_digest(filename, PROBECACHE)  # None until done
+    """
+    def __init__(self, filenames, store):
+        """
+        The thread starts immediately.
+        """
+        self.filenames = list(filenames)
+        self.store = store
+        self.stop_work_thread = False
+        Thread.__init__(self, daemon=True)
+        self.start()
+
+    def run(self):
+        """
+        Computes the missing digests, one file at a time.
+        """
+        for filename in self.filenames:
+            if self.stop_work_thread:
+                break
+            if self.store.get(filename, DIGEST_VARIANT):
+                continue
+            try:
+                digest = content_digest(filename)
+            except OSError:
+                continue
+            self.store.put(filename, DIGEST_VARIANT, digest)
+
+    def stop(self):
+        """
+        Stops after the current file.
+        """
+        self.stop_work_thread = True
+# ------------------------------------------------------------------#
+
+
+def stored_digest(filename, store, compute=False):
+    """
+    Returns the full content digest of `filename` computed
+    by `DigestThread`, None if it is not available (yet).
+    With `compute`, a missing digest is computed now and
+    stored, in which case it raises OSError.
+    """
+    digest = store.get(filename, DIGEST_VARIANT)
+    if digest is None and compute:
+        digest = content_digest(filename)
+        store.put(filename, DIGEST_VARIANT, digest)
+    return digest